@@ -8,22 +8,22 @@ from PySide6.QtCore import Signal
 
 class ConnectWindow(QDialog, Ui_Dialog):
     user_data = Signal(dict)
-    def __init__(self) -> None:
+    def __init__(self, client) -> None:
         super(ConnectWindow, self).__init__()
         self.setupUi(self)
+        self.client = client
         self.setWindowTitle('Connect')
         self.pushButton.clicked.connect(self.connect_to_lichess)
         self.pushButton_2.clicked.connect(self.close)
 
     def connect_to_lichess(self):
-        API_HEADERS = {
-            "Authorization": f"Bearer {self.lineEdit.text()}"
-        }
+        token = self.lineEdit.text()
         try:
-            response = requests.get("https://lichess.org/api/account", headers=API_HEADERS)
+            response = self.client.account(token)
 
             if response.status_code == 200:
                 user_data = response.json()
+                self.client.set_token(token)
                 dialog = MessageWindow('Sucessful connected!')
                 self.user_data.emit({'user': user_data['username'], 'token': self.lineEdit.text()})
                 dialog.exec()
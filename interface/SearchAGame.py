@@ -1,7 +1,6 @@
 import threading
 import time
 
-import requests
 from base_windows.search_a_game import Ui_Form
 from PySide6.QtWidgets import (QDialog)
 from PySide6.QtCore import Signal, QTimer
@@ -11,7 +10,7 @@ stop_queue = False
 
 
 class SearchAGame(QDialog, Ui_Form):
-    def __init__(self, current_token) -> None:
+    def __init__(self, client) -> None:
         super(SearchAGame, self).__init__()
         self.setupUi(self)
         self.setWindowTitle('Search a Game')
@@ -25,7 +24,7 @@ class SearchAGame(QDialog, Ui_Form):
         self.yes_rated.clicked.connect(self.rated_click)
         self.no_rated.clicked.connect(self.no_rated_click)
         self.setup_buttons()
-        self.current_token = current_token
+        self.client = client
         self.spin_minutes_ai.setMinimum(3)
         self.cancel_queue.hide()
         self.wait_time.hide()
@@ -55,10 +54,7 @@ class SearchAGame(QDialog, Ui_Form):
                             'color': self.get_ai_selected_color(),
                             'variant': 'standard'}
         print(challenge_params)
-        response = requests.post("https://lichess.org/api/challenge/ai",
-                                headers={"Authorization": f"Bearer {self.current_token}",
-                                         "Content-Type": "application/x-www-form-urlencoded"},
-                                data=challenge_params)
+        response = self.client.challenge_ai(challenge_params)
 
 
     def put_in_queue(self):
@@ -72,10 +68,7 @@ class SearchAGame(QDialog, Ui_Form):
         print(f'Iniciando o post request com os seguintes parâmetros: {challenge_params}')
         in_queue = True
         stop_queue = False
-        with requests.post("https://lichess.org/api/board/seek",
-                                headers={"Authorization": f"Bearer {self.current_token}",
-                                         "Content-Type": "application/x-www-form-urlencoded"},
-                                data=challenge_params, stream=True) as response:
+        with self.client.seek(challenge_params) as response:
             for line in enumerate(response.iter_lines()):
                 if stop_queue is True:
                     break
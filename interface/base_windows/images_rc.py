@@ -0,0 +1,2005 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x05\x02\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x04\x00\x00\x00i7\xa9@\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\
+\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x02\
+bKGD\x00\x00\xaa\x8d#2\x00\x00\x00\x09pH\
+Ys\x00\x00\x0d\xd7\x00\x00\x0d\xd7\x01B(\x9bx\x00\
+\x00\x03\xe3IDATx\xda\xed\x9c\xc9oNa\x14\
+\x87\x9f\x0e\x94\x22\xe6\x1a\x13C\x91F\x84X\x88\xc6\xd8\
+\x90\x10\xc2\x86hH%v,E,\xfc\x01,$v\
+\x88\xbdX\x89\x8d\xa0vR\x0d\x8a\xd4B\x0c\x11b&\
+\x95\xb6\x91\x98\xdbF9\x16\x82V\xb4\xfd\xee}\x87s\
+\xaf\x9e\xe7]\xbf\xefw\x9e\xdf=\xf7\xde\xef\x0e\xdf\x07\
+\x86a\x18\x86a\x18\x86a\x18\x86a\x18\x86a\x18\x86\
+1h(R\xfb\xe4Q,c\x0a\xd3\x81\xd7\xb4\xd0\xc4\
+'\xed(\xe2QD-\x17\xe9Dz\x8c\x0e\xea\xd9\xa6\
+\xb89\x22\xb2\x9a[\xbd\xd4{\x8efVi\x97\x17\x9a\
+\xbdt\xf7\xa9/\x08\xdd\x1c\xd0.1$'\xfa\x95\xff\
+5\x8ek\x97\x19\x8a\xfd\x05\xe9\x0b\xc2>\xedRC\xb0\
+j\x80\xe6\xef\xbd#,\xd7.\xd77E4\x17\xac/\
+\x087\xfe\xb73\xc2\xb6D\xfa\x82\xb0E\xbbd\xbf\x9c\
+O\x1c\xc0Y\xed\x92}2\x82/\x89\x03\xf8Ly\x8c\
+\xd2\x8a\xa3\x04P\xcd\xf0\xc4s\xcaY\xfa\xff\x040-\
+\xe2\xacL\x060u\xb0\x07\x90a\xe2\x04\xd0\x1eqV\
+&\x03x\x12qV&\x19FG\xe2\xd3`g\x8a3\
+G\x0a\xe2t@'\x0d\x89\xe7\x5c\xa2#Jm\x91\xd8\
+\x94\xb8\x036\xc4),N\x07\x94\xb2.\xf1\x9c\xf5\x94\
+\xc4\x89 <\xa3\xa8O\xbc\xfd\x05\xe1\x02#\xb5K\xf7\
+A9M\xa9\xf4\x05\xe1j\x9c\x03aHJ9\x97Z\
+\xff\xe75a\xcew\x84CN\xfa\x82pP[\xc1\x85\
+\xea\x04\xb7\xc1\xfa\x1a_\xa9\xd6\xd6HK\x09\xf7\x9d\xf5\
+\x05\xe1~^w\x83]^\xf4\x05a\xa7\xb6J\x1a\x8a\
+y\xec-\x80Gy\xbcj]\xebM_\x10jB\x95\
+\x19.\xd9\x1d^W\xab\x0bVg \x8ah\xf3\xda\x01\
+\xad\xdaBI\x99\xedU_\x10f\x85)4\xd4.\xb0\
+$\x07+\x06\x0d\xc0\xff\xf6\x9a\x99\xaf\x00\xc6\xe5`\xc5\
+\xa0\x01\x8c\xf6\xbe\xe2\xd8|\x05\xf0\xd5\xfb\x8a]\xf9\x0a\
+\xe0}\x0eV\x0c\x1a@K\x0eV\x0c\x1a\xc0\xbd\x1c\xac\
+\x18\x941\x1e\xee\x04\xf4\xbe+\xe0\xff\xb0\x0a\x84\xeb\x80\
+w\x5c\xf7\xba^S\xde\x8e\x01p.\xc3\xabEab\
+\x8a\xc7a}\x8dN*B\x95\x19\xae\x03\xda9\xe3m\
+\xad\xd3\xb4\x05\xab3 \x95ty\xda\xfe\xb3\xb5U\xd2\
+r\xc4K\x00\x87\xb55\xd23\x9c{\xce\xfaw\x18\xa6\
+\xad\xe1\xc2B>:\xe9\x7f`A\xd8\x02C\xdfm}\
+\xcee\xa7\xf9\x0d\xbc\x08\x5caP6\xf1\xcay\x17x\
+\xc9Fm\x8dt\x94\x15\xf8\xeb\x80B\xc61\x86j\xeb\
+$e\x0a7\xbd\xe9\x0b\xc2\x0d&k+%\xa1\x8ag\
+^\xf5\x05\xe1)\xf3\xb4\xb5\x0ae\x01\xed\xde\xf5\x05\xa1\
+\x8d\xf9\xdaj\x850\x8f7A\xf4\x05\xa1\x859\xdaz\
+\x03Q\x11\xa0\xf9{\xef\x08\x13\xb4\x15\xfbc(W\x82\
+\xea\x0bBc\x96\xcf\x08\xfeN|\xfd\x8dc\xda\x9a}\
+\xb1\x81\xefQ\x02\xf8\xcefm\xd5\x7fQ\xe1\xf9yp\
+\x7f\xa35\xdc\x0d\x92\xf4\x9c\x8a\xa6/\x08'\xb5u\xff\
+fe\xa4\xf6\xff\xb3\x1b\xd4h+\xf7\xa4\x98\xbbQ\xf5\
+\x05\xe1v\x96\xde\x1b\xaa\x8b\xae/\x08\xb5\xda\xda\xbf(\
+\xe1\xa1J\x00\x0f\xb2\xf2\xfe\xe0v\x15\xfd\x0c\xf5\xc05\
+\xb5\x00\x1a\xb5\xd5\x01\x16\xab\xe9\x0b\xc2B\xd7\xf2\xdd\x8f\
+\xa4{T\xe3\xdf\xed\xba\x80\xeb\xaf\xf4Ky\xa3z}\
+\xd6\xca4\xbe\xb9,\xe0\xda\x01k\x94/O'\xb1\xda\
+m\x01\xd7\x00\xb6\xaa\xea\x03\xdag\x82\xe7\xaa\x87@A\
+x\xea&\xe0\xd6\x01\x95\xcc\xd0\xcd\x1f\x98\xe5\xf6\x0a\xa5\
+[\x00k\xb5\xed\x01X\xa3\x17@6\xfe\xecf\x85^\
+\x00\x8b\xb4\xdd\xdd\xabp\xf9\x1e0\x84O\x99\xb8A\xd9\
+\xc5H\xba\xd3Nv\xe9\x80\xaaL\xe8C\x99\xcb3#\
+\x97\x00\xb2\xf3\x90b\xaeN\x00\xd3\xb5\xbd\x7f\xe3\xf0w\
++.\x01D\xf9\x97\x17\x0b \xc3\x01\x04\xfa\x0dG\x0a\
+\xc6\xeb\x04\x90\x8ds\x00\xc0\x10\x9d\x00\x1c>\xd63e\
+:\x01\x0c\xfa\x0e\xc8N\x00\x83\xbe\x03\x1c*)u\xf8\
+\xd8\xa3.G_\xaf\xbc\xd5.\xc00\x0c\xc30\x0c\xc3\
+0\x0c#g\xfc\x00\xa2W\x8aF\x80p^6\x00\x00\
+\x00%tEXtdate:creat\
+e\x002018-07-26T19:\
+59:38+02:00\x8e\x18\xe6\xbe\x00\
+\x00\x00%tEXtdate:modi\
+fy\x002018-07-26T19\
+:59:38+02:00\xffE^\x02\
+\x00\x00\x00\x19tEXtSoftware\
+\x00www.inkscape.or\
+g\x9b\xee<\x1a\x00\x00\x00\x00IEND\xaeB`\
+\x82\
+\x00\x00\x04f\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x04\x00\x00\x00i7\xa9@\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\
+\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x02\
+bKGD\x00\x00\xaa\x8d#2\x00\x00\x00\x09pH\
+Ys\x00\x00\x0d\xd7\x00\x00\x0d\xd7\x01B(\x9bx\x00\
+\x00\x03GIDATx\xda\xed\x9cOHTQ\x18\
+\xc5\xcf\x886&\x88V\x84d\x10\x18\x94\x10\x82\xb4\xd1\
+H\x08\x097\xb5\x08Z\xf4g\xd98\xb4\x0c\x92V\x86\
+m[\x04\xad4\x10\xa2l\xd7\xbfE\x10\xd8&\x88\x08\
+\x1a\xc2M\x08mD*\xc8\xc6\xb2h\x98p\x91\xd64\
+\xb7MQ:\xcf\xd7\xbc\xb9\xf7\xbe3:\xe7\xf7Vs\
+g\xbe\xfb\x9d\xef\xcc\xcc{\xf7\xdd\xb9w\x00!\x84\x10\
+B\x08!\x84\x10B\x08!\x84\x10\xa2fHX\xc5\x9e\
+\xc4\xfe5\x9e\x9b\xc2\x03\x98\x80\xf66\xa4\xd0\x1a\xd2g\
+\x1e\x13X\x08\xccu\x1c=k\xc4\xbc\xc4\xbd\xc0\x5c\xde\
+\x19\x81\x099\x86\x02\x22\x92\x98\x0d\x8d10\x98E2\
+ r(4f\x84Q>0\x1d**\x13\x10\xd1\xfb\
+\xdf\xf2\x0d\x0cz\x03\x223\xa1\x11\xd3\x95\x17Qga\
+\xc0\xa6\xc8\xcf&Q\x0eA\xaf\x8a\x9e+\x06\x036\x04\
+5o@\xbd\xb7\x9e\xbb\xf0\xba\xa4\xad\xb1\xac\xc8\xdbX\
+*i\xdb\xb9\xfe\x0cHbw\x85\x91\xed\xde4\x05P\
+\xf3_\x01\x19\xc0\x16\xc0F\x06\xb0\x05\xb0\x91\x01l\x01\
+l,\xc6\x01\x8d\x89\xeb8\xc8\xd6\x0f \x83\xb3\x89%\
+\xfbn\xa2\x93\xce\x9a*!\x9d\xad\xbc\x0a\x8b\xaf\xc0\xdc\
+\x22e\x16\xa2\x04\x83Oo*\x8f\xb6\x99\x11\xda{,\
+s`\x1b\xfb$R\xc4\x8b/\x0f{\x03\xee;ba\
+\x0f\xde\x975\xc5\xe1\xf3\xf8\x88}\xcc7\x80m\x01\xb9\
+|\xb6\x05UP>\xd3\x82*)\x1f\x00:\x91\x8d\xbd\
+\xfc,:]H\xb7\xb9\x0a\xac\xb4\xe0\x09\xda[0\x81\
+]\x9e\xbd~\x87\x14\xbe\x02\xf38\x8c\x19\xcf\xa9\x22[\
+\x90\xed\x8fe\xd8\xd3\xef\xec\xdd\x07\xdc}\x02\x00\xe0T\
+\xdd\x9d3\xd8\xee\xd9\xe7\xcf\xb8\x85\xe2i\xdcu\xd5\x9f\
+\xcb9\xc1\xe5\x22nz.\xffO&w]\xb1\x07r\
+td\x00[\x00\x1b\x19\xc0\x16\xc0F\x06\xb0\x05\xb0\x91\
+\x01l\x01ld\x00[\x00\x1b\x19\xc0\x16\xc0F\x06\xb0\
+\x05\xb0\x91\x01l\x01ld\x00[\x00\x1b\x19\xc0\x16\xc0\
+F\x06\xb0\x05\xb0\x91\x01l\x01ld\x00[\x00\x1b\x19\
+\xc0\x16\xc0F\x06\xb0\x05\xb0q\xbcg\xa8\x03[=\x0b\
+\xce\xe1\xad\xe7\x0c\x953\xdem\x0a\xde\x17\xc8\x14L\xb7\
+\xc18\xbb\xd4 \x06a:L\xce\xbb\x019\xd3a`\
+0\xe8J\xb6\xab5B=x\x86$P\x8ff\xcf>\
+/\xa2\x00\x00\xcb8\x84)\xcf\xa9\x22\xd0\x86\xb9\xd8\xd7\
+\x09\xce\xc7\xbb\xbf0\x8c\x06<\xa5\xac\x14}n\xb3i\
+\xda%\xd7(\xe5\x1b\x18\x8c\xd9\x8b\xb7>\x07\xb4\x0e^\
+\xb8\xe1l\xd5bDfp5\x9d\x8fie\xde\x9a\x0c\
+\xe7\xbd\x9f\xf8C\x18\xce\xdb\xea\xb7\x1e\x09\xfela\xda\
+o\x9f\xddz$8\x8a\x1d\xe8\x22\x95\xff\x0a\xa3\xd6}\
+\xd8\x8f\x03\xd8;\xa7,+\xa8\xf9\x9b!\x19\xc0\x16\xc0\
+F\x06\xb0\x05\xb0\xb1\xbe\x0cn\xc6e\xe2e\xf0\x22\xbe\
+\xc5n@\x0a'\xd0\xf0\xf7\xe19\x9c'\x95\x0f\x0c\xe0\
+\x03\xae<\xfe\xa7\xe1\x07\xeec\xc2\xaf\x01GW\xef\x8a\
+)\xd0\xca\xff\x9d}`E\xc3\x11,\xe0\x91O\x03\xfa\
+V7\x8ca\x8b\xbb-\x5c\x11\x99\x09\xba\x1d\xec\xf3k\
+@\xc9I\xf3;.\x91\xca/W\xa1\xd3\x97o<d\
+\x00[\x00\x1b\x19\xc0\x16\xc0F\x06\xb0\x05\xb0\x89j\xc0\
+\x1c[0[a\x13&i\xbf\x02\x94sL\xa2)Z\
+A\x95\xcc\xa85{\xfc#N;\x0aXdK\x10B\
+\x08!\x84\x10B\x08\xb1\x1e\xf8\x05\x8e\x9b*A\xe6\x03\
+(\xae\x00\x00\x00%tEXtdate:c\
+reate\x002018-07-26\
+T19:59:39+02:00(\
+o\xed\x0a\x00\x00\x00%tEXtdate:\
+modify\x002018-07-2\
+6T19:59:39+02:00\
+Y2U\xb6\x00\x00\x00\x19tEXtSoft\
+ware\x00www.inkscap\
+e.org\x9b\xee<\x1a\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x0b\x19\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x04\x00\x00\x00i7\xa9@\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\
+\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x02\
+bKGD\x00\x00\xaa\x8d#2\x00\x00\x00\x09pH\
+Ys\x00\x00\x0d\xd7\x00\x00\x0d\xd7\x01B(\x9bx\x00\
+\x00\x09\xfaIDATx\xda\xed\x5c{p\x15\xd5\x1d\
+\xfeB\x12HR\x90\x874<\x02\x08\x18d\x84N\x0b\
+\x96W\x917XA\x04[,`aZ\x95\xa2D,\
+Xk\x14\x95\x01\xb1\xa2\xb5\xf8\xc0\xc8X-\xd2Qk\
+\xab\x16*\x11\xa9\x96\x16\x94\x02\xc2XA\x84\xa6\xb4\xe8\
+\x14T@\x09\x05\x1b\xca#\x81<\xee\xd7?\xce\xfe\xee\
+97\xb9\xb9\xf7\xee\xbdg\xef\xa6\xd3\xfd\xeedrv\
+\xf7\xec\xef\xf7\xfb\xbe\xb3{\xf6\xbcv\x81\x00\x01\x02\x04\
+\x08\x10 @\x80\x00\x01\x02\x04\x08\x10 @\x80\xff3\
+d\xfa\xe25\x03}\x11B\x95\xdf\xe4\xed\xa3\x00\xe3\xd0\
+\x07\x19qr\xf5\xc1.\x10D)\xda\xfa\x1d\xb0M\xe4\
+\xe2i\x84@\x10e\x18\x1e#\xdflT\x81\xce\xaf4\
+\xaeX\xffCx(L\x8b\xa8Aq#\xb9\xee5r\
+\x11\xc4u~\x87m\x0f\x1b\xebQ[\x18%\xcf\xed\xf5\
+\xf2\x10\x9b\xfc\x0e\xdb\x1ev4 7\xab^\x8e\xc9\xa8\
+\x93c\x97H\x9eZ\xb4\xf2;p[x_Q\xea\xae\
+\x058\x8b\xbe\xc6\xf1\x02\x9c\x90#\xc5<\xa4s\x8d\xf6\
+;p\xcb\x02,c\xb1&W\x86\xdc\xf0\xf1\xb5\xb2\xb7\
+\x88$\xd9I\xf2\xdc\xecw\xe0\xb6\xb0S\x11Z\xca\x10\
+\xa7h\x09~\xee\x1c\x1d#{\x86\xb1\x86$9Dr\
+,\xf17\xec,k\x96\x0eb\x00\x00\xfc\x03\x19X\x85\
+]8\xa4\xf6\x16\xa1#j\x01\x0cV\x9byx\xd1q\
+Y \xe7\x8d\xc7\x1e\x1c\xc0A\x9c\xf5W\x88\xd4\xe1<\
+\xe0:\xf1<\xc9m\xcc\x22\xa2\xfc\x16SpK\xfdc\
+\x87\xb1\x06?\xc2`d\xfbM$Y\x8c\x12*?%\
+I\xde\x15\x85~\x07\x9e\x09\x0bpWT\x81@T\xe2\
+\xcf\xb8\x1d]\xfc\xa6\xe3\x1e\x19\xd8\xaf(t%I\x9e\
+aa\x03r%\xd4\xd8\xc6f\x8dI@\x10u\xd8\x86\
+y\xe8\x94\x8e\xb0\xed\xe1>U\xa1\xf5\xc2G\x00\x80\xa3\
+x\x06\xe5\xe1\x83\xb9\x18\x8c\xeb\x22\xdcm\xc1\x06l\xc7\
+Q|\x8a\x9a\xc6,\xd6\xe15\x94`\x9b\xf72\xd8\xc1\
+;\xaa\xf4\xa6\xd3\x1dj\xf917\xf2A^\xcd\x0b\xa3\
+_\x0d;0\xc6oj\x89\xa0\x9f\x04\xfc\xb4\x1b\xf6\x95\
+\xe6F\x88\x7f\xe7J\x8egvC\x116E4\xaa\x9a\
+$6\xa8P\xf3x\xd2\x8d\x00U\xd1v\x9e\xe0J\x8e\
+ef\xa4\x04\xd5x\x0cy~\x93l\x1c\xd3%\xd0\xb9\
+.o\x80\xc6\xf1\x09\x8b\xd9&R\x84\x0f1\xc4o\xa2\
+\xd1\xd1\x0d\xc7U\x88\xadXnM\x00\x92\xac\xe0\x22\xb6\
+2%\xa8Aq\xd3\x1bC\xc8\x91f0\xf8\x98U\xfa\
+\x0a\xe5\xbc\x81\x19\xa6\x08\xaf4\xad[!\x03/Jh\
+CY\xeb\x81\x00$\xb9\x8d\x17\x9b\x12lG;\xbfi\
+k\xdc/a\xe5\xf3\x10I\xf2eN\xe0D\xae\xb1,\
+\xc1i\xdehJ\xb0/\x1d\x8d\xa4D\xd0\x175*\xa4\
+ln!Y\xc3\x99N\x88\xcd\xb8\xda\xfau\xf0\x02s\
+\xb5\x04\xfb\xd1\xd1o\xf2\x00\xf0\x96\x04\xf4\x0b\x92d\x91\
+QJ#<\xb8\x15\xdefk\xed\xe1\x03\x5c\xe07\xfd\
+\xa9\x12\xcc\x8d$\xc9\xd7\x22\x1eZ\x83<\x10\x80\xfc\x80\
+\xf9\xda\xc7\x1b>\xcdk8\xc8\xc5'*\x90\x0b\xf89\
+\xc9J\x16D\x08\xf0-O\x04 \xf7\xb0\x9d\xf6\xb2\xdc\
+O\x01\xc2\xd5\xdfr\x92\xe4\xe3\xf5\x9a\xaf\xab<\x12\x80\
+\xfc\x0b\xf3\xb4\x9f)~\xd1/\xc0\x19\x15B\x1fV\x93\
+${E\xd0o\xed\xaeI\xec\x12\xbf\xd3\x9d\xe9\x0at\
+\xf7G\x80_\x09\xd5\x8d$\xc9\xb2z\xe5\x7f\x9f\x87\xf4\
+Ir\xb1\xf6\xf5\x96\x1fm\xc3\xfe2\xc6?\xd9\x09h\
+}\x04\xfdB\x9e\xf5X\x80:\x8e\xd5\xfe|\x18Y\xde\
+\xaa\x5cgq\x9f\x13\x90\xf9\x04h\xc1\xed\x1e\xd3'\xc9\
+#\xba\xabt\x12\x1d\xd2K?\xfc\xf8\xbb-\x1c\xce)\
+vp\xf65\xe7+i\xa0O\x92\xab\xb4\xe8+\xd3I\
+\xbf\x05\xfe\xa9\xdc\xb6\xe5\x09#\x9c\xbfq\x14[s\x14\
+\xf7\xba&r\x80#\xd9\x99\x0f\xb8>/\xc4\xd1\x22@\
+-\xbe\x96>\x01\x8aE\xf7\xc7-\x95\xe4U\x8e\xbd-\
+\xae\xcf\xdc\xab\x87M^O\x17\xfd\xf6\xa8P.{\xf1\
+\xbc%\x01\xe4\x01\xfa\xcb$\xce\x9d#\x02\x84\xf0\xf5d\
+\xe84s}\xc6\x12\xb4Q\x89ehnI\xd3j\xe7\
+\x7f2O\xb3\xc5\xc8\x91\x93\x17Y\x0a'&.\x95\xde\
+\xdf(K\xa5O\x1e\x0f\x0fwlH\xea\xfcy\xfa\x1a\
+\xe8\xed\xbd\x00\xa5\xd2\xd9\xddeM\x80\x92p\x07\xba\x22\
+\xa9\xf3\x8f\xe8Q\xe4\x12\xaf\xe9\x0fqV\x01\xf1\x06k\
+\xf4\xab\xc33H\xc3\x93\xb61C\x048\xe5\xf5r\x8b\
+\xcd\xcaQ\x8e3\xf6c\x03O\x84\x9f\xe5\xbfI\xda\xc6\
+.\xdd\x1e\x98\x95:\xc9\xc6q\xa5\xb8\xf9\xb15\xfa\x07\
+\xc2c\xbe]Rz\xa6\x0c\x10\x01<\x9cF\xcb\xc0n\
+\xe9\xfd\x1f\xb7D\xbf\x9aC\xc3e\xb74%KO\xe9\
+\x8a\xb0\xd0+\x01\xc2S\x1f?\xb1V\xfes\x8d\xfe\xc3\
+\xdb)Y:\xa9G\x0b\xef\xf4\x86~3\xecS\x0e:\
+\xf0\xb4%\xfa+\x22\xfa\x8f\xc9=\x025\xae\x11K[\
+\xdd\x12K\x0c\xd7\xa2\x8fJ\xdc\x8b\x96V\x14}\x01\xb7\
+El\xd7\xa6ho\x92$\x86\xe2B+\x01F \x03\
+{\x94\xbe\x1d#\xa7s\x93Fi\x83%4\x7fJ\xd1\
+\xe21=F\xf4}7\xd4\x12\xbb\x02\xae\x91\xbe\xd6\x02\
+c\xdd[\xf2x\x13\xd3\x1b\x94xN\x8a6\xf31P\
+\x92\x93R\xb1\x13\x1d;\xe5\xfe\xb71\xce\xf3*st\
+\xc9\xbf.\xa9\x9d)\xdb]\xaa\x9bC-\xec\xd2\x0f?\
+\xff\x97Y\xa0\xbf\xdc\x5c\x1b\xb4\x0e_\x91\xf4\xc1\x94-\
+\xef\xd5v-\xaf(qJ\xa9}\xca\xf5\x7f(rm\
+\xd8F\xe4`\xa4l\xd9\xa8[\xba\x88\xe5\x85\xa9\x93\xd6\
+\xe8\x8eZevq\x8a\xe1U\xf2\xbb&\xfdR\xe4\x02\
+\xb8^m\xb5\xb1@\x9f\x9c*\xb6\xd7'N/~%\
+X\xa4\xa6\x9f\xb2R\x1cz\xfd\x0c#\xf1\xb2\xde|\x0e\
+SQ\x05H\x07\xf6\x12+e5D'\xac\x0d\x94\xb7\
+\xc01\xa5\xea4\x92\xe4\xef\xd9\x8f\xd9\xec\xc9\x15\x0c\xb9\
+*\x9b\xed\xech\x96\xfe\xc3a\xfb\xeb\xd4\x9e\xefY\xb9\
+\x02\xb6k\x0f\x17\xdb\x12`\x8a\x98\xdcLr\xb3Q\x81\
+=\xea\x22\xb0\x15l\xaeC\xab\xc6l\xc3~\xb9\xbd\xea\
+\x95\xac\xd2~f\xda\x12\xe0ye\xf0R\x92t\xc6`\
+\xb3\x9c\xa9\xaf\xc4\xae\x81\x0a^k\x96\xfd1\x8c0\xac\
+\x17\xca\xfe\xadV\x04 \x07\x89\x9f'm\x09p@\x19\
+\x5cHR\xad\xf1o\xe6\xfc\x81G\x12\x08\xe8=\xf60\
+\xe9\xefF\xb7\x08\xeb?\x94\x99\x04;\xedKr\xbex\
+z\xcf\x0e\xfdl\x19\x01T\x0d\xd5a\xc6\x15\xd0\x8au\
+q\x82\xa9\xe5\xd2\xc8%\x8f/5X\xdc\xe4\xac-\x1c\
+g\x89>\xf9k\xf1u\xd6N5\xd8R\x82\x7f\x97$\
+\xf9\xa6\xb1Z\xeb\xfe8\xa1\x1c\xe4p\x93|U\xbd\xbe\
+\x0f\x00t\x14yK\xe23K\x10\xefk\x8fV\xd6\x9b\
+g\x9aU I\xbe\xc4\x9e\x04\xdbsi\x9c\xf5`\xa5\
+\xe6R\x16\xe2C\xf4\x8bb\xfd\x1eu4\x93\x87\xad\x09\
+pJ\x17\x91\xa5\xd6`\xa52\xb7\xd6p\x12\xaf?p\
+^\x0fT\xab\xdfsQ{\xd0-\xf0\x99:>\xc1\x1a\
+}\xd2x\x17iNb\x04\xe3\xbd2sX\xb5Q>\
+6v\xc9\x8d\xfc\x05\xde\xc1G\xe8\x8d\xab#ZS'\
+1\x11;\xf4\xe6\x09\xcc\xc1\xda\xa8\x96g\xa3\xb3J\x14\
+\xd9)*\x07\xbdpT%\xec\xb4\xad\xf0\x87\xc6\x86\xc1\
+\x0f\x86g\x83\x07\x18+\x9e+8\xd0,\xfb\x0d\x8d.\
+ek'/\xd1\xf5\x8e[\x99\xba\xc3l\xdd\xcf\xb4\x82\
+\x07\x95\xb9\xee\x0d\x9e\xfa\xfd\x0d\xa2\x0f\x85\xef\xc0Az\
+o-\x16\xc5hh?#\xf9~k\x95>\xb9L\xfc\
+\xef\xb7#\xc07%\xd0\xc8\x99\xdbS\x11\xabwg\x92\
+$\xeb8Y\xef\xfb\x0f\xae\x88au\x84t\xb0FZ\
+\xa6O\x96J\x04\xe7\xed\xbc\x11\xd7\x1c\xffR\x06\x87:\
+\xef\xfb)\x1c\x8f\xa8\xe6\xd4\x15\xb0\xd0\xa4\xff\x8d\x186\
+\xf3\xa5\xfa\xcbJb-A<\x18k\x95\xba%\xcc2\
+&\x1e\x16\x83\xd3\xf8\xefF\x04(#\xb9^_\x13\x95\
+\xb8<\x86\xbdLl\x92\xf3\xe6[\xa7O~\xa1\xe3\x1a\
+\x980\xc7\x98h+\xd7\x00\x98\xc71\xbc\x897s:\
+/3\xe8\x8f#\xf9\xa9\xf9\xbeO\xec\x8e\xc8\x13\x92\xef\
+\xab\xd6\x1a\xc0&B\xbaC4\xd1\x8e\x00\xc0$\xb9c\
+\xa3\xff\xfe\xc83f\x95\xf8hL[K$_+\xee\
+\xf7\x80>I\xbd^\xd5\xe2<\xe1\xf58\xd7\x18\xfd\xee\
+<\xc2\xcb\xf5\xf6\x8e\x98o~\xce\x93|\x19|\xd5#\
+\xfa\xc6\xf3\xe9\x1e{\x02\x00\x97\xc9\xccp\xfd_\x8e\xf9\
+rSy\xcc\x8a\xa7H&\xd7\xdd\x8d&\xb8\xc5x\x89\
+&\xa1u\xc4\x89>*vc4\xba`\x1c\x06\xa2\x0d\
+\xb2q\x1a'P\xa8V\xe9\x9e\xd3y\xce\xe1\xdb\xf2\xce\
+t\x14\xdc\xa1o\x8e\x05\xb8\xc3f\xe1\xd4C\xbe$<\
+^;\xd8\xd9\xf8\x18\x0aA\x1c\xc3\xb0\x18\xb9\xef\xd69\
+\x7f\xe0r8\xcd-\xee\x14O\x9e\x7f\x9ec\x86tg\
+Q\x87R\x5c\x14#\xe7\x02M\xff&\xcbM\xdf\x86x\
+D|\x95y-\x00\xd0\x13\xdf\xc1,L\xc6\x97c\xe6\
+Z\xa8\xe9\xdf\xeaq\xe9\x93\xe4\xf3\xe2\xeds\xef\x05H\
+\x04\xf35\xfd[\xd2@\x9f\x5c#\xfe*\xfc\xa6\x0e\x00\
+\xb3u\xcd_\x9c\x06\xf2$\xf9\x86\xee\x0d\xf8\x8e\x11\xa8\
+N7}r\xb3\xae\x98\xed} $)t\x95I\x15\
+pVZ.~\x85w\xb5\x00\x09,\x9as\xbfT6\
+Qdb\xb5<\x92g\xe0\xd94\xbe\xd4a\x0c=\x7f\
+\xc9O\x01n\x95\xa9\xba\xfex\xd6C7\x0d\x91\x1b5\
+\x99n\x01\x0a\xf0\x80J\xe4c]\x9a\xdfu\xce\x8b\x9a\
+L\xb7\x00?\x93\xb7:\x9fD\xd7\xb4\xd2o\x1a\x02t\
+\xc24\x95\xb8\x12\xd3\xd3L?\x82\xb5o\xb7@\x91\xea\
+\x14g\xe2\xa9\xb4\xd3\x87\xf9\x16C\x02/4x!@\
+\xb6L\x80O\xb67M\x9f\x1c\xe8\x8f\x00ce\xcac\
+\xae/\xacC\xbe\x0b0A\xfd\xeb\x81\xb1\xbe\x08\xc0\xa8\
+\xc9t\x0a\xe0,\x81\xb8\xca\xa7\xaf\x9d\x18\xacC\xf1s\
+\xdb\x17\xa0\xb9\xac*\x1e\x91\x9a\x1d\x1b\x02\xf8r\x05\x14\
+J\xdd\xdb\xcf\x7f\x01\x12\x80}\x01\xba\x8a\xe1\x1e\xfe\x0b\
+\x90\xc0-`\xbf\xc3\xe8|\xdd\xa55\xfe\xea\x93\x00\xee\
+\x86\x01\xec\x0b\xe0\xf4\xc0*\xd4\x176\xfd\x85/\x95`\
+\xaa\xeb\xdem\xc2\x97J\xb0\x89\x0cE\x02\x08\xe1\x88\x1f\
+n\xb3\xb1Z\x7fA\xda\xc7_\x15\xeeN$\x5co\xda\
+*-\x9b\xc0\xb7a\xab\xccI\xab\x00\x01\x02\x04\x08\x10\
+ @\x80\x00\x01\x02\x04\x08\x10\xc0\xc4\x7f\x01\xf7Pg\
+\xed\x01d\xbao\x00\x00\x00%tEXtdat\
+e:create\x002018-07\
+-26T19:59:28+02:\
+00B\xb2\xe6 \x00\x00\x00%tEXtda\
+te:modify\x002018-0\
+7-26T19:59:28+02\
+:003\xef^\x9c\x00\x00\x00\x19tEXtS\
+oftware\x00www.inks\
+cape.org\x9b\xee<\x1a\x00\x00\x00\x00\
+IEND\xaeB`\x82\
+\x00\x00\x09l\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x04\x00\x00\x00i7\xa9@\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\
+\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x02\
+bKGD\x00\x00\xaa\x8d#2\x00\x00\x00\x09pH\
+Ys\x00\x00\x0d\xd7\x00\x00\x0d\xd7\x01B(\x9bx\x00\
+\x00\x08MIDATx\xda\xed\x5ci\x8c\x14E\x18\
+}\xb3\xcb\x9e\x02\x0a\x18\xaeE\x82\xb2*\xb0\xa0\xa0r\
+y\x10@DPn\x5cX4\xc6\xc8\x12%\x01\x0f\x8e\
+\x04\x15]!\x1a\x8f(\x82G$\x1a\x0d^1\xb8\x1a\
+9\x22F#d\x11\x04D\x10\x8c\x86\x08*\xab\x11Q\
+\x8e5\xe0\xc2\xb2\xbb\xec\xee<\x7f\xd4\xccX\xdd\xd33\
+\xd33S\xd55j\xbf\xfa\xd15_WW\x7f\xefM\
+UuW\xf5\xd7\x0d\xf8\xf0\xe1\xc3\x87\x0f\x1f>|\xf8\
+\xf0\xe1\xc3\x87\x0f\x1f>|\xfc\xcf\x90m\xe4\xac\x01\x94\
+ \x88z\xd3\xe4\xd5\xa3\x08\xa3\xd0\x07\x81\x04\xa5\xfa`\
+7\x08b\x0d\xda\x99vX%\x0a\xb0\x12A\x10\xc4w\
+\xb8.N\xb9Y\xa8\x07CiMB\xb1\xfeEx\x22\
+B\x8bh\xc2\xc2\x18\xa5\x1e\x92J\x11D\x99i\xb7\xd5\
+\xe13\x1b\xb5\xc5\x0ee\xe6\xd9\xca\x10\x1bM\xbb\xad\x0e\
+\xdb\xa3\xc8\xcd\xb4\x95\x98\x80\x96\xa82\xcdhc\xdaq\
+U\xf8:\x8a\x5c\x1dJ\xa4\xfdE\xa8\x89*A\x10#\
+\xcc\xba\x9d\xa5\xb1\xeeB\xacFA\xe4\xd7\x8b\xe8\xe0X\
+\xea\xe2\xff\x8a\x00A\x07[_,\x0b\xe5Fbr\x8c\
+\xe3\xba\x9a\x15\xa0\x95\xb2\x9a\xaaq\x95\x83u6:\xa3\
+\x19\xc0\xe0\x98\xc7\x8d\xc178\x88j\xd4\x99\x15\x22}\
+<\xe4\xd8\xc3\xdd\xa7Cx\x1f\xf7c0rL\x13I\
+\x15\xc3\xd3\x14 \x9c\xce`3\xe6\xa1\x9bi:\xc9#\
+\x80\xfd\xe9Q\xef\xcc\xb1\xec\x18\xfe\xd5\x82\xad\xb8\x07]\
+L\x93J\x0e\x8f\xa6'\xc0\x02\x92\xe4\xcf\x5c\xcd\xf9\xec\
+\x15\xbeK\xf8 \xeemu\x86\xe1\x8b\xf4\x04\xd8J\x19\
+{\xb9\x88\xdd\xc5\x9e\xed\x18i\x9a\x9a\x1b\xf4O\xb1\xc7\
+\x87r\x1d\xd9L;ZX\xc9\xde\xe1[\xe6\x92\xf4]\
+\xd4\x8bOR\x12 23\xbc\x81utB\x0b+Y\
+L\x10g\xb1\x0c\x85\xa6I\xc6\xc6\xf4\xf4\xc7\xff|N\
+b%\xcf8\x88P\xc7\x05\xcc&\x88\x03\x18b\x9a\xa8\
+3\xba\xe3\xb8\xa2\x8b \xdb\xb0\x9c\xdf8\x88\xf0\x15K\
+\x081\xd1\xce\xb85\x84|\xecRE?\x9cFpC\
+\x94\x04\xa79I\xec]\x9dY]!\x80\xb7U\xd3\x17\
+i(\xb7\xd9$\x08r\x89\xd8\xb7\x0d\xedM\xd3\xfe\x07\
+K\xed\x8e\x97\xf1c~\xc4[\x14H\x10`9km\
+\x22\xac\x12\xa3\xc1\xbeL\xb9I*A\x93\xecr+\xbe\
+\x13\x19\xbdK\x95\xb4\x83\x1e\xdcb\x93\xe0\x0df\x11\xc4\
+~t6M\x1e\x006Y\xdd])9\xfa\xb9\xa2\xae\
+\x90\xcd\xe7l\x12,\x17{\xf6\xa2\xadi\xfa\xa5VW\
+'Z\xdc\xdc\xa9p<\x98\xcf\x16K\xdd\xa1\xb1`\x83\
+\xa1\xe7\x1a!\x14\xe0\x17\xd9\xc9\x02\xfefqr\x8d\xd2\
+!q\x06\x9b,\xb5O\x15\xf6\xe5&\x05\xb0\x0d\x7f\xf3\
+l\x0d\xb5\x5c\xa9\x00`\xb9\xa5\xf6\x13\xbcH\xd8\xa7\x98\
+\xa2_\x84\xd3V\x07\x7f\xb08x\x92\xe7*\x16\x00\x5c\
+b9\xc3.\xe6\x11\xc4\x09\xf40#\xc0[V\xe7\xfa\
+\xda\xfe\xff%\xca\xe9\x83\x01\xbea9\xc7\x0aa\xdfd\
+\xe2\xdep\x80}\x8d\x7f\x9c\xc5\xb5\x1fY\xa8A\x00\xb0\
+\x90\xdf[&J\x83\x85\xfd.\xef\x05\xd8bwM\xbe\
+\x024\xf0j-\xf4Ap\x00\x1b\xa53\xed\x16\xf7\x04\
+'\xd1\xc9[\xfa\xa5\xd1\x8e\xb5\xe1\x91\x90S\x8d\x9c\xae\
+\x8d>\x08.t\x1aj_\xf5\x92~\x1e~rr\xac\
+\x84U<\xc9*^\xa6\x95>\x98\xc5\x1d\x92\x00\xc7\xd8\
+\x8e \x9aq\xb9w\x02,\xd4K0q\x1ad\xb9-\
+zFX\xd7{E\xff|\x9c0-\x00\xb8J\x12\xe0\
+4;\x10D\x10Wz#\xc0K\xa6\xc9\x83`'\x9e\
+\x94$xXX\xd7zA\xbf\xb7u\xf6g.-\x96\
+\x048*.\xbaA\x5c\xaa_\x805\xa6\x89\x87S[\
+K\x1b\x98+\xac\xcf\xeb\xa6?$\x14\x05\x94\x11\xe9\x19\
+I\x80\x9f\x18 \x88Z\xdd\xe1\x16U\xa6I\xcb\xa9\xc8\
+rKt\xad\xb0\xceL\x9fdl\xdch\x9a\xb2=\xbd\
+.\x09\xf0\x8a\xb0m\xd5G?\x80=\xa6\x09\xdb\xd3\x15\
+\x96\xe9q>A\x04Q\x9c\x1c-\xf7\x11\x22\xd30@\
+\x9f\xba\xa9a\x0f\xf6E\xf2\xe7a\x9c\xf8\x9b&'W\
+\x87[\x01\xb2Pa\x9a\xae\x13\xde\x93\xf2\xb7\x8b\xcdx\
+=g*5\xdd\xdc\x9dSO\x06#\x9d\xa0\x91\xad\x09\
+\xa29F0V\x0c\xb8k\x01\x01\xc7\xb0\xc7\x0c\xc0A\
+\xec\x8c\xe4s1\x1c\x00\xb2q\xb3z\x01&z9\xd7\
+J\x0er'\x18-6\x1a:\x81\xf2g\x7f\x91\xb4>\
+\xdd\x1a\xe4\xa5\xb8\xfd\xc2V\x8b<\xb5\xf4\xf5]\xff\xd7\
+\xa1o\xbau\x04\xf8\x87$\xc1\x85\xc2\x9aDD\x89\x9b\
+.0G}\x93\x02\x00l\xc4\xf4\xe4\x06,'\x10\x9b\
+\xa5_7\x88\xcdP\x95\x02\xf4\xc0MZ\xe8\xaf\xc5\x04\
+4\xa8X\xd2\xae\x92\xf2\xa3\xc4&\x890\x8a\xc4\x02\xcc\
+\xd6\xf2\xf8i\x15JQ\x0f\xa8\x98\xc0\xca\x02\x0c\x0a\x0b\
+\xa0l\xa1<\x0fG\xe5\x1ew3\xf7\xf2,\x0fr\xae\
+\x98}\xa5\x9a\x9e\x8a\xd4\xbfN\xc5X\x22?\x92;_\
+\xd8z\xaa\x12`\x8a|\xa2\xe1\xd2Z\xdc\x82T\xdd=\
+\x8bYR\xfdGT\x08 G\x93\x8c\x16\xb6\xdb\xdc\x12\
+L\xd4\x05&\xc8?*\x90\x05\xa0\x19\x00\xf0Hj\xad\
+\xec\x18F\xe1\xb5\xc8\xafb5\xeb\xf9\xdfJ\xf9\xd0\xc2\
+\xe0`\xb7\xc7&\x12\xc0\x12\xa7\xd9\x0b@\x0bZ!\x08\
+\xe0\xdcT\xe2\xdc\xf7b \xb6H\xbf\xc7\xa8\xa0\x0f|\
+\x17-\x80\xa2h\xb2\x1c\xeb\x0a\xa0\x88\xe5\x14\x8f\xa9k\
+\xc53\x99d\xd2\xbbQ\xc1M\xa9\xc5\x16F\xa5~R\
+\x17\xf8Y\xd8\xea\xd4\x0c\x83\xad\xad'\x1a+M=*\
+\x92s\xb2\x1e\xf7E\xd5\xdeY\xd5\x02k\x8eem\xa8\
+\xbd\xb0*\x897\xcf\xb6\x9fj\x06\x0f\x92<\xce\xc5\x22\
+T\xc9m:\x80\xfe\x0e\xb5?\xa8\x86>\x08Kd\xe1\
+ aS\x14_|&\xfadI?\xf7]\x85\xd6\x0e\
+5\xe7\xe1\xb0:\x01*%\x01\xca\x84\xednw\x04\x13\
+\x0d\x82\x87\x9c4I\x025\x98\x8a;q\xdaa\xcf,\
+\x95o\x0b\xfd&\xe5/\x12\x9bK\xd4\x08P\x9d\x96_\
+\x9f\xa2\x1f>t\xdc\xd3\x1eK\xd5\xd1\x07\x0eK\xf9\x0b\
+\xc5\xc6\xe5\xdbh\x89\x04\xd8\x93\xb2O-\xa8\xc0M8\
+\x12c\xef\x13\xe9O\x83d\xc8- $\x80\xcb\x16\x90\
+\x08\xa3S\xec\x95\x7f\x85'f\x8e\x18\x86fu\xfd\x1f\
+\x04\xaf\x91\xc6\x80jakT\xf3F\x5c.\x8e\xa5D\
+?\xde\x84\xb4\xa3\xca\xe1O\xa4\xee\x92\x00M\xcc\x11\xd6\
+\xeej\xda\xc0SI\xbbs\x06\xd7\xc4\xa9/\x1b\x1bU\
+\xd3\x07s,\x11\x03\xa1e\x91\x81j\x04h\x97t\x1b\
+\x88?\x11Y\xa1\x9e>\x08\xcb\xba\xd0@aKjq\
+4\x1e\xc6'\xd5c\x9f\x8d[\xd7\x12=\xf4\xc1\x03\x92\
+\x00c\x84M\xe1s\xc2;\xd0\xe0\xd2\x91\xedq\xdf\xfc\
+\xbcG\x17}p\x97$\xc0\xad\xc2\xf6\xa0\x1bj\xee\x96\
+\xc5\xdf\xc4\xd5\x96\xa5\xb7X8\x8a24\xc5\xdc;[\
+\xe7\xf3\xfbZ)\x1f\xba\xc2vts\x9c\xdbK\xc5\x1e\
+\x8c@7\x8c\xc2@\x9c\x87\x1c\x9cB\x0d\x8a\xa3\xa2t\
+\x1b0\x19\xbf\xc6\xacaA\x82\xce\xa1P\x80\xd0\xeb$\
+\x9ac\x07\xbbJ\x1fC!\x88\xa3\xb86N\xe9\x07\xf4\
+5~\x91\xde\x92\xba\xc0\x0b\xc2\xe6\xea\xf3\x1c\xa9\x7f?\
+\xe0w\x94\x87\x16\x87\x80 \xd6b\x10\xbe\x88Yv\x11\
+\x9e\xd4\xfbo\xa4\xde\x02\xd2\xb9[z\x17_\xe2\x0a\xb4\
+E\x0dv\xe0x\x9cr\x8b\xf1\xb8n\xfa\x8ec\x80\xab\
+\x9b\xed\xf4n\x17\xab]L\x96\xee\xf5\x82>pJ\xca\
+\x87\xde\xa4)ps\x9c\xceo\x88\x00\xc0,\xac\xf0\x82\
+>\x22\xbd\x11@\xf8J\xec\xea\xedB\xbd\x02\x0c\xc3\xcb\
+^\xc5\xf23Z\x80\x5c7\xed[\xa7\x00\x17\xe0}\xef\
+>\x88!\x7f\xc3%rR\x17\x9d@\x9f\x00\xd9\xa8t\
+w+\xa2Q\x80sL\x0a0\xc7\xdb7\xbd\xe5.\x10\
+i\xf9\x06[@\x11\x1e\xf3\x92~\x8c\x16\xe0b\x18\xd4\
+%\xc0\xd3^\xbf\xd5\xe90\x08\x1a\x14\xa0\x0b\xa6yK\
+?\xd3\x06\xc1\xd9\xde\x7f\x0e\xc9Q\x80\x5c3\x02\xe4X\
+\x1e\x80{\x04\x99kdF\xce\xc4\xc7\xe9\x10\xe0z\x13\
+\x1fH\xcb\x97\xf2\x8d\x86\x05\x18\xeb=}kw7-\
+\xc00\x13\x02\xc8\xa1\x81\x11\x01\x82\x89\x8fS/@.\
+\xfa\x98\x10 s\xba@\xb1\x9b\xb1W=\x1c\xbb\x80\x0b\
+\xa8\x17\xe0\x02\x13\xf4c\xb4\x00#]\xc0\xd0\xd7]\x1c\
+\x05p\x01\xf5\x02\xb8\x98\x81\xe9\x80c\x170\xd2\x02\xf2\
+\xd3\xaf\x22\xdd\xd3\x9a\x1d\x04\x7f7#\x80\xbc\x02\xfa\xa7\
+\xd8\x04-a\x031\xa0\xee\xab\xb2a|\x80\xc9\x98\xaa\
+}\xad1\x0a\x15R \xd2\x01\x00h\xc0R\xa7\x00\x1f\
+;\xf4\xac\xd8\xb5\xce\x80o\xc3\xd6\xa3\xc1\xb4\x0b>|\
+\xf8\xf0\xe1\xc3\x87\x0f\x1f>|\xf8\xf0\xe1#S\xf17\
+\x8f0|\xb1<\x80\xd5e\x00\x00\x00%tEXt\
+date:create\x002018\
+-07-26T19:59:36+\
+02:00\xde'\x9d\xe3\x00\x00\x00%tEX\
+tdate:modify\x00201\
+8-07-26T19:59:36\
++02:00\xafz%_\x00\x00\x00\x19tE\
+XtSoftware\x00www.i\
+nkscape.org\x9b\xee<\x1a\x00\
+\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x10\xed\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x04\x00\x00\x00i7\xa9@\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\
+\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x02\
+bKGD\x00\x00\xaa\x8d#2\x00\x00\x00\x09pH\
+Ys\x00\x00\x0d\xd7\x00\x00\x0d\xd7\x01B(\x9bx\x00\
+\x00\x0f\xceIDATx\xda\xed\x9c{\x90\x17\xd5\x95\
+\xc7?\xf3~0O\x9d\xdf<`\x867\x84\x87\x01u\
+\x82\xc4\x15k\x0d\x11\x82QH\x14_\x85\x11\x91d\xe3\
+\xee\xe6a\x14-7\x9b\xda\xdd*]bLm\xd6$\
+\x9b\xcd\xba%$\xd1\x94\xba\x98\x88\x11\x94\x0dB@+\
+U1 \xc4HV\x11e`FF\x86y\xe8\xbc_\
+\xc0\xcc\xd9?\xbao\xdf~\xff^3\xf3K\xa5~\xdf\
+\xae\x99\xbe\xbf\xee\xef\xbd}\xee\xe9\xdb\xe7\x9e{\xee\xed\
+\x864\xd2H#\x8d4\xd2H#\x8d4\xd2H#\x8d\
+4\xd2\x98h\xe4\x92\x9bj\x11R\x85\xa5\xfc\x8c\x0f\x10\
+\x84\x0f\xf8)\x97\xa5Z\x9c\x89E\x1e[\x18El\xdb\
+(\x8f\x93\x97j\xb1\x92G%\x8b\x99Oa\x14V\x0e\
+{\x1c\x95W\xdb\xcbdG\xc9Y\xc8|\x16S\x99\xea\
+j\xfa\xa1\x80\xfby\xdb\xac\xc80\xbbY\x11\xc2}\xc4\
+\xb7\xfa\x82\xf0pH\xae\x95\xecf\xd8\xe4\xbd\xc5\xfd\x14\
+\xa4\xba\xcav,\xe0=Oe\x9e$\xdf\x97;\x95!\
+\x83\x91+\xf7\xca>\xf9\x8d\xdc#9*\xcf \xb5\xbe\
+y\xf2\xf9\xb9\xa7\xfcw\x99\x9f\xeaj+\xcc\xe1C\xdf\
+\xfb\xb9\x93L\x1f\xf6}\xc6\xd9LyI\x14vJ\x86\
+\xcas\xafO\x8e,^\xf4-\xbf\x83Y\xa9\xae:@\
+&\x7f\x08l\xd2\x9b|\xf8/\x18\xe7\xd6\x88\x1d\xd7\xaa\
+\x1c\xcf\xfb\xe4\xb8?\xb0\xfcC\xbe*\x9e`\xdc\xa2\xc4\
+\x99#\xcfI\x9b4\xc8\x83\x92\xab\x04\xfc\x88I\x1e\xfe\
+\x01\xe3\xdcf\x87\x026\xab\x1c\x07<\xfc\x22:\xd5#\
+\xf3\x90\x9c\x90VyNfk\x15\xdc\x94\xea\xea\xc3v\
+C\x94)\xd2jU\xe7\x19-\xe0\x0d\x1e\xfe>\xe3\xcc\
+&\x87\x02\xeeQ\xfc}\x1e\xfe\x8d\xaa\xacm\x16\xbbU\
+j\x14\xff\x97\xa9\xae>4\x1b\xa2|\xd7Q\xa1\x8f\x07\
+\xdb\xf5\xc7\x8c3u\xd2g\xb1{e\x8a\xe2\xff\x97\x87\
+o\xf6\x19\x8b\x1d\xe5\x7fG\xf1\x9b\x92\x15?\xf9g\xa8\
+\xc2\xd8-t\x1c\xbcH%\xbc}\xf6\x8b\xc6\xee\x14k\
+i\x03\xa0\x95\x1b\xf8@\x9d\xdd\xe9\xe1GB\xcb\xafJ\
+V\xfc0\xd7#\x83\xcbY\xc54\xb2hf/\xafp\
+\xde\x97\xd5e\x08q\xcaq\xf0}}\xd6\x8d]\xfc\x89\
+\x8f\x03\xecf:K\x81\x03\x0c\xaas\x7f\xe4\xd7\x1e~\
+\xa7\xb1k\xf6/\xbf3\xb0^Wq5\xb5\x8c\xd0\xc8\
+\xaf\xf9=\x12\xbfj\x96r\xd0aq\x8f\xb1\xca\x97\xb7\
+\xd78\xbfH\x86\xac\x06\xfa\x9ad\xaa\x5c\x1b|r\x5c\
+\xc6\xa0\xafM\x1f\xa0\xde\x87\xbdQu\x9b\x07\xac\xf2\x87\
+\xe4\x22\x95g\x8f\xafL\x9f\xe5\x98\xa3\xe4\x83\xf1\x8f5\
+nQ\xee\x8am\x1b\xf1\xed\xa5\xbf\xa2\xce\xaf\x94\x06\x11\
+\x19\x91\x1dR\xa5r\x0c\xab\x06\xec\xc2jz=\xa5\xf7\
+r\x9d/\xb7R\xf9\x7fU\xb2SFD\xa4AV\xe8\
+\x5c\x7f\xe7\x93c\x13#\x9e\xd2\x87\xb89\x9e\xea_a\
+9\x9d\xcem\x94\x1b=\xdc\x02N\xa9\xf3\x19R'\xe5\
+v\xfe\xa3\x81WX\xc0\xff:J\xde\xc5\xbc@\xee\x0f\
+5\xaf\x5c\xea\xb4\xd3$4\xf9x\x9b\xb7\xb8\x86YZ\
+\x05\x9f\x8c\xb5\xfa\x99\xbc\xa9\xb2Ed\x9d\xac\x97:]\
+L\x0bE\x1e\xfe\x95\x01\xeaz\xd3\xc7\x0b\xb0\xe3\x19\x8b\
+\xf9L(\xaf\x88#\xbe\xe5\x9f\xe5*\x0f\xb7\x983\xea\
+\xfcT\xb9C\xd6I\x85\xe6\xbf\x11\xab\xc9_\xa1\xb2\x5c\
+ovU\xc3\xf2\xf7\xba\x98\xbf\xf1\xc9\xb1\xc6\xa7I\xbf\
+\xce\xe4(\xd7y\xc3&Z8\xa6p\xc8S~\x0f\xab\
+}\x98w\xa9\xf3_\x95\xb3f\x17\xfb9\x9d\xe7\xd3\xb1\
+)\xe0Q\xe5\xda\x0cXfgD\xea\xc3\x9cU\x98\xc9\
+\xd3\x8ev\xb0/\xea\xe8\xbe\x80\xb3\x16\xfb\x5c\xd4\xb1]\
+>\xfb\x1d\xcd\xf9)f\xf8\xf2LG{\x89\x8cX\xb2\
+\xf7k\xb7\xe9{\xb1)\xc0,\xe4o\x1d\xae\xc7#\xba\
+a\x07\xa1\x84\xa7m\x8fJ\xb4\xb1\xfd_9\xee\xe7\xe5\
+Q\xd8\xd9f\xf4H\x10\x9e\xa2$\x90\xf7'?\xb7\xec\
+\xae\x90\x9b\xe7\xf7T\xe4\x18;g\x5c\xc3\xfa\x15|g\
+{t\xf7L5\x9f\x89R\xa5%!\xbf\xbcXe{\
+\xa0\xde\xa7'\x90\x17\xb7\xec~\x0a0\xdd\xb2\xfd\x0e\xef\
+\xe17*\xd1L0\xec\x01\xce;\xc7T\x01\xf6\xd2\xc2\
+\xc2\xa8\xa6\xec\xf6!\x85m\x80\xe1#\xbb\x9f\x02\xf6\x1b\
+\xbb7\xf87\xeb\xd0\xb3\xbc\xa0\x92\xfb\x08F\x8e-\xbd\
+:\xc0\x07P\xf8D\x1c\x0a\x888|\x840\x05\x98\xb2\
+?\xcf/\xacC\xdf\xd5Om\x98\xec6\x14\xd3\xa6\x9e\
+\xb7\xcf\xca\x16yB\xd6i\xcfn\x90\xa9!9\x1fs\
+<\xd7\xf7\x840K]\xce\xca\x08\xa5!\xec{\x1c\xdc\
+\xc7B\x98\xd3\x95\x03\x97)\xeb\xe4\x09\xd9*\xd7\xe8|\
+g|\xba\xf0\x00|\xc9\xb7\xdf\x15\x84\x07C\xf3\xfd\xc4\
+\xc1=\x12\xc2\x5c\xee)yy\x08\xdb\xe9\x07\xfc$T\
+\x86\xcd\x81\xb2o\x88\xb5\xfa\x00\xff\xe1[\xc4\xaf\xc8\x0a\
+\xcd\xe5\x8e\xdc\x057\xec\x07\x0cF\xad\xd4*\xee\x03\x81\
+\xdc%\xaeR\x7f\x1e*C\x16;|e\xff\x81?=\
+\xc87\xfa\x1a\xf7\xd2\xef9\xba\x9b\x91\xd0\x8b\xbb\x9f\xce\
+`Cx\x99\xaa\x9be\x0a\x82\x95\xb5\xd1\xf5;\x870\
+\x8c\xf8\x8c(\xfb\xf8\x06w\x137j\xf8\x16\xbf\xa5\xc5\
+\xa6\xc5\xee\x80\xa8\xad\xc2v\x97\xd6;\x03\x1d\x9c&\x83\
+\xb1Y\x07\xc3\x82B\x1b\x05*$fm\xdbCe\xa8\
+\xa5\xdb\xc6=\xcdo\xf9\x165\xf1W\xde\x8e\x13\xb6\x02\
+w\x852\xcd\xe8\xed\xe5\x9a\xbf\xce\x97W\xa5\xce\xef\x91\
+\x975\xb7\xda\x97{\x9b:o\x95\xba3L\x04\xe5\xc6\
+!\x08\x0d\xd1+\x17\xcb\xf0\xe0\xb0-}\x0d_\x08a\
+\x9a\x8ds\x19\x8b\xd4\x11\xff\x87\xc0l\xee\x19\xd4\xb3\x84\
+\x0cu\xb4\xde\x97k\x96\xb0\x90+\x5cW\xf1\xc5\xed\xac\
+\x09\x90|\x8c\x14\x00\xdf\x0f\x09C\xe5\xaa\xddzu\xe4\
+\xd3\xcc\x0cV\xc0l\xca)\xd3\xc1}?+0\x9dO\
+\x19\x89\x8d\xda\xc0\x04\xfb\x01\x15.o\x7f\x8c\x14p\xc8\
+\xf1\xebB~\x18\xc8\xccQ\xbb\xdbU2C\xeb\xc2\xab\
+\x80%\xcez\xfb)`\x83!a6\xeb\xf4\x8d\x0fn\
+\x01?v9_\x87\x88\x8a\xd8Z\x803\xa2v\xb3O\
+\xb0\xdb@\xae\x92\xb0R\xbbn\x1b|\xaeQ\x1f\xa3\x02\
+2\xb8\xddH\xac\xa1Z\xd7;\xa8\x05\xacv\xcd\x12D\
+\x1ff\xc7\xa8\x80N\x1a]G\xfe\x93r_f\x8e\x96\
+\xd0z\xf8\xa7\xa9Fla\xba\x8a\x15\xbb\x14\x10a\x9a\
+\x8bi=@w\xda\xeb\xed\xdf\x02J=!\xf5\x93|\
+46\x0a\xb0\x9a\x92e\xae\xaa\x03F\xd69zw\x8d\
+\xee{\xdc\xfd\xb8\xd9\xf5gq1\x00\x97h\xef\xca\xdd\
+\x06L-\xd6\xb0\xca\xae\x00\xff\x16\xf0(S\x5cR\xc6\
+`\x01bU\xc0aUo\xcbm\xb9\xd3w\xb8\x9b\xab\
+w\xd9\xaa\xf5\xc2\x0d\xae\xf6b:A\x0b\xcd\x88\xd9$\
+\x16\xf8+\xa0\x94\xcf\x1b\x89\xf5dC\xb8\x0dX\xae\x1c\
+\xdd\x8b\xf5TD\x0c\x16 N\x05\xb4\xb0Y_\xfd\xbf\
+)\xf6\xf0r\xec\xbb/\xaa{\x91\xcf\xad\x0e\x96\xc3\x04\
+:RN\x05\xdc\xa6\x06\xf2w8\xeb\xedU\xc0$\x1e\
+7.\x96\xcd\xc3\xb4\xba\xa4\x1e\x1b\x05\x98fpD\xbb\
+\xec\xd3\xf8\xb6\x87g\x19A\x80\xb9:\xccc\xf7\x062\
+\xb94P\x01\x9fp\xc8c\xe6\xba\xc2\x5c\x08\x10b\x04\
+\x1fQ\xb6\xe2\x9b\x8c\xaac1\x99\xc0\xd8az\x83\x0f\
+\xc9\xb0,\xd4C\xd8+],s\x18\xfd\xb4\x19\x8az\
+\x5c\xfbd\x8b-\xce|u\xec\xb0\x15\xb2:\xa4y:\
+8~\x91:\xb6\xc5d=\xa58\xad\xae\xab^\xae\x86\
+\xd6\xf3dP\x1e\x8c\xc3\x0b4\xeeGl0\x9f\xa7\xc3\
+\xe4\xb2U\x19\xadL\xb6\xb8|}G\x0b\x80[\xf5\x00\
+\xfc\x0e\x8bc\xde\xee|=\xbf\xc7\x22\x1d\xde\xd7\xcd\xe2\
+\x8b\xc6n\x925\xa3\x11\xd0\x02\xf2\xd8j\xd4\x22\x93-\
+\xe4\xebv\x1f\x93\x05\x88]\x01\x87\xf5n)_WG\
+\xe7\xf2/\x0e\x96\xad\x1b\x04(b\xad:\xb3\xde\x8a\xc7\
+\x99U\x5cl\xabG\x8ev\x9d\x95\x02r\xb9\xcdH\xdc\
+d\x99\x9a\x80n\xf0A\xb5T\xe6\x1b\x5c\x81\xed\xc1\x8f\
+\xc9\x02\xc4\x8e\xabU\x83l\x11\x91~\xbdD\xe1\x9c#\
+\xb4u\xce8\xba\xcbj\xdc\xaf\xe8\xc6\xad\x9c\xa7\xdfc\
+\xc6\xed\xed\xf8\x8ab\xbdf\xb2\xd6\xaa|\xafZ\x9c\x97\
+\x14\xe7\xac\xed\x8a\x17\xab\xe0\xfa\x0c\xe9\x15\x913\xfaz\
+1\xce\x01\xc4\x8ar5\xe1dTn\xbf\x9e\xa0z\xd3\
+\xba5\x19\xea\xe2{-\xa1G\xb5\xaav\x9awo\xc0\
+\xf8\xfd\x84C\x01?\xd3!7\xe3\xfe\x9a\xe3\xca\x992\
+jq\xf6(\xce\xa8\xd5\xd5g\xab\xe59\x19\xb2\xc7\xa9\
+\xa4Q.\x18[\x05\xd8\xcc\xa0\x81/k]\xff\x93\xc9\
+\xc8\xf5\xde5\x91\x7f\xd5me2p\xa9\xe2\xbc\xedP\
+\xc0[\xba\xb4K\x80j\xd5\x96\xec\x0bil\xadI=\
+\x04\xff\xac\x8e\xdcer\xe25\x81\xf1\xe0Y\xa3\xe8\xcf\
+\x9b\x97\xea\xd63\x86\xc3\xa6=+R\xe2\xbcf\x13\xbb\
+Y\xb2\x14\xef\x1f\xb0\xa6\xae\x8am37\xc6\xccS\x89\
+b}\x19\xf8\xa6\x91\xce\x94\xf7m\x9c\xdfi\x05\x18\x1e\
+\xd4<5\xcd>Y:M\x8e5\x0d\xb6-\xd6j\xc5\
+\xbeB\xe4\xb0cG\x89\x0e\xce\xaa\x8e\xc1\xd7S\x99\xc2\
+J\x95\xbc\x93\x0ce\xe4\xea]\x17\xce\xe4\x12\x95\x5c\x02\
+j\x04\xb9\x8a:\x1b'\xc7\x99\xccd\xab\xea<~L\
+\x99S\xc817\x81\xe02\x83\x06n\xd3\xf7\xe4^l\
+q\x9e#\x8e\xbb\xfb\xacf-S\xf3\xce\xf7\x8b\x1b\xf7\
+)\xce\x1f\xb9R\xf1\x7f\xe1`\xbc\xa9\xcb\xa9\x046\xa9\
+__\xb0\x18\xe3g\x02\xc1c\x06ED:\xf4R\x88\
+~fS\xab.\x7f\xd4!\xf8\xb0D\x14\xeb\x19\xf5l\
+?\xebQ\xc06\xc59\xcf6#u\xa1m\xcd\x89\x88\
+\xc8\xdb\xbazS\x98A\x9f\x91\xae\x906o?1\x0e\
+&\x10\xa0\xc1i\x06\x1db\x0b\xfb\x98\xa9\xd2\xc7]\x95\
+\xbb[\x0bf\xa6\x1a<\x0ah\xd0%\x99\xac\xbb]\x8c\
+\xe3\x9a1S-\xb6\xb3/\x9e\x13yh\x1cM x\
+\xcc\xa0\x81\x1b\xb4X\xdfS\xa9\xf7]\xa2\x1f\xd1\x1c\xf3\
+\xae\xf9!\xe2b\xbd\xe1:\xdf\xe4s\xa5\xd5\x0eF\xfc\
+&0>\x98\x93\x19u\x8e\x8b\x9e\xd6\x8bb\xac\xc9\xae\
+\x16O\xe5\xea\x1dU[\xe5\xab\x80U\x0eN\xbd\xe7|\
+\x8b>k^\xa9\x5cN;\x18V\xbf\xf4@\xec\x95\x8a\
+g\x9d\xa0iYOq\xc6v\xb0F\xc7F\xac\xb2\xbc\
+\xc3\xb5\x0d\x8e_\xfeK\xb6\x9ccao8\xd9\xd6\x0b\
+\x98W\xfawG\xc0\xbfU/\xd5\x8bq\x1c\x10/|\
+\xcc\xa0\x81\xcf\xb8\x1ao\x8f\xe7\xeeuJ\x81\xed\xfcN\
+\xdf\x16\xb0\xc3\xc6\xc8\x97\x8f<\xe7\xbb]WYn\xf3\
+\x12E\x125\x81\xf1\xb4\x80NN\x1a\x09w'\xeb\x8e\
+\x8dx[@\x19\x9f\xb3\xfd\xf2\x9f\x00\xb0\xb7\x80\xeb}\
+\x82\x8e\xceR\xad\x18\x88\x05K\xaa\x13\xb1\xc4\x02\x15\xa2\
+-dq\xe2\xb0\x11xp+`\x1a\x9b\xf5\x08\xd1\xb7\
+\xd0s\xac\xe5\x7f\xcct1\xcf1@\x1f0L?\x90\
+K?\x05\x94\x00\x85\x0c\x98\x9cy\x1c\xa0\x9cR\xcal\
+\x8b:\x9c\x83\xc0\x87=\x13\x0e\x7f\xf0$\xc6\x1e\xbef\
+PDdD\x96YM3C\xbe*\xd7J\xbd\xcc\x96\
+\x1a)\x97B\xc9\xb1\xaf\xec\x8b{\xcb\x94<)\x91*\
+\x99-KlG\x97\xb9\x5c\xe9DM \xaeV\x14\x0d\
+W\xab\xa5\xa9\xadf\xe8\xf1\x1d\xf6\xf3:o\xd3J\xbb\
+\xcfd\xf2x\x22\x9f2&3\x8bO\xb2\x8c\x05\x14\xd1\
+\xa6'\xacV\xb0w\xbc\x14p\x01\x1dF\x8eK\xe9\xa2\
+\x8d~\x12X\x83<.(\x22\xa2\x0c\x94P\x11\x8f\x0d\
+\x88O\x01p\x92\xe9c#r\x19\x19\xc0$\xa0\x1f\x10\
+\x9fe\xe5\x09\xa21`\x05a\x00\xe23\x82\xd0\x1d\x9d\
+\x92E5\xb5Ts\x01e\x94:\xfe\xca\x81\xac\x90E\
+~\xd0\xc3\x08\xd0I\x17\xddt\xd1m\xfe\xef\xe2#Z\
+h\xa65\xca\xfa\x8cX%LF\x01\xcd\xb6\xf8\xae\x89\
+\x08\xf3\x98A\x1d\xd5\xd4QC-UQ\xd6\xd1\x84\xc1\
+PNy\xc0\xd9\x11Zi\xa6\x85S\xb4\xd0\xccI\xde\
+\xa1\xddK:E\x5c\x88W\x01;\xb9\xd6H\x5c\xcf|\
+>\xc6\xc7\x98\x1b(\xee\xd8#\x8b\xc9\xae\x05\xc8\x9d\xbc\
+\xcb;\x1c\xe3(\xbfR\x87v\x8c\xaf\x0cKUG\xb4\
+]\xfe\x9c\xf0K\xddEF[r\x99$2Tl\xb0\
+F\x1aS]k\x0b'\xa5ZU\xffx\xbcf=\xde\
+\x97\xa6\x84\x1f\x19\x89\x16V\xe8W\x9dR\x8a\x0fX\xa9\
+\x87g?\x1a\xff\x9e9\x9b\xc3\xaa\xb9\xcd\x91\xe6T\xdf\
+|i\x969\xba\xf9\xbf\x9e\x84\xfd\x8d\x03\xd3\xd4\xbb\x82\
+\xc8\x1c[@*\x15h\xb3W\xffT\xe82\xde\x00\xc4\
+\xeb\x08\x19\x98\xcf>\xb5\xa8\xedS\x9e\xd7\xfe?\xa4\x95\
+vZ\xe8\xa6\x8b\x01\x06\xe9\xa6\x9f!\xba\xe9\xe7,\x98\
+\xff\x01\x06\x192S\xf9\xd6\x14c\x1e\x85@.\x93(\
+\xa5\x80B\xf3\x7f\x19eTSI%\x17:\xaet\x9e\
+\x15\xbc\xa2~\x9ca9G'J\x01\x0e\x15\xfc#+\
+9\xca\xbb\xbc\xcbi\xdah\xe3\x5c\x82E\xc6\x82\x5c\x22\
+T1\x999\xcce>/\xeb\x19\xfa\x04\xab\x9f\x0c\x16\
+\xd0\x95\xf8\x18o\x8c\xb7\xce\xd4|K`M\xca+\xae\
+\xb6\xeb\x12\xafD\xa2\x8f\x80\x81\x83\xc1nG\x09\x15\x94\
+S@>\xe5\x14P@\x19\x05\xe4\x03\x85V\x88C\xa7\
+\x86\xad@\x88\x91\x1ab\x90.\x06\x19\xa4\x93!\x06\xe9\
+\xa4#\xe4-\x19\x0e\xb24U\x0a\xa8\xe7u\xa3\x84\x0c\
+\x96\xb2\x88\xa9L&B%5D\x02\xbe\x9f\x918\x86\
+h\xe74\xed\xb4\xd1B\x13G8\xa8:|a\xc9x\
+L\x84\xc5\x8a\xfbT3\x5c7\xa1\xdd\xdf\xad\xba\xf9o\
+J\xbe\x12\xc9\xc1|=\xa1P\xfa'\xac\xfa\xfd:\xc6\
+\xfcB\xf2\x15H\x16\xf3\xd4\xbd86a\x0a8\xaa\xef\
+\xff\xdcd\xc5O\xfe\x03\x0a\xe3\xd9\xedO\xc0\xd5\xe3\x8d\
+\x07xa\xf6\xc0\x99\x8e\xb9\xfca\xda8C+\xed\xb4\
+\xd1K\x1f}\xf4\xd0M\x1f}\xf4\x01\xd0k~\x8d\xa1\
+\x9f\x0cs5d\xb69\xb7PD\x11E\x94RB\x11\
+E\x94\x10!B\x155Dl\x01\xf2:2\x94\x09\x5c\
+\xa0B\x81\xa9S\x80\xb9Hj*/\xd2@\x03\xc79\
+\xc3\x99\xb8\x22|\xc3\xe6\xbe=\x0a\xaf\x8cjj\x98\xc5\
+,fQ\xab\x02?\xf5\xbc\x94t\x0d\x92\xc4\xde\x94\xba\
+@q\x04\xc0\xc7\x077\xfb|\xada\x22\xb7\x91d\xbf\
+$\x94\x9c#t#\xdb\xc2\xcch6\x95D(\xa5\x88\
+\x22\xca(6\x9fj\x80b\xf3\xd9Saq8O/\
+\x00=\xf4\xd1G/]\xf4\xd1K\x0f\xed\xb4\x05|\xbd\
+\xc5\xc4\x087\x05\xbc\xd2?\xee\x0aX\xc4\x01\xbb\xc3\x97\
+\xc7Lf3\x8biTRC%\x911\xfb\xee]\x1b\
+\xed\xb4\xd2B;M\x1c\xa7\x81\x13\x96\xdd\x00`\x90\xcb\
+\xf8\xbf1\xbaT\x1c\xc8T\x1f\xc5B\x16\xcb\x0ei\xf2\
+\x99\xad\x1b/\x8cH\x93\xec\x90E\xfaAx-\xc9\x96\
+\x9c\x10\xac\xb1\xe0j9?aU\xb7\xe3\x9c\x5c7&\
+\xe3\xc1D\xf1\xbcq\xe9*\x9f\xa5\x0c\x13\x85\x0f\xa5R\
+)`{\xa2\xd5H\xd4\x13\xccR_p\xf9\xfa\x04N\
+\x8c\xb8q\x01_S\xc9\xab\x12\x0d\x87&\xaa\x80\xe5j\
+q\xe6\xea\x04\x0b\x18\x1bX\xaf\x89\x96{\xdeM\x8b\x11\
+\x89\x19\x8fB\xde2f\x89\xf3\x18H\xe97\x0dG)\
+T=\xc2\x09.\xd2\x1f%\x8b\x1d\x89I\xbfQM\x92\
+\xafM\xf1'\x1d3\xf5+\x193}\xdfQ\x1d'\xec\
+6L\xcfB\xe9M\x99\x01T\xe8\x95\xf9\xca\x10\xeeJ\
+\xa4*\x89\xdd@\xd3\xee\xdd\x11\xfbG9\xc6\x0dE\xfa\
+\xfd\xc4\x84\xacqb\x0a0?v\xf0\xd3\xc0\xcf\xf9M\
+\x1c:y\xd2%U|Hl8\xfc\x8a\xf1U\xb9\xa3\
+,e=\xd3\x99\xc1\x0cj&\xd4\x19\x13N\xd3\xc8I\
+\x1ay\x92\xf7\xd4\xc1W\x13))1\xa9\xf3x\xc7\xbd\
+V(\x8fiL\xa7\x86\x0a\xaa\x88PA\x84J*\xa3\
+|N.6\xf4\xd1N+\x1dt\x98\xfb\x16\x1air\
+\x8e\x06\x00\x1a\x99\xe7=8^\x0a\x80\x8by5t\xb1\
+\x8f\x85r\x0a)\xa4\x84b\x0a(\xa2\xd4|\xe6\xd4\xe3\
+Z\x0c\xe6(P}\x1ds\x94n\xfa\x18\xa0\x8f\x1e\x06\
+\x18\x88\xf5!\xeb\xe6\xafC\xber6.X\xcc\xf1\x94\
+\xcf\x08\xa9\xed=\xfd\xe2a\xbcH|>\xbd\x95\xc7\xe9\
+f\x80as\xca'\x15\xe8\xe6\x18\x07\xd8\xca\xc6\xc4\xd7\
+j\x8c\x8d\xe5*g\xba\xb9\x19& BE\x94\xaf\xfd\
+\xc4\x8fs\xb4\xd3A\x1bmt\xd0hnc\xd0\x09\x8d\
+\x9f\xe9.\xa7\x92\x0a&QJ\x11\x05\x14SB!\x85\
+\xd6\xc3\xaf\xf6E`\x06\x8a\xf5'r;\x19`\x80\x1e\
+z\x19\xa4\x8fn\xfa\xe9\xa0\xed\xcf\xa0\xc7M#\x8d4\
+\xd2H#\x8d4\xd2H#\x8d4\xd2H\xe3/\x06\xff\
+\x0f\x13\xe1\x1a#\xc9\xcaw\xb8\x00\x00\x00%tEX\
+tdate:create\x00201\
+8-07-26T19:59:29\
++02:00\xe4\xc5\xed\x94\x00\x00\x00%tE\
+Xtdate:modify\x0020\
+18-07-26T19:59:2\
+9+02:00\x95\x98U(\x00\x00\x00\x19t\
+EXtSoftware\x00www.\
+inkscape.org\x9b\xee<\x1a\
+\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x0cs\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x04\x00\x00\x00i7\xa9@\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\
+\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x02\
+bKGD\x00\x00\xaa\x8d#2\x00\x00\x00\x09pH\
+Ys\x00\x00\x0d\xd7\x00\x00\x0d\xd7\x01B(\x9bx\x00\
+\x00\x0bTIDATx\xda\xed\x9c{t\x14\xd5\x1d\
+\xc7?$\x90\x04\x88\x84$\x04HP\x93\xf0\x8a\xb1\x07\
+)\x98`\xb1\xc1#\x825\x82Z\x1fT\x81\xfa\xc2G\
+\xb5\xa8T\x0fZ\xa9\xc7Vj\xab\xa7\xb6\x1e\xab\xd6\x17\
+\x87c\xeb\x03\xf5T\xaaR*G\x11\xa8RB)\x04\
+QH\xc2#\x90\xb0\x11I\x80\x90\x17y\xbf\xf6\xd7?\
+v\xe7\xb1\xc9\xeef\xb3sw\x17u\xbe\xf3\xc7\xdc\xb9\
+s\x1f\xbf\xdf\xf7\xfef\xe6w\x7fsg\xc0\x86\x0d\x1b\
+6l\xd8\xb0a\xc3\x86\x0d\x1b6l\xd8\x087b\x88\
+\x89\xb4\x08\x91\xc4\x9d4\xd1\xc4\x9d\x91\x16#R\x88\xa7\
+\x15Ah%>rBDE\x90\x80\x91\xc4\x01\x10\xc7\
+\xc8\xef&\x01\xa7\x05\xbe\xf3\x04\x0c\x0cs\x7f\xb1\xcc!\
+\xc5\x9d\x1e\xa1\xe7\xce\xe7$\x00B\x15\x1bh\x8f4)\
+\xa1C\x14\x05H\x1f[\xc1\xb7\xd9*\xa7\xf4\xa9\xbe \
+L\x09\xa7H\xe1e\xbb\x92\x8e>\xcbtP\x19N\x91\
+\xa2\xc3J@3\xfb\xc8\xa2\x85:\xea\xa8\xa3\x89\x04w\
+\xfe\x11j\xdcy_\xf1\x0b\x0a\xc3*S\x041V7\
+\xfa\xb1\x91\x13\xe2[|\xc3\xb1\x09\xb0\x09\xb0\x09\xb0\x09\
+\xb0\x098\x8d\x91\xc3j\xfd1\xf8.\xe7GZ\x9c\xf0\
+b<\x1b{9\xc0\x1b\x18\x17i\xb1\xc2\x85\xab\xa8\xf7\
+:\x07\xa8\xe3\x8aH\x8b\x16\x0e\x5cI\xa7\xcfiP\x17\
+\xd7FZ\xbcPc*-\x9a\xba\x09\xb2T\xd6\xc8\x1a\
+Y*\xc3\x0c\x0aZ\xc2;\x17\x0c7\x86\xb2_Su\
+\xb6\x9c\x10\x0d'd\x96A\xc1>\x86DZ\xcc\xd0\xe1\
+IC\xfd61\xa3C.7(\xf8]\xa4\xc5\x0c\x15\
+F\xbb\xc3\xe02N\x1a\xa4'\x1a$\xd3\xb8\x0cFG\
+Z\xd4\xd0\xe0qm\x8c?\x15o\xd8h\xd8\xc0\xe3\x91\
+\x165\x14\x18\xc0!\x97zs\xc5\x17\xe6h\x04\x1cb\
+@\xa4\xc5U\x8f\xa9\xda\xf8~\xe2\x93\x80O\x0c\x1b\xf8\
+~\xb8\xc4\x0a>,>\x90\x1fp1i\xa41\x92\x81\
+\xd4SO5\xc5\xecd\xb7\x8f\xb8\xdf9\xae]\x02\x97\
+\xf8lr&g\xd0\xa8\x95\xfe\xb2\xd7\xe9!L!\x97\
+l\x92\x18\xcep:\xa9\xe68Ulg\x8bV)|\
+\xa4]\xc7\xfb4\xf8pf\xda\xd9\xcc\xbd^nc\x8f\
+\xb8\xceO\x11\x7f\x98\xac\xb5\xb2\xcc\xa3n\x06\x0f\xb3\xd3\
+\xa7\x03\xd5\xc96\x1e1\xbde\x08)\x06\xb0\x90\xc3\x01\
+\x84\xb6\xbb\xd8\xc45\x1esM\xf7-\xf0b\xbf\x04\xcc\
+\xd0\xea/\xd7\xc9\xbe\x99m8\x03\xe8\xb1\x85W\xc8\x0a\
+\xb5\xfag\xb1)\xa0\xc8\xbe\xb6\x95p\x93~\x91=\xea\
+\xca\x9b\xee\x97\x80if\x0b\x18\xc4\x22\x0e\xf6\xab\xbf.\
+\x9e\xd7#\xcd\x01\x8fh\xe0\xc8c\x0d\xc9\xe6\x8c1\x5c\
+@\x1a)\xc4PO=\x87)\xa4\xaew\xadR\x16\xb3\
+\x09X\xc2s\x00\xe38\xe4\xa7\x8bL\x1c\xae\xc4\xbd\x14\
+\xb1\x92\x89=\xcf\x8f&\x873I \x91v\xaa9A\
+\x11\xfbz\x16\xa9`>\xffS=\xf2\x00\xf9\x9a\x1b\x83\
+ \x99\xf2\x07)\xee5~N)\x95\x15r\x89D\xf7\
+\x1c\x997\x19\xc9\x95\xaet\xb4\xb4\xfb\x1c\xff6\xa3\xe6\
+\xbf<\xcd>V\xae\x92U\xf2\x95\x97:\x95\xf2\x96\x5c\
+&\x03\xcc\xbdu\xb0H\xbd\xfay\xe6I\xccK\xd2\xe9\
+\xd7\x90\x8f\xc9\x9f$\xcd\x93\x82\x1a\xee\xd1\xd2\xbb}\xd6\
+\xfb\xc2\xabag\xca\xcbR'\xfeQ,\x8b$\xca\xa8\
+\xe3\xe4!\xb5\xea\xa7R\xa55\x9e#\x15\x12\x08\xda\xe4\
+e\xc90+\xe2\xa4\xdd\x95z\xd9g\x9d\xbf\xf4R~\
+\xac\xfcU:\x02\xeaOd\x87d\x9b\xeb\xde\xa3\x92\x80\
+\x8f\xb4fgIS\x80\xe2\x88\x88\xb4\xca\xa3\x12\xd3K\
+\xa9\x85>\xcb\xdf\xe0Q.Z\x1e\x92\x96~\xf4&\xd2\
+dn\xa1\x9b\xcbU\xa9\xbfPktj\xbf\xd4wa\
+\xaf\xf1hso#\xa4\xcbk\xc9N\x893\x95:W\
+v\xf4\xbb/\x11\xa7\xdcg\xb4QG\xa6\x0a\xf5cp\
+\xb8\x1a\x1c&\xe5A\x88$\xd2%\xcb<oRR\xe0\
+\xb5\xdc\xcfM%.\xf72_\x0c\x94\x82\xdb\x8dv>\
+S\x11\xf5\xbe[k\xee\x85 E\x12\x11\xf9@\x12L\
+\xea\xfd\xd4K\x89\x95\xa6\xf3K|\xd8H`\xe80\xdb\
+\xdc\x1dV\xd5\x8f\xd6\x5c\x91\x89\x96\x84\x12)\x96T]\
+\xac(9\xd2\xe3\xec\x7fe\xa0~\xf6QK\xfd\x88\x88\
+\x1c\x95D\xad\xb5\xfdV\xe7\x95s4\xb1\xde\xb0,V\
+\xa9\x9c\xad+\x99%\xad\xa63u\xa6\xe7\xc5\x12\xcb\xfd\
+\x88x\xd8\xd3,k\x04\xbc\xe9j\xe6\xcc\x80\x1fF\xfe\
+\xe0\x90\xb1\xba`\x0b\xc4\xa9\xe7\xcf\xd3so4\xe5Z\
+A\xbb\xe1\x87\xac\xb0F\xc01W3\xbfR\x22\x96\xc8\
+~\xc38\xe5\x19w\xde\x1bz\xce\xf7\xa4YQ?\x22\
+\x0fh\xad:\xac\xa8?F\x13m\xab2\xc1\xfe-\x83\
+\xdcm\xc6\xc9^\x11i\x961\xee\xe3\xc1R\xa4\xac\x17\
+\x91\x0d\xc6E`!\xc2\xa8\xfb\xef\xeaF\xc6|}\xe6\
+H\xa7\xfcV?\xb2\xf2\x94\xe9\x8d:\x83\x80\x19\xc1\x13\
+\xf0K\xcd4\xd5\xe2z]\xb8{$\xde\x9d\x9al\xf1\
+)\xd3\x1b\xfa\x83\xf7z\x7f*\xfaw\x14\x06\xb9v\x89\
+V.#/xI\xb7\xca\x17ir\xa7\x9eV\xbe`\
+M\x7f\xbf2(x\x02\x06x\xec\x94!\x99\x95=r\
+\xe62[q\x1f\xd0\xac%\xfc\xaeM\xf4O\x80\xb8v\
+M\xa8\xc6\x15\x5c\xe7q\xbc,\xc8v|\xe3$\xa7\xb4\
+\xe4\xb1\xe0\x098\xe8\xda\xed\xa3K\xb9\x80O\x98\x02\xd2\
+\xe7\x92\xa7\xbc\xfd\x02-\xe1\xa4(x\x02\xdcU\xdbz\
+\x07\x9e,#\x8b\xdb\xf4\xf4]\xca[\x87\xcdZ\xa2\x98\
+\xfa\xe0\x09(\xd5.\xa4\x7f\x84@\xc4%zJ\xd9\xc4\
+]G\x1boi\xc9-\xfeK\xfa'\xa0\x9b\xb5\xae\xc4\
+\xdb8\x95\x0b9XO\xa9_\xb0\xfc.\xd5Z\xb2\x8f\
+\xb1\xebk\xbe\xfc\xb6kw\x88\xd5\xca\x85\x0c\x1d:x\
+BK\x96\x18\xd7Bp\x04\xac\xd7\x16\xaf\xff\x9a\xceH\
+\xeb\x150\xfeH\xa9\x96|^{\x92\x05\x8f\xc5\x9a\xd7\
+\xf6\x98bO\xadL\xf7\x07\xcb\x94\xb6[$C\xb4\x96\
+\x0f\xa8\xf8,s\x10e\xae\xe6\x06\xca\xf6o\x00\x01\xa7\
+$\xcb\x98\x05\xe4\xf7\xad^\xdf1\xb3N\xees\x99Q\
+\x17\xd7q\xd4:\xa1!E77q@;x\x8f\x8f\
+U\xb5\xbb\xc2\x88\x0b\x07\x1b\xac\x0c\x87\x058\xe5\x0ec\
+\xf4\xcbUNa\xe2)\xd1\x1a\x9e\xae\x8c\x02\xd5\x048\
+\xe5~C\xfdV\xd5\x8bo39\xa15>M\x8e[\
+\x12\xb4E\xbe\x962)\x93u\xba\xb8[\xa5\xd1\xb2\xfa\
+\x9dr\xab\xf9\xa5\xc8\x82@\x15\x0b|\xa2w!\x9f0\
+\xd4\x95\x1c\xcb\x87d\x07X\xad\x83\xbd\x1c\xa0\x02\x07\x15\
+|M\x0d\xb5\xb4z-\x17K\x12I\xa4\x91N\x06\xe9\
+dq\xae\xd6Y@h`\x01\x1f\x19\x87\xf7\xf1\x82\xaa\
+\x917\xe3\x22\x1a5\x8e\xe3\xe5u\xbf\xe3\xd1%\x9f\xcb\
+\xb3\xb2P&\xe9\x01\xb0\xfenQ2A\xe6\xc9\x93\xb2\
+\xa5\xc7\x8aBo\xd8'\xe7\x185\x9d<\x1c\x0a\xe5]\
+\xc8\xa3\xd6\x10\xf1\x16\xaf/\xca\xca\xe5\xcf\x92/g\x04\
+\xa9\xb6\xb7-Nf\xc8\xef\xfd\xc4\x0bW\xc8P\xb3\xf1\
+\x87bfeB6\xe5\x86h\xe3e\xbdI\x902y\
+\xccX\xe3\x13\x82m\x9c,\xed\xf5j\xbdZ\xae6\x97\
+i\xee\x11f\x08\x00\xfd\x0f\xf6\xa4\xf0\x1as\x8c\xc3\xf9\
+<\xc5(\xde\xe7U>\xf59a\x1aL&\x19dp\
+\x16#I&\x89d\xe2\x80\x04\xa2\x80:\xa0\x93\x1aj\
+\xa8\xe1$Gp\xe0\xc0a\x043z!\x97\xdbX\xc8\
+0\x00\xde\xe5~\xaa\x8cSG\xf81_\x84v\xfc5\
+\xd2\x1e\xa4\xc3\xe0=FFx\x1d\xb1\x04\x99+\xbf\x91\
+\xd5R*\xdd\xfd\xbe\xa7;d\xad<!\xd7\xca(\xaf\
+-'\xcac\xb2Cf{\xe6\xae\xd5\xbfJ\x0f\x0b\xa6\
+Q\xea\xcbTc%_\x9e\x97/\x83P\xdb\x1b\xf6\xcb\
+J\x99\xa7\xc7\x8e}l\xcd\xdc\x1d\xfe\xb5\xa5q,7\
+\xdb\x81\xcb\x16\xae\x95\xbf+\xf4\x15\x0d\xb4\xca:Y\xe4\
+\x8b\x86\xcf\xb5E\x98\xe1\xc7;\x86\x18\x13\xe5i\x8b\x0e\
+R\xdf8%+%\xd7S\xf9\x06\xee\xb7\xf6\x13\x08k\
+\x86\xf3\x88+\xf2\x10\xcb\xeb\xfc$\xc0\xb5\x08\xdd\xd4\xd0\
+D#]@=\xc3\x88\x22\x8a\x04\x86\x90\x14\xf0\xccu\
+#\x0b\xdc?\x9c\xa0\x88\xcb\xccw\xc1``\xed\x17\x1a\
+\xee\x9bu&7\xf8)\xb2\xc7\xed\x09:\xa8\xe4$\x0d\
+>K\x9eA\x12id\x90N\x06\xe3\x99\xecs\xed\xeb\
+l\xf2X\xe3Jn\xb6\xaa~\xc8\xfe!\xd2\xc6\x0e\xfe\
+\xc3N\xf6p8\xe0:\x8d4R\xc16\xfd8\x95\xf3\
+\xc8!\x8f\x0b\xdd\x0f\xbd\xd0@9\x01E\xac\xe5#v\
+*\xf8\x13J\x15U\xac\x07\xa2\x99\xcc\xa5\x5c\xcd\xb4\x90\
+|\xe6\xaa\x90\x80b^\xe3\x03\xca\x95\x8b\xd8\xcd.v\
+\xf1\x14\xa9\x5c\xc5M\xfc\xf0t$\xc0\xc9J^e\xbb\
+\xcf\xf3#\x18G:\xe9\x9cM\x0a#Hf\x98\xdb\x0b\
+L\xe4\x14\xdd@\x1dM\xd4R\xc3q\x8eR\x81\x83r\
+\xaf\x97v\x15+XA6\xb7\x07\xf0#\x920\x13P\
+\xc6\xcf\xbc\xe4\xa62\x83\xf3\x99\xccy\xa4\xfa\xac\xe9\xba\
+\xba{\x87nj\xd9\xcd\x1evQ\xd0\xcb\xa2\xf6\xf1\xa0\
+\xd2\xf7\x08J\x08\xe8\xf68\x8a'\x9f\xb9\xcc\xb0\xf4)\
+p\x123\x99\x09\xc0Q\xb6\xb0\x9e\x0f\xb5\x07\x9fg\x7f\
+\x11\xff\xb2\xe8\x19O\x9fl\x88\xdc\x22\xeb<\xd6\x7f\xa9\
+B\x97l\x96%\x92\xd4\xd3\x07\xdc\x14i\x02\xde4\x84\
+\x99\x22\xaf\x84\xc4\x096\xa3M\xde\x91\x99\x9eN\xb0e\
+X\xbb\x04\xf6\xbav\x83Y\xcd\x9c\x00\xed\xb1\x91\x1aj\
+\x11\xb7/\x08Q$\x00\xc3Ifx\x9fuc\x99\xcf\
+|\xb6q\x0d\xc7]\x19\xa5}V\x091\x01\xee\xaf\xb5\
+\xd2\x99\xeb\xb3\xc81\xf6\xb0\x1f\x07\x158\xa8\xa4\xc6\xcf\
+\x0b\xb6h\x92\x18M\x06\x99\xa43\x81Id\xf8(7\
+\x9d\xe9\x9a'x\x12\xcb\x08\x91'\xd8\xc0V\x0a(d\
+\xb7\xf1\x96\xb6OtSM\xb5i5C\x02\x938\x9f\
+\x8b\xc8\x0b\xe9\xff\x16\x15\x13\xe0\xa4\x905|LQ\x8f\
+'C0h\xa0\x80\x02\x9e\x03\xb2\xb8\x94\xab\xb9\xc8\xff\
+j\xa7\xc8\x13\xb0\x9d\xd7\xf8\xa7\xf5\xd9\x89\x17\x1c\xe0\x00\
+/\x90\xc8\x5cnf\x96b\x87X\x91\x1f\xf0,\xafR\
+\xec\xf3\xbc\xeb\xba\xce \x83d\xf7\x16\xe5\xf6\x05\xc1\x15\
+\x15\xac\xa1\x86Zj\xa8\xa0\x82\x0a\xca)\xf7\x12_\xac\
+c\x15\xab\xc8\xe0V\xdaN7\x02\xcax\xc0K\xee\x04\
+\xf2\xc8\xe1<&\xf5\xf1)_\x22\x90\xc8x\x8f\xbc\x16\
+J\xd8\xcd.\x0a(\xe9A\x85\x83\xe5Jm@\xd1\x5c\
+\xc0\x8cd\xae`\x0e3\xfc8\xc0}c\x08\xb9\xe4\x02\
+PG\x01\x1f\xb3\x96\xaf\xbd\xf5\x17\xf1\xbf =\xeb\xe9\
+\x99\x0d\x97\xc5\xf2\x99\xf2%\xaf\x22\x22N\xd9)\xcbz\
+~\x8a'|\x1ai\x02\x1e0\x84\x89\x96\x1f\xc9\xde\x10\
+{\x82\x95\xb2\xc0\xf3+\xb4m\xd6U\xb0\x86d\x8e\x9a\
+G$Z\xae\x97\x8d\x8a\xc2\xe1=\xb1]\xee\x92\xc1\x9e\
+\xe3\xef\xe4\xcaH\x13\x00cYG\x97\xa7a\x8e\x91\x07\
+\xa5P!\x0d%\xb2\x5c&\xf64~'[\xb9 \xd2\
+\xcak\xc8f]\xefh\xfdH\xb9QV\x05\xf8\x95\xa9\
+w\x1c\x97\xf7\xe5.I\xf7\xf6&`\xbb\xba\xc0\x90\xaa\
+\x19u\x0eK\x99\xe7\xed\x992\x9a\x5cr\xc9f\x02\xe3\
+\x03x\xe3\xdfN\x19\x079@!\x85Tx+ l\
+\xe0i6\xa8R_mH!\x83\xc5,d\x8c\xef\x02\
+i\xa42\x8a\x14R\x88a\x180\x8cS@3\xedT\
+SM5\x95\x1c\xf5\xb7\x22\xb5\x8e\xd5\xbc\xc8\x1e\x85\x12\
+\x87\x00Q\xcc\xe2o\xe6U\x04J\xb6f\xde\xe3\x1ab\
+C!ph\x82J\xd1\x5c@>\xf9L\xb5\x18\xbe\x13\
+JX\xcfz\xb6(\xf5~\xc3@\x80\x86\xa1Le\x1a\
+\xb9Lb\x5c?\xc6\xaf\x0b\x07%\xec\xa0\x90B\xffK\
+\xddO\x7f\x02\x0cDs6\x13Hg\x14)\x8c \x85\
+h\x12\x80x\x9a\x80&:\xa9\xe5\x04\xd5\x9c\xa4\x82\x83\
+\x1c\xfe\x06-K\xb6a\xc3\x86\x0d\x1b6l\xd8\xb0a\
+\xc3\x86\x8do&\xfe\x0f\xf5\xf6\xa1\xc5i\xb1X\xa8\x00\
+\x00\x00%tEXtdate:crea\
+te\x002018-07-26T19\
+:59:27+02:00\xb4\xfa\x96\xc9\
+\x00\x00\x00%tEXtdate:mod\
+ify\x002018-07-26T1\
+9:59:27+02:00\xc5\xa7.\
+u\x00\x00\x00\x19tEXtSoftwar\
+e\x00www.inkscape.o\
+rg\x9b\xee<\x1a\x00\x00\x00\x00IEND\xaeB\
+`\x82\
+\x00\x00\x05)\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x04\x00\x00\x00i7\xa9@\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\
+\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x02\
+bKGD\x00\x00\xaa\x8d#2\x00\x00\x00\x09pH\
+Ys\x00\x00\x0d\xd7\x00\x00\x0d\xd7\x01B(\x9bx\x00\
+\x00\x04\x0aIDATx\xda\xed\x9c\xc1K\x14Q\x1c\
+\xc7\xbf\x8a\xee\x86\xa4I\x06\xa2\x15\x89iJx)B\
+\x0f\x81\x07\xf1\x92\x06a`\xda\xd1\xed/\xf0\xd4E:\
+\x84\x81w+\xbc\x94\xc7\xb4\x0e\x9d\xa4\x83\x22\x11\xe4A\
+\xb4\x90\x0e&\x96H\x9bR`\xa1k\x876e_\x87\
+q\xda\xd5};;\xf3\xde\xbc\xf9M\xec\xef3\x87\x9d\
+y;\xbfy\xdf\xdfw\xdf{\xce\x1bg\x06`\x18\x86\
+a\x18\x86a\x18\x86a\x18\x86a\x18\x86a\x98\x82\xa1\
+H+\xf6\x16.\xe5\xf8n\x1e/!$\xe5\xd5\x18@\
+\xa5\xc31\xb71\x8e\xef\xd2\xbaz\xd0\x9a#\xe6=\x9e\
+K\xeb2\xce\x10\x84\xc32(\x89\x88b\xd51F@\
+`\x15QI\xe4\xa0c\xcc\x10E\xfa\xc0\x92\xa3\xa89\
+ID[\xde\xf4\x05\x04\xda$\x91s\x8e\x11K\xeaI\
+\x14k\x18\x10\xf1\xfcm\x14n\x90\xed\xe5\xbd.\x97\x94\
+h\x18p@\x13\xcefl\xad\xe3\x93\x8b\x98\x8e,\xe7\
+S\x98u\x11\xd7\x80\xba\x8c\xad8V\xf4\xe5k\xb0l\
+5\xc0Q\x91\xc9\x88\xdd,\x17$\x11\xedv\xa3M\x8a\
+\xa3$\xd3\x0d\xba]\x12\xb9`}7r(f\xd4\x8e\
+XVO\xc2\x87\x16\x90\x83\x16|\xce*;\xe6*\xf2\
+\x19~g\x95\x9d6%\xd3\x9c\x01Q\xd4+F\xd6\x1a\
+\xd3$Ag\x10\x94R\xe6b\x9f\x88\xc4\xf7\x12W#\
+\x99\x9b\xa3\x13\x1b\xd0\x83\xaa\xbc\xfb\xc4$\xd5\x16#\x96\
+7\xae\x0a=\xbe\x1b\xe0{\x178\x83\x0fx\x85}\x87\
+=j\xd1--\x7f\x8cnl:J\xbd\x86\x9a\xf0\x1b\
+\x00\xd4\xb8\xf8-e\x14\xe1\xba\xffb\xf2\xe2{\x17\xf8\
+\xdf`\x03\xa8\x05P\xa33\x1d\xfe\x88&\x008\x85\x0a\
+\x22\xf1\x09lY++hV=\x86\xce Xn}\
+l\xd92\xe8(W\x0f\xd5\xe9\x02\xbb\xd4y\xffcM\
+=T\xa7\x0b\x5c\xc0\x9c}\xd6S\x89\xdb\x81v\x84\x04\
+\x9ea\xdb\xde\xf8\x816\xc9\xbc#\x10\x1a\xf1\xd5\x9e\xc3\
+\x9d\x13k\x22(\xbe\x88\xf3\xe9\xb9\xe37\x5c\xa4I\x9e\
+\xcc\x820\xa5O`A\xd8\xd2\x0f\xd8\x820\xa6\x0f\x00\
+M\xd8\xb0e\xd5\x8b\xb8\xb1\xf4\xe3\xa2>\x9d\xfe\x86u\
+\x16\xa2\x8b\xce_\x81\xc3\x16\xcc\xda\x172*\xd0h\xc8\
+\xe7U$\xec\xd5Mt\x10_\x10\x94X\xb0\x01\x11\xd0\
+\xe2\xd3\xaf\x0f\xf8\xd7\x02\x00\xa0\x0f\x13\x00\x10\xc1}C\
+\x1e\xdf\xc3\x1fk\xa5\x1f\x93~\x1d\xd3\xcf\xeb\x01I\xeb\
+#\x82\xbb\x86\x0c\x18\xb6\x0dH\xfaw\xcc\x82\x9f\x0d\xb2\
+\x01\xd4\x02\xa8a\x03\xa8\x05P\xc3\x06P\x0b\xa0\x86\x0d\
+\xa0\x16@\x0d\x1b@-\x80\x1a6\x80Z\x005l\x00\
+\xb5\x00j\xd8\x00j\x01\xd4\xb0\x01\xd4\x02\xa8a\x03\xa8\
+\x05P\xc3\x06P\x0b\xa0\x86\x0d\xa0\x16@\x0d\x1b@-\
+\x80\x1a6\x80Z\x005l\x00\xb5\x00j\x0c</\x90\
+\xc2\xa2!\xb1)\xa3V\xe83\x16\xd8-2c\xd4\xa9\
+\xca\x88\x05\x96\xbe\x80P|(E\x82_\xf7\x08\xb5\xe2\
+\x8d\xf5\xc8k1&\xd0i\xc8\xe3\x19\xf4\xdb\xdd \x89\
+v\xcc\x1b\xaaF\x81j\xc4\xed\xdf\xe6\x81\xd1\x1b%\x87\
+\xd3m`3\xd8\xe7\x0b\x9d(\xc5k[\xd6\x0d\x912\
+j@J\xf4\xa6-x\xab\xf3\xd0\xb4\x9f<\xb2%5\
+\x8b\x1d\xa3\xe9\x0b!\xc4\xaehI[\xf0P_\xbc\xfe\
+\x18\x10\xc3\x13k\xa5\x14\x9d8\x1e\x80\xdf\xbf0\x83=\
+{\xe3\x0e\x9eR\x1b\xb0\x8d\x13\x01d\x9d\x8b\x1d\xc7\x17\
+r\x04b\x00\xc9\xdb;\xfc\xcb\xc0\xb73\xc1\xcb8\x19\
+`\xd6?\xf1.\xc0\xda\x9c9\x18\x90\xa6\x8d\x0f\x7f\x99\
+L\xa7\x07BM\x0a~2\xc4\x06P\x0b\xa0\x86\x0d\xa0\
+\x16@M\xc1\x1b\xe0\xfd<`\x00\xbd(\xcd.\xbe)\
++4\xc6^zu\xfaP\xf1\x0b\x8c\x9b\xad\xb9+\xd0\
+\xcb\x1e*K\x97\xb7\x84\xbcv\x81\xabf\xfd\xf5\x01\x8f\
+\x0a\xbd\x1a\x10\xfe1\xc3\xa3B\xc5\xb9@\x1d\xfa\xa8\x13\
+=\xc2$\xd6\x95\xe2\x14\x0dh\xc0\x08u\xc6GXT\
+4 \xfcM\xda0\x05o\x80b\x17H\x18\xfb\xef\x8f\
+*\x09\xc58E\x03\xe6q\x85:c\x9f(\xf8.\xe0\
+\xd5\x808\xb5`j\x85e\x98\x22?\xd9uZ\xa6\xbc\
+\xbesQ\xe5\x9aj\xb9\xc1\x17q\xea\xb1\x1f\xa2\x97;\
+1\x0c\xc30\x0c\xc30\x0c\xc30!\xe6/\x1e\xd7-\
+\xf5\xc2\xba\xf0\x0f\x00\x00\x00%tEXtdat\
+e:create\x002018-07\
+-26T19:59:30+02:\
+00\xbd\xf7\xa8\xd9\x00\x00\x00%tEXtda\
+te:modify\x002018-0\
+7-26T19:59:30+02\
+:00\xcc\xaa\x10e\x00\x00\x00\x19tEXtS\
+oftware\x00www.inks\
+cape.org\x9b\xee<\x1a\x00\x00\x00\x00\
+IEND\xaeB`\x82\
+\x00\x00\x07\x89\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x04\x00\x00\x00i7\xa9@\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\
+\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x02\
+bKGD\x00\x00\xaa\x8d#2\x00\x00\x00\x09pH\
+Ys\x00\x00\x0d\xd7\x00\x00\x0d\xd7\x01B(\x9bx\x00\
+\x00\x06jIDATx\xda\xed\x9cYl\x15U\x18\
+\xc7\x7f\xed-]\xa0\xa5\xa5\xad\x94\x16\xc4KqaG\
+DP\x0315\x82 \x0f\xc2\x83\x1a\x88\x11\x09<`\
+|\x014\xd1\x04i\x8c\x8f.\x0f\xc4\x10\x8c\x01%\xe2\
+\xf2\xa6)\x9aXMAH\x04\x0a1\x01\x8c \x04\xb4\
+\x12-k\x17nwz\xdb\xdb\xcf\x87\xf6\x96Bzg\
+\xe6\xce\x9c3\xe7V\xe6\xf7\xbd\x942=\xf3\xfd\xff3\
+s\xb69g            \
+\xe0.$\xcd\xe0\xb9'\xb1\x88\x09\xc0\x15\x8ep\xc9\xb4\
+\x11~\xb3\x9cZ\xfa\x90\x81\xe8\xe3(\xcf\x98N\xc9?\
+\xb2\xf9rP\xfa\xd0\xd8K\xb6\xe9\xd4\xfc \x93\x83\xc3\
+\xca\x17\x84\xfd\x8c2\x9d\x9e~v$\x94/\x08\xdbM\
+\xa7\xa7\x9b\xd9\xc4,\x0d\xe8e\xa6\xe9\x14\xf5\xb2\xc7R\
+\xbe |j:E\x9d\x84h\xb05\xe0:!\xd3i\
+\xeac\xb2\xad|A\x98\xe4gJ\xe9\xbe\x1a0\xc1\xd1\
+Q\xa5\xff_\x03:\x14\x1e5\x22\xc9\xb7i\x03\x04!\
+\xc6X\xd3i\xea\xa4\xd6\xd6\x80#\xfe&\xe4\xef#\x00\
+_)8bD\x93E\x9d\xe5\xf5\xff\x93L\xd3)\xea\
+f>\x9d\x09\xe5w\xf1\x98\xe9\xf4\xfc`e\x02\x0b:\
+y\xcetj~0\x9b\xaa\x04mA\x8co\x99e:\
+=\xbd\x84\xf9\xda\xa6!\x8c\xf1\x05\x93M\xa7\xa9\x87,\
+\xb6Y<\xfdC\xa3\x83\xadd\x99NW5\x0b9\xeb\
+H|<\xce\xf0\xa8\xe9\x94\xd5\x11\xe2]z\x92\x92/\
+\x08Q*}\xef\xa5h\xa1\x98\x9a\xa4\xc5\xc7\xa3\x9a\x22\
+\xd3\xe9{e:\x17]\xcb\x17\x84\xbfx\xc8\xb4\x04/\
+,\xa6\xd9\x93|Ah\xe4\x09\xd32\xdc\xb2\x886\xcf\
+\xf2\x05\xa1\x9d\x0a\xd3R\xdc\xb0P\x91|Ahe\x81\
+i9\xc9R\xc6%{a\xd9\xb2N\xd6I\xb6\x13\x0b\
+\xea\xfd\x9d'\xf2J6\xc7\x9c\x5c\xd9\x1a\x11\x11\xa9q\
+v\x17\xd4\x8e\xa4\xce\xd1\xe7N$\x95I\x9c2g\x16\
+\xec6-\xcb)k\x9c=\xd9\xe5\x83\x06\x94;\xad\x0b\
+\x9e7-\xcd\x09y\xd4k3\xe0_rU\xa7\xab\xbe\
+\xb3\xf9\x0e\x13\xb5\x99;\x89m\xda\xcaV\xc4\x0c\xa2N\
+\x1b7\x17w\x80\xd0\xad\xbag\x98\xa1\xd8\x807\xac_\
+p\x8fb\xc9\xe0]\x5c2\xf8\xdb\x15\x5c\x1b\xf8\xa9\x9d\
+\xfd\xf4X\x15\x90\xc9\x16^U\x9c\xb3B\x0a\xadG\xfc\
+irH\xec8$i\xd6\xf7@;\x05\xa6e&\xe6\
+M\xeb\x1bx\x9e\xad|\x11\x91yv\x8f\xc1\x16\xd32\
+\x13s\xde:\xf5R\x89\xda\xca\x8fJ\xa9\x9d\x01gM\
+\xcbL\xc4\x14\xfbJl\xb5\x9c\x93\xe6\x81\x88\x0c\x8a\x8e\
+\x0c\xfc\xa6IN\xcbj'U\xe1\xbd\xa6\xa5\x0e\xcfz\
+\xc7u\xb9\xfbV\xa0?^Q\x97\xb4\xca~\xc0S\xbe\
+Y\xad\xf0L*\x0d\xf0o\x1aS\xe1\xe0X\xa5\x01\xfa\
+z\x80wR\x96\x8a\x06\xe4\x92\xe7\x9b\x01\x05\xe4\xa4\x9e\
+\x01\xfeNX\x94x/B\xb5\x01\xfe\x22\xa9g@\x8b\
+\xaf\x06(;\x9b:\x03\x22>\xca\x17\xdaR\xcf\x80\xa8\
+\x8f\x164\x11K=\x03\xe0xr\x87\xc7\x86\xf9\xc9!\
+\xc7\xd4%\xad\xd2\x80$\xd7w\xd5S\x07@\x1d\xf5\xc9\
+\x9e\xa9V]\xd2*'D\x0e'wx\x8ce\xbc\x05\
+\xbc\x97\xfc\x1d\x90\xe4\x99\xfc\x22\xe4\xf1E\xa8\xd3\xa8S\
+y\xdf\xaa|\x04b|\xec\x8b\xd1;\xe9\xf3\xe5<.\
+(r\xb8\x08\xc6KtP\xa82e\xb5k\xf3\xbb\xe8\
+e\x89f\x93\xb7r@\xf3\x19<\x11\xe2\xb8\xd6\xeb_\
+\x9b\xfa\xdb)f\xd2\xaaM~\x0b\xd3T\xa7\xabc\xe7\
+\xe8\x22\xaa\x87\x0e\x8d\xcb\x19\xe7\xb2\xa0\x06\xfe\x19\xfa\xcf\
+V\x96\xab\xec\x01\xe8dq|qDH\xf69\x9a\x0a\
+O\xc4>\x09\xc5\xaf~\xeb\xc8Z*3\x83\xdf\x11d\
+\xa9'\xf9\x22\x22K\xfb\xe5\x9fR\x7f\xf3\xf7\xa3k>\
+\xe0\x0f\xe6\xf3\x1dD=\x17\x14\x05\xa8b\x01\xe74e\
+\xaa\x8dU\xf4 i\xb2Kb\xae\xaf~Lv\xf5\xbf\
+(\xeba\xa5\xae4um\x9f\x9f\xcd\xd1\xf8[\xd01\
+\xae\xf7@Do\xed\x9fj\xe7q\xce\xe82A=9\
+\x5cP\xde\x04\x9e\x1bI{\xcb+\xb5\xf4\x02\xde6-\
+\xcb)\xa5th1\xa0\xdd\xe1\xc6\xcb\xa4\xd0\xd1\x0a\xbc\
+\xcch-\xc6\x8e\xe1%-\xe5*\xe77m]\xe1\x93\
+\xa6\xa59\xa1\x5c\x9b|A\x08\xabNW\xf5\x1a!\x98\
+\xbb\x91\xb5Z\x16uv\xb3\x97O\xe6rQC\xd1*\
+\xd9\xbc\xc3s\xef\xd7\x82\xd7?R\x9d\xaf\xf2J\xb0\xe0\
+i\x9d\xf6\xe6\xeb\x9en\xf1N\xf8f\xc4\xfb\x85N@\
+D\xc2]\xaa\xf3U\xdd\x15\xce\xa0'\xcc*Mu@\
+\x15\x17!C\xdd[!\x1d\x06\xe4\xd0\xa9A\xfb\xedg\
+\xb8\xa9\xb28\xd5u@\x17W\xb5\xca\xbf\xacV\xbe\x8e\
+\x9e\xa0\xdeI\xab$\xdf?\x9a0\xe0\x07\xad\x06Tk\
+-]\x09c=l\x94\xb4\x8b\xc3\x9aF\x19\x8a\xc9\xb0\
+\xf9^\x98\xdb\xd89\x92\xbe.\xf1\xac\xe2!\xd1)\x96\
+\x99\x96\x94,\xe9\xbcH\x8d\x83\xcf\xe6\xd8E\x8c\x9fx\
+a\xc4.\xe6\xe2>\xb6\xf0\xa3\xcbW\xa6\x9dT\xb3Y\
+\xf7\xc2h\x7f\xbe)\x9a\xc3\xc3\xcc\xe7\x11\xa6s?\xc5\
+6\xc76r\x81\xb3\x9c\xe0\x04'U\xb7\xf9\xc3\xa1~\
+8\x1c'\x8d\x02\xf2\xc9#\x8f<\xca(g*\xe5\x94\
+\xdb\xca\x87b\x84t\xb2\x99\xc04.\xd3F\x1b\xad\xb4\
+\x12A\xd9\xca\xc0;\xd3tC6\xb3x\x80\xa9\x141\
+\x8eB\x0a\x19M>\x10\x9f\x01\x0fi\xfb\x18V+1\
+n\xcd\x96\xb7\xd0I3\xcd4\xd3D\x1d\xe79M\xb7\
+n\x03\xb2X\xc2\x0a\xe6\xb0 %\xb7\xb1v\xf3+\xdf\
+\xf3\x19\x8dz\x8a/a;\x11\xad\xd3]j\xa2\x8d\x0f\
+\x19\xaf^\xfeZZ\x8cKs\x1e\xcd\xacWY\xbd\x87\
+\xd8m\x5cR\xf2q\x80)j\xe4\x8f\xe2\x1b\xe3b\xdc\
+E\x93\x9a\xf5J;\x8d\x0bq\x1f=\xac\xf1*\x7f\x83\
+q\x11\xde\xa2\xd7\xce\x02\xeb\xaa\x22D\x83\xeb\x05>\xa9\
+\xc2\x0d\xee\xb1\x9aE\xb4\x1ed\xa4\xab\xdb\x9b\x93\x80>\
+\xed\xab>s\xac5Z\x1b\xd0\xc3\x07\xda\x12k\xa4\x8a\
+M\x84\x09\xb3\x89*]\x9d\x17\xe0}\xeb\xed\xe8v\xad\
+e:{X\x9b\xe0\xffnp\x9d\x16\x22\xb4pcH\
+y\x05@\xfa@\xd7\x18\xb2\x18\x0d\xf4\xd2F\x94\x0e\xba\
+h\xe7\x1a\x97\xf8\x9b\xb3\x5c\xb9\xa3\xb4Rf\x10f\x22\
+%\xe4\x92\xc3\x182\xc9#\x03\xe8\x1c\xec\xe0\xb6\xd0\x07\
+\xb7\x8d\x0a\xc6Q@>\xf9\x8cO\xf8\xa0\xeea\x03\x9e\
+G\x11\xafquH\xb5\xd2\xcdA*\xa9H\xb1\xaf|\
+\x15QA%?\xd3=$\xd3\xcbl\xb4\xffCg\xfd\
+\xa5l\x9ed\x0e\x854p\x81C\xb4\x9bVkA.\
+\x15<H1\xcd\x9c\xe2\x177\x83\xa3\x80\x80\x80\x80\x80\
+\x80\x80\x80\x80\x80\x80\x80\x80\x80\xbb\x80\xff\x00!5\x02\
+\x95\x22\x9d\xbe^\x00\x00\x00%tEXtdat\
+e:create\x002018-07\
+-26T19:59:33+02:\
+00\x8c\x1f\xb2D\x00\x00\x00%tEXtda\
+te:modify\x002018-0\
+7-26T19:59:33+02\
+:00\xfdB\x0a\xf8\x00\x00\x00\x19tEXtS\
+oftware\x00www.inks\
+cape.org\x9b\xee<\x1a\x00\x00\x00\x00\
+IEND\xaeB`\x82\
+\x00\x00\x07p\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x04\x00\x00\x00i7\xa9@\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\
+\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x02\
+bKGD\x00\x00\xaa\x8d#2\x00\x00\x00\x09pH\
+Ys\x00\x00\x0d\xd7\x00\x00\x0d\xd7\x01B(\x9bx\x00\
+\x00\x06QIDATx\xda\xed\x9c[l\x15E\x18\
+\xc7\xbf\xdeN\xa1\x5c\xc4\x02\x85\xb6\x5c\xcbUh \x98\
+\xa0\x5c\xe4\x1e%\x18\xe4A\x01A\x8d\xbc\x98(\xf0`\
+\x0c1$j\xc2\x83>h\x10\xa3`\x88F\x12\xa3&\
+\xde \x88(\x95K\xa2\x10nU|P\x04\x11\x94\x12\
+@[.\x01\xb9\x149\xa5\x95\xbf\x0f\xd3og\xcf\x81\
+\x9e\xcb\xce\xee~g\xeb\xfc\xce\xc3\xcc\xc3\x9e\xd9\xef\xff\
+\xdf\x99\xd9\x9d\xd9\x99%\xb2X,\x16\x8b\xc5b\xb1X\
+,\x16\x8b\xc5b\xb1X,\x16\x8b\xe5\x7fC\x9e\xd8\x99\
+\xbb\xd0\x04*\xa7>D\xf4'\xd5\xd3>j\x94\xb6\x22\
+<\xf2h>\xd5P\x9c\xe0\xfa]\xa7-4O\xf0r\
+\x84\xc8\x14\xfa1A\xba\xfbw\x80&K\x87\x174\xcf\
+RK\x9b\xf2A\xa0\x16Z.\x1db\x90\xacM\x94\xdb\
+\x17\xe31\x1e}\x93Mx[:\xcc\xa0X\xa6EV\
+\xe0\x0d\x9c\x04s\x12\xab\xd0\xdbm\xc1s\xd2\xa1\x06\xc1\
+d]\xf9\x97\xe2\x1a\x92i\xc4bwC\x98(\x1d\xae\
+\xdf\xe4\xd1\x01\x96\xb7\x0am\xf1\xba\xb6\xa0\xb6\xbd\xdd\x11\
+\xe6\xb1\xb4%H\xc5\xd3\xda\x82\x87\xa5C\xf6\x97\xaf\x94\
+\xac2\x5cIi\xc0U\xdd\x17l\x92\x0e\xd9O:\xd1\
+?J\xd6J\xa4\xe356\xe0\x1a\x95H\x87\xed\x1f3\
+\xb8b\xd7\xa55\xe0\xb8n\x04\xd3\xc2\x08-?\x14\x03\
+*URN\x03\xd3\x1eZE\xbd\x93\xfe\xd5\x1e\x0c\xa8\
+\xc8FQE;4 \x87\x09\xc7\x80\xf3*\xa9\xcf\xe8\
+\xe0\xfa\xa4\x7f\xb5\x07\x03\x8e\xb3\xb4\x93i\x0f\xad\xa33\
+I\xffj\x0f\x06\xd4R\x5ce>N{\xa8sD\x13\
+\xfd\x10Jl!Q\xa3nm\xe5\xb8\x90\xf2&xA\
+?\x08m\x91\x0e\xd9_f\xf3\xdd}aJ\x03\x1e\xd5\
+O\x01\xb3\xa4C\xf6\x93BZ\xad\x07\xbb\x9f\xb6)\xff\
+\x13\xf7\x90\xf8M*\x90\x0e\xdb/\xba\xd0\x16\xf7\x84\xc7\
+\xa26\x0dX\x9481\xf25u\x96\x0e\xdd\x0fJh\
+\x9f\x16\xd5\x0f\x9bR6\x81/\xd0\xcfm\xc1\x1e\xea(\
+\x1d\xbe)\x85\xb4\x99\xe5\xe4\xe3y4\xa6\x1d\x0b4b\
+\x19\xf2\xb5\x05\x9b\xa2\xde\x10^a)%\xd8\x98V<\
+\xb3\x01\x1d\xb5\x05/KK0a\x1cO\x83u\xc0\xce\
+\x8c\xe5\x03\xc0w(f\x03\x9ai\x9c\xb4\x0c\xaf\x14\xd0\
+a%\x22\x0f\xeb\xb3\x92\x0f\x00\x9f!\x8f-8\x1c\xd5\
+f\xb0HO\x82z\xe1\x19\xdd\x0c\x9e\x90\x96\xe2\x85|\
+\xfaC\x85\xdf?\x83\xae\xef\xf6\xdd\xa1sG8\x16\xc5\
+Q\xab3\x0b\xb4\xce\x93|\x00xW\xd7\x81\xa9\xd2r\
+\xb2g\x9d\x0a\xbd\x0f\x9a=\x1bp\x03\xe5l\xc0{A\
+\x85\x19T\xd5\xca\xa39*\xb3\x80\x0a=\x17RD\x0b\
+9;'(\x03\x82\xa2\x8a+\xef~\xcf\xd7\x1f\x00\xf6\
+\xeaF\x90~:\xd1\x13A\xd5\x80\xb1*\x89\xd1\x18\xa3\
+b\xee\xa6\xa2\xa4\x12\xa3b@\xeb\xf5\x1aA\xc5F\xc5\
+t\xa0\xbb8; Z\x06\x94\xaa\xa4\xcc\xb8 \xa7\x84\
+\xd2h\x19p\x87J\xba\x19\x17t\xe7-\x99h\x18\xd0\
+\x9c\x90\x18p\x833M\xd12\xe0\xb2J\xfe6.\xc8\
+)\xe1r\xb4\x0ch\x9d\xdc?j\x5c\x90SBf/\
+\x15r\xc6\x80C*i\xa0\x06\xa3b\xea\xe9lR\x89\
+Q1\xe0g\xfaWe\xbe1*\xc6\xf9w\x0b\x1d\x8c\
+\x96\x01\x97h\xbf\xca\xac7*\xe6s\xce\xec\x8bZ\x1f\
+@\xb4Y%\xdb\xe9w\xcfE\x1c\xa3\x1dI\xa5E\x89\
+\x9et]=\xc5?\xe6y$0\x9f\xc7\x01q\x1f\x9e\
+\xa8\x04\xf8\x90'\xc4vy\x92\xff\xad\x9e\x14\xfb@Z\
+\x8a7\x06Q\x13\xcf\x09]\xccZ\xfeE\xbd\x824N\
+U\xd2R\xbc\xb2\x92\x07\xb3\xd3\x10\xcfJ\xfeuL\xd1\
+\x03\xe1W\xa5ex\xa7#\x1db\x19\xb3p9c\xf9\
+\x970S\xcb?H\x1d\xa4e\x980\x8a\xae\xb2\x94j\
+\x9c\xc8H~\x1dFj\xf9W\xa8ZZ\x82\x19]y\
+\x89$\x81\xd0\x13{\xd2\xca\xdf\x8d\x9e\xee\xb7\x83_R\
+\x17i\x09&\xcc\xa6\xd3\x89K\xe1\x8b\xb1-\xa5\xfcm\
+\xfa\x8d\x10\xffN\xd1\x83\xd22\xbcQ\x9c\xbc;\xa0\x14\
+KQ\x9b\xb6\x06\xd4b\x09J\x93MXC1i9\
+\xd9RN\xdf\xbb%\xcc\xc4F4e\xdc\x09\xc6\xb1\x01\
+\xf7'ZP\xab\xd7OF\x81\xe1tB\x07?\xca\xe3\
+\x83\xd0NT\xbb-\xa8\xa3\xa1\xd2\xb22\xa5\x9a\xces\
+\xd8\x05X\x81\x1b\x9e\xe4\x03@\x13^r\xaf\x158G\
+#\xa4\xa5e\xc2Pj\xe0\x90{`\x87g\xf1\xccv\
+t\xd7\x16\xd4\xd3`iy\xe9(\xd3\x95\xbf\x0a\xc7\x8c\
+\xe5\x03\xc0o\x18\xe0n\x08=\xa4%\xa6\x22F\xbb9\
+\xd4ah\xf0E>\x00\xfc\x85!\xda\x82]\xb9|G\
+X\xab\xaf\xfei\xdf\xe4\x03\xc0)w-X#-\xb3\
+-f\xd1M\x15bW\x1c\xf2U\xbej\x08\xdd\xd8\x80\
+\x9b\xf4\x90\xb4\xd4\xdbQF\xe7\xb8\xe7\xdf\xea\xbb|\x00\
+\xa8A\x01[p6\x17'H>\xe2*\xba\x22\x10\xf9\
+\x00\xf0\xa2n\x0697E2\x89\xab\xffX\x83\xfb~\
+:\x9a1N7\x83\xa9\xd2\x92\xdd\xe4\xd3/*\xb0\x18\
+\x8e\x04&\x1f\x00~E\x8c-\xf8)\x97\xd6\x0d=\xce\
+U\xf3\x85@\xe5\x03\xc0r\xdd\x0c\xe6K\xcbf\x0a\xe8\
+\xa8\x0a\xa9\xf26{\x82\xfd\xa6\x11\x15l\xc0\x91\x5cY\
+?\xb8\x80\xaf\xc9\xda\xc0\xe5\x03\xc0\x9a\x9c\xab\x03{y\
+%xv\x13\x9f^\x89\xeb\xf9\xe2]\xd2\xd2\x89\x88\xc6\
+\xf0\xf5x+\x14\xf9@\xc2.\xf3Q\xd2\xf2\x89\xdeQ\
+\xa1t\xc6\xa5\xd0\x0c\xb8\x88\x126@\xfck\x13\x85<\
+\xf6_\x1c\x9a|\x00x\x8a\x0d8c\xda\x11\x9a\xdeK\
+\xa7\xf3\xf0\xf4\xc9P}w\xce\xd6\x8b\xa6\xc8\x1a\xf0\x88\
+J\xfa\xd1\xbd\xa1\x1a0Qo,6\xbc\x13\x98\x1a0\
+S%sC\xfe\xe2E>\xcd\xe5\xec\x03\x92\x06\x0c\xa2\
+\xfe*\x13\xfe&?\xe7\x8c\x03\xcd\x96P\x9a\x190C\
+%1\x9a\x10\xba\x01\x93\xf4\xc4\xd0t9\x03Z?v\
+3^\xe0k\x17%t\x0fg\xef\x933`t\x82\x0f\
+!\xe3\x9cu\xb4\x94\x01E\xbc\x92Y\xe6q\xcc9\xeb\
+H\x83-\x09F\x06\x0c\xe7f(l@\xb1\xc9;#\
+\x13\x03\x06\xf3\xf9\x87\x88\x180Lw\x83\x06\x01\x98\x18\
+\xd0\x87\x13\x83\x1ah@\x91/\x9f[11\xa0\xd2\xf8\
+\xec\x86T\xde\x92\xb1\x06\x84j@\xeb\x1e\x8e^b\x06\
+8K\x06\xba\xcb\x18\xd0\xda\x07u\x123\xc09s\x91\
+\xf72L\xfa\xaf\xd6\xd3\xbeO[\x85\x0cp\xb6\x10\x18\
+\xec\xcc21 \xc6a\x04\xb4\x97!s\x0cj\x80\x0f\
+M \x070\xa8\x01\xed\xc3\x00\x83HL\x9a\xc0j\x93\
+\xde\xd7W.H\x07`\xb1X,\x16\x8b\xc5b\xb1X\
+,\x11\xe3?\xa2\x88\xbap\x96vF\xde\x00\x00\x00%\
+tEXtdate:create\x00\
+2018-07-26T19:59\
+:29+02:00\xe4\xc5\xed\x94\x00\x00\x00\
+%tEXtdate:modify\
+\x002018-07-26T19:5\
+9:29+02:00\x95\x98U(\x00\x00\
+\x00\x19tEXtSoftware\x00w\
+ww.inkscape.org\x9b\
+\xee<\x1a\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x0a\xa7\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x04\x00\x00\x00i7\xa9@\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\
+\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x02\
+bKGD\x00\x00\xaa\x8d#2\x00\x00\x00\x09pH\
+Ys\x00\x00\x0d\xd7\x00\x00\x0d\xd7\x01B(\x9bx\x00\
+\x00\x09\x88IDATx\xda\xed\x9cyl\x14\xd7\x1d\
+\xc7?\xbe\x0fl\x8c\x8d\x01\x036\x01\xdb\x10\xceR \
+\x81\x10(1\x01AH\x95\x12\xf5TR\x91(\xe0(\
+Q\x12EA\xa1\xa9\xd4\x96?\x92*M[P\x84\x9a\
+\xd0*\x12\x91\xd5\xe6\xa0I%\x5c\x125\xb4\x0a\x85V\
+\xdc\x8dj\xd2\x06\xe2\x16c\x83b\xcc\xedc}\x1f\xd8\
+\xbf\xfe1\xfbv\xd6\xf6\x1e\xe3\xdd7;\xebt>\xef\
+\x8f}\xde\x99Y\xff\xbe\xdf\x99y\xf3\xce\x01\x17\x17\x17\
+\x17\x17\x17\x17\x17\x17\x17\x17\x97\xffC\x12\x1c\xfc\xdf\x85\
+\xac\xa0\x00\xb8\xc21\x1a\x9c6\x22\xd6\xdc\xc7\x09\x06\x10\
+o\x1a\xe08\xeb\x9c\x0e)v\xa4\xf3\xb6O\xba\x7f\xfa\
+\x1d\xe9N\x87\x16\x0bR9\x1cP\xbe \x1c$\xc5\xe9\
+\xf0\xec\xe7uSp\x9a\xcc\x97\xf9\x92\xe6o\xc1.\xa7\
+\xc3\xb3\x9b\x05\xf4\x1bRS\xe5\x15i\x15\x11\x11\x8f\xbc\
+,\xa9\xca\x80[\xccs:D{\xa90\x84&\xcb\x01\
+\xf1\xe7#IR\x16\xbc\xe9t\x88v\x92\xc4\x0dC\xe6\
+\xd32\x94'\x95\x01\xd7Ir:L\xfb\x98\xa6\xee\xf5\
+O\x86\x19p\xca,\x07\x0ac\x19RbL\x0d(P\
+\x99Y\xc36\xcd6\xb3\x93\xbf\xbc\x06t\xa8L\xfb\xb0\
+Mm\x01\xf6\xfa\xf2\x19p\x89\x01#sh\xd8\xa6\xbf\
+\xaa\xcc\x00\x97b\x1aS\x8c9a\xdc\xe7\xb3\xa5cP\
+\x09\xd0.\xb3T\x09p\xcc\xe9\x10\xed\xe5\x19U\xd4m\
+\x90\x16\x9f\xfcfYo\x16\x81O\xc56\xa0X\xb7\x06\
+\xd3\xa8f\x86\x91\x9dH9\x13\x80\xeb\xec\xe1\x86\xda^\
+\xcb\x5czc\x1cS\x8cYBg\xd0\xb6@\x17\xcb\x9c\
+\x0e/\x16l\x0cbA'\xdfp:\xb4X\xb0\x80?\
+\xaa\xf6\xc0\x90\xd4\xcf>\xe6;\x1d\x9e\xbdL\xe7\xdd \
+\xe2M\x13\xdeb\x9a\xd3a\xdaC\x1a?\x19|\xe9'\
+\xc8jyG\xde\x962I\x18lB\x07?\x22\xcd\xe9\
+pu\xb3\x94j\x7f\x91\xa9\xf2\x98\x9c\xf1=\x06\xff-\
+\x8f\x9a\x0db#\x9d\xe5\x0e\xa7C\xd6G\x12/\xd2g\
+\x8aK\x91'\xa4~Xc\xe8\x0by\x5c\x92\xfd-\xe8\
+e{\x8c\xeb\xa96\x91\xcf\xc7\xfe\xe7\xf6A9/\xc1\
+8'\x0f\x0c\xbe\x0e\x0e0\xde\xe9\xf0\xa3e\x0e\x17M\
+A\xd3\xe5O\x12\x8e\x0f\xe56\x7f\x0bj\xb9\xddi\x09\
+\xd1\xb0\x92&SL\xb9\xb7\x0b,\x1c\x1e\xd9\xeco\xc1\
+M\x96;-#RV\xd0\xa6dd\xc9{\x96\xc4+\
+*%\xc7\xb4\xa0\x9d2\xa7\xa5D\xc2RS~\x89|\
+>\x22\xf9\x22\x22ge\x86iA+w:-g\xa4\
+L\xa1A\x85\xbfT\xae\x05\x11\xd9%\x15R!]A\
+\xb6^\x91%\xa6\x05\x97b\xdbO\x14-\xe9\x9cT\xa1\
+\xdf%\x9e\xa0gy\xad \xc8\xda\xa0\xdb[d\x99i\
+\xc1\x89\xd1T9\xfa\xad\x0a{\xa1_\xab\x7f(\x0d>\
+q\x0dA\xf7i\x96\x05\xa6\x05{\x9c\x96e\x95\x87T\
+\xc8\xf9r!\xc4]^\xeb\x93V\x1br\xaf\xf1\xa6\x05\
+\xdfvZ\x9a\x15\xb2\xb9\xa4j|\x87B\x16s\xd6\x0c\
+\x109h\xd6\x10\xeb\xc9rZ^xv*Y\xaf\x8a\
+h1@\xe4\x17\xe65\xf0s\xa7\xe5\x85c.\xbdF\
+\xa8\x8b\xe5\x966\x03\xfad\xa1\xda\xb7Gw\xcd0Y\
+\xb3\x01\xcf\x1b\x03\xdc\x89\xbc\x1ep\x84\xab\x8f\x83\xbe1\
+\x81k\xbeo?b\x927\x97\xc5\xda\x00#\xe4\xc9\xec\
+\xe6k\x08@*[yRs\xcc\x1a\xc9S-\xfe\xc7\
+\x02\x9e\xc9\x01\xb9'Tg\x88 \xc8=2\x10\xf0\xd8\
+Mf\xbdp\x9c\xd32\x83\xf3\x82\x92\xf1Y@\x11U\
+a\xe5#HU\xc0c\xcf\x98\xdd&[\x9d\x96\x19\x9c\
+sF\x88k\x82\xdc\xcb\x97%%\xac\xfc\x14\xb9\x1c\xe4\
+h\xdf\xd5S\xed\xb4\xcc`\xccP\x22\xf6\x05-\xce\xf6\
+\xca\xed\x92\xebMfs'\xc7\xfbM\x9e\xcc\x93\xbdA\
+\x8f}\xdf\xb4\xa9\xc8i\xa9\x81\xd9\xac\xba\xbb:\xc4\x0a\
+\xd6\x9f\x02\x06\x1df\xb7\xd9\xa3\xfa\x82\xd6\xd9\xe9\xb4\xda\
+\xf8XN\xa6-\xfef\x9aM\xc2\xd5\xf1i\x80\xb7\x1b\
+\xb3\xcc\x16\xf9\x00\xf7\xaa\x8c\xc6\xc6\xb1N\x03\xa6\x1a\x1f\
+\xf6\x8dm\xf8\xe6OM\x89G\x03\xb2\xc8\xd6\x1e\xdd\x10\
+|]\x02\xe3\xc8\x88?\x03&\x0f\xcb\xd8g\x00\xbe\xaa\
+c\x1c\x19\xe0Cw\xed:`\xb0\x12\x7f\x06xT\xa6\
+\xc56\x03<\x01\xb3\xf1b\x80Ow\xb3\xfd\x06\x88\xff\
+\x9c\xaax1\xa0WYp\xd66\x03\xce\xa8L#\xfd\
+\xf1g\x00\x9c2>\x8e[\xdc=)@.4GU\
+\xe6\xa4\xbe\xa0u\x1a\xe0\x9d\xdf\xf5w5\x17.\x0c\x85\
+\x14\x03Plqjh?GT\xf6\x84\xc6\xa85\xb2\
+Z\xd5\xed?\xb0T\xb7\x17\xa9\x91r)\x97\x1a\x8b{\
+W\x9a\x8d\xa1UNK\x0dL\x92\x1a\x08]gQ\xd2\
+\xc8X\xa3\xe4\xd7\xc5\xef\xb0\xf9\x0f\xc37\x88#\xe5\x03\
+\xf3\xfcosZfp\xc6\xab.\xb1)\xd2\xa4U\xfe\
+M)0'\xd0\xe49-3\x14\xbek\xe0n\x8b\x83\
+\xe1Vh\x97U\xa3\xe2\xfc\x03$qJ\x85\xbaR\x1a\
+5\x9d\xfd\xbb\xfdG\x08\xe3~9\xc5<ZU\xb8E\
+\xb2?j\xf9\x952\xd5\x94\xef\xf1_V\xa0\x07;\xe6\
+\x0a\xaf\xe0\x80j\x1a\xc3R\xbe\xc5\x9d\x8c\x8d\xe0gZ\
+\xf9'\xef\xf3\x89\xff\x17\xf7\xc5k\x0d`(+\xcd\xc9\
+\x11\xdaR\xeb\xe8\x9a*3\x97\xcf\xb4\xca\xffT\xff\xc5\
+o7\xa9\xec\xd7&\xbfr4\xae(}\xd0\x7frd\
+\x94\xa9\x8f\x8dv\x85i\xd7\x82\x89\x05\x1cWc\xf9\xcb\
+\xd8\xa3\xfaKGD\x03\x9b\xcd\x22\xb0\x9d\xbbllg\
+k'\x83\x1au\xf66Jw\xc4\x8f\xc0.\xff\x99\xa3\
+\xff\x19Mk\xcb\xb7\xab\xb0\xd7IOT\xb5\x80\x1eY\
+gZ\xf0c\xa7eYe2\x1dF\xc8%\x1aZ\x04\
+\x8dR\xac\x0ch7\x17^\xea\xc3\x8e\x86\xe5&56\
+\xb6\x9b\xdc\xa8\x7f,\x8f7Tv\x0c\xdf\xb7!Z\x1b\
+\xf8\x97q\xc6\xee\x8f\xfa\xec+|\x8b\xeaN;-\xcd\
+\x0a\xc5\xea\x9e\xfd\x836\x03\xde3\xcb\x81\xe9\xba\xc3\xd5\
+?\x8a\xb1\xd0\xf8H\xe0g\xda\xa6t\x0d\x90\xa0FB\
+\x16r1\xde\x0dXc|\xd8t\xbd\xaea\xbf\x1d?\
+\xab\x93\xea(k}\xa1\xd3\xe7\xba\xc3\xd5_\x13\xec\xb6\
+uRs\xb7\xbeqa{\x0cH\xa6\xcf\xc8<\xa3\xf5\
+E\x10\xf5\xec6\xff\x83\xb6Q!;\xc8P\x17\xeba\
+m\xcf\x00\x11\x91C\xe6M\xa0\xb9B\xac\xbb\x22\xd4\xc5\
+U#\xa3\xb7\xeb\xc6\xf7k\x97\xe9\xd6\x1c\xb1v\xf6\x19\
+g*Y~*\x9dZ\xce~\x87\xbcd\xce\x17\xdf\xe7\
+\xb4\xbc\xf0\x94\x9be\xf6T\xd9\x19t\xb9\x8c5\xae\xca\
+\x0e\xffNQ\xe1q\xa7\xe5\x85g\xec\xe0\x85\x92)r\
+\xbf\xbc&\xe7F,\xfd\xbf\xf2+\xd90tf\xe9Q\
+\xfd3\xf0\xec\xe8\x10If\x17O\x0f\xfd2\x9f\xc5,\
+b&\xc5\x940!\xe0\xb3\xac\x8b\xeb\xd4Q\xcby\xaa\
+\xa8\xa2q\xf8\x0e\xbf\xe1\xb9\xd1\xf3v\x89\x0d\xaaI\x14\
+8eJ\x91\x94\xcab)\x96bY,\xa5R$\x99\
+\xe1:E\xd7;-i\xa4$\xf2]>\x0e\xf3\xb6\x00\
++\xa9\x9f\xbf\xf0\x9d\xf8\x1d\x0f\x0e\xc7ml\xe5\xcf!\
+\xde\x1a\x12*ur\x80\xe7\xec\x9e\x18\x1d\x9b\xb7\xc8d\
+\xf0U\x96\xb0\x989\x94\x92\x1ff\xdf\x9b\xd4PM\x15\
+U\x9c\x8e\xc53\xdf\xbeI}\x09\x8c#\x87l\xb2\xc9\
+f\x0a\xc5\x94PLqX\xf9\x90\x8f\x90H:\x05\xcc\
+\xe62m\xb4\xd1J+-h\x9b\x1984\xccHH\
+g>3)a<\xb9\xe4\x91G&9\x00\x8c!\x15\
+H\xb2:\x14\x98\xc5\xf3\x0c\xf0\xaa\xf5\x97\x87\xb5\xd2\x0f\
+\xf4z\x0f\xf0\xd0I\x13M4\xd1H\x1d\xe78C\x8f\
+=&\x99\xa4\xf1uvs\x84\xee\xe8\x1b\xb6\xd3\xe4\x15\
+o\x97i\xa3\xbc,\x85:\x9a\xca\xdd\x1c\xe1\x05\x0b\xd7\
+X\x84Lb\x17-\xd1\x87\x99,w\xc8\x0f\xe4\xe4\x90\
+\xa5Q\x03r\x5c\xb6\xc9\x92\xc1/\xd1\x88,\xb5\xb1\x93\
+\x89\xd6eY\xbd\x05\x1e\xe1\xb5\x88\xc6\xb8\x81D&0\
+\xdd[\x04\x94\xb2(\xe4\xe2\xcfvNs\x9e:j\xa9\
+\xe3\x227,N\xb8\x1bF3\xdb\xa8\xb0VjX1\
+ \x897\xd82\xf4\xcb1\xcc\xa4\x80<o\x11`t\
+\x7fg\x90\x0e$z\x0b\x84\x5c\xb2\xc9f,c\x22\x13\
+\x01@\x07\xad\xb4\xd1\xe6\x9d~\xeba\x00\xe8\xa6\xcb\xab\
+R\x15\x01W8?\xbc\x1c9D9\x17t\x18\x90\xc2\
+\xef\xf9\xa6\xf9\xe7\x1c\xd6\xb0\x88\x95\x01\xde\x099rn\
+\xf2!\xf0\x80\x96\xdb\xb6\x86\xa3\xbcc\xbe\x95\x10\xa0\x89\
+\xefq0\xfa_\xfe\xb5y\x7f\xdd+\xff\xd0\xd2\xc0m\
+\x96c\xf2KY\xefm\xea\xa4\xc8\x06\xd9!\xc7B,\
+\xb4\xb7\xceIY\xed_\x1e\xf4\xf1P8y\xe1\xae\x80\
+-j\xd5~\x22;\xd8\xea\xdb\xfd:5\xd4\xd1\x82\x07\
+\x0f\x9eA\x13\xe4s1\xaa\x00\x06\xc6Mq\x8b6z\
+\xe8\xa4\x13\x0fW\xa8\xf7[4;\x98\x02\x0a\x99L\x0e\
+\x99d\x92F6\xc9\x98\x17<\xde\xaa\x80\xff\x5c\xf4q\
+\xe40\x8e\x1cr(\xa1\xd4[\xf2\x09\x15l3\xf7\xea\
+g\x13{#?\xfbI\xea-0\x09\xde\xf5|_\xc8\
+\x1eyX\xcfCK{*\x92\x87\xe5M\xa9\x17\x91\x06\
+Yn~\xdf\x14z^Y\xe8+ \x85V\xd5\x07W\
+\xca4\xea\xa9\x89\xdc\xcc\xc0\x0c\xa0\xbd[n\x16\x85\x5c\
+\xa4N\xfd\xd9\xcdX\xd5Q\x1b\x09/\xd9v\xc6nP\
+\xc9\xb3\x14Q\xc4\xb3T\xaa\x17.\xdb\x90^\x0c-0\
+\x5c\x19\x90H\x05\x8f\x04\xd9\xd6\xccu<\xb4\xe0\xf1\xbb\
+1\x8d\xdb_=\x09!\x8dL\x8cB\xa0\x97\x0e\xbah\
+\xe7\x1a\x0d\x5c\xa0\x9a+C~m2s\x99\xceT&\
+\x91E\x06cH\xf5\x16\x02\x9d\xbe\x0a\xae\xf1\x14\xf4o\
+\x15\xe4z\x8b\x80\x89A\x87\xa1+\xd8b\xad>\x10\x8a\
+\xa7\xb8\xea\xe7h\x0f\x87\xd9NY\x9c\xbd\xe5k<e\
+l\xe7\x10=~\x91^\xe6\x89\xf0\x07Z\xab\x09\xa6\xb3\
+\x8a\xaf\x90\xc7\x0dj\xf8[\x80\xb7\x22\xc7\x0fY\x941\
+\x8b|\x9a\xf8\x94#\xf67\x8e\x5c\x5c\x5c\x5c\x5c\x5c\x5c\
+\x5c\x5c\x5c\x5c\x5c\x5c\x5cF%\xff\x03\x13\xaa\x92\x9a\xe8\
+\xcbv\x0f\x00\x00\x00%tEXtdate:\
+create\x002018-07-2\
+6T19:59:24+02:00\
+\x85\x12\x8cT\x00\x00\x00%tEXtdate\
+:modify\x002018-07-\
+26T19:59:24+02:0\
+0\xf4O4\xe8\x00\x00\x00\x19tEXtSof\
+tware\x00www.inksca\
+pe.org\x9b\xee<\x1a\x00\x00\x00\x00IE\
+ND\xaeB`\x82\
+\x00\x00\x0e4\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x04\x00\x00\x00i7\xa9@\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\
+\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x02\
+bKGD\x00\x00\xaa\x8d#2\x00\x00\x00\x09pH\
+Ys\x00\x00\x0d\xd7\x00\x00\x0d\xd7\x01B(\x9bx\x00\
+\x00\x0d\x15IDATx\xda\xed\x9c{xT\xd5\xb9\
+\xc6\x7f\xc9\xe4\xc2%\x11\xc2p\x0b\x97&F\x10\xb0@\
+\xe4\x12\x91\x1a\xf1V\x0f\x88\x22\xc5c\x85**mQ\
+Z\x8a\x07\xb5\x07\xf5`k\xa9\xf6\xb1V\xd1\xb6\x14\xf0\
+\xd2\xa7\x8a\x0fO\x8b\x8a\x1c\xa9\xd7Z\xb0Z\xa5\xa5\x82\
+x$\x22\x92pK@\x03\x02\xb9\x00\x81\x90\xdb\xbc\xfd\
+cv\xd6\xec\xc9L\x92\xc9\xcc\x9e\x19\x8e\xce\xbb\xfe\x98\
+\xbd\xd7Z\xfb[\xdf\xf7\xee\xb5\xd7^\xeb[\xdf\x1eH\
+ \x81\x04\x12H \x81\x04\x12H \x81\x04\x12H \
+\x81X#\x8d\xb4x\xab\x10O\xdcB\x0d5\xdc\x12o\
+5\xe2\x85\x0cj\x11\xa2\x96\x8c\xf8)\x91\x1cG\x02z\
+\xd3\x09\x80N\xf4\xfej\x12pZ\xe0+O@J\x8c\
+\xdbKg2\xbd\xac\xe3\x9e&w\x06G\x00\x10\x07X\
+G]\xbcI\x89\x1e\x92\xd9\x80\xdaI\x1b\xbe\xcc\xbdr\
+T\xbb\xe6\x0b1*\x96*\xc5\x96\xedr\xea\xdb\xadS\
+Oy,Ur\xc5\x94\x80\x13|\xca\x10NRE\x15\
+U\xd4\xd0\xcd\xca\xdfO\x85\x95\xb7\x8f\xf9l\x8e\xa9N\
+qD\x9e\xe9\xf4y\xf1S\xe2K<\xe0$\x08H\x10\
+\x90  A@\x82\x80\xd3\x18cYm^\x83/0\
+&\xde\xea\xc4\x16\x83X\x1f0\x01^\xc7Y\xf1V+\
+V\xb8\x9a\xeaf\xb3\xb3\x95\xed\xa3\xa0\x8a\xab\xe2\xadZ\
+,0\x85\x06\x84\xae\xd6\xeb\xaa\x95$\xd5\xea5M\xf1\
+R\xd0\xc85\xf1V/\xda\x18\xcdI\x94\xa5\x97\xd4\x12\
+\xff\xab\xeeB\x9c\x8c\xedZ0\xd6\xe8\xca\x0e\x94\xa1M\
+\x0a\x86\x7f)C\x88O\xe9\x12o5\xa3\x87\x07\x11Z\
+\xaa\xd6\xb0\xc4\xfb <\x10o5\xa3\x85\xbe\xd4\xa2\xf3\
+\xd5d\x99{\x5cw\xe9\xeb\x1a\xae\xbbt\xdc\xcai\xd2\
+8\xefc\xd07\xde\xaaF\x07\xf7#\xf4\xa2el\x83\
+.0\xe3\x7f\xa1\x1a\xac\xdc\xd5\xde\x9c\xfb\xe3\xadj4\
+\x90\xc4.\xd4G\xf5\x96\xa9\x8b\xfdf\x01\x8fZ\xb9u\
+\xea%\xc4.\x92\xe2\xad\xae\xf3\x18\x8d\xd0\x0d\x96\xa1\x8d\
+\x1a\xe8G\xc0@5Z%\xdf\xf1\xe6\x9c\x1b+\xb5\xc2\
+w\x8b\xa7p>\x17\xd3\x8f~\xf4&\x85j\xaa9\xcc\
+6>`k+~\xbf\xa1\x00\xf9\xd6\xc9&\xf6\xfb\x15\
+\xee\xe7C\x0a\x00\x18\xc9*o\xed\x8f\x02$ta\x14\
+\x05\x0c\xa3\x07\xdd\xe9N\x03\x87\xf9\x82\x03\xbc\xcf{\x1c\
+\x8f-\x01)L\xe5\x06.\xe3\x8c\xa0\xa5\xf5\xfc\x8b\xd5\
+\xbc\xc8\xc1\x16\xf9\xb9\x00\xdd\xad\x93\xd2\x80\xcb\xf6Z\x04\
+t\xb7\xd5\xb6];\x9do\x93\xdf\x8a\xb6\x8d|\xc0+\
+<e\xed-D\x19I\x5c\xcf\xde\x10\x5c\xdb\x8d\xbc\xc5\
+4\xbf\xb5\xe6\xfd\x08=iu\xf4\x97\x02\xaex\xd9*\
+Y\xe6=_d\xc8\xbe\x89\x8dxBh\xf1$O0\
+\xa4\xe3\x06u\xac\x07\x0cd\x05\x97z\x0f\xfbr.\xc3\
+\x18B\x8e\xd5\xff\xca)\xa1\x84\xed\xcd>m\x17\x97r\
+)\xdby\x88U4\x02x\x1f\x8c}\x96\xa0\xaf\x07\x88\
+n\xce\xb1\x1e\x8dS@*3Y\xc8 {\xad\x1c\xce\
+a(g\xe3\x06\x92\xe9\xccnvP\xcc\x16\xaa\xa13\
+s\x98\xcdr~\xca\xd1h\xdd\xfdB\x8e \xd4M\xf3\
+\xb4Y\x9eV&3\xdb\xf4\x98&*\xddwg\x8a\xb9\
+\x0c\x80\xffB\xe8JSo\x90\xdf\xfd\x1bb\xf2'y\
+s~\xc4\x04\x8a}\xe5\xe9\xbaBK\xb4\xb3\x956\xeb\
+\xf4\x8an\xd4\x19\xde\xba\xa5\x9c\x1f\x1d\xf3'Q\x8b\xd2\
+u\xb7\xaa\xd4>\x0e\xebQ\x0d\xf5\x19\xb8\x92\xdeLA\
+(C\xa7\xac\x1a\x0f\xf9\x11\xf0\x88\x95[\xab.\xde\x9c\
+W|\xdd\xfeL=\xa4C!\xb4yL\xbfP7!\
+\xea\xf9n4\xee\xfeI4\x5cE!(\xe2\xc3;\xba\
+\xa4\xd9\xc4\x0a~\xe4=z\xc1*\xabQ_c~\xb6\
+NX\xb9\x7fj\xf1d\x8f\xd0\x9f\xcd\xcc1\x14\x94\xeb\
+\x1a!<,\x08\xd5\xb0\xd0&\x1c\xd9|H\xdf\x89\xac\
+&\xd3\x96\xd9D\x19;(\xa1\x8eL\xd2\xc9e0\x03\
+\x83\x88[\xcf\xbdl\x02\x10\x0d\xa4A!\xefY%O\
+\xf0Cs4\xc7:\xfa\x06\x1b\xcd\x95\x03\xb8\x9f\x9b\x03\
+|vM\x94R\xc2~\xea8I\x06g3$\xa0\xd5\
+\xa5\xdcI\x03\xccc\x99s\xf7\xff\x0dt\xb9\xealL\
+o\xd4\xcdr\x07\x8c\xc4\x99\x9a\xaae\xda\xdd\xe2\xaex\
+\xb4\xd2\xaf\xeek&\x7f\xa2\x10\xfa\xa6\x19O^6u\
+\x92u\x87\xe9\x15\xcd\xd8\xa5%\x9a\xa4\xce\x01\xad\x0e\xd4\
+\x1dz\xdf\xaf\xe6\xeb\xea\x22\x9a\xb8\xc2)\xf3\xafGC\
+u\xcc\x88\xdf\xa7+\xdby%\x15\xeaY\x9d\xf4S\xe9\
+\x0b]gJ\xf3M\xa7.SO\xf5\xd2~\xeb\xacI\
+\xf9V\x8d\x1c\xfd\xcd\xef\xea:=\xaf\x8b\xdbi\xf3\x22\
+m\xb1]\xb1Ni\xa2\x8a3\x9d0?\x8d\xd24}\
+hD\xffMY\xa1lq+K\x8bl\xa4I\xd2\x0b\
+\xca\xb4\xca\x16\x9b\xbc\xb7\xf5ws\xfc\xb0U:M\xd5\
+\xb6\xab\x1a\xf4\xb8\xddm\xd6FJ\xd1}\xb6\xf1b\x85\
+\x10\xef8\xe1\xf5\xfe\x01\xba\xc36\xacu\x0aI\x19o\
+\xea\xa9G\xcd\xa8/I\xdb\xac\x97_\xba\xb6\x06\x0c_\
+\xdb,\xc9\x0b\xfc\x06\xbd\x97\xed\xef\x92\x10\xd2\xb7l\xed\
+}O\x88\xd9\x91\x9a\xefbg\x86*,\x91\x9f\xabg\
+\x87\xd4A\xe8\x1cm\xb4\x19Ti=\xf7\xe7\xe8\xa8\x9f\
+\xf9\xd5\x1a*\x94\xa2\xa7\xfc\xea^\xdf\xe1\xd6\xd0Uf\
+i]\xa3>bG\xa4\xeb\xca\xc9\xe8F\xa3\xd2\xb40\
+\x14B.\xddi\xb9?%\xa9^\xd7\x0a\xa1+\xcd\xfa\
+Oj\xd4\x15B.=g3\x7f\xbd\x06\x84\xd5\x1a\xba\
+\xdd\xc8\xb8[\xc8\x9a\x86\x85\x8d\x95\xbeQ{K\x98\x0a\
+!T`\x86:\xa9\xc1\x1a\x10o\xb2:\xbbG\xb3\x85\
+\x92\xf5\x8c\xcd\xfc\xa5r\x85\xddV\x92\x19B\x8b\x84x\
+22\x02\x0e\xba\x8d\x0b\xe3\xce\x08\x08@}\xf4\x9e\x8d\
+\x82\xe9Bh\xae$i\xae\x10Zf\xeb\x0f\xf3#j\
+\x09M\xb7$y\xd4OA\x16\x9e\x1d@\x7f4\xc9\xbc\
+\xa4\xfaG\xa8V\x9a\xd6\x1a#Oi\xbc\x10Z\xa8\x85\
+B\xe8\x87\xa6\xa4I7F\xd8\x0e\xean\x1e\xaf\xa9B\
+\x91x\x18\xa7\xf8\x9e\xa8\x9d\x11\xab\x85R\xb5\xc6\x18Z\
+n#\xf4<3v{t\xab\x03\xed\xa0\x1d\x96\xbc\xbb\
+\x84\xb8\xb0-\x13\xdb~O\x0e\xb3\x1c9\xc0\x8e\xc8\x1e\
+%\x00\x1a\x98\xc1Z\xeb8\x9b\x97\xacPa7\xabI\
+\xb7r\x17\xf0\x94\x03\xed\xf8\x96\xddnoSa\x13\x90\
+\x0a=\xac\xc3\xcf\x1cQ\xac\x81\x99\xc6\xd7U\xc0}\x00\
+\xfc\x9a\xafY9\xabx\xd4\x91V\xb0\x5c\x10\x96\xbb#\
+5|\x02\x92\xbc\x9e\x89v\xa5t\x00'\x98\xca!\xeb\
+x\x01\xa3\xb8\x90\x99\xd6Y\xb1Y\x12E\x8e\xe6\xc7\xfe\
+ \xd0vlb\xdb\x1e!\xf9\x08\xe8\x86S\xd8\xc7\x0d\
+\xfc\x95$ \x85\xc7\xc9\xb0f*\xf5\x5c\x13\x89o\xb3\
+\x05\x06X\xbf_\x18\x16ZC\xdb=`\xa7qQ9\
+\xea\xa7^\xcf\xd3\xd6\xd18\xe3\x0a[\xccv\xc7\xe4\x8f\
+0\xf1\xd8{\xc0\xc3\xc7\xe1K\x1a\x86\xfe\xc3\x8c\xcf}\
+\x1c\x19\x9f\xbd\xa9\x87\x0e\xfaM\x85\xf76{\x82\x1cI\
+\xf7\x98\x09v\xaa\xd8\x1a\x09\x95.j\xb2\xcc\xe2$\xb2\
+\x89P\xcb\xf4]?\x02\xa6;(9U{-\xa9/\
+\x0a\xb14\xb2\xde\xf4'\xb4\xce\x12\xf7i\x04\xd3\xd3`\
+j\xee3\xe6\xefvT\xf2\xcdF\xeeuB\x5c\x1c\x19\
+\x01W\xf9&\x96\xd2lG\xfb\x80o\xd12\xcfA\xa9\
+\xdd\xf4\x99\x99\xba\xb9\xc4\xb6HW\x83\xa9|\x9enD\
+\x1e\x0cc9\xdcz\xca3\x04\x0crP\xea\xef\xfdo\
+\xd7\xad\x91\x99\x0f0\x17\xddd\x84\xbe\xae$\xc7T\xcd\
+5R\xcfrL\xe6\xb7\x8d\x7f\xf1#\xa5\x8ab'>\
+\xcbLew\xb2-\xa8\xe5g\x8e)\x9bcd\x0ev\
+H\xe28\xe3wh\xd0(!&En>\xc0d<\
+CUc\xd4\x9d\xe3\x90\xba\x03\x8d\xc4\xb3\x1d\x917B\
+\x87\x8d\xc4EB\xbc\xe8\x8c\xf9\x00O\xa2YF\xb8\xc7\
+\xa1Ak\x80\x918\xc4\x01i\xc3\xf5\x85\x91\xb7V\xc9\
+b\x0fY\xce\x11\x90\xc1'\xe8W\xb6\xf7\xf6\x83J\x8e\
+X\xe5l\x07\x09\xb8\xd4\xb6a\xb7U\x99\xa2\xd6\xe9\xe0\
+\xdb39\x94\xa4\x156\x0a^\x09\xfb\x8d\xd0Y\xfd\x95\
+\xa7<\x8d\xd2\x01IR\x85\x06y\x03\xe4\xc2N\xb7\xda\
+6m\xb6\xab\x8fh\xe2;\xa1\x1a\x16\xfa[\xf2\x1b\xfc\
+\xd5\xd5u\xb9\xed\xbdr\x90[x\xb5\xdd\xcb\xd28\x87\
+!\xe4\x90K\x0e\x03p\xd3\x83\xceA\xeb\xd5QI%\
+\xe5\x94QJ\x19\xc5l\xe7DHjue)\xb3\xcc\
+Y1\x97p\x00n\x8bt\xfe\x17\x1c\x138\x9e\xa4_\
+\xf8m\x8c\xff\xc1\x1b\xd4\x14\x90\x5c\x1a\xad\xf9\xfa\xa3\x8a\
+\x8cG\xb1\xa3hR\x89V\xeb\x7fTh\xdfj\x0fH\
+\x17j\x97\xed\x9a\x7f\xa8\xa7\xf0pw4\x8c\xf7\xa2\x90\
+J4\xc3o\xd7\xaeJ?\xf6\xdb,9S\xb7\xeb\x8d\
+\x16{B\x91\xa1V\xef\xea^\x0d\x0f0\xbe\x8b~\xed\
+\xb7\x89\xf2\x9c:\x89&\x07\x9d\x0aA1\x8c=hh\
+\x8b`\xd72\x9d+\x94\xa7E\xfa\xc8A\xc3[b\x97\
+\x16k\xa41\xffZ\xed\xb1\x955\xe8\x0e%\x89\x13\xfc\
+gG\x0d\xea\xf8L\xb9\x17+\x98\x9c\xc2\xbd\xdck\xf3\
+\x12\x15q\x98KZu.\xd4\xb2\x97RJ\xd9\xcf!\
+*\xa8\xa4\x82S\xc0Q<@\x16\x90\x8a\x1b7nz\
+2\x90\x5cr\xc9m%\xfe\x0a`3O\xb3\x93\xfb\x98\
+`\xcb+a\x16\x1ba?S\xf9\xbf\xe8\xde\xfff\xd2\
+\xfe\x9bz\x94\xaf\xb7\xdb\xbcc\xd5zU?\xd7\xb5\x1a\
+\x1c\xc6+3GS\xb4PkZx\x0d\x82\xa1I\x8f\
+y\xb7\xcc_6^\x90\x98\xe0<J\x10\xfa\x9d\xd9\x89\
+\xf3\xe1\x94\xde\xd0m\xcaw`\xa6\x80\xd0\x10\xcd\xd6j\
+\x13M\xdc\x12;t\xa1\x10'\xf8A\xeccK;\xb1\
+\xe8\xfcz\xffP\xa9:\xad\xd1u\xcd\xc1J\x8e\xa6N\
+\x9a\xac\xa7\x03h\xf8\xa3R\x85\xd8b|\xf7\xb1\xc6\xd2\
+U>e\x8a\xf5c\xf5\x8e\x82\xe9\xf6\x94\xa9\xd9~\xc3\
+\xef\xaf\xc4Qn\x8f\xf9\x9f@\xf80v\xe1\x11IR\
+\x91\xa6\x87\xdc\xe1]\xea\xad<\xe5k\x8c\xc6\xe82\x15\
+h\x8cF)O}\x95\x162\x0d\xdf\xd4;V\x7f\xbb\
+\xa8\xa8\xedM\x8fP\x10\x11{\x1f\x1c;\x97k(\xe1\
+M\xd4j\x9d3\x18i\xcd\x04s\xe9G\xcf6\xdc\xeb\
+\xc7\xa9\xa4\x9cR\xca(e\x17[[\x8d|]\xcfz\
+\xc63\x9e\xbf\xb0\xfd\xef\x1c\x88+\x01\xf0\x19K\x82\xe6\
+w\xe2<&0\x96\x91\x1d\x08\xd3\xc9$\x93\x1c\xc6\x9b\
+\xf3\x03\x14\xf1\x01\x1b\xf8'\xc7\x02\xean\xb4E\x93\xc5\
+\x95\x80@\x8c\xe0j\xae`\xac\xd9\xed\x0b\x1f\xd9d3\
+\x11hb+\xebX\xcb&<N+\x1b1\xe6\xd9\x9f\
+\xcd\xe1Z\x1c\x10\x22\xe7$\xca\xf5\x84\xed+\x13\x84\xf8\
+]\xe4&8\xd2\x03\xbar=\xdfg\x5c\xab\xe5G\xd8\
+M\x19e\xec\xe30G\xa8\xe0\x985\x0b\xac\xe2\x0c\x5c\
+@\x16\x19\xf4\xc0M\x1f\xfa\x93C.yA\xc7\xb6l\
+\xe60\x87O\xf9\x03\xcf\xc6&2>\x04\xccC\x99\xba\
+\xa7\x95H\xder=\xaf\xbb41\xc4 7\xff\xd4C\
+\x97h\xbe\x9em\xa5G\xd5h\xb1w\x9f\xca\x81\x1e\x10\
+!\x01sM\x04\x99\x0f\xc7\xb5Z\xb3\x1c\xf3\xf4\xf6\xd7\
+\x0c=c\xf3\xf65\xe3\xa4~)WTV\xfd\x1d\xc0\
+\xdc\xc7\xfc\x95:\xa1\x15\x9a\xdc\xa1H\xc2P\x93K\x13\
+\xf4\xdb\x00\xb2\x1f|+\xce\x04,_\xe9S\xe6C\xcd\
+\x89\xca$\xd8\x9e\xd25\xc3/\x88\xf6\xf9-\x91\xdb\x10\
+\xd1 \xf8\xc4\xf6i\xf4\x05\xde\xe7\x01^oc2d\
+G&nz\x90D\xa6\xd5\xb4\x87\xa3@5\x15T\xb7\
+{m\x1d\xcf\xf1\x1c\xe3\xf9\x09\x93\x81Z\x9e)\x893\
+\x01E\xc7\xf3\x99\xcc\x1e\xdem\xa3N_F2\x94\x5c\
+r\xc8\xa5\x1f\xee6\x22M\x9a\xa8\xe4 \xa5\xec\xa5\x8c\
+\x9d|\xdcj|\xdbF\xae$\x9f\xb1\xbc\xcd\x1e\x07^\
+\x06\x11\xbe\x06\x0f\xb1\x22h~7.\xa0\x90\x02\xf2;\
+\xb0Hw\xd1\x8b^\x8c0\xe7G\xf9\x98-\xbc\xcb\x06\
+\x13R\xe3\xc3\xd6\xc8\xb6\xfd\x9d#\xa0%\x92)\xe0[\
+Lb\x84\x03\xff\xd1\xd5\x8dB\x0a\x99\x0f\x14\xb3\x8e\xb5\
+\xbcK\x83\xb3\xca:\x00\xbf\x99\xe08=\xae\xf2(\xce\
+\x04+\xb5R\x97\xfb\xaf:O\x97\x99`wf\xf1}\
+\x86\xb7Z\xee}\xaeK)\xa5\xc2J\x1ek.\x08^\
+\xaf\xa0\x1b7=p\x93C\x0e9\xe4\x91\x17\xc4\xbf\x98\
+\xc5LfR\xca\x0a~\x1f\xdb?\x9ck\x03\xf3\x90[\
+\x0f\xf8}\xe0\xe0C\x89\x9e\xd6\x5c\x15z\xbf\xe4\xea`\
+\xea\xa2\x02\xcd\xd6r\x15\x05\xfdd\xea\x94\x96+\xe7\xf4\
+\x98\x09.\x08\xb2\x03pD+t]X\x13\xe0`)\
+KS\xb4\xcc\x16k\xde\x8c:-Q\xba\x83\x9fE\x85\
+\x85\xdb\x7f\xe3\xafT\x95\x96\xe9\x22G\xe3}\x9aS\x92\
+\xc6\xe8\x97\xfa\xbc\x05\x09\x0f\xbf\x1dg\x02\xb6\xfb\xbe\xa5\
+\xd1\x06\xcd\x0c\xf2E\x97\xb3)ES\xf4\xaamkn\
+\x8dS^\x91p!w\xc3\xe7\x92\xf4V\xbb\xdft9\
+\x99F\xea\x055I:\xeeydJ\x9c\x09\x80{\xf2\
+\xee|mLc\xec\x8coN\x83=\xb7\xfd\xe3\xa7\xe3\
+\x22\xd7\xdf\x19\x0c\xe3\xb5\x18\x13\xf0>\x17\xc4\xdb\xe8\x96\
+\x18\xcb*\xef?DE9yx\x93\xcb\xe3mlk\
+\xc8\xe5a>\x8b\xa2\xf1\x95<\xc9\xc8x\x1b\xd9\x1e\x92\
+\xb9\x8cg\xa8t\xd8\xf4\x13\xaca\x9a\x03\x8e\xe6 \x88\
+\xce\x96\xa2\x8bqLb\x12\xa3#\x5c\x13\x89Ox\x93\
+7y\xcf|\xb6\xf0\xff\x84\x80fte4\xe7Q\xc0\
+\x08\xce\xea\xc0\xfdk\xa4\x94O\xd8\xc4f6\x87\xe0%\
+9\xad\x09\xf0\xc1\xc5\xd7\x18L\x0e}\xe8EOz\xe1\
+\xa2\x1b\x90A\x0dPC\x03\x95\x1c\xe20G(c'\
+{O\xc3uo\x02\x09$\x90@\x02\x09$\x90@\x02\
+\x09$\x90\xc0\x97\x0b\xff\x06DD\x15\xd1z<{1\
+\x00\x00\x00%tEXtdate:cre\
+ate\x002018-07-26T1\
+9:59:36+02:00\xde'\x9d\
+\xe3\x00\x00\x00%tEXtdate:mo\
+dify\x002018-07-26T\
+19:59:36+02:00\xafz\
+%_\x00\x00\x00\x19tEXtSoftwa\
+re\x00www.inkscape.\
+org\x9b\xee<\x1a\x00\x00\x00\x00IEND\xae\
+B`\x82\
+\x00\x00\x0c\xbe\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x04\x00\x00\x00i7\xa9@\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\
+\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x02\
+bKGD\x00\x00\xaa\x8d#2\x00\x00\x00\x09pH\
+Ys\x00\x00\x0d\xd7\x00\x00\x0d\xd7\x01B(\x9bx\x00\
+\x00\x0b\x9fIDATx\xda\xed\x9cmpT\xd5\x19\
+\xc7\x7f\xd9\xc4\x90M6\x9b\xacd7\x01\x02A \x08\
+h\xc5V^\xaaU\xc7\x0a\xb6\xd8)\xb4c\x15;\xb5\
+E\xa1\xedtl-U\xd1\xb1\xad}\xff\xd2q:\x1d\
+[u:v\x94i\xa7\x8e:\xcet\xb4\x8aE\xad\x14\
+\xed8S\x81\xa0@\xb5Z\xc0 \xe1-\xc9&\xb0\x9b\
+d\xc9\x0b!9\xfd\x90\xdde\xef\xdes\xce}\xd9\xcd\
+^>\xdc\xff\x99Iv\xf7\xfe\xcf9\xcf\xf3\xdcs\x9e\
+\xfb\x9c\xe7\x9e{\xc1\x87\x0f\x1f>|\xf8\xf0\xe1\xc3\x87\
+\x0f\x1f>|\xf8(5*\xa9\xf4Z\x04\xaf\xb0\x9c?\
+s\x1c\x81\xe08\x7fb\x99\xd7\xe2\x94\x16Sx\x92q\
+DN\x19\xe7\x09\xa6x-V\xe1\x88\xb1\x98\x85T[\
+\xb0.\xe0u\x83\xf2\x99\xf2\x0f*,jV\xb3\x90\xc5\
+\xc4\xbcVS\x86 \xf7\xf3AZ\x91\x11^\xe3\x06\x0d\
+\xf7!\xa9\xfa\x02\xc1\xaf5\xb5>\xc7k\x8c\xa4y\xff\
+\xe5~\x82^\xab\x9c\x8bE\x1c4)\xf3\x17\xaa\xa4\xdc\
+Y\x0c+\x0d0D\xb3\xb4N\x15O\x99\xb8\x07X\xe8\
+\xb5\xda\x19\xb4rR\xaa\xce\x16\x02\x12\xf6}J\xf5\x05\
+\x82{%5\xcayY\xca\xede\xae\xd7\xaa\x03\x04x\
+W\xa9\xce&\x09\xffE\xad\x01^\x90\xd4\xb8_\xc9\xde\
+-5q\x89q\xabF\x9dS\xd4\x98\xf8;\xb5\x06\xd8\
+i\xe2\x87Hh\xf8\xb7\x14~\xfe\x0a7\x80\x1a\x11>\
+o\xfa\xed\xb4\xb65\xf3\xd1U\xd4\xbb\xec\xbdD\x06\xd0\
+\x870KM\xbf\x1c\xd0\xf2\xf7\xdbh\xc1\xfe\xd1\x92\x18\
+\xa0A{\xd4|\xcd~Y\xcb\xdfb\xfa%\xaa\xe57\
+\x16*\xbe.\xf4(\xe3JV\xd1B9\xc7\xd8\xc6\x9b\
+\x9c\x95\xb2\x92Z!\x92\xa6_\xb6\xf2\x1e\x9fP\xb0\xf7\
+\xf2\xaa\xe9\xb7\x84V~\xd5\xd1\x0a\xaec%\xcd\x8cq\
+\x98W\xd9\x81pn\x9a\xe5\xec2\xb8\x9b\xfd\xac\x92\xf2\
+\xb6i\x9d\xda\x1d\x92\x1a\xcb\x18\x92r\x07\xb9B\xc2\xde\
+\xa0m\xffu\xa9L_`\xbf\x81\xb5\xcb\xf9Z\xe3V\
+I\xb82&\xbdJ\x7fO#\xde\x88b\x00\xaff\xc0\
+\xc4\x1d\xe0\x8bRn,\x1b\xff\xc9\xca\x9d\x92\x1a\x9b\x18\
+3\xf1\x86Y\xebD\xfd\xcf(:\x1d\xe7f\x137\xc8\
+Q\xa5x\x0f+{X\xc4+\x06\xe6V\x16(\xb9\x8f\
+(\xdb\xef\x90D\x9b\xb7\xe6-\xb3\xce\x99\xe0\xd3v\xd5\
+\x0f\xb0O\xd9e'!\x13\xff\x1a\x85\xb9\xf6I\xa2\x80\
+\x5c<\x9be>\xab\xe5\x85\xf8\x8f\xb4\xfd3\x5cg\xe2\
+\xd6\xd2\xa5\x94}\x8f]\x97\x7f\x83v\xd6}[Rc\
+\x8ddH\xb71\xdd\xa2\x9f=9\xa2\xe91\x83\xdd\xa6\
+\xf6\xfbY-a~G+\xfb\x0a{\x06xX\xdb\xc8\
+\x0b\xd2:sx\xc60\x0e\xb6[\xae\xee\x83\x9c\xc9\xb2\
+G-\xd7vU\xbca\x18\xceOs\x91\x94\xa7\x0f\xb4\
+\x7fk\xcf\x00\xfaF\xf6)\xeb\x85y&g\xaaX\xad\
+\xed\xaf2\xb4z\xa5\x05\xbb\x22\x9d=\x12\x08\x9e&\xac\
+\xe4\xbd\xe7\xf4\xe4\xc9f\xc5\x05ZQ\xd4g\xb6\x9f#\
+\xd9\xcfM\x92 \xd8\x88\xa5\x9aof\xac\xca\x99PG\
+\xe8W\xf2\x1c\xcb.3\xc0qm#\xc74\xc7r\x13\
+\x9c\xeb\x8bj\x80\xdc\xd6tiT\xc7\xb2\xcb\x0c\xf0\x86\
+\xb6\x91\xed\x9ac\xb9\xf6_m\x11\xc4.q`\x80\xa8\
+!F\xd0\x19\xc0\xbd\xec9\xa8%\xae\x9cEC\xcc\xd2\
+\xd4|\xdc\xc0\xbdG\xc3\xac\xcb\x0bV\xc6\xa8\xd3\xb0\xef\
+1p\x1f\xd70gk\xf2M]\x92K\xb8t\x04\x0c\
+\xf0ce\x07\xbf\xc9\x99\xe7f\x18\xcf\x8dn\x12\x5c\x91\
+\xd7s@\x1a\x06\xcb[\xd2\x8d\x80\xc3\x1aO\xffCR\
+\xd8\xc6\xa3R\x1b\xfe\x8drm\xad\xfc\xcc\x9dz`?\
+`j\xfb\x01%wi\x1e\xf3)\xad\x0c\xe5\xbc$\x95\
+\xfd\xf7r\xba*6\xfa>\xf7J\x92\x13\xaf1\xa6\xed\
+<\xff\xdc\xa8\xc7\x80yq\xa26\xd6\x86\xbc\xefzO\
+?&YQ\xa6\xb8\x9b\x1f\xe0\x18\xd3x\x90\xb7\xe8\xcc\
+\xb1b\x9f\x22k\x9b\xc1\xf3yVO(\x03\x9c\x0e\xd3\
+\x19\xeaP0\x83\xa6\x94\xd8\xf3Z\x19\x9a\xe9\xcb\xe1\x9e\
+\xe0-\x1ed\x9as\xe5sq(\xa7\xc1\xadZ\xa69\
+{\xfb5)\xafQ:H\x9b\xa4\xdc\xdbL\xbc-:\
+\x11\x0ca\x5c\xbb\xb5rv\x96\x07\xef\xe4|\xbe\x91\xaf\
+k\x98\xe6\xc1)\x9f\x04\xf2\xe1.w\x83\xe6\x16tS\
+\xe0\x1b\xacQH^$\x03\xc0\xef4\x19 \xb3\x7f^\
+\xc1\x1c\xdb\x06\x90\xfd:\x9b\xcf\xda\xe8%\x83\x86\xbck\
+@\x91\x0c\xb0\xdb\xf0m*\x8f(\x99\xe6sS\xc6\xba\
+\x82\x0cp\x87DB\xf5\x08\xf8C^\xf0\xb5\x9b\xa2 \
+bJ1\xdc\xa4`\xee\x92\xcc\xec\xc3\x12\x15\xba\xa5>\
+ .1_\xbb\x84\xb7S\xd1\xfb\xea<\xde8\x17\x16\
+\xc7\x00F78\xb1\xd6\x8bHy{\xa4\x8a\xe5\xaf\xc2\
+g+c\xb5\x96<\xe6J)\xeb]i\xdfu\x1c\xcb\
+\xe3\xd9p\x81v\xd3\xe2\xf9C\xa9I\x11o\xc9\x07g\
+\xfeu|\x09*\xe4O\x02\xb9\x0b\x95\xfb\x80\x87\x99\x91\
+\xf7\x8b\x0d\x0f`\xd7\x00\xe6\xa6\xd6K\x97\xbbr\xd1n\
+\xca\x1b/\xea\x0c\xad\xd1\x00u|Y\xca\x92\x99\xf9z\
+I\xfe\xd9\x96\x07pk\x00\xf8#\xb5\xb6D\x83*\xbe\
+\xaaQS}\xe46\xc5V\x0bs/5<A\x99-\
+\xa9]\x22\x22\xcd\xb4>j\xe2\x1dW\xcc\xed]9\x9c\
+\x80!R3\x96~\xc3\x09iS\xb0\xcc\xab\xfa\xc7$\
+\xac\x22\xba@0\xbb\xc1\x89%\xec5y,\xf52z\
+q\x96\xb3P\xc9\x11\x88\x9c\xe4\xf8\xa5JNw^\xaf\
+WJ\xee\x03\xd8t\x81\xf6\xef\x0d\xee\x96\xd6}2/\
+\xd6W\x87(\xb7g?\xd9\xbd\xd9\xf9M%\xc7\xd8\xcb\
+\x146K\xb5\xb0\x19\x03\xd85\x80|>\xcd\xe7\xe7\x86\
+\xef\xea\x10e]6\x1fg\xcf\x00\x95\xdc\xa6\xe4\x18{\
+\xf9\x95b\xabL\x11=\x00\xa8\xae\xc8\x82Q\xc3Em\
+T3\xb83\xc1\xd3\x0e\xed\x14x;\xcd\xfa\x8a\x86s\
+&\xa7\xc7\xcbs\x92\xeb\xfa\xe8\xa3@D\x147\x9c\x04\
+\xfb\xb2C\xb2L\xab\xda\x96\xf4\xd9\x1b\xd4\xb2\x86\xd2\xe7\
+\xf7e\x0dg<\xeb\xf1+\x94\xdbs\x8a\xec\x02A\xee\
+\x06'\xcaO\xd3\x8cJ\xadj\xa3L\x07>\xa5\xe5\x08\
+\x04\x9f\x04\x9a\xb4cId'\xc1\xcf\x94\x0c\x9b.\xd0\
+\xc9\x06\x09\xb5S\xf9\x09\x97\xa6\x0d\xa0C\x05\xeb\xb0\xb3\
+\xa3c)\xb0\xde\xe2\xb6\xcaDO\x0b\xf8\x91\x0bi]\
+\x1b@\xedT*\xd9L9V\xa9*XO\x99M\x03\
+\xac\xb3\xe0\x5c\x00\x04\xd8\xac\xd8\x89\xa8\x97\xd65Vj\
+\x07\xe5\xbd\xa8\xf2<\xb9\xe5j\xcd}\xe7L\xd9\xcb5\
+\x96\x9c\x18\xb0I\xcb(\xb2\x0b\x04\x9d\x1b\x14\x08N3\
+\x8ffK\xc1\x9f\xb5\x98\xdb\x02\xc1Y\x9e\xb3\xe4\xcc\xe0\
+\x22RZ7Yt\x17\x08H\xd7\xe6\xe7\xcav\xe6X\
+\x0a>n\xc9\xb0\xc7\x9a\xc3v\xedq\xdb.\x10\x8b<\
+\xbf\x11Ws\x89\xe6\xe8E\x8cY\xde\xe3-\xc3\x0e\xac\
+Yc\x8adk\x06\xaf\xf3W\xbbJ9\xd9&g\xe5\
+X\xeev\xd0Va\xb0\xea\xe9];\x8d\x14\xdf\x00\xa5\
+\xdb\xb7k\xd5\x93\x83\x5c\xa0\xbdA9\x81\x08'\x1d\xf1\
+\xbd\x82\xa0\x81Sv\xc9N\xceZ\x82\x8f\xbd\xd6\xcd\x16\
+\x0e\xd9W\x1f\xcb\x8d,F\xbc#\xcd\xf2\xdbD\x0da\
+\xc2\x84\x80\xf2\xf4\x1e\x97\xea\xf4\x121B\x8aQ\xe0,\
+\x03\x00\x0cp\x16\x18\xa0\x8f$#\xce;r\xe0\x01\x9c\
+\x1b\xc0b{z%1\x9a\x891\x83&b\xd4\x11N\
+\x97z\xc2\x8e.8\xe70D\x92$}$I\x92\xa0\
+\x8b\xc3\x1c\xe5(Gu\x86q\x14\x05:5@\x1e\x22\
+\xcc\xa7\x95\x8b\x99I\x133\x88M\xc2\xf3LA\x82\xd2\
+{\x9b]\x1c\xe5\x08\x1d|\xc0{|`\xbc\xf1\xef\xc8\
+\x00\xce\x9c\xda\x85\xf4\x06\xca.\xe5bZi\xe5bZ\
+-\xb6\x8a\x97\x0a\x82C\xec`'\xfff\x0f\xe3\x8e\x5c\
+\xa0S\x030\xb5\xe3\x9f\xb3\x16;\xab\xa2\xc1 #\x80\
+ I\x0d\x95@\x85$\xd1\xec\x0c\xfbXq\xe4d\x8b\
+\x93\x1a\xce\xa6\x00wU\xd8Q\x7f\x848\xc7\x88\x93`\
+\x80~\xfaI\xd2G\x7f\xb6\xc08}\xda\xfa\x13\xfe\xa2\
+\x8ez\xea\x0d\x7f\xa7\xd2\xccL\xed\xde\xab\xc5\xdcU\xf1\
+KG\x1a94@y\xc2\xbc\x01\xb6\x9f\x83\xb4s\x82\
+N:\xe9\xe2\x04\xdd\xf4:k\x14s\x8b\xa0~\x14 \
+\xc8,f2\x93\x16f1\x9fK\xf2\x9e\xa8\xa9p0\
+\xfc]`\xfa\xc6mB\x88a\xf1\xbex^<$\xbe\
+%\xae\x15Mv\x967\x93Zf\x8a\x1b\xc5/\xc4\xab\
+\x22!\x84\xd8&\xa6\xdf5\xa9\x06`9\x22,\x02\x9e\
++-+\x01\x11\x16\x08\xa7O\x119\x0dm\xcbhW\
+lS>?\xd0N+\x8e\x1e\x8fq\xba\x80\x11<\xe6\
+\xb5\x8eZ<\xe6L}7\xa8\xe0\x1d\xaf\x07\xbb\xb2\xb4\
+\xb9\x0c7\x1d\xa2\xc5\xb4\x15\xe1\xfc(G\xb5\xdbx\x15\
+p\xb7\xbc]\xc8v\xc5\xa66`*\x8dD\x99F\x1d\
+\xf5T\x13\xa4\x8e\x1a\xaa\xa8K\x07;5\xd9\xecy0\
+\x9b\xd4\x1df(\xfdi\x84A\xe0\x0c\xa7\xe9c\x88\xc1\
+\xf4\xdf$I\xba\x88\x13\xe7\xa4Z\xa6.\xae\xe7\xc3R\
+\x19\xc0`\x82\x1a\x96\xb0\x90\xf9\xccg:1b\x96\xd9\
+\xf1Bp\x86\x1e\xba9\xc1A\x0e\xf0!\xbb\xcfmf\
+u\xa9~!XD\x12q\xbbh\x13\xa3\xc2+\x8c\x8a\
+6q\xbb@\x90\xf0\xe6]\x02k\x96\x8bq\xcf\x94\xcf\
+`\x5c,\x17\x8a'\x0em\xc1a(l\xc0K+\xda\
+\xca\x94aG?\xbd$\x18b\x98\x04C\x0c\x91d\x88\
+a2\x0b \x0c\x9f\xa6d\xf7\xc2L|\xaa\x22H=\
+A\x82D\xa8\x22H\x84\x06\xe5cBe\xac\xdc\xb5S\
+\xff<\xf2\xa4\x19\x80\xf2;O\xb5]X\x06\xd0\xc5\xff\
+8\xc0\x11N\xd0C\x9cNz\x18.\xa4a\x09\xaa\x88\
+2\x9d(1\xa6\xd1B+\x0b\xd2.\xe8\x94\x08|\xb7\
+\xc8]9\xc1\xb5\xf7m\x14kE\xb3'\x97\xbdf\xb1\
+Vl\x14\xd7n*\x5c\x8b\xc2\xf0\x92\x17\xcag\xcb\x8b\
+^\xab\x0f\x0b<5\xc0\xfcB\xc5/\xfcf\xc6\xa8\xa7\
+\xe6/\xb8\xf7\x82\x9c \x80\xfc\x0a<\x85\x18M4\x12\
+%F-!B\x84\xa9#D(\xfd\xe0Vm\xba\xe3\
+\x1a\x04\x83\xc0\xb9\x94x\x8a\x14)\xfa\xe8'E\x8a~\
+z\xe8\xa1\x9bNz\xe4y\xe0E\x85\xde\xab(\xdc\x00\
+K\x00\xc2\xcce\x1es\x99\xcb<\x9ah\xd2\xbe\xf7\xc4\
+l\xac\x09D-xI\xba\xe8\xa4\x9dv\xda\xf9\x88\xf6\
+\x89\xbc\xd1\x15\xfc\xbd`\x0d\x0a\xc3\xd2m[E\xdc\x93\
+\x10(.\xb6\x8a\xa5\xdb<V\x9f\xb5{\xc7\xbc\x8c\x03\
+\xf7\x8e\x15\xfa&\xa1\xc2nv\xde\xccs\xa9\x80\xfa-\
+\x09g\x89\xd3C\x1f)R$\x19H\xcfj\xc8\xdc\xfc\
+\x9axm\xd0D\xfdLJ<L\x88\x10\xb5\xd4\x13\xa2\
+\x960Qb\x9ayz\x9a\xd0\x18\xb7(\x1e\xe9\xb7\x85\
+B|\xc0e<E`3\x1b\xd3_G8\xc4G\xb4\
+\xd3A\x9cN\xe2\xf4H\x1e\x01q\x87\x18Q\x1a\x99F\
+\x94\x16\xe61\x979Y\xbf\xb1\x19\xcay\x9ae\xbc\xef\
+\xb6m\xf7# \xc0\xdb,\x832n\xa4\x91\xc3\xb4s\
+\x8c\xf1\x22)l\xddu3s\x99M7\xaf \x00v\
+p\x15\x93\x9e\x0a\xcb\xc7\x1a\xcf3@\xb9\xc5\xf5z\xd0\
+} d\xf5~\x80\xd2b\x83\xdb\x8an\xa7@9\xbd\
+\x8e.\xf6\x93\x8d\x04Q\x8b\xe7\x9a\x15p;\x02\xae?\
+\xaf\xd4\x87\x88\xe4\x01\xcbID5\x1f{>\xeb\xf3K\
+\xbb\xbb\xb7\x8c\xba\x1b\x01\x1b\x98]J{\xdb\xc2\x1c\xcb\
+\x1d\xc6E4\xc0jW\xb5&\x1b_*\x9d\x01\x22\xae\
+jM6\x5cI\xe5\xce\x00\x1d\xaejM6\x5cI\xe5\
+\xce\x00oz\xad\xab\x14\xff*]WS\xce\xc3\xab\xc0\
+\xc7\xa5}7\xf9\xe5\x9a\xe7?\xbd(I\x8a\xb7w\xcb\
+&\x16\xf3\x91\xe7jg\xcaA.s\xab\x86\xfb\xfb\xe9\
+\xdd<A\x1f\x83\x8c\xe4\xdc\xe6-5\xfa\xd8\xcfN6\
+\xb3\xc1\xe2\x1db\x1a\x14g\xf7w\x84\xd9\xe9\xd2@#\
+Q\xa24\x14\xfd&\xf1(=\xf4\x12'N/\x87\xd3\
+%Qx\xb3\x93\xb7\xfd=B\x8c\x06j\xa8#D\x90\
+Z\xc2TS\x9d\xbdVg\xfe\x87 \xbb\xcf5\x91\xfd\
+?\xc8 \xfd\x0c0D\x8a>N\xd3K\xbc\x18\xca\xfa\
+\xf0\xe1\xc3\x87\x0f\x1f>|\xf8\xf0\xe1\xc3\x87\x0f\x1f\x13\
+\xf8?\xa4P\xb1e\xcfR\xfcV\x00\x00\x00%tE\
+Xtdate:create\x0020\
+18-07-26T19:59:3\
+8+02:00\x8e\x18\xe6\xbe\x00\x00\x00%t\
+EXtdate:modify\x002\
+018-07-26T19:59:\
+38+02:00\xffE^\x02\x00\x00\x00\x19\
+tEXtSoftware\x00www\
+.inkscape.org\x9b\xee<\
+\x1a\x00\x00\x00\x00IEND\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x06\
+\x07\x03}\xc3\
+\x00i\
+\x00m\x00a\x00g\x00e\x00s\
+\x00\x0e\
+\x0cR\x85\xc7\
+\x00b\
+\x00l\x00a\x00c\x00k\x00-\x00p\x00a\x00w\x00n\x00.\x00p\x00n\x00g\
+\x00\x0e\
+\x02\xb1\x84'\
+\x00b\
+\x00l\x00a\x00c\x00k\x00-\x00r\x00o\x00o\x00k\x00.\x00p\x00n\x00g\
+\x00\x10\
+\x08\xe8\xe2\x87\
+\x00w\
+\x00h\x00i\x00t\x00e\x00-\x00k\x00n\x00i\x00g\x00h\x00t\x00.\x00p\x00n\x00g\
+\x00\x10\
+\x0e\x15\xd7G\
+\x00b\
+\x00l\x00a\x00c\x00k\x00-\x00k\x00n\x00i\x00g\x00h\x00t\x00.\x00p\x00n\x00g\
+\x00\x0f\
+\x0b\x101\xe7\
+\x00w\
+\x00h\x00i\x00t\x00e\x00-\x00q\x00u\x00e\x00e\x00n\x00.\x00p\x00n\x00g\
+\x00\x0e\
+\x02_H\x07\
+\x00w\
+\x00h\x00i\x00t\x00e\x00-\x00k\x00i\x00n\x00g\x00.\x00p\x00n\x00g\
+\x00\x0e\
+\x0cKA\x07\
+\x00w\
+\x00h\x00i\x00t\x00e\x00-\x00r\x00o\x00o\x00k\x00.\x00p\x00n\x00g\
+\x00\x10\
+\x0c\xbe?\x87\
+\x00b\
+\x00l\x00a\x00c\x00k\x00-\x00b\x00i\x00s\x00h\x00o\x00p\x00.\x00p\x00n\x00g\
+\x00\x0e\
+\x06\xf4@\xe7\
+\x00w\
+\x00h\x00i\x00t\x00e\x00-\x00p\x00a\x00w\x00n\x00.\x00p\x00n\x00g\
+\x00\x10\
+\x0a{\x0aG\
+\x00w\
+\x00h\x00i\x00t\x00e\x00-\x00b\x00i\x00s\x00h\x00o\x00p\x00.\x00p\x00n\x00g\
+\x00\x0e\
+\x0c\xbd\xb5'\
+\x00b\
+\x00l\x00a\x00c\x00k\x00-\x00k\x00i\x00n\x00g\x00.\x00p\x00n\x00g\
+\x00\x0f\
+\x04\xbcb\xa7\
+\x00b\
+\x00l\x00a\x00c\x00k\x00-\x00q\x00u\x00e\x00e\x00n\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0c\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\xc6\x00\x00\x00\x00\x00\x01\x00\x00.\xee\
+\x00\x00\x01\x959\xfd\x81\xb0\
+\x00\x00\x004\x00\x00\x00\x00\x00\x01\x00\x00\x05\x06\
+\x00\x00\x01\x959\xfd\x81\xb0\
+\x00\x00\x01\x9a\x00\x00\x00\x00\x00\x01\x00\x00hv\
+\x00\x00\x01\x959\xfd\x81\xb0\
+\x00\x00\x010\x00\x00\x00\x00\x00\x01\x00\x00H\x1f\
+\x00\x00\x01\x959\xfd\x81\xb0\
+\x00\x00\x00V\x00\x00\x00\x00\x00\x01\x00\x00\x09p\
+\x00\x00\x01\x959\xfd\x81\xb0\
+\x00\x00\x01R\x00\x00\x00\x00\x00\x01\x00\x00O\x93\
+\x00\x00\x01\x959\xfd\x81\xb0\
+\x00\x00\x00\xa2\x00\x00\x00\x00\x00\x01\x00\x00\x1d\xfd\
+\x00\x00\x01\x959\xfd\x81\xb0\
+\x00\x00\x00\xe8\x00\x00\x00\x00\x00\x01\x00\x00;e\
+\x00\x00\x01\x959\xfd\x81\xb0\
+\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x959\xfd\x81\xb0\
+\x00\x00\x01x\x00\x00\x00\x00\x00\x01\x00\x00Z>\
+\x00\x00\x01\x959\xfd\x81\xb0\
+\x00\x00\x01\x0a\x00\x00\x00\x00\x00\x01\x00\x00@\x92\
+\x00\x00\x01\x959\xfd\x81\xb0\
+\x00\x00\x00|\x00\x00\x00\x00\x00\x01\x00\x00\x14\x8d\
+\x00\x00\x01\x959\xfd\x81\xb0\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
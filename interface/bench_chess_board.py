@@ -0,0 +1,223 @@
+"""
+Benchmark e verificação (perft) do ChessBoard e do gerador de lances.
+
+O perft conta as folhas da árvore de lances legais até a profundidade dada e
+compara com os valores de referência das posições clássicas (posição inicial,
+Kiwipete, ...), o que valida make/unmake, roques, en passant e promoções. Os
+micro-benchmarks medem make/unmake, apply_move (UCI) e translate_move (SAN).
+Não precisa de Qt, porta serial nem rede.
+
+Os resultados podem ser gravados em JSON (--json) e comparados com uma
+execução anterior (--compare), por exemplo antes e depois de uma mudança.
+
+Uso:
+    python bench_chess_board.py [--depth 3] [--positions startpos,kiwipete]
+                                [--repeat 5] [--json resultados.json]
+                                [--compare anterior.json]
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+
+from chess_board import ChessBoard, STARTING_FEN
+from move_generator import legal_moves, move_to_uci
+from notation import clear_san_cache
+
+# Posições de referência: FEN e número de nós esperado por profundidade (1, 2, ...)
+PERFT_POSITIONS = {
+    'startpos': (STARTING_FEN, (20, 400, 8902, 197281, 4865609)),
+    'kiwipete': ('r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1',
+                 (48, 2039, 97862, 4085603)),
+    'position3': ('8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1',
+                  (14, 191, 2812, 43238, 674624)),
+    'position4': ('r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1',
+                  (6, 264, 9467, 422333)),
+    'position5': ('rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8',
+                  (44, 1486, 62379, 2103487)),
+}
+
+# Partida usada nos micro-benchmarks de apply_move/translate_move
+SAMPLE_GAME = ("e2e4 c7c5 g1f3 d7d6 d2d4 c5d4 f3d4 g8f6 b1c3 a7a6 c1e3 e7e5 d4b3 c8e6 f2f3 f8e7 "
+               "d1d2 e8g8 e1c1 b8d7 g2g4 b7b5 g4g5 b5b4 c3e2 f6e8 f3f4 a6a5 f4f5 a5a4 b3d4 e5d4 "
+               "e2d4 b4b3 c1b1 b3c2 d4c2 e6b3 a2b3 a4b3 c2a3 d7e5 h2h4 a8a3 b2a3 d8a5").split()
+
+
+def perft(board, depth):
+    """Número de posições alcançadas após depth lances legais."""
+    moves = legal_moves(board)
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        board.make_move(*move)
+        nodes += perft(board, depth - 1)
+        board.unmake_move()
+    return nodes
+
+
+def divide(board, depth):
+    """Perft separado por lance da raiz (útil para localizar divergências)."""
+    counts = {}
+    for move in legal_moves(board):
+        board.make_move(*move)
+        counts[move_to_uci(move)] = perft(board, depth - 1) if depth > 1 else 1
+        board.unmake_move()
+    return counts
+
+
+def measure(function, repeat):
+    """Melhor tempo (s) entre repeat execuções e o valor retornado."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench_perft(name, depth, repeat):
+    fen, expected = PERFT_POSITIONS[name]
+    depth = min(depth, len(expected))
+    board = ChessBoard(fen)
+    elapsed, nodes = measure(lambda: perft(board, depth), repeat)
+    if board.fen() != fen:
+        raise AssertionError(f"{name}: make/unmake não restaurou a posição ({board.fen()})")
+    return {
+        'depth': depth,
+        'nodes': nodes,
+        'expected': expected[depth - 1],
+        'ok': nodes == expected[depth - 1],
+        'seconds': elapsed,
+        'nps': nodes / elapsed if elapsed else 0.0,
+    }
+
+
+def bench_make_unmake(repeat, iterations=2000):
+    """make_move + unmake_move de todos os lances legais da Kiwipete."""
+    board = ChessBoard(PERFT_POSITIONS['kiwipete'][0])
+    moves = legal_moves(board)
+
+    def run():
+        make, unmake = board.make_move, board.unmake_move
+        for _ in range(iterations):
+            for move in moves:
+                make(*move)
+                unmake()
+        return iterations * len(moves)
+    elapsed, count = measure(run, repeat)
+    return {'operations': count, 'seconds': elapsed, 'ops_per_second': count / elapsed}
+
+
+def bench_movegen(repeat, iterations=500):
+    """Geração de lances legais na Kiwipete."""
+    board = ChessBoard(PERFT_POSITIONS['kiwipete'][0])
+
+    def run():
+        for _ in range(iterations):
+            legal_moves(board)
+        return iterations
+    elapsed, count = measure(run, repeat)
+    return {'operations': count, 'seconds': elapsed, 'ops_per_second': count / elapsed}
+
+
+def bench_apply_move(repeat, iterations=200):
+    """apply_move (UCI) de uma partida inteira a partir da posição inicial."""
+    def run():
+        for _ in range(iterations):
+            board = ChessBoard()
+            for move in SAMPLE_GAME:
+                board.apply_move(move)
+        return iterations * len(SAMPLE_GAME)
+    elapsed, count = measure(run, repeat)
+    return {'operations': count, 'seconds': elapsed, 'ops_per_second': count / elapsed}
+
+
+def bench_translate_move(repeat, iterations=50):
+    """translate_move (SAN, sem o cache) de cada lance da partida de exemplo."""
+    board = ChessBoard()
+    positions = []
+    for move in SAMPLE_GAME:
+        positions.append((board.copy(), move))
+        board.apply_move(move)
+
+    def run():
+        for _ in range(iterations):
+            clear_san_cache()
+            for position, move in positions:
+                position.translate_move(move)
+        return iterations * len(positions)
+    elapsed, count = measure(run, repeat)
+    return {'operations': count, 'seconds': elapsed, 'ops_per_second': count / elapsed}
+
+
+def compare(results, previous):
+    """Imprime a razão entre a execução atual e uma anterior."""
+    print(f"\ncomparação com {previous.get('timestamp', '?')}:")
+    for name, result in results['perft'].items():
+        old = previous.get('perft', {}).get(name)
+        if old and old.get('depth') == result['depth']:
+            print(f"  perft {name:<10} {result['nps'] / old['nps']:6.2f}x")
+    for name, result in results['micro'].items():
+        old = previous.get('micro', {}).get(name)
+        if old:
+            print(f"  {name:<16} {result['ops_per_second'] / old['ops_per_second']:6.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark e perft do ChessBoard")
+    parser.add_argument("--depth", type=int, default=3, help="profundidade do perft")
+    parser.add_argument("--positions", default=','.join(PERFT_POSITIONS),
+                        help="posições separadas por vírgula")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--divide", metavar="POSIÇÃO", help="mostra o perft por lance da raiz")
+    parser.add_argument("--no-micro", action="store_true", help="executa apenas o perft")
+    parser.add_argument("--json", help="grava os resultados neste arquivo")
+    parser.add_argument("--compare", help="resultados anteriores (JSON) para comparação")
+    args = parser.parse_args()
+
+    if args.divide:
+        board = ChessBoard(PERFT_POSITIONS[args.divide][0])
+        counts = divide(board, args.depth)
+        for move, nodes in sorted(counts.items()):
+            print(f"{move}: {nodes}")
+        print(f"total: {sum(counts.values())}")
+        return
+
+    results = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'perft': {},
+        'micro': {},
+    }
+    failed = False
+    for name in args.positions.split(','):
+        result = bench_perft(name, args.depth, args.repeat)
+        results['perft'][name] = result
+        failed |= not result['ok']
+        status = "ok" if result['ok'] else f"ERRO (esperado {result['expected']})"
+        print(f"perft {name:<10} d={result['depth']} {result['nodes']:>9} nós "
+              f"{result['seconds'] * 1000:9.1f} ms {result['nps']:10.0f} nós/s  {status}")
+
+    if not args.no_micro:
+        for name, function in (('make_unmake', bench_make_unmake), ('movegen', bench_movegen),
+                               ('apply_move', bench_apply_move), ('translate_move', bench_translate_move)):
+            result = function(args.repeat)
+            results['micro'][name] = result
+            print(f"{name:<16} {result['ops_per_second']:12.0f} op/s")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark do leitor NDJSON (lichess_stream.NdjsonReader) contra o laço
+original (response.iter_lines() + json.loads).
+
+Usa um stream gravado (--file, um arquivo NDJSON como o recebido do Lichess,
+incluindo as linhas vazias de keep-alive) ou gera um stream sintético de uma
+partida longa. Não precisa de rede, Qt nem porta serial.
+
+Uso:
+    python bench_stream.py [--file stream.ndjson] [--plies 200] [--repeat 20]
+"""
+import argparse
+import io
+import json
+import time
+
+import requests
+
+from lichess_stream import JSON_BACKEND, READ_BUFFER_SIZE, NdjsonReader
+
+SAMPLE_MOVES = "e2e4 e7e5 g1f3 b8c6 f1b5 a7a6 b5a4 g8f6 e1g1 f8e7 f1e1 b7b5 a4b3 d7d6 c2c3 e8g8".split()
+
+
+def synthetic_stream(plies, keep_alive_every=3):
+    """Gera um stream de jogo: gameFull seguido de um gameState por lance."""
+    lines = [json.dumps({'type': 'gameFull', 'id': 'bench', 'initialFen': 'startpos',
+                         'white': {'name': 'white'}, 'black': {'name': 'black'},
+                         'state': {'type': 'gameState', 'moves': '', 'wtime': 300000, 'btime': 300000,
+                                   'winc': 2000, 'binc': 2000, 'status': 'started'}})]
+    moves = []
+    for ply in range(plies):
+        moves.append(SAMPLE_MOVES[ply % len(SAMPLE_MOVES)])
+        lines.append(json.dumps({'type': 'gameState', 'moves': ' '.join(moves),
+                                 'wtime': 300000 - ply * 500, 'btime': 300000 - ply * 400,
+                                 'winc': 2000, 'binc': 2000, 'status': 'started'}))
+        if ply % keep_alive_every == 0:
+            lines.append('')
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def make_response(data):
+    """Resposta HTTP falsa cujo corpo é lido de um buffer em memória."""
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(data)
+    return response
+
+
+def legacy_loop(data):
+    events = 0
+    for line in make_response(data).iter_lines():
+        if line:
+            json.loads(line)
+            events += 1
+    return events
+
+
+def reader_loop(data, chunk_size):
+    reader = NdjsonReader()
+    events = 0
+    for _ in reader.iter_events(make_response(data), chunk_size):
+        events += 1
+    return events
+
+
+def measure(function, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do leitor NDJSON")
+    parser.add_argument("--file", help="stream NDJSON gravado")
+    parser.add_argument("--plies", type=int, default=200, help="lances do stream sintético")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--chunk-size", type=int, default=READ_BUFFER_SIZE)
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, 'rb') as f:
+            data = f.read()
+    else:
+        data = synthetic_stream(args.plies)
+
+    legacy_time, legacy_events = measure(lambda: legacy_loop(data), args.repeat)
+    reader_time, reader_events = measure(lambda: reader_loop(data, args.chunk_size), args.repeat)
+    print(f"stream: {len(data)} bytes, {reader_events} eventos, decodificador: {JSON_BACKEND}")
+    print(f"iter_lines + json.loads: {legacy_time * 1000:8.2f} ms ({legacy_events / legacy_time:10.0f} eventos/s)")
+    print(f"NdjsonReader:            {reader_time * 1000:8.2f} ms ({reader_events / reader_time:10.0f} eventos/s)")
+    print(f"ganho: {legacy_time / reader_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+"""
+Núcleo sem Qt que liga as partidas do Lichess ao tabuleiro físico.
+
+BoardController reage aos eventos do Lichess (início/fim de partida e estados
+dos jogos), aos lances lidos pelo tabuleiro e aos resultados dos comandos, e
+mantém o ESP32 sincronizado com a partida em foco. Ele não cria threads: quem
+o hospeda (a interface gráfica, via sinais do Qt, ou o serviço headless, via
+uma fila) entrega todas as chamadas em uma única thread e recebe as mudanças
+de estado pelos métodos de um BoardListener.
+
+Os lances do tabuleiro físico são rastreados por um LatencyTracer, da leitura
+na serial até o ACK do ESP32 com o eco do Lichess, e todas as partidas podem
+ser gravadas por um GameRecorder (lances, relógios e eventos do tabuleiro).
+A abertura de cada partida é identificada a cada lance pelo OpeningBook, e o
+seu código ECO é exibido no LCD. A posição da partida em foco é enviada ao
+EnginePool (motores UCI locais) para avaliação.
+
+No modo bruto do tabuleiro, os bitmaps de ocupação lidos pelos sensores passam
+pelo OccupancyTracker, que infere o lance na confirmação do botão.
+"""
+import logging
+import time
+
+from board_protocol import REJECT_REASONS
+from game_manager import StreamClosed
+from lichess_events import GameStart, GameFinish
+from move_generator import validate_move
+from move_inference import OccupancyTracker
+
+logger = logging.getLogger(__name__)
+
+
+class BoardListener:
+    """Notificações do BoardController (todas opcionais)."""
+
+    def on_focus(self, session):
+        """A partida em foco mudou."""
+
+    def on_position(self, session, new_moves):
+        """Novo estado da partida em foco (lances novos e relógio)."""
+
+    def on_game_finished(self, session):
+        """A partida em foco terminou."""
+
+    def on_games_changed(self):
+        """Alguma partida começou, terminou ou mudou fora do foco."""
+
+
+class BoardController:
+    """
+    Estado compartilhado entre a interface gráfica e o serviço headless.
+
+    games: GameManager com os streams das partidas.
+    serial_bridge: SerialBridge com o ESP32.
+    submit_command: função (action, game_id, move=None) que enfileira um comando.
+    auto_focus: ao terminar a partida em foco, passa para a próxima em andamento.
+    tracer: LatencyTracer que mede o caminho dos lances do tabuleiro.
+    recorder: GameRecorder que grava as partidas (por padrão, nada é gravado).
+    book: OpeningBook com os nomes das aberturas (por padrão, nenhum arquivo).
+    engine: EnginePool que avalia a posição em foco (por padrão, nenhum motor).
+    """
+    def __init__(self, games, serial_bridge, submit_command, listener=None, auto_focus=False, tracer=None,
+                 recorder=None, book=None, engine=None):
+        self.games = games
+        self.serial_bridge = serial_bridge
+        self.submit_command = submit_command
+        self.listener = listener or BoardListener()
+        self.auto_focus = auto_focus
+        # Os padrões são importados só quando usados: quem hospeda o núcleo
+        # passa os seus próprios e não paga esses imports na inicialização
+        if tracer is None:
+            from latency_trace import LatencyTracer
+            tracer = LatencyTracer()
+        if recorder is None:
+            from game_recorder import NullRecorder
+            recorder = NullRecorder()
+        if book is None:
+            from opening_book import OpeningBook
+            book = OpeningBook(None, None)
+        if engine is None:
+            from engine_pool import NullEnginePool
+            engine = NullEnginePool()
+        self.tracer = tracer
+        self.recorder = recorder
+        self.book = book
+        self.engine = engine
+        self.occupancy = OccupancyTracker()
+        self.event_handlers = {
+            GameStart: self.handle_game_start,
+            GameFinish: self.handle_game_finish,
+        }
+
+    @property
+    def focused(self):
+        return self.games.focused
+
+    @property
+    def current_game(self):
+        """Id da partida em foco ainda em andamento (ou None)."""
+        session = self.games.focused
+        return session.game_id if session is not None and session.active else None
+
+    def other_games(self):
+        """Partidas em andamento fora do foco."""
+        return [session for session in self.games.active_sessions() if session.game_id != self.current_game]
+
+    # -------------------------------------------------------------------------
+    # Eventos do Lichess
+    # -------------------------------------------------------------------------
+    def handle_event(self, event):
+        """Despacha os eventos gerais do Lichess para o tratador do seu tipo."""
+        handler = self.event_handlers.get(type(event))
+        if handler:
+            handler(event)
+
+    def handle_game_start(self, event):
+        """
+        Registra a partida (o gerenciador abre o stream do jogo) e a coloca em
+        foco se não houver outra partida em andamento.
+        """
+        session = self.games.start_game(event)
+        self.recorder.start_game(session)
+        focused = self.games.focused
+        if focused is None or focused.finished:
+            self.focus_game(session.game_id)
+        elif focused is not session:
+            logger.info(f"Nova partida {session.game_id} em segundo plano")
+            self.listener.on_games_changed()
+
+    def handle_game_finish(self, event):
+        """
+        Encerra a partida e, se estava em foco, mostra o resultado no tabuleiro.
+        Se o estado final ainda não chegou pelo stream do jogo, o encerramento
+        fica para quando ele chegar (handle_game_event).
+        """
+        session = self.games.finish_game(event)
+        if session is None:
+            return
+        if not session.finished:
+            logger.info(f"{session.game_id}: fim da partida recebido antes do estado final")
+            return
+        # Só depois do estado final: o REC_END vem após os últimos lances no log
+        self.recorder.end_game(session.game_id, session.status, session.winner)
+        self.engine.cancel(session.game_id)
+        if session is not self.games.focused:
+            self.listener.on_games_changed()
+            return
+        self.serial_bridge.send_result(session.result)
+        self.listener.on_game_finished(session)
+        next_game = self.games.next_game_id() if self.auto_focus else None
+        if next_game:
+            self.focus_game(next_game)
+        else:
+            self.listener.on_games_changed()
+
+    def handle_game_event(self, game_id, event):
+        """
+        Aplica um evento do stream do jogo à sua partida. Para a partida em
+        foco, envia os lances novos ao ESP32 e notifica o listener.
+        """
+        arrived = time.monotonic()
+        session = self.games.get(game_id)
+        # Se a partida já terminou, não processa novos eventos
+        if session is None or session.finished:
+            return
+        if isinstance(event, StreamClosed):
+            session.final_state = True
+        else:
+            self._apply_game_event(session, event, arrived)
+        # Os últimos lances já foram aplicados: conclui um gameFinish adiado
+        if session.final_state and session.pending_finish is not None:
+            self.handle_game_finish(session.pending_finish)
+
+    def _apply_game_event(self, session, event, arrived):
+        game_id = session.game_id
+        new_moves = session.apply(event)
+        if new_moves is None:
+            return
+        clock = session.clock
+        first_ply = session.plies - len(new_moves) + 1
+        for number, ply in enumerate(new_moves, first_ply):
+            self.recorder.record_ply(game_id, number, ply.uci, clock.remaining_ms('white'),
+                                     clock.remaining_ms('black'))
+        if not new_moves:
+            self.recorder.record_clock(game_id, clock.remaining_ms('white'), clock.remaining_ms('black'),
+                                       clock.to_move, clock.running)
+        opening_changed = self._update_opening(session, new_moves)
+        if session is not self.games.focused:
+            self.listener.on_games_changed()
+            return
+        if session.move_sync.rebuilt:
+            self.serial_bridge.send_reset()
+        traced = [ply.uci for ply in new_moves if self.tracer.pending(game_id, ply.uci)]
+        for uci in traced:
+            self.tracer.mark(game_id, uci, 'echo', arrived)
+        for ply in new_moves:
+            on_ack = self._serial_ack(game_id, ply.uci) if ply.uci in traced else None
+            if not self.serial_bridge.send_move(ply.lcd, ply.uci, on_ack) and on_ack:
+                self.tracer.skip_serial(game_id, ply.uci)
+        # O reset apaga o código da abertura no ESP32
+        if session.opening and (opening_changed or session.move_sync.rebuilt):
+            self.serial_bridge.send_opening(session.opening.eco)
+        self.listener.on_position(session, new_moves)
+        for uci in traced:
+            self.tracer.mark(game_id, uci, 'render')
+        if new_moves or session.move_sync.rebuilt:
+            self.engine.analyse(game_id, session.board)
+
+    def _serial_ack(self, game_id, uci):
+        return lambda: self.tracer.mark(game_id, uci, 'serial')
+
+    def _update_opening(self, session, new_moves):
+        """
+        Atualiza a abertura da partida e indica se ela mudou. Um lance novo
+        custa uma consulta à tabela; reconstruções refazem a linha.
+        """
+        previous = session.opening
+        if session.move_sync.rebuilt or len(new_moves) > 1:
+            session.opening = self.book.classify(session.move_sync.applied)
+        elif new_moves:
+            session.opening = self.book.opening(session.board) or previous
+        return session.opening != previous
+
+    # -------------------------------------------------------------------------
+    # Foco
+    # -------------------------------------------------------------------------
+    def focus_game(self, game_id):
+        """
+        Coloca a partida em foco: o ESP32 recomeça e recebe os lances dela, e
+        os lances do tabuleiro físico passam a ser enviados para ela.
+        """
+        previous = self.games.focused
+        session = self.games.set_focus(game_id)
+        if session is None:
+            return None
+        if previous is not None and previous is not session:
+            self.engine.cancel(previous.game_id)
+        self.occupancy.clear()
+        # O ESP32 guarda só uma posição: recomeça e reenvia os lances da partida
+        self.serial_bridge.send_reset()
+        for ply in session.move_sync.history:
+            self.serial_bridge.send_move(ply.lcd, ply.uci)
+        if session.opening:
+            self.serial_bridge.send_opening(session.opening.eco)
+        self.listener.on_focus(session)
+        self.listener.on_games_changed()
+        self.engine.analyse(session.game_id, session.board)
+        return session
+
+    def next_game(self):
+        """Passa o foco para a próxima partida em andamento."""
+        game_id = self.games.next_game_id()
+        if game_id and game_id != self.current_game:
+            return self.focus_game(game_id)
+        return None
+
+    # -------------------------------------------------------------------------
+    # Tabuleiro físico e comandos
+    # -------------------------------------------------------------------------
+    def handle_board_move(self, uci, received=None):
+        """
+        Valida o lance lido pelo tabuleiro físico antes de enviá-lo ao Lichess.
+        Lances ilegais são recusados na hora (sem ida à rede) e o tabuleiro é
+        avisado para desfazê-los; erros de leitura conhecidos são corrigidos.
+        received é o instante (time.monotonic) em que a serial leu o lance.
+        """
+        dispatched = time.monotonic()
+        # O lance do tabuleiro físico vale para a partida em foco
+        session = self.games.focused
+        if session is None or session.finished:
+            logger.warning(f"Lance {uci} ignorado: nenhuma partida em foco")
+            self.serial_bridge.send_reject(uci, 'not_your_turn')
+            return False
+        self.recorder.record_serial(session.game_id, 'move', uci)
+        if not session.my_turn:
+            logger.warning(f"Lance {uci} recusado: não é a sua vez")
+            self._reject(session, uci, 'not_your_turn')
+            return False
+        check = validate_move(session.board, uci)
+        validated = time.monotonic()
+        if check.uci is None:
+            self.tracer.record('validate', (validated - dispatched) * 1000)
+            logger.warning(f"Lance {uci} recusado localmente ({check.reason})")
+            self._reject(session, uci, check.reason)
+            return False
+        if check.repaired:
+            logger.info(f"Lance {uci} corrigido para {check.uci} ({check.reason})")
+        self.tracer.begin(session.game_id, check.uci, received or dispatched, dispatched, validated)
+        if not self.submit_command('move', session.game_id, check.uci):
+            self.tracer.discard(session.game_id, check.uci)
+            return False
+        return True
+
+    def handle_board_occupancy(self, bitmap):
+        """Bitmap de ocupação da varredura (modo bruto): registra as peças levantadas."""
+        self.occupancy.feed(bitmap)
+        session = self.games.focused
+        if session is not None and session.my_turn:
+            self.occupancy.table(session.board)  # prepara a tabela antes da confirmação
+
+    def handle_board_confirm(self, bitmap, received=None):
+        """
+        Confirmação do lance no modo bruto: infere o lance pelo bitmap final e
+        segue o mesmo caminho do lance enviado pelo firmware.
+        """
+        session = self.games.focused
+        if session is None or session.finished or not session.my_turn:
+            return self.handle_board_move('0000', received)
+        check = self.occupancy.infer(session.board, bitmap)
+        if check.uci is None:
+            seen = self.occupancy.describe(session.board, bitmap)
+            logger.warning(f"Ocupação {bitmap:016x} não corresponde a um lance ({check.reason}: {seen})")
+            self._reject(session, seen, check.reason)
+            return False
+        self.occupancy.clear()
+        return self.handle_board_move(check.uci, received)
+
+    def _reject(self, session, uci, reason):
+        self.serial_bridge.send_reject(uci, reason)
+        self.recorder.record_serial(session.game_id, 'reject', uci, REJECT_REASONS.get(reason, 0))
+
+    def resign(self):
+        """Desiste da partida em foco, ou aborta se ainda não houve lance próprio."""
+        session = self.games.focused
+        if session is None or session.finished:
+            return False
+        if (session.color == 'white' and session.plies == 0) or (session.color == 'black' and session.plies == 1):
+            action = "abort"
+        else:
+            action = "resign"
+        return self.submit_command(action, session.game_id)
+
+    def handle_command_result(self, result):
+        """Trata o resultado de um comando enviado ao Lichess."""
+        action = result['action']
+        latency = result['latency_ms']
+        if result['ok']:
+            label = f"{action} {result['move']}" if result['move'] else action
+            logger.info(f"{label} enviado em {latency:.0f} ms")
+            if action == 'move':
+                self.tracer.mark(result['game_id'], result['move'], 'post', result.get('done_at'))
+        elif action == 'move':
+            logger.error(f"Lance {result['move']} rejeitado ({result['status']}): {result['error']}")
+            self.tracer.discard(result['game_id'], result['move'])
+            if result['game_id'] == self.current_game:
+                self._reject(self.focused, result['move'], 'server')
+        else:
+            logger.error(f"Falha ao enviar desistência ou abortar o jogo: {result['error']}")
+
+    def serial_tick(self):
+        """Envia ao ESP32 os relógios da partida em foco (chamado a cada segundo)."""
+        session = self.games.focused
+        if session is None or session.finished:
+            return
+        clock = session.clock
+        self.serial_bridge.send_clock(clock.remaining_ms('white'), clock.remaining_ms('black'),
+                                      clock.to_move == 'black', clock.running)
+
+    def shutdown(self):
+        # Partidas que terminaram sem o estado final chegar: fecha a gravação com os lances recebidos
+        for session in self.games.sessions.values():
+            event = session.pending_finish
+            if event is not None and not session.finished:
+                self.recorder.end_game(session.game_id, event.status or session.status, event.winner)
+        self.games.shutdown()
+        self.tracer.close()
+        self.recorder.close()
+        self.book.close()
+        self.engine.close()
@@ -0,0 +1,204 @@
+"""
+Emulador do ESP32 sobre um pseudo-terminal (pty), para testar o protocolo
+serial sem o tabuleiro físico.
+
+O emulador confirma os quadros confiáveis com ACK, mantém o conteúdo do LCD
+16x2 como o firmware faria e permite injetar lances do tabuleiro digitando-os
+no terminal (ex.: 'e2e4'). No modo bruto (FRAME_MODE) o lance digitado vira a
+sequência de bitmaps de ocupação que os sensores leriam (retirar a peça
+capturada, levantar a peça, colocá-la no destino) seguida da confirmação. A
+opção --drop descarta uma fração dos quadros recebidos para exercitar a
+retransmissão.
+
+Uso:
+    python board_emulator.py [--drop 0.2]
+    # em outro terminal: ESP_PORT=<porta pty exibida> python lichess_interface.py
+"""
+import argparse
+import os
+import pty
+import random
+import select
+import sys
+import threading
+import tty
+
+import board_protocol as protocol
+from chess_board import ChessBoard, EMPTY, SQUARE_INDEX
+from move_inference import occupancy
+
+
+def format_clock(ms):
+    seconds = ms // 1000
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+class BoardEmulator:
+    """
+    Lado ESP32 do protocolo: decodifica quadros, responde ACKs e atualiza o LCD.
+    """
+    def __init__(self, fd, drop_rate=0.0, on_lcd=None):
+        self.fd = fd
+        self.drop_rate = drop_rate
+        self.on_lcd = on_lcd
+        self.decoder = protocol.FrameDecoder()
+        self.lcd = ["Aguardando nova", "   partida..."]
+        self.white_ms = 0
+        self.black_ms = 0
+        self.last_san = ""
+        self.opening = ""
+        self.moves = []
+        self.position = None
+        self.mode = protocol.BOARD_MODE_MOVES
+        self.board = ChessBoard()  # posição lógica (lances recebidos do host)
+        self.rejected = []
+        self.frames = []
+        self._seq = 0
+        self._last_rx_seq = None
+        self.unacked = {}
+        self._lock = threading.Lock()
+
+    def write(self, data):
+        with self._lock:
+            os.write(self.fd, data)
+
+    def _send_reliable(self, frame_type, payload):
+        self._seq = (self._seq + 1) & 0xFF
+        frame = protocol.encode_frame(frame_type, self._seq, payload)
+        self.unacked[self._seq] = frame
+        self.write(frame)
+
+    def send_board_move(self, uci):
+        """Simula o botão de confirmação após um lance no tabuleiro."""
+        if self.mode == protocol.BOARD_MODE_RAW:
+            self.send_raw_move(uci)
+        else:
+            self._send_reliable(protocol.FRAME_BOARD_MOVE, uci.encode('ascii'))
+
+    def send_occupancy(self, bitmap):
+        self.write(protocol.encode_frame(protocol.FRAME_OCCUPANCY, 0, protocol.occupancy_payload(bitmap)))
+
+    def send_raw_move(self, uci):
+        """Bitmaps lidos pelos sensores durante o lance e a confirmação com o bitmap final."""
+        current = occupancy(self.board)
+        board = ChessBoard()
+        board.restore(self.board.snapshot())
+        try:
+            board.apply_move(uci)
+        except (ValueError, KeyError, IndexError):
+            board = None  # lance sem sentido: os sensores não mudam
+        if board is not None:
+            to_sq = SQUARE_INDEX[uci[2:4]]
+            if self.board.squares[to_sq] != EMPTY:
+                current &= ~(1 << to_sq)
+                self.send_occupancy(current)
+            self.send_occupancy(current & ~(1 << SQUARE_INDEX[uci[:2]]))
+            current = occupancy(board)
+            self.send_occupancy(current)
+        self._send_reliable(protocol.FRAME_BOARD_CONFIRM, protocol.occupancy_payload(current))
+
+    def send_log(self, text):
+        """Simula um printf de depuração do firmware."""
+        self.write(f"{text}\n".encode())
+
+    def _render(self, line1, line2):
+        self.lcd = [line1[:16], line2[:16]]
+        if self.on_lcd:
+            self.on_lcd(self.lcd)
+
+    def _render_clock(self):
+        self._render(f"WHITE {self.opening or ' LM ':<4.4} BLACK",
+                     f"{format_clock(self.white_ms):>5.5} {self.last_san:<4.4} {format_clock(self.black_ms):>5.5}")
+
+    def handle_frame(self, frame):
+        self.frames.append(frame)
+        if frame.type == protocol.FRAME_ACK:
+            self.unacked.pop(frame.payload[0], None)
+            return
+        if frame.type in protocol.RELIABLE_FRAMES:
+            self.write(protocol.encode_frame(protocol.FRAME_ACK, 0, protocol.ack_payload(frame.seq)))
+            if frame.seq == self._last_rx_seq:
+                return
+            self._last_rx_seq = frame.seq
+        if frame.type == protocol.FRAME_CLOCK:
+            self.white_ms, self.black_ms, _, _ = protocol.decode_clock(frame.payload)
+            self._render_clock()
+        elif frame.type == protocol.FRAME_MOVE:
+            self.last_san, uci = protocol.decode_move(frame.payload)
+            self.moves.append(uci)
+            try:
+                self.board.apply_move(uci)
+            except (ValueError, KeyError, IndexError):
+                pass  # posição recebida por FRAME_POSITION (replay)
+            self._render_clock()
+        elif frame.type == protocol.FRAME_MODE:
+            self.mode = frame.payload[0]
+        elif frame.type == protocol.FRAME_RESET:
+            self.board = ChessBoard()
+            self.moves = []
+            self.last_san = ""
+            self.opening = ""
+        elif frame.type == protocol.FRAME_REJECT:
+            reason, uci = protocol.decode_reject(frame.payload)
+            self.rejected.append((uci, reason))
+            self._render("Lance invalido", f"{uci} ({reason})")
+        elif frame.type == protocol.FRAME_OPENING:
+            self.opening = frame.payload.decode('ascii')
+            self._render_clock()
+        elif frame.type == protocol.FRAME_POSITION:
+            self.position = frame.payload.decode('ascii')
+            self.moves = []
+            self.last_san = ""
+            self._render("Posicao recebida", "    (replay)")
+        elif frame.type == protocol.FRAME_RESULT:
+            result = frame.payload.decode('ascii')
+            self._render("    GAME OVER", f"{result:^16}")
+
+    def feed(self, data):
+        """Processa bytes recebidos do host."""
+        for item in self.decoder.feed(data):
+            if isinstance(item, protocol.Frame):
+                if self.drop_rate and random.random() < self.drop_rate:
+                    continue
+                self.handle_frame(item)
+
+    def run(self, stop_event=None):
+        """Laço de leitura do pty até stop_event ser sinalizado."""
+        while stop_event is None or not stop_event.is_set():
+            ready, _, _ = select.select([self.fd], [], [], 0.1)
+            if not ready:
+                continue
+            try:
+                data = os.read(self.fd, 1024)
+            except OSError:
+                break
+            if not data:
+                break
+            self.feed(data)
+
+
+def open_pty():
+    """Cria um par pty em modo raw e retorna (fd do mestre, caminho do escravo)."""
+    master, slave = pty.openpty()
+    tty.setraw(master)
+    tty.setraw(slave)
+    return master, os.ttyname(slave)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Emulador do tabuleiro (ESP32) via pty")
+    parser.add_argument("--drop", type=float, default=0.0, help="fração de quadros recebidos descartados")
+    args = parser.parse_args()
+
+    master, slave_path = open_pty()
+    print(f"Porta serial emulada: {slave_path}")
+    emulator = BoardEmulator(master, args.drop, on_lcd=lambda lcd: print(f"[{lcd[0]:16}]\n[{lcd[1]:16}]"))
+    threading.Thread(target=emulator.run, daemon=True).start()
+    for line in sys.stdin:
+        move = line.strip()
+        if move:
+            emulator.send_board_move(move)
+
+
+if __name__ == "__main__":
+    main()
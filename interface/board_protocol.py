@@ -0,0 +1,215 @@
+"""
+Protocolo binário entre o host e o ESP32.
+
+Formato de cada quadro:
+
+    SOF(0xA5) | versão | tipo | seq | tamanho | payload (tamanho bytes) | CRC16
+
+O CRC é o CRC-16/CCITT-FALSE (polinômio 0x1021, valor inicial 0xFFFF) sobre
+os bytes de versão até o fim do payload, transmitido em big-endian. Quadros
+confiáveis (lance, reset, resultado, rejeição, posição, abertura, modo e, no
+sentido contrário, lance e confirmação do tabuleiro) são confirmados com um ACK
+contendo o seq recebido; o relógio e os bitmaps de ocupação são enviados a cada
+mudança e não precisam de confirmação. Bytes fora de quadros válidos
+são tratados como texto de log do firmware, o que mantém compatibilidade com o
+printf do ESP-IDF na mesma UART.
+"""
+import binascii
+import struct
+from collections import namedtuple
+
+PROTOCOL_VERSION = 1
+SOF = 0xA5
+HEADER_SIZE = 5
+CRC_SIZE = 2
+MAX_PAYLOAD = 64
+
+# Tipos de quadro (host -> ESP32)
+FRAME_CLOCK = 0x01
+FRAME_MOVE = 0x02
+FRAME_RESET = 0x03
+FRAME_RESULT = 0x04
+FRAME_REJECT = 0x05
+FRAME_POSITION = 0x06
+FRAME_OPENING = 0x07
+FRAME_MODE = 0x08
+# Tipos de quadro (ESP32 -> host)
+FRAME_BOARD_MOVE = 0x10
+FRAME_OCCUPANCY = 0x11
+FRAME_BOARD_CONFIRM = 0x12
+# Confirmação (ambos os sentidos)
+FRAME_ACK = 0x7F
+
+RELIABLE_FRAMES = frozenset((FRAME_MOVE, FRAME_RESET, FRAME_RESULT, FRAME_REJECT, FRAME_POSITION,
+                             FRAME_OPENING, FRAME_MODE, FRAME_BOARD_MOVE, FRAME_BOARD_CONFIRM))
+
+# Modos do tabuleiro (FRAME_MODE): o firmware interpreta os sensores e envia
+# o lance (FRAME_BOARD_MOVE) ou só envia os bitmaps de ocupação (move_inference)
+BOARD_MODE_MOVES = 0
+BOARD_MODE_RAW = 1
+
+# Motivos de rejeição de um lance do tabuleiro (FRAME_REJECT)
+REJECT_MALFORMED = 1
+REJECT_ILLEGAL = 2
+REJECT_NOT_YOUR_TURN = 3
+REJECT_SERVER = 4
+REJECT_AMBIGUOUS = 5
+REJECT_UNCHANGED = 6
+REJECT_REASONS = {
+    'malformed': REJECT_MALFORMED,
+    'illegal': REJECT_ILLEGAL,
+    'not_your_turn': REJECT_NOT_YOUR_TURN,
+    'server': REJECT_SERVER,
+    'ambiguous': REJECT_AMBIGUOUS,
+    'unchanged': REJECT_UNCHANGED,
+}
+
+# Relógio: tempo das brancas (ms), tempo das pretas (ms), flags
+CLOCK_STRUCT = struct.Struct('>IIB')
+CLOCK_BLACK_TO_MOVE = 0x01
+CLOCK_RUNNING = 0x02
+
+# Ocupação dos sensores: bit i = casa i (a1 = 0, h8 = 63)
+OCCUPANCY_STRUCT = struct.Struct('>Q')
+
+Frame = namedtuple('Frame', ['type', 'seq', 'payload'])
+
+
+def crc16(data):
+    """CRC-16/CCITT-FALSE dos bytes dados."""
+    return binascii.crc_hqx(data, 0xFFFF)
+
+
+def encode_frame(frame_type, seq, payload=b''):
+    """Monta um quadro completo pronto para ser escrito na serial."""
+    if len(payload) > MAX_PAYLOAD:
+        raise ValueError(f"Payload muito grande ({len(payload)} bytes)")
+    body = bytes((PROTOCOL_VERSION, frame_type, seq & 0xFF, len(payload))) + payload
+    return bytes((SOF,)) + body + crc16(body).to_bytes(CRC_SIZE, 'big')
+
+
+def clock_payload(white_ms, black_ms, black_to_move=False, running=True):
+    flags = (CLOCK_BLACK_TO_MOVE if black_to_move else 0) | (CLOCK_RUNNING if running else 0)
+    return CLOCK_STRUCT.pack(max(0, int(white_ms)), max(0, int(black_ms)), flags)
+
+
+def move_payload(san, uci):
+    """Último lance jogado: tamanho do SAN, SAN e o lance UCI."""
+    san_bytes = san.encode('ascii', errors='replace')[:15]
+    return bytes((len(san_bytes),)) + san_bytes + uci.encode('ascii')
+
+
+def result_payload(result):
+    return result.encode('ascii', errors='replace')[:16]
+
+
+def position_payload(squares):
+    """
+    Posição completa (replay): 64 símbolos de peça ('.' para vazia), de a1 a h8
+    fileira por fileira, na mesma ordem do last_valid_board do firmware.
+    """
+    payload = ''.join(squares).encode('ascii')
+    if len(payload) != 64:
+        raise ValueError("A posição deve ter 64 casas")
+    return payload
+
+
+def opening_payload(code):
+    """Código curto da abertura (ECO, até 4 caracteres) para o LCD; vazio apaga."""
+    return (code or '').encode('ascii', errors='replace')[:4]
+
+
+def reject_payload(uci, reason):
+    """Lance do tabuleiro recusado: código do motivo e o lance UCI lido."""
+    return bytes((REJECT_REASONS.get(reason, REJECT_ILLEGAL),)) + uci.encode('ascii', errors='replace')[:8]
+
+
+def mode_payload(mode):
+    return bytes((mode,))
+
+
+def occupancy_payload(bitmap):
+    """Bitmap de ocupação (bit i = casa i, a1 = 0) em big-endian."""
+    return OCCUPANCY_STRUCT.pack(bitmap)
+
+
+def decode_occupancy(payload):
+    return OCCUPANCY_STRUCT.unpack(payload)[0]
+
+
+def ack_payload(seq):
+    return bytes((seq & 0xFF,))
+
+
+def decode_clock(payload):
+    white_ms, black_ms, flags = CLOCK_STRUCT.unpack(payload)
+    return white_ms, black_ms, bool(flags & CLOCK_BLACK_TO_MOVE), bool(flags & CLOCK_RUNNING)
+
+
+def decode_reject(payload):
+    return payload[0], payload[1:].decode('ascii', errors='replace')
+
+
+def decode_move(payload):
+    san_len = payload[0]
+    san = payload[1:1 + san_len].decode('ascii')
+    uci = payload[1 + san_len:].decode('ascii')
+    return san, uci
+
+
+class FrameDecoder:
+    """
+    Decodificador incremental: recebe bytes em pedaços arbitrários e devolve
+    quadros válidos (Frame) e linhas de texto (str) na ordem em que chegaram.
+    """
+    def __init__(self):
+        self.buffer = bytearray()
+        self.text = bytearray()
+        self.crc_errors = 0
+
+    def _flush_text(self, out):
+        while True:
+            end = self.text.find(b'\n')
+            if end < 0:
+                break
+            line = self.text[:end].decode('utf-8', errors='replace').strip()
+            del self.text[:end + 1]
+            if line:
+                out.append(line)
+        if len(self.text) > 512:
+            # Linha sem terminador: descarta para não crescer sem limite
+            del self.text[:]
+
+    def feed(self, data):
+        """Processa novos bytes e retorna a lista de quadros/linhas completos."""
+        out = []
+        buffer = self.buffer
+        buffer += data
+        while buffer:
+            start = buffer.find(SOF)
+            if start < 0:
+                self.text += buffer
+                del buffer[:]
+                break
+            if start:
+                self.text += buffer[:start]
+                del buffer[:start]
+            if len(buffer) < HEADER_SIZE:
+                break
+            length = buffer[4]
+            if buffer[1] != PROTOCOL_VERSION or length > MAX_PAYLOAD:
+                self.text.append(buffer.pop(0))
+                continue
+            total = HEADER_SIZE + length + CRC_SIZE
+            if len(buffer) < total:
+                break
+            end = HEADER_SIZE + length
+            if crc16(bytes(buffer[1:end])) != int.from_bytes(buffer[end:total], 'big'):
+                self.crc_errors += 1
+                self.text.append(buffer.pop(0))
+                continue
+            self._flush_text(out)
+            out.append(Frame(buffer[2], buffer[3], bytes(buffer[HEADER_SIZE:end])))
+            del buffer[:total]
+        self._flush_text(out)
+        return out
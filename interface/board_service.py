@@ -0,0 +1,196 @@
+"""
+Serviço headless que liga o tabuleiro físico ao Lichess, sem Qt.
+
+Roda o stream de eventos, os streams das partidas, a porta serial e os
+relógios com o mesmo núcleo da interface gráfica (BoardController). Todos os
+eventos das threads de rede e da serial entram em uma fila e são tratados em
+ordem pela thread principal, que também envia os relógios ao ESP32 a cada
+segundo. Pensado para computadores pequenos montados sob a mesa, onde o
+PySide6 pesa em memória e no tempo de inicialização.
+
+As partidas são iniciadas em outro lugar (site ou aplicativo do Lichess); o
+serviço acompanha todas e, quando a partida em foco termina, passa para a
+próxima em andamento.
+
+Uso:
+    python board_service.py --token <token> [--port /dev/ttyUSB0] [--log-level INFO]
+                            [--metrics-port 9108] [--latency-dump latencias.json]
+                            [--record games.rec | --no-record]
+    (o token também pode vir da variável de ambiente LICHESS_TOKEN)
+"""
+import argparse
+import logging
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+
+from board_controller import BoardController, BoardListener
+from game_manager import GameManager
+from game_recorder import GameRecorder, DEFAULT_PATH as RECORD_PATH
+from latency_trace import LatencyTracer
+from lichess_client import LichessClient, LICHESS_URL
+from lichess_commands import CommandWorker
+from lichess_stream import ReconnectingStream
+from opening_book import OpeningBook, BOOK_PATH, ECO_PATH
+from serial_bridge import BOARD_MODE, SerialBridge, find_esp_port
+
+logger = logging.getLogger("board_service")
+
+# Intervalo de envio dos relógios ao ESP32 (s)
+SERIAL_TICK = 1.0
+
+
+class LogListener(BoardListener):
+    """Registra no log as mudanças que a interface gráfica mostraria na tela."""
+    def on_focus(self, session):
+        logger.info(f"Em foco: {session.game_id} ({session.color}) contra {session.opponent_text}")
+
+    def on_position(self, session, new_moves):
+        if new_moves:
+            opening = f" [{session.opening.eco} {session.opening.name}]" if session.opening else ""
+            logger.info(f"{session.game_id}: {session.last_san}{opening} "
+                        f"(brancas {session.clock.text('white')}, pretas {session.clock.text('black')})")
+
+    def on_game_finished(self, session):
+        logger.info(f"{session.game_id} terminou: {session.result}")
+
+
+class BoardService:
+    """
+    Hospeda o BoardController: as threads de rede e da serial só colocam
+    eventos na fila, e a thread que chama run() os trata em ordem.
+    """
+    def __init__(self, client, port, tracer=None, recorder=None, book=None, board_mode=BOARD_MODE):
+        self.client = client
+        self.inbox = queue.Queue()
+        self._stop = threading.Event()
+        self.event_stream = ReconnectingStream(client.stream_events, self._post('event'),
+                                               self._on_stream_error, self._post('status'),
+                                               name="event stream")
+        self.games = GameManager(client, lambda game_id, event: self.inbox.put(('game', game_id, event)),
+                                 self._on_stream_error)
+        self.commands = CommandWorker(client, on_done=self._post('command'))
+        self.serial_bridge = SerialBridge(port, on_event=self._post('serial'), board_mode=board_mode)
+        self.controller = BoardController(self.games, self.serial_bridge, self.commands.submit,
+                                          listener=LogListener(), auto_focus=True, tracer=tracer,
+                                          recorder=recorder, book=book)
+
+    def _post(self, kind):
+        return lambda item: self.inbox.put((kind, item))
+
+    def _on_stream_error(self, message):
+        logger.error(f"Stream error: {message}")
+
+    def _dispatch(self, message):
+        kind = message[0]
+        if kind == 'event':
+            self.controller.handle_event(message[1])
+        elif kind == 'game':
+            self.controller.handle_game_event(message[1], message[2])
+        elif kind == 'serial':
+            event = message[1]
+            if event['type'] == 'move':
+                self.controller.handle_board_move(event['move'], event.get('received'))
+            elif event['type'] == 'occupancy':
+                self.controller.handle_board_occupancy(event['bitmap'])
+            elif event['type'] == 'confirm':
+                self.controller.handle_board_confirm(event['bitmap'], event.get('received'))
+            else:
+                logger.debug(f"ESP32: {event['line']}")
+        elif kind == 'command':
+            self.controller.handle_command_result(message[1])
+        elif kind == 'status':
+            logger.info(f"Stream de eventos: {message[1]}")
+
+    def run(self):
+        """Laço principal (bloqueante) até stop()."""
+        self.serial_bridge.start()
+        self.commands.start()
+        threading.Thread(target=self.event_stream.run, name="event-stream", daemon=True).start()
+        next_tick = time.monotonic() + SERIAL_TICK
+        while not self._stop.is_set():
+            try:
+                message = self.inbox.get(timeout=max(0.0, next_tick - time.monotonic()))
+            except queue.Empty:
+                message = None
+            if message is not None:
+                try:
+                    self._dispatch(message)
+                except Exception as e:
+                    logger.error(f"Erro ao tratar {message[0]}: {e}")
+            if time.monotonic() >= next_tick:
+                self.controller.serial_tick()
+                next_tick += SERIAL_TICK
+                if next_tick < time.monotonic():
+                    next_tick = time.monotonic() + SERIAL_TICK
+        self._shutdown()
+
+    def stop(self):
+        self._stop.set()
+        self.inbox.put(None)
+
+    def _shutdown(self):
+        self.event_stream.stop()
+        self.controller.shutdown()
+        self.commands.stop()
+        self.serial_bridge.stop()
+        self.client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serviço headless do tabuleiro digital")
+    parser.add_argument("--token", default=os.environ.get("LICHESS_TOKEN"),
+                        help="token da API do Lichess (padrão: $LICHESS_TOKEN)")
+    parser.add_argument("--port", help="porta serial do ESP32 (padrão: detecção automática ou $ESP_PORT)")
+    parser.add_argument("--base-url", default=LICHESS_URL, help="URL base da API do Lichess")
+    parser.add_argument("--log-level", default="INFO", choices=("DEBUG", "INFO", "WARNING", "ERROR"))
+    parser.add_argument("--log-file", help="grava o log neste arquivo em vez da saída padrão")
+    parser.add_argument("--metrics-port", type=int, default=os.environ.get("LATENCY_METRICS_PORT"),
+                        help="expõe as latências dos lances em http://127.0.0.1:<porta>/metrics")
+    parser.add_argument("--latency-dump", default=os.environ.get("LATENCY_DUMP"),
+                        help="grava o resumo das latências neste arquivo JSON ao encerrar")
+    parser.add_argument("--record", default=RECORD_PATH, help="arquivo onde as partidas são gravadas")
+    parser.add_argument("--no-record", action="store_true", help="não grava as partidas")
+    parser.add_argument("--book", default=BOOK_PATH, help="livro de aberturas Polyglot (.bin)")
+    parser.add_argument("--eco", default=ECO_PATH, help="tabela de nomes das aberturas (opening_book.py build-eco)")
+    parser.add_argument("--board-mode", default=BOARD_MODE, choices=("moves", "raw"),
+                        help="quem interpreta os sensores: o firmware (moves) ou o host (raw; promoção sempre dama)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level, filename=args.log_file,
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    if not args.token:
+        parser.error("informe o token com --token ou LICHESS_TOKEN")
+
+    client = LichessClient(args.token, base_url=args.base_url)
+    try:
+        response = client.account()
+    except Exception as e:
+        logger.error(f"Falha ao conectar ao Lichess: {e}")
+        sys.exit(1)
+    if response.status_code != 200:
+        logger.error(f"Token inválido (HTTP {response.status_code})")
+        sys.exit(1)
+    logger.info(f"Conectado como {response.json().get('username')}")
+
+    port = args.port or find_esp_port()
+    if port is None:
+        logger.warning("Nenhuma porta serial informada ou encontrada; seguindo sem o tabuleiro")
+    tracer = LatencyTracer(dump_path=args.latency_dump)
+    if args.metrics_port:
+        tracer.serve(int(args.metrics_port))
+    recorder = None
+    if not args.no_record and args.record:
+        recorder = GameRecorder(args.record, username=response.json().get('username')).start()
+        logger.info(f"Gravando as partidas em {args.record}")
+    service = BoardService(client, port, tracer, recorder, OpeningBook(args.book, args.eco), args.board_mode)
+    signal.signal(signal.SIGINT, lambda *_: service.stop())
+    signal.signal(signal.SIGTERM, lambda *_: service.stop())
+    service.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+"""
+Representação compacta do tabuleiro de xadrez baseada em bitboards.
+
+O estado é mantido em doze bitboards de 64 bits (um por tipo de peça e cor),
+um mailbox de 64 casas para consulta O(1) da peça em uma casa e os campos de
+lado a jogar, roques, en passant e contadores de lances. Os lances são
+aplicados com make/unmake em O(1), sem cópias do tabuleiro.
+
+O hash Zobrist da posição (compatível com os livros Polyglot) é atualizado
+incrementalmente a cada lance, e a pilha de hashes das posições da partida
+permite contar repetições.
+
+Casas são indexadas de 0 (a1) a 63 (h8): sq = rank * 8 + file.
+"""
+from zobrist import PIECE_KEYS, CASTLE_KEYS, EN_PASSANT_KEYS, TURN_KEY
+
+# Índices das peças nos bitboards (brancas 0-5, pretas 6-11)
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+WHITE, BLACK = 0, 1
+EMPTY = 12
+NO_SQUARE = -1
+
+PIECE_SYMBOLS = 'PNBRQKpnbrqk.'
+PIECE_INDEX = {symbol: index for index, symbol in enumerate(PIECE_SYMBOLS[:12])}
+PROMOTION_KINDS = {'n': KNIGHT, 'b': BISHOP, 'r': ROOK, 'q': QUEEN}
+
+FILES = 'abcdefgh'
+SQUARE_NAMES = [f + r for r in '12345678' for f in FILES]
+SQUARE_INDEX = {name: index for index, name in enumerate(SQUARE_NAMES)}
+
+# Direitos de roque (bits)
+CASTLE_WK, CASTLE_WQ, CASTLE_BK, CASTLE_BQ = 1, 2, 4, 8
+CASTLE_ALL = 15
+CASTLE_SYMBOLS = ((CASTLE_WK, 'K'), (CASTLE_WQ, 'Q'), (CASTLE_BK, 'k'), (CASTLE_BQ, 'q'))
+
+# Máscara aplicada aos direitos de roque quando uma peça sai ou chega na casa
+CASTLE_MASK = [CASTLE_ALL] * 64
+CASTLE_MASK[SQUARE_INDEX['e1']] &= ~(CASTLE_WK | CASTLE_WQ)
+CASTLE_MASK[SQUARE_INDEX['h1']] &= ~CASTLE_WK
+CASTLE_MASK[SQUARE_INDEX['a1']] &= ~CASTLE_WQ
+CASTLE_MASK[SQUARE_INDEX['e8']] &= ~(CASTLE_BK | CASTLE_BQ)
+CASTLE_MASK[SQUARE_INDEX['h8']] &= ~CASTLE_BK
+CASTLE_MASK[SQUARE_INDEX['a8']] &= ~CASTLE_BQ
+
+STARTING_FEN = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1'
+
+
+class BoardView:
+    """
+    Visão de compatibilidade que expõe o tabuleiro como state[row][col],
+    com row 0 correspondendo à 8ª fileira e '.' para casas vazias.
+    """
+    __slots__ = ('_squares',)
+
+    def __init__(self, squares):
+        self._squares = squares
+
+    def __getitem__(self, row):
+        start = (7 - row) * 8
+        return [PIECE_SYMBOLS[piece] for piece in self._squares[start:start + 8]]
+
+    def __len__(self):
+        return 8
+
+    def __iter__(self):
+        return (self[row] for row in range(8))
+
+
+class ChessBoard:
+    """
+    Gerencia o estado interno do tabuleiro de xadrez e operações relacionadas.
+    """
+    __slots__ = ('bitboards', 'occupancy', 'squares', 'turn', 'castling',
+                 'ep_square', 'halfmove', 'fullmove', 'history', 'hash', 'positions')
+
+    def __init__(self, fen=STARTING_FEN):
+        self.set_fen(fen)
+
+    def reset_board(self):
+        """Reseta o tabuleiro para a posição inicial."""
+        self.set_fen(STARTING_FEN)
+
+    def set_fen(self, fen):
+        """Carrega uma posição a partir de uma string FEN."""
+        fields = fen.split()
+        self.bitboards = [0] * 12
+        self.occupancy = [0, 0]
+        self.squares = bytearray([EMPTY] * 64)
+        for row, rank_text in enumerate(fields[0].split('/')):
+            file = 0
+            for char in rank_text:
+                if char.isdigit():
+                    file += int(char)
+                    continue
+                self._put(PIECE_INDEX[char], (7 - row) * 8 + file)
+                file += 1
+        self.turn = WHITE if len(fields) < 2 or fields[1] == 'w' else BLACK
+        self.castling = 0
+        if len(fields) > 2:
+            for flag, symbol in CASTLE_SYMBOLS:
+                if symbol in fields[2]:
+                    self.castling |= flag
+        self.ep_square = SQUARE_INDEX.get(fields[3], NO_SQUARE) if len(fields) > 3 else NO_SQUARE
+        self.halfmove = int(fields[4]) if len(fields) > 4 else 0
+        self.fullmove = int(fields[5]) if len(fields) > 5 else 1
+        self.history = []
+        self._reset_positions(self.compute_hash())
+
+    def _reset_positions(self, key):
+        self.hash = key
+        self.positions = [key]
+
+    def compute_hash(self):
+        """Calcula o hash Zobrist da posição do zero (o incremental deve coincidir)."""
+        key = CASTLE_KEYS[self.castling] ^ self._ep_key()
+        for square, piece in enumerate(self.squares):
+            if piece != EMPTY:
+                key ^= PIECE_KEYS[piece][square]
+        if self.turn == WHITE:
+            key ^= TURN_KEY
+        return key
+
+    def _ep_key(self):
+        """
+        Chave do en passant: como no Polyglot, só entra no hash se um peão do
+        lado a jogar estiver ao lado do peão que avançou duas casas.
+        """
+        ep_square = self.ep_square
+        if ep_square == NO_SQUARE:
+            return 0
+        file = ep_square & 7
+        if self.turn == WHITE:
+            pawn, base = PAWN, ep_square - 8
+        else:
+            pawn, base = PAWN + 6, ep_square + 8
+        squares = self.squares
+        if (file > 0 and squares[base - 1] == pawn) or (file < 7 and squares[base + 1] == pawn):
+            return EN_PASSANT_KEYS[file]
+        return 0
+
+    def repetition_count(self):
+        """
+        Quantas vezes a posição atual já ocorreu na partida (incluindo agora).
+        Só as posições desde o último lance de peão ou captura podem se repetir,
+        e apenas as com o mesmo lado a jogar.
+        """
+        recent = self.positions[-1 - self.halfmove:]
+        return recent[::-2].count(self.hash)
+
+    def is_threefold_repetition(self):
+        return self.repetition_count() >= 3
+
+    def fen(self):
+        """Retorna a posição atual em notação FEN."""
+        rows = []
+        for row in self.state:
+            text = ''
+            empty = 0
+            for symbol in row:
+                if symbol == '.':
+                    empty += 1
+                    continue
+                if empty:
+                    text += str(empty)
+                    empty = 0
+                text += symbol
+            rows.append(text + (str(empty) if empty else ''))
+        castling = ''.join(symbol for flag, symbol in CASTLE_SYMBOLS if self.castling & flag) or '-'
+        ep = SQUARE_NAMES[self.ep_square] if self.ep_square != NO_SQUARE else '-'
+        turn = 'w' if self.turn == WHITE else 'b'
+        return f"{'/'.join(rows)} {turn} {castling} {ep} {self.halfmove} {self.fullmove}"
+
+    def copy(self):
+        """Cópia barata do tabuleiro (sem o histórico de lances)."""
+        board = ChessBoard.__new__(ChessBoard)
+        board.bitboards = self.bitboards[:]
+        board.occupancy = self.occupancy[:]
+        board.squares = self.squares[:]
+        board.turn = self.turn
+        board.castling = self.castling
+        board.ep_square = self.ep_square
+        board.halfmove = self.halfmove
+        board.fullmove = self.fullmove
+        board.history = []
+        board._reset_positions(self.hash)
+        return board
+
+    def snapshot(self):
+        """Estado compacto e imutável da posição, para restaurar com restore()."""
+        return (bytes(self.squares), self.turn, self.castling, self.ep_square, self.halfmove, self.fullmove,
+                self.hash)
+
+    def restore(self, snapshot):
+        """Volta à posição de um snapshot() (sem histórico de lances)."""
+        squares, self.turn, self.castling, self.ep_square, self.halfmove, self.fullmove, key = snapshot
+        self.bitboards = [0] * 12
+        self.occupancy = [0, 0]
+        self.squares = bytearray(squares)
+        for square, piece in enumerate(squares):
+            if piece != EMPTY:
+                bit = 1 << square
+                self.bitboards[piece] |= bit
+                self.occupancy[piece >= 6] |= bit
+        self.history = []
+        self._reset_positions(key)
+
+    @property
+    def state(self):
+        """Visão compatível com a antiga lista de listas (state[row][col])."""
+        return BoardView(self.squares)
+
+    def piece_at(self, square):
+        """Retorna o símbolo da peça na casa (índice ou nome), ou '.' se vazia."""
+        if isinstance(square, str):
+            square = SQUARE_INDEX[square]
+        return PIECE_SYMBOLS[self.squares[square]]
+
+    @staticmethod
+    def letter_position(letter):
+        """Converte uma letra (ex.: 'a') para um índice numérico (0 para 'a')."""
+        return FILES.index(letter.lower())
+
+    def _put(self, piece, square):
+        bit = 1 << square
+        self.bitboards[piece] |= bit
+        self.occupancy[piece >= 6] |= bit
+        self.squares[square] = piece
+
+    def _remove(self, piece, square):
+        bit = 1 << square
+        self.bitboards[piece] ^= bit
+        self.occupancy[piece >= 6] ^= bit
+        self.squares[square] = EMPTY
+
+    def apply_move(self, move):
+        """
+        Atualiza o estado do tabuleiro aplicando o movimento UCI dado.
+        Suporta roque, en passant, promoção e movimento normal.
+        """
+        promotion = PROMOTION_KINDS[move[4].lower()] if len(move) > 4 else None
+        self.make_move(SQUARE_INDEX[move[:2]], SQUARE_INDEX[move[2:4]], promotion)
+
+    def make_move(self, from_sq, to_sq, promotion=None):
+        """Aplica um lance em O(1), guardando o necessário para desfazê-lo."""
+        squares = self.squares
+        piece = squares[from_sq]
+        if piece == EMPTY:
+            raise ValueError(f"Nenhuma peça em {SQUARE_NAMES[from_sq]}")
+        kind = piece % 6
+        captured = squares[to_sq]
+        capture_sq = to_sq
+        rook_from = rook_to = NO_SQUARE
+        if kind == KING and abs(to_sq - from_sq) == 2:
+            # Roque: move também a torre
+            if to_sq > from_sq:
+                rook_from, rook_to = from_sq + 3, from_sq + 1
+            else:
+                rook_from, rook_to = from_sq - 4, from_sq - 1
+        elif kind == PAWN and to_sq == self.ep_square and captured == EMPTY:
+            # En passant: o peão capturado está atrás da casa de destino
+            capture_sq = to_sq - 8 if piece < 6 else to_sq + 8
+            captured = squares[capture_sq]
+
+        self.history.append((from_sq, to_sq, piece, captured, capture_sq, promotion,
+                             rook_from, rook_to, self.castling, self.ep_square, self.halfmove, self.hash))
+
+        # Hash: retira as chaves do estado anterior e soma as do novo
+        key = self.hash ^ TURN_KEY ^ CASTLE_KEYS[self.castling] ^ PIECE_KEYS[piece][from_sq]
+        if self.ep_square != NO_SQUARE:
+            key ^= self._ep_key()
+
+        self._remove(piece, from_sq)
+        if captured != EMPTY:
+            self._remove(captured, capture_sq)
+            key ^= PIECE_KEYS[captured][capture_sq]
+        placed = promotion + (piece - kind) if promotion is not None else piece
+        self._put(placed, to_sq)
+        key ^= PIECE_KEYS[placed][to_sq]
+        if rook_from != NO_SQUARE:
+            rook = ROOK + (piece - kind)
+            self._remove(rook, rook_from)
+            self._put(rook, rook_to)
+            key ^= PIECE_KEYS[rook][rook_from] ^ PIECE_KEYS[rook][rook_to]
+
+        self.castling &= CASTLE_MASK[from_sq] & CASTLE_MASK[to_sq]
+        key ^= CASTLE_KEYS[self.castling]
+        if kind == PAWN and abs(to_sq - from_sq) == 16:
+            self.ep_square = (from_sq + to_sq) // 2
+        else:
+            self.ep_square = NO_SQUARE
+        if kind == PAWN or captured != EMPTY:
+            self.halfmove = 0
+        else:
+            self.halfmove += 1
+        if self.turn == BLACK:
+            self.fullmove += 1
+        self.turn ^= 1
+        if self.ep_square != NO_SQUARE:
+            key ^= self._ep_key()
+
+        self.hash = key
+        self.positions.append(key)
+
+    def unmake_move(self):
+        """Desfaz o último lance aplicado em O(1)."""
+        (from_sq, to_sq, piece, captured, capture_sq, promotion,
+         rook_from, rook_to, castling, ep_square, halfmove, key) = self.history.pop()
+        self.positions.pop()
+        self.hash = key
+        self.turn ^= 1
+        if self.turn == BLACK:
+            self.fullmove -= 1
+        if rook_from != NO_SQUARE:
+            rook = ROOK + (piece - piece % 6)
+            self._remove(rook, rook_to)
+            self._put(rook, rook_from)
+        self._remove(self.squares[to_sq], to_sq)
+        if captured != EMPTY:
+            self._put(captured, capture_sq)
+        self._put(piece, from_sq)
+        self.castling = castling
+        self.ep_square = ep_square
+        self.halfmove = halfmove
+
+    def translate_move(self, move):
+        """Converte um movimento no formato UCI para a notação algébrica (SAN)."""
+        from notation import uci_to_san  # notation depende de move_generator, que importa este módulo
+        return uci_to_san(self, move)
@@ -0,0 +1,72 @@
+"""
+Modelo dos relógios da partida.
+
+Os tempos recebidos em cada gameState (wtime/btime) são ancorados em
+time.monotonic(); o tempo restante é calculado sob demanda a partir dessa
+âncora, sem acumular erros de timer e em qualquer taxa de atualização.
+"""
+import time
+
+# Abaixo deste tempo o relógio passa a exibir décimos de segundo
+TENTHS_THRESHOLD_MS = 10000
+
+
+def format_clock(ms):
+    """Formata milissegundos como 'mm:ss', ou 'ss.d' nos últimos segundos."""
+    ms = max(0, int(ms))
+    if ms < TENTHS_THRESHOLD_MS:
+        return f"{ms // 1000:02d}.{(ms % 1000) // 100}"
+    seconds = ms // 1000
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+class GameClock:
+    """
+    Relógio das duas cores ancorado no último gameState recebido.
+    """
+    def __init__(self, time_source=time.monotonic):
+        self.time_source = time_source
+        self.reset()
+
+    def reset(self):
+        """Zera o relógio (sem tempo definido e parado)."""
+        self.white_ms = None
+        self.black_ms = None
+        self.to_move = 'white'
+        self.running = False
+        self.anchor = self.time_source()
+
+    @property
+    def is_set(self):
+        return self.white_ms is not None
+
+    def update(self, white_ms, black_ms, to_move, running=True):
+        """Ancora os tempos informados pelo servidor no instante atual."""
+        self.white_ms = white_ms
+        self.black_ms = black_ms
+        self.to_move = to_move
+        self.running = running
+        self.anchor = self.time_source()
+
+    def stop(self):
+        """Congela os tempos no valor atual."""
+        if self.is_set:
+            self.white_ms = self.remaining_ms('white')
+            self.black_ms = self.remaining_ms('black')
+        self.running = False
+        self.anchor = self.time_source()
+
+    def remaining_ms(self, color):
+        """Tempo restante (ms) da cor dada no instante atual."""
+        base = self.white_ms if color == 'white' else self.black_ms
+        if base is None:
+            return 0
+        if self.running and color == self.to_move:
+            base -= (self.time_source() - self.anchor) * 1000
+        return max(0, int(base))
+
+    def text(self, color):
+        """Tempo restante formatado para exibição."""
+        if not self.is_set:
+            return '--:--'
+        return format_clock(self.remaining_ms(color))
@@ -0,0 +1,339 @@
+"""
+Avaliação da partida por motores UCI locais (ex.: Stockfish).
+
+EnginePool mantém um ou mais processos do motor e analisa a posição de cada
+gameState. Os métodos só escrevem comandos curtos na entrada do motor e nunca
+esperam por ele: o handshake (uci/isready) e a leitura das linhas 'info' ficam
+em uma thread por processo, e os resultados são entregues pelo callback
+on_info(game_id, EngineInfo), que a interface gráfica liga a um sinal do Qt.
+
+Uma nova posição da mesma partida cancela a busca anterior ('stop'); a
+próxima busca só começa após o 'bestmove' da cancelada, como exige o UCI.
+Avaliações concluídas ficam em cache pelo hash Zobrist da posição, de modo que
+voltar a uma posição já analisada (resync, troca de foco) não custa uma busca.
+
+O uso de CPU é limitado pelo número de processos e pelas opções Threads e Hash
+de cada um. Configuração por variáveis de ambiente: ENGINE_PATH (comando do
+motor; vazio desliga a análise), ENGINE_POOL_SIZE, ENGINE_THREADS, ENGINE_HASH
+(MB), ENGINE_DEPTH e ENGINE_MOVETIME (ms). uci_stub_engine.py é um motor
+mínimo para testes.
+"""
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from chess_board import WHITE
+from zobrist import PositionCache
+
+logger = logging.getLogger(__name__)
+
+ENGINE_COMMAND = os.environ.get("ENGINE_PATH", "")
+ENGINE_POOL_SIZE = int(os.environ.get("ENGINE_POOL_SIZE", 1))
+ENGINE_THREADS = int(os.environ.get("ENGINE_THREADS", 1))
+ENGINE_HASH_MB = int(os.environ.get("ENGINE_HASH", 64))
+ENGINE_DEPTH = int(os.environ.get("ENGINE_DEPTH", 20))
+ENGINE_MOVETIME_MS = int(os.environ.get("ENGINE_MOVETIME", 3000))
+
+# Intervalo mínimo entre duas linhas 'info' repassadas (s)
+INFO_INTERVAL = 0.1
+# Reinícios de um processo que terminou sozinho antes de desistir dele
+MAX_RESTARTS = 3
+
+# Avaliação do ponto de vista das brancas; mate > 0 se as brancas dão mate
+EngineInfo = namedtuple('EngineInfo', ['key', 'depth', 'score_cp', 'mate', 'pv', 'nodes', 'final'])
+Job = namedtuple('Job', ['game_id', 'key', 'fen', 'white_to_move'])
+
+
+def parse_info(line, key, white_to_move):
+    """EngineInfo de uma linha 'info' com score e pv (None para as demais)."""
+    tokens = line.split()
+    depth = nodes = 0
+    score_cp = mate = None
+    pv = []
+    index = 1
+    while index < len(tokens):
+        token = tokens[index]
+        if token == 'depth':
+            depth = int(tokens[index + 1])
+            index += 2
+        elif token == 'nodes':
+            nodes = int(tokens[index + 1])
+            index += 2
+        elif token == 'score':
+            kind, value = tokens[index + 1], int(tokens[index + 2])
+            if kind == 'cp':
+                score_cp = value
+            else:
+                mate = value
+            index += 3
+            if index < len(tokens) and tokens[index] in ('lowerbound', 'upperbound'):
+                return None  # resultado parcial de uma janela de aspiração
+        elif token == 'pv':
+            pv = tokens[index + 1:]
+            break
+        elif token == 'string':
+            return None
+        else:
+            index += 1
+    if not pv or (score_cp is None and mate is None):
+        return None
+    if not white_to_move:
+        score_cp = -score_cp if score_cp is not None else None
+        mate = -mate if mate is not None else None
+    return EngineInfo(key, depth, score_cp, mate, pv, nodes, False)
+
+
+def format_score(info):
+    """Avaliação para exibição: +0.35, -1.20 ou #3 / #-2."""
+    if info.mate is not None:
+        return f"#{info.mate}"
+    return f"{info.score_cp / 100:+.2f}"
+
+
+# =============================================================================
+# Processo do motor
+# =============================================================================
+class UciEngine:
+    """
+    Um processo do motor. Só o pool chama os métodos de busca; a thread de
+    leitura avisa o pool quando o motor fica livre ou termina.
+    """
+    def __init__(self, pool, index):
+        self.pool = pool
+        self.name = f"engine-{index}"
+        self.process = None
+        self.ready = False
+        self.job = None  # busca em andamento (inclusive a que está sendo cancelada)
+        self.cancelled = False
+        self.restarts = 0
+        self._write_lock = threading.Lock()
+
+    @property
+    def idle(self):
+        return self.ready and self.job is None
+
+    def start(self):
+        # subprocess e shlex só são carregados quando há um motor configurado
+        import shlex
+        import subprocess
+        command = shlex.split(self.pool.command) if isinstance(self.pool.command, str) else self.pool.command
+        self.ready = False
+        self.job = None
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                        stderr=subprocess.DEVNULL, text=True, bufsize=1)
+        threading.Thread(target=self._run, name=self.name, daemon=True).start()
+
+    def send(self, command):
+        with self._write_lock:
+            try:
+                self.process.stdin.write(command + "\n")
+                self.process.stdin.flush()
+            except (OSError, ValueError):
+                pass  # o processo terminou; a thread de leitura trata o EOF
+
+    def search(self, job):
+        self.job = job
+        self.cancelled = False
+        self.send(f"position fen {job.fen}")
+        self.send(f"go depth {self.pool.depth} movetime {self.pool.movetime_ms}")
+
+    def stop(self):
+        if self.job is not None and not self.cancelled:
+            self.cancelled = True
+            self.send("stop")
+
+    def quit(self, timeout=1.0):
+        if self.process is None:
+            return
+        import subprocess
+        self.send("quit")
+        try:
+            self.process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+    def _handshake(self, lines):
+        self.send("uci")
+        for line in lines:
+            if line.strip() == 'uciok':
+                break
+        else:
+            return False
+        self.send(f"setoption name Threads value {self.pool.threads}")
+        self.send(f"setoption name Hash value {self.pool.hash_mb}")
+        self.send("isready")
+        for line in lines:
+            if line.strip() == 'readyok':
+                return True
+        return False
+
+    def _run(self):
+        lines = iter(self.process.stdout)
+        if self._handshake(lines):
+            self.pool._engine_ready(self)
+            last = None
+            last_sent = 0.0
+            for line in lines:
+                job = self.job
+                if job is None:
+                    continue
+                if line.startswith('info '):
+                    info = parse_info(line, job.key, job.white_to_move)
+                    if info is None:
+                        continue
+                    last = info
+                    now = time.monotonic()
+                    if not self.cancelled and now - last_sent >= INFO_INTERVAL:
+                        last_sent = now
+                        self.pool._emit(job, info)
+                elif line.startswith('bestmove'):
+                    final = last._replace(final=True) if last is not None else None
+                    last = None
+                    last_sent = 0.0
+                    self.pool._search_done(self, job, final, self.cancelled)
+        self.ready = False
+        self.pool._engine_exited(self)
+
+
+# =============================================================================
+# Pool
+# =============================================================================
+class NullEnginePool:
+    """Pool sem motor (análise desligada)."""
+    def start(self):
+        return self
+
+    def analyse(self, game_id, board):
+        pass
+
+    def cancel(self, game_id):
+        pass
+
+    def close(self, timeout=1.0):
+        pass
+
+
+class EnginePool:
+    """
+    Distribui as posições entre os processos do motor. Cada partida tem no
+    máximo uma busca em andamento e uma posição pendente (a mais recente).
+    """
+    def __init__(self, command, size=ENGINE_POOL_SIZE, threads=ENGINE_THREADS, hash_mb=ENGINE_HASH_MB,
+                 depth=ENGINE_DEPTH, movetime_ms=ENGINE_MOVETIME_MS, on_info=None, cache_size=4096):
+        self.command = command
+        self.threads = threads
+        self.hash_mb = hash_mb
+        self.depth = depth
+        self.movetime_ms = movetime_ms
+        self.on_info = on_info
+        self.engines = [UciEngine(self, index) for index in range(max(1, size))]
+        self.pending = OrderedDict()  # game_id -> Job
+        self.cache = PositionCache(cache_size)  # hash -> EngineInfo final
+        self.searches = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @classmethod
+    def from_env(cls, on_info=None):
+        """Pool configurado pelas variáveis ENGINE_* (NullEnginePool sem ENGINE_PATH)."""
+        if not ENGINE_COMMAND:
+            return NullEnginePool()
+        return cls(ENGINE_COMMAND, on_info=on_info)
+
+    def start(self):
+        for engine in self.engines:
+            try:
+                engine.start()
+            except OSError as e:
+                logger.error(f"Falha ao iniciar o motor ({self.command}): {e}")
+        return self
+
+    def analyse(self, game_id, board):
+        """Analisa a posição atual do tabuleiro, substituindo a busca anterior da partida."""
+        job = Job(game_id, board.hash, board.fen(), board.turn == WHITE)
+        with self._lock:
+            cached = self.cache.get(job.key)
+            running = False
+            for engine in self.engines:
+                if engine.job is None or engine.job.game_id != game_id:
+                    continue
+                if engine.job.key == job.key and cached is None and not engine.cancelled:
+                    running = True
+                else:
+                    engine.stop()
+            self.pending.pop(game_id, None)
+            if cached is None and not running:
+                self.pending[game_id] = job
+            self._dispatch()
+        if cached is not None:
+            self._emit(job, cached)
+
+    def cancel(self, game_id):
+        """Descarta a posição pendente e interrompe a busca da partida."""
+        with self._lock:
+            self.pending.pop(game_id, None)
+            for engine in self.engines:
+                if engine.job is not None and engine.job.game_id == game_id:
+                    engine.stop()
+
+    def close(self, timeout=1.0):
+        with self._lock:
+            self._closed = True
+            self.pending.clear()
+        for engine in self.engines:
+            engine.quit(timeout)
+
+    def _dispatch(self):
+        """Entrega posições pendentes aos motores livres (com o lock)."""
+        for engine in self.engines:
+            if not self.pending:
+                return
+            if not engine.idle:
+                continue
+            busy = {other.job.game_id for other in self.engines if other.job is not None}
+            game_id = next((game_id for game_id in self.pending if game_id not in busy), None)
+            if game_id is None:
+                return
+            self.searches += 1
+            engine.search(self.pending.pop(game_id))
+
+    def _emit(self, job, info):
+        if self.on_info:
+            self.on_info(job.game_id, info)
+
+    # -------------------------------------------------------------------------
+    # Chamados pelas threads dos motores
+    # -------------------------------------------------------------------------
+    def _engine_ready(self, engine):
+        logger.info(f"{engine.name} pronto ({self.command})")
+        with self._lock:
+            engine.ready = True
+            self._dispatch()
+
+    def _search_done(self, engine, job, final, cancelled):
+        with self._lock:
+            engine.job = None
+            if final is not None and not cancelled:
+                self.cache.put(job.key, final)
+            self._dispatch()
+        if final is not None and not cancelled:
+            self._emit(job, final)
+
+    def _engine_exited(self, engine):
+        with self._lock:
+            job, engine.job = engine.job, None
+            if self._closed:
+                return
+            if job is not None and job.game_id not in self.pending:
+                self.pending[job.game_id] = job
+            if engine.restarts >= MAX_RESTARTS:
+                logger.error(f"{engine.name} terminou; análise desligada neste processo")
+                return
+            engine.restarts += 1
+            logger.warning(f"{engine.name} terminou; reiniciando ({engine.restarts}/{MAX_RESTARTS})")
+        try:
+            engine.start()
+        except OSError as e:
+            logger.error(f"Falha ao reiniciar {engine.name}: {e}")
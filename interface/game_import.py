@@ -0,0 +1,289 @@
+"""
+Importação do histórico de partidas de um usuário do Lichess para SQLite.
+
+O stream NDJSON de /api/games/user/{username} é lido linha a linha (memória
+constante, independente do número de partidas). Os lances SAN de cada partida
+são convertidos em lances compactos de 2 bytes (origem, destino e promoção) e
+gravados em transações de BATCH_SIZE partidas, junto com o ponto de retomada:
+a última partida importada e a sua data. Uma nova importação continua dali,
+pedindo ao Lichess só as partidas a partir dessa data (duplicadas são
+ignoradas pela chave primária).
+
+A tabela games é indexada por data, adversário, abertura (ECO) e resultado.
+A mesma rotina importa um arquivo NDJSON gravado (--file), útil para testes.
+
+Uso:
+    python game_import.py <usuário> [--token <token>] [--db games.sqlite]
+    python game_import.py <usuário> --file partidas.ndjson
+"""
+import argparse
+import logging
+import os
+import sqlite3
+import struct
+import time
+
+from chess_board import ChessBoard, SQUARE_NAMES
+from lichess_stream import json_loads, READ_BUFFER_SIZE
+from move_generator import PROMOTION_LETTERS
+from notation import parse_san
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB = os.environ.get("GAME_DB", os.path.join(os.path.expanduser("~"), ".digital_chessboard",
+                                                    "games.sqlite"))
+BATCH_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id TEXT PRIMARY KEY,
+    username TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    last_move_at INTEGER,
+    color TEXT,
+    opponent TEXT,
+    opponent_rating INTEGER,
+    rating INTEGER,
+    speed TEXT,
+    rated INTEGER,
+    variant TEXT,
+    status TEXT,
+    winner TEXT,
+    result TEXT,
+    eco TEXT,
+    opening TEXT,
+    plies INTEGER,
+    moves BLOB
+);
+CREATE INDEX IF NOT EXISTS games_created ON games (username, created_at);
+CREATE INDEX IF NOT EXISTS games_opponent ON games (opponent, created_at);
+CREATE INDEX IF NOT EXISTS games_opening ON games (eco, opening);
+CREATE INDEX IF NOT EXISTS games_result ON games (username, result);
+CREATE TABLE IF NOT EXISTS import_state (
+    username TEXT PRIMARY KEY,
+    last_game_id TEXT,
+    last_created_at INTEGER,
+    imported INTEGER NOT NULL DEFAULT 0,
+    updated_at INTEGER
+);
+"""
+
+INSERT_GAME = """
+INSERT OR IGNORE INTO games (id, username, created_at, last_move_at, color, opponent, opponent_rating, rating,
+                             speed, rated, variant, status, winner, result, eco, opening, plies, moves)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+PROMOTION_CODES = {None: 0}
+PROMOTION_CODES.update({kind: index for index, kind in enumerate(sorted(PROMOTION_LETTERS), 1)})
+PROMOTION_BY_CODE = {code: kind for kind, code in PROMOTION_CODES.items()}
+
+
+# =============================================================================
+# Lances compactos
+# =============================================================================
+def encode_moves(san_moves, variant='standard'):
+    """
+    Converte os lances SAN em bytes: um uint16 por lance com origem (6 bits),
+    destino (6 bits) e promoção (3 bits). Só partidas do xadrez padrão são
+    convertidas; para as demais devolve None.
+    """
+    if variant != 'standard' or not san_moves:
+        return None if variant != 'standard' else b''
+    board = ChessBoard()
+    codes = []
+    for san in san_moves:
+        move = parse_san(board, san)
+        codes.append(move.from_sq | move.to_sq << 6 | PROMOTION_CODES[move.promotion] << 12)
+        board.make_move(*move)
+    return struct.pack(f'<{len(codes)}H', *codes)
+
+
+def decode_moves(data):
+    """Lances UCI a partir dos bytes de encode_moves."""
+    moves = []
+    for (code,) in struct.iter_unpack('<H', data or b''):
+        promotion = PROMOTION_BY_CODE[code >> 12]
+        moves.append(SQUARE_NAMES[code & 63] + SQUARE_NAMES[code >> 6 & 63] +
+                     (PROMOTION_LETTERS[promotion] if promotion is not None else ''))
+    return moves
+
+
+# =============================================================================
+# Banco de partidas
+# =============================================================================
+def game_row(game, username):
+    """Linha da tabela games para uma partida do export do Lichess."""
+    players = game.get('players', {})
+    white = players.get('white', {})
+    black = players.get('black', {})
+    user_id = username.lower()
+    color = 'white' if white.get('user', {}).get('id') == user_id else 'black'
+    me, opponent = (white, black) if color == 'white' else (black, white)
+    if 'user' in opponent:
+        opponent_name = opponent['user'].get('name')
+    elif 'aiLevel' in opponent:
+        opponent_name = f"AI level {opponent['aiLevel']}"
+    else:
+        opponent_name = 'Anonymous'
+    winner = game.get('winner')
+    status = game.get('status')
+    if winner:
+        result = '1-0' if winner == 'white' else '0-1'
+    elif status in ('aborted', 'started', 'created', 'noStart', 'unknownFinish'):
+        result = '*'
+    else:
+        result = '1/2-1/2'
+    variant = game.get('variant', 'standard')
+    san_moves = game.get('moves', '').split()
+    try:
+        moves = encode_moves(san_moves, variant)
+    except (ValueError, IndexError) as e:
+        logger.warning(f"Lances da partida {game.get('id')} não convertidos: {e}")
+        moves = None
+    opening = game.get('opening') or {}
+    return (game['id'], user_id, game.get('createdAt', 0), game.get('lastMoveAt'), color, opponent_name,
+            opponent.get('rating'), me.get('rating'), game.get('speed'), int(bool(game.get('rated'))), variant,
+            status, winner, result, opening.get('eco'), opening.get('name'), len(san_moves), moves)
+
+
+class GameStore:
+    """Banco SQLite com as partidas importadas."""
+    def __init__(self, path=DEFAULT_DB):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def resume_point(self, username):
+        """(id, data em ms) da última partida importada do usuário, ou (None, None)."""
+        row = self.db.execute("SELECT last_game_id, last_created_at FROM import_state WHERE username = ?",
+                              (username.lower(),)).fetchone()
+        return row if row else (None, None)
+
+    def write_batch(self, username, rows):
+        """Grava as partidas e o ponto de retomada na mesma transação."""
+        if not rows:
+            return 0
+        last = max(rows, key=lambda row: row[2])
+        with self.db:
+            before = self.db.total_changes
+            self.db.executemany(INSERT_GAME, rows)
+            inserted = self.db.total_changes - before
+            self.db.execute(
+                "INSERT INTO import_state (username, last_game_id, last_created_at, imported, updated_at) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT (username) DO UPDATE SET "
+                "last_game_id = excluded.last_game_id, last_created_at = excluded.last_created_at, "
+                "imported = imported + excluded.imported, updated_at = excluded.updated_at "
+                "WHERE excluded.last_created_at >= import_state.last_created_at",
+                (username.lower(), last[0], last[2], inserted, int(time.time() * 1000)))
+        return inserted
+
+    def count(self, username=None):
+        if username is None:
+            return self.db.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+        return self.db.execute("SELECT COUNT(*) FROM games WHERE username = ?", (username.lower(),)).fetchone()[0]
+
+    def moves(self, game_id):
+        """Lances UCI de uma partida importada."""
+        row = self.db.execute("SELECT moves FROM games WHERE id = ?", (game_id,)).fetchone()
+        return decode_moves(row[0]) if row else None
+
+
+# =============================================================================
+# Importação
+# =============================================================================
+def import_lines(store, username, lines, batch_size=BATCH_SIZE, on_progress=None, should_stop=None):
+    """
+    Importa partidas de um iterável de linhas NDJSON (bytes ou str).
+    Retorna (partidas lidas, partidas novas).
+    """
+    batch = []
+    read = inserted = 0
+    for line in lines:
+        if not line or line.isspace():
+            continue
+        try:
+            game = json_loads(line)
+            batch.append(game_row(game, username))
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Linha ignorada: {e}")
+            continue
+        read += 1
+        if len(batch) >= batch_size:
+            inserted += store.write_batch(username, batch)
+            batch = []
+            if on_progress:
+                on_progress(read, inserted)
+            if should_stop and should_stop():
+                break
+    inserted += store.write_batch(username, batch)
+    if on_progress:
+        on_progress(read, inserted)
+    return read, inserted
+
+
+def import_from_lichess(client, store, username, max_games=None, on_progress=None, should_stop=None):
+    """Importa as partidas do usuário a partir do ponto de retomada."""
+    _, since = store.resume_point(username)
+    response = client.export_games(username, since=since, max_games=max_games)
+    if response.status_code != 200:
+        response.close()
+        raise RuntimeError(f"Falha ao exportar as partidas de {username} (HTTP {response.status_code})")
+    try:
+        return import_lines(store, username, response.iter_lines(chunk_size=READ_BUFFER_SIZE),
+                            on_progress=on_progress, should_stop=should_stop)
+    finally:
+        response.close()
+
+
+def import_from_file(store, username, path, on_progress=None):
+    with open(path, 'rb') as f:
+        return import_lines(store, username, f, on_progress=on_progress)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Importa as partidas de um usuário do Lichess para SQLite")
+    parser.add_argument("username")
+    parser.add_argument("--token", default=os.environ.get("LICHESS_TOKEN"),
+                        help="token da API do Lichess (padrão: $LICHESS_TOKEN)")
+    parser.add_argument("--db", default=DEFAULT_DB, help="arquivo SQLite de destino")
+    parser.add_argument("--file", help="importa de um arquivo NDJSON em vez do Lichess")
+    parser.add_argument("--max", type=int, help="número máximo de partidas a pedir")
+    parser.add_argument("--log-level", default="INFO")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    start = time.monotonic()
+
+    def progress(read, inserted):
+        elapsed = time.monotonic() - start
+        logger.info(f"{read} partidas lidas, {inserted} novas ({read / elapsed if elapsed else 0:.0f}/s)")
+
+    with GameStore(args.db) as store:
+        if args.file:
+            read, inserted = import_from_file(store, args.username, args.file, progress)
+        else:
+            from lichess_client import LichessClient
+            client = LichessClient(args.token)
+            try:
+                read, inserted = import_from_lichess(client, store, args.username, args.max, progress)
+            finally:
+                client.close()
+        logger.info(f"Concluído: {read} lidas, {inserted} novas, {store.count(args.username)} no banco "
+                    f"({time.monotonic() - start:.1f} s)")
+
+
+if __name__ == "__main__":
+    main()
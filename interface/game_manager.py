@@ -0,0 +1,416 @@
+"""
+Gerenciamento de várias partidas simultâneas (ao vivo e por correspondência).
+
+Cada partida ativa tem sua própria GameSession, com ChessBoard, relógio e
+stream do jogo. Os streams rodam em um pool limitado de threads; os eventos
+recebidos são entregues ao callback on_game_event(game_id, evento), e quem
+hospeda o GameManager (interface gráfica ou serviço headless) decide em qual
+thread aplicá-los com GameSession.apply. Uma das partidas fica em foco: é ela
+que aparece na tela e no tabuleiro físico.
+
+Com mais partidas ativas que streams (max_streams), as excedentes são
+consultadas por uma única thread a cada POLL_INTERVAL segundos: o stream do
+jogo é aberto só para ler o gameFull e fechado em seguida. A partida em foco
+sempre tem stream próprio; ao receber o foco, uma partida consultada toma o
+lugar de outra fora do foco (de preferência por correspondência), e um stream
+liberado pelo fim de uma partida passa para a próxima consultada.
+
+O gameFinish do stream de eventos pode chegar antes do último gameState do
+stream do jogo. Nesse caso a partida só é encerrada quando o stream do jogo
+entrega o estado final (ou termina, o que é avisado por um StreamClosed), para
+que o último lance não se perca.
+"""
+import logging
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from chess_board import ChessBoard, STARTING_FEN, WHITE
+from clock_model import GameClock
+from lichess_events import GameFull, GameState
+from lichess_stream import FATAL_STATUS, NdjsonReader, ReconnectingStream, shutdown_response
+from notation import lcd_notation, uci_to_san
+
+logger = logging.getLogger(__name__)
+
+# Número máximo de streams de jogo abertos ao mesmo tempo
+MAX_GAME_STREAMS = 8
+# Intervalo entre as consultas das partidas sem stream próprio (s)
+POLL_INTERVAL = 10.0
+
+# Lance aplicado: UCI, SAN e a variante compacta do LCD (calculados uma vez por ply)
+Ply = namedtuple('Ply', ['uci', 'san', 'lcd'])
+
+
+# =============================================================================
+# Sincronização incremental da lista de lances
+# =============================================================================
+class MoveListSync:
+    """
+    Mantém um cursor de lances (ply) para um jogo e aplica ao ChessBoard apenas
+    o sufixo novo da string 'moves' recebida do Lichess. Caso o prefixo já
+    aplicado não corresponda mais (takeback, reconexão com outro estado),
+    reconstrói o tabuleiro a partir da posição inicial da partida (initial_fen).
+    """
+    def __init__(self, board, game_id=None):
+        self.board = board
+        self.game_id = game_id
+        self.initial_fen = STARTING_FEN
+        self.applied = []  # lances UCI já aplicados ao tabuleiro
+        self.history = []  # Ply dos lances aplicados
+        self.last_san = None
+        self.rebuilt = False  # indica se a última sincronização reconstruiu o tabuleiro
+
+    @property
+    def cursor(self):
+        """Número de lances (ply) já aplicados."""
+        return len(self.applied)
+
+    def reset(self, game_id=None, initial_fen=STARTING_FEN):
+        """Reinicia o cursor e o tabuleiro para um novo jogo."""
+        self.game_id = game_id
+        self.initial_fen = initial_fen
+        self._clear()
+
+    def set_initial_fen(self, fen):
+        """Posição inicial do GameFull ('startpos' ou FEN); refaz o tabuleiro se ela mudou."""
+        fen = STARTING_FEN if not fen or fen == 'startpos' else fen
+        if fen != self.initial_fen:
+            self.initial_fen = fen
+            self._clear()
+
+    def _clear(self):
+        self.applied = []
+        self.history = []
+        self.last_san = None
+        self.board.set_fen(self.initial_fen)
+
+    def sync(self, moves_list):
+        """
+        Sincroniza o tabuleiro com a lista completa de lances.
+        Retorna a lista de Ply efetivamente aplicados nesta chamada.
+        """
+        cursor = len(self.applied)
+        self.rebuilt = False
+        if moves_list[:cursor] != self.applied:
+            # Prefixo divergente: reconstrução completa
+            logger.info(f"Resync completo do jogo {self.game_id} ({cursor} -> {len(moves_list)} lances)")
+            self._clear()
+            self.rebuilt = True
+            cursor = 0
+        applied = []
+        for move in moves_list[cursor:]:
+            san = uci_to_san(self.board, move)
+            self.board.apply_move(move)
+            # applied e history andam juntos: um lance inválido deixa o cursor no anterior
+            ply = Ply(move, san, lcd_notation(san))
+            self.applied.append(move)
+            self.history.append(ply)
+            self.last_san = san
+            applied.append(ply)
+        return applied
+
+
+class StreamClosed:
+    """Entregue a on_game_event depois do último evento do stream de um jogo."""
+    __slots__ = ()
+
+
+def is_game_over(event):
+    """Indica se o evento do stream do jogo informa o fim da partida."""
+    state = event.state if isinstance(event, GameFull) else event
+    return isinstance(state, GameState) and state.status not in ('created', 'started')
+
+
+# =============================================================================
+# Estado de uma partida
+# =============================================================================
+class GameSession:
+    """
+    Estado de uma partida acompanhada: tabuleiro, relógio e stream do jogo.
+    """
+    def __init__(self, event):
+        self.game_id = event.game_id
+        self.color = event.color
+        self.source = event.source
+        self.opponent = event.opponent
+        self.speed = event.game.get('speed')
+        self.board = ChessBoard()
+        self.move_sync = MoveListSync(self.board, self.game_id)
+        self.clock = GameClock()
+        self.to_move = 'white'
+        self.status = 'started'
+        self.winner = None
+        self.finished = False
+        self.final_state = False  # o stream do jogo já entregou o estado final (ou terminou)
+        self.pending_finish = None  # GameFinish recebido antes do estado final
+        self.stream = None
+        self.opening = None  # Opening (opening_book) da linha jogada, se conhecida
+
+    @property
+    def active(self):
+        return not self.finished
+
+    @property
+    def polled(self):
+        """Partida em andamento sem stream próprio (acompanhada por consulta periódica)."""
+        return self.active and self.stream is None
+
+    @property
+    def last_san(self):
+        return self.move_sync.last_san
+
+    @property
+    def last_uci(self):
+        return self.move_sync.applied[-1] if self.move_sync.applied else None
+
+    @property
+    def plies(self):
+        return self.move_sync.cursor
+
+    @property
+    def opponent_text(self):
+        """Nome do adversário (com rating, exceto contra a IA)."""
+        name = self.opponent.get('username', 'Unknown')
+        if self.source == 'ai':
+            return name
+        return f"{name} ({self.opponent.get('rating', '00')})"
+
+    @property
+    def my_turn(self):
+        return self.active and self.to_move == self.color
+
+    def apply(self, event):
+        """
+        Aplica um GameFull/GameState à partida. Retorna os lances novos
+        (lista de pares UCI, notação) ou None se o evento não for de estado.
+        """
+        if isinstance(event, GameFull):
+            self.move_sync.set_initial_fen(event.initial_fen)
+            state = event.state
+        elif isinstance(event, GameState):
+            state = event
+        else:
+            return None
+        moves_list = state.moves_list
+        new_moves = self.move_sync.sync(moves_list)
+        if is_game_over(state):
+            self.final_state = True
+        self.to_move = 'white' if self.board.turn == WHITE else 'black'
+        self.status = state.status
+        # O relógio só corre depois que as duas cores fizeram o primeiro lance
+        running = len(moves_list) >= 2 and state.status == 'started'
+        self.clock.update(state.wtime, state.btime, self.to_move, running)
+        return new_moves
+
+    def finish(self, event=None):
+        """Marca a partida como encerrada e para o relógio."""
+        self.finished = True
+        if event is not None:
+            self.status = event.status or self.status
+            self.winner = event.winner
+        self.clock.stop()
+
+    @property
+    def result(self):
+        """Resultado no formato PGN, ou 'Aborted'."""
+        if self.status == 'aborted':
+            return 'Aborted'
+        if self.winner == 'white':
+            return '1-0'
+        if self.winner == 'black':
+            return '0-1'
+        return '1/2-1/2'
+
+
+# =============================================================================
+# Gerenciador de partidas
+# =============================================================================
+class GameManager:
+    """
+    Mantém uma GameSession por partida ativa e multiplexa os streams dos jogos
+    em um pool limitado de threads.
+    """
+    def __init__(self, client, on_game_event, on_error=None, on_status=None, max_streams=MAX_GAME_STREAMS,
+                 poll_interval=POLL_INTERVAL):
+        self.client = client
+        self.on_game_event = on_game_event
+        self.on_error = on_error
+        self.on_status = on_status
+        self.max_streams = max(1, max_streams)
+        self.poll_interval = poll_interval
+        self.executor = ThreadPoolExecutor(max_workers=self.max_streams, thread_name_prefix="game-stream")
+        self.sessions = {}
+        self.focus_id = None
+        self._poller = None
+        self._poll_wake = threading.Event()
+        self._closed = False
+
+    @property
+    def focused(self):
+        return self.sessions.get(self.focus_id)
+
+    def get(self, game_id):
+        return self.sessions.get(game_id)
+
+    def active_sessions(self):
+        return [session for session in self.sessions.values() if session.active]
+
+    def streamed_sessions(self):
+        """Partidas em andamento com stream próprio."""
+        return [session for session in self.sessions.values() if session.active and session.stream is not None]
+
+    def start_game(self, event):
+        """
+        Registra a partida de um evento gameStart e abre o seu stream.
+        Um gameStart repetido (ex.: após reconectar o stream de eventos)
+        devolve a sessão já existente.
+        """
+        session = self.sessions.get(event.game_id)
+        if session is not None and session.active:
+            return session
+        session = GameSession(event)
+        self.sessions[session.game_id] = session
+        if len(self.streamed_sessions()) < self.max_streams:
+            self._open_stream(session)
+        else:
+            logger.warning(f"{len(self.streamed_sessions())} streams de jogo abertos (limite {self.max_streams}): "
+                           f"partida {session.game_id} consultada a cada {self.poll_interval:.0f} s")
+            self._start_polling()
+        return session
+
+    def _open_stream(self, session):
+        game_id = session.game_id
+        stream = ReconnectingStream(
+            lambda: self.client.stream_game(game_id),
+            lambda game_event: self.on_game_event(game_id, game_event),
+            self.on_error,
+            (lambda status: self.on_status(game_id, status)) if self.on_status else None,
+            is_game_over,
+            name=f"game stream {game_id}",
+        )
+        session.stream = stream
+        self.executor.submit(self._run_stream, session, stream)
+
+    def _run_stream(self, session, stream):
+        try:
+            stream.run()
+        finally:
+            # Um stream trocado pela consulta periódica não encerra a partida
+            if session.stream is stream:
+                self.on_game_event(session.game_id, StreamClosed())
+
+    def _release_stream(self, session):
+        """Passa a partida para a consulta periódica, liberando o seu stream."""
+        stream, session.stream = session.stream, None
+        stream.stop()
+        logger.info(f"Partida {session.game_id} passa a ser consultada a cada {self.poll_interval:.0f} s")
+        self._start_polling()
+
+    def _assign_streams(self):
+        """Dá os streams livres às partidas consultadas, a partida em foco primeiro."""
+        polled = sorted((session for session in self.sessions.values() if session.polled),
+                        key=lambda session: session.game_id != self.focus_id)
+        for session in polled:
+            if len(self.streamed_sessions()) >= self.max_streams:
+                break
+            logger.info(f"Partida {session.game_id} volta a ter stream próprio")
+            self._open_stream(session)
+
+    # -------------------------------------------------------------------------
+    # Consulta periódica das partidas sem stream
+    # -------------------------------------------------------------------------
+    def _start_polling(self):
+        if self._poller is None:
+            self._poller = threading.Thread(target=self._poll_loop, name="game-poll", daemon=True)
+            self._poller.start()
+        self._poll_wake.set()
+
+    def _poll_loop(self):
+        while not self._closed:
+            self._poll_wake.clear()
+            for session in list(self.sessions.values()):
+                if self._closed:
+                    return
+                if session.polled:
+                    self.poll_game(session)
+            self._poll_wake.wait(self.poll_interval)
+
+    def poll_game(self, session):
+        """Abre o stream do jogo só para entregar o gameFull atual."""
+        game_id = session.game_id
+        try:
+            response = self.client.stream_game(game_id)
+            try:
+                if response.status_code != 200:
+                    logger.warning(f"Consulta da partida {game_id}: HTTP {response.status_code}")
+                    if response.status_code in FATAL_STATUS:
+                        self.on_game_event(game_id, StreamClosed())
+                    return
+                for event in NdjsonReader().iter_events(response):
+                    self.on_game_event(game_id, event)
+                    break
+            finally:
+                shutdown_response(response)
+        except Exception as e:
+            logger.warning(f"Consulta da partida {game_id}: {e}")
+
+    def finish_game(self, event):
+        """
+        Encerra a partida de um evento gameFinish e fecha o seu stream. Se o
+        stream do jogo ainda não entregou o estado final, a partida continua
+        aberta com o evento em pending_finish (session.finished fica False).
+        """
+        session = self.sessions.get(event.game_id)
+        if session is None:
+            return None
+        if not session.final_state:
+            session.pending_finish = event
+            if session.polled:
+                self._poll_wake.set()  # busca o estado final sem esperar o intervalo
+            return session
+        session.pending_finish = None
+        session.finish(event)
+        if session.stream is not None:
+            session.stream.stop()
+        if event.game_id != self.focus_id:
+            del self.sessions[event.game_id]
+        self._assign_streams()
+        return session
+
+    def set_focus(self, game_id):
+        """
+        Coloca a partida em foco, descartando a anterior se já terminou. Uma
+        partida consultada ganha stream próprio no lugar de outra fora do foco.
+        """
+        previous = self.focused
+        if previous is not None and previous.finished and previous.game_id != game_id:
+            del self.sessions[previous.game_id]
+        self.focus_id = game_id
+        session = self.focused
+        if session is not None and session.polled:
+            streamed = self.streamed_sessions()
+            if len(streamed) >= self.max_streams:
+                # Cede o stream de uma partida fora do foco, de preferência por correspondência
+                streamed.sort(key=lambda other: other.speed != 'correspondence')
+                self._release_stream(streamed[0])
+            self._assign_streams()
+        return session
+
+    def next_game_id(self):
+        """Próxima partida ativa depois da que está em foco (ordem circular)."""
+        active = [session.game_id for session in self.active_sessions()]
+        if not active:
+            return None
+        if self.focus_id not in active:
+            return active[0]
+        return active[(active.index(self.focus_id) + 1) % len(active)]
+
+    def shutdown(self):
+        """Fecha todos os streams e libera o pool."""
+        self._closed = True
+        self._poll_wake.set()
+        for session in self.sessions.values():
+            if session.stream is not None:
+                session.stream.stop()
+        self.executor.shutdown(wait=False)
@@ -0,0 +1,519 @@
+"""
+Gravação das partidas em um log binário append-only e leitura por mmap.
+
+Cada partida acompanhada gera registros de tamanho fixo (RECORD_SIZE bytes)
+no mesmo arquivo: início da partida, metadados, lances com os relógios,
+eventos do tabuleiro físico e fim da partida. Os registros das partidas
+simultâneas se intercalam e são identificados pelo número da partida no
+arquivo (slot). Formato de cada registro (little-endian):
+
+    tipo (B) | flags (B) | slot (H) | ms desde o início da partida (I) | dados (20s) | CRC32 (I)
+
+A cada INDEX_INTERVAL registros é gravado um registro de índice com o início
+das partidas abertas desde o índice anterior e um ponteiro para ele, de modo
+que o leitor encontra todas as partidas percorrendo a cadeia de índices a
+partir do fim do arquivo, sem varrer o log inteiro.
+
+As escritas são feitas por uma thread própria a partir de uma fila, sem
+bloquear quem grava (interface gráfica ou serviço headless). O arquivo é
+descarregado quando a fila esvazia e sincronizado em disco (fsync) ao fim de
+cada partida. Um registro cortado por uma queda é descartado ao reabrir o
+arquivo (o CRC não confere), sem afetar as partidas anteriores.
+
+Uso (leitura):
+    python game_recorder.py games.rec                # lista as partidas
+    python game_recorder.py games.rec --pgn saida.pgn
+"""
+import argparse
+import logging
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = os.environ.get("GAME_RECORD", os.path.join(os.path.expanduser("~"), ".digital_chessboard",
+                                                          "games.rec"))
+
+RECORD = struct.Struct('<BBHI20sI')
+RECORD_SIZE = RECORD.size  # 32 bytes
+HEADER = struct.Struct('<BBHI20s')
+SLOT_HEADER = struct.Struct('<BBH')  # tipo, flags e slot de um registro
+INDEX_INTERVAL = 256
+QUEUE_SIZE = 4096
+NO_SLOT = 0xFFFF
+NO_RECORD = 0xFFFFFFFF
+
+# Tipos de registro
+REC_START, REC_META, REC_PLY, REC_CLOCK, REC_SERIAL, REC_END, REC_INDEX = range(1, 8)
+
+START = struct.Struct('<Q8sB')  # início (epoch ms), id da partida, cor (0 brancas, 1 pretas)
+META = struct.Struct('<BB18s')  # chave, parte, texto
+PLY = struct.Struct('<HBBBII')  # número do lance, origem, destino, promoção, brancas ms, pretas ms
+CLOCK = struct.Struct('<IIBB')  # brancas ms, pretas ms, lado a jogar, relógio correndo
+SERIAL = struct.Struct('<BB18s')  # tipo do evento, código, texto
+END = struct.Struct('<B18s')  # vencedor (0 nenhum, 1 brancas, 2 pretas), status
+INDEX = struct.Struct('<IHI')  # índice anterior, slot, registro de início
+
+META_KEYS = {'opponent': 1, 'rating': 2, 'source': 3, 'speed': 4, 'player': 5}
+META_NAMES = {code: key for key, code in META_KEYS.items()}
+SERIAL_KINDS = {'move': 1, 'reject': 2, 'log': 3}
+SERIAL_NAMES = {code: kind for kind, code in SERIAL_KINDS.items()}
+WINNERS = {None: 0, 'white': 1, 'black': 2}
+WINNER_NAMES = {code: winner for winner, code in WINNERS.items()}
+
+SQUARES = [f + r for r in '12345678' for f in 'abcdefgh']
+PROMOTIONS = ' nbrq'  # índice 0: sem promoção
+
+
+def encode_record(rec_type, slot, t_ms, payload, flags=0):
+    header = HEADER.pack(rec_type, flags, slot, t_ms & 0xFFFFFFFF, payload)
+    return header + struct.pack('<I', zlib.crc32(header))
+
+
+def decode_record(data, offset=0):
+    """Decodifica um registro; retorna None se o CRC não conferir."""
+    rec_type, flags, slot, t_ms, payload, crc = RECORD.unpack_from(data, offset)
+    if zlib.crc32(data[offset:offset + RECORD_SIZE - 4]) != crc or not rec_type:
+        return None
+    return rec_type, flags, slot, t_ms, payload
+
+
+def _text(raw):
+    return raw.rstrip(b'\0').decode('utf-8', errors='replace')
+
+
+def encode_uci(uci):
+    """Lance UCI em (origem, destino, promoção) para o registro de lance."""
+    promotion = PROMOTIONS.index(uci[4]) if len(uci) > 4 else 0
+    return SQUARES.index(uci[:2]), SQUARES.index(uci[2:4]), promotion
+
+
+def decode_uci(from_sq, to_sq, promotion):
+    return SQUARES[from_sq] + SQUARES[to_sq] + (PROMOTIONS[promotion] if promotion else '')
+
+
+def repair_tail(path):
+    """
+    Descarta o fim do arquivo cortado por uma queda: bytes além do último
+    registro completo e registros finais com CRC inválido. Retorna o número
+    de registros válidos.
+    """
+    size = os.path.getsize(path)
+    count = size // RECORD_SIZE
+    with open(path, 'r+b') as f:
+        while count:
+            f.seek((count - 1) * RECORD_SIZE)
+            if decode_record(f.read(RECORD_SIZE)) is not None:
+                break
+            count -= 1
+        if count * RECORD_SIZE != size:
+            logger.warning(f"{path}: descartando {size - count * RECORD_SIZE} bytes incompletos no fim")
+            f.truncate(count * RECORD_SIZE)
+    return count
+
+
+# =============================================================================
+# Gravação
+# =============================================================================
+class NullRecorder:
+    """Gravador que descarta tudo (gravação desligada)."""
+    def start_game(self, session):
+        pass
+
+    def record_ply(self, game_id, ply, uci, white_ms, black_ms):
+        pass
+
+    def record_clock(self, game_id, white_ms, black_ms, to_move, running):
+        pass
+
+    def record_serial(self, game_id, kind, text, code=0):
+        pass
+
+    def end_game(self, game_id, status, winner):
+        pass
+
+    def close(self, timeout=2.0):
+        pass
+
+
+class GameRecorder:
+    """
+    Grava as partidas em segundo plano. Os métodos só enfileiram o evento
+    (com o instante da chamada) e podem ser chamados de qualquer thread.
+    """
+    def __init__(self, path=DEFAULT_PATH, username=None):
+        self.path = path
+        self.username = username
+        self.events = queue.Queue(maxsize=QUEUE_SIZE)
+        self.dropped = 0
+        self._games = {}  # game_id -> (slot, início em time.time())
+        self._pending_index = []  # (slot, registro de início) ainda fora do índice
+        self._thread = None
+
+    def start(self):
+        """Abre o arquivo (reparando um fim cortado) e inicia a thread de escrita."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self.path):
+            self._count = repair_tail(self.path)
+            log = GameLog(self.path)
+            log.games()
+            self._next_slot = log.next_slot
+            self._last_index = log.last_index
+            log.close()
+        else:
+            self._count = 0
+            self._next_slot = 0
+            self._last_index = NO_RECORD
+        self._file = open(self.path, 'ab')
+        self._thread = threading.Thread(target=self._run, name="game-recorder", daemon=True)
+        self._thread.start()
+        return self
+
+    def _put(self, *event):
+        try:
+            self.events.put_nowait((time.time(),) + event)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1:
+                logger.error("Fila do gravador de partidas cheia, descartando registros")
+
+    def start_game(self, session):
+        self._put('start', session.game_id, session.color, session.opponent, session.source, session.speed)
+
+    def record_ply(self, game_id, ply, uci, white_ms, black_ms):
+        self._put('ply', game_id, ply, uci, white_ms, black_ms)
+
+    def record_clock(self, game_id, white_ms, black_ms, to_move, running):
+        self._put('clock', game_id, white_ms, black_ms, to_move, running)
+
+    def record_serial(self, game_id, kind, text, code=0):
+        self._put('serial', game_id, kind, text, code)
+
+    def end_game(self, game_id, status, winner):
+        self._put('end', game_id, status, winner)
+
+    def close(self, timeout=2.0):
+        """Grava o que estiver na fila e fecha o arquivo."""
+        if self._thread is None:
+            return
+        self.events.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+    # -------------------------------------------------------------------------
+    # Thread de escrita
+    # -------------------------------------------------------------------------
+    def _run(self):
+        try:
+            while True:
+                event = self.events.get()
+                if event is None:
+                    break
+                try:
+                    self._write_event(*event)
+                except Exception as e:
+                    logger.error(f"Erro ao gravar {event[1]}: {e}")
+                if self.events.empty():
+                    self._file.flush()
+        finally:
+            self._write_index()
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+
+    def _append(self, rec_type, slot, t_ms, payload, flags=0):
+        self._file.write(encode_record(rec_type, slot, t_ms, payload, flags))
+        self._count += 1
+        if rec_type != REC_INDEX and self._count % INDEX_INTERVAL == 0:
+            self._write_index()
+
+    def _write_index(self):
+        """Registros de índice com as partidas iniciadas desde o índice anterior."""
+        entries = self._pending_index or [(NO_SLOT, NO_RECORD)]
+        self._pending_index = []
+        for slot, record in entries:
+            index_record = self._count
+            self._append(REC_INDEX, slot, 0, INDEX.pack(self._last_index, slot, record))
+            self._last_index = index_record
+
+    def _write_meta(self, slot, key, value):
+        data = str(value).encode('utf-8')
+        for part in range(0, max(len(data), 1), 18):
+            self._append(REC_META, slot, 0, META.pack(META_KEYS[key], part // 18, data[part:part + 18]))
+
+    def _write_event(self, moment, kind, game_id, *args):
+        if kind == 'start':
+            if game_id in self._games:
+                return  # gameStart repetido
+            color, opponent, source, speed = args
+            slot = self._next_slot
+            self._next_slot = (self._next_slot + 1) % NO_SLOT
+            self._games[game_id] = (slot, moment)
+            self._pending_index.append((slot, self._count))
+            self._append(REC_START, slot, 0, START.pack(int(moment * 1000), game_id.encode('ascii')[:8],
+                                                        0 if color == 'white' else 1))
+            meta = {'opponent': opponent.get('username', ''), 'rating': opponent.get('rating', ''),
+                    'source': source or '', 'speed': speed or '', 'player': self.username or ''}
+            for key, value in meta.items():
+                if value != '':
+                    self._write_meta(slot, key, value)
+            return
+        if game_id not in self._games:
+            return
+        slot, started = self._games[game_id]
+        t_ms = int((moment - started) * 1000)
+        if kind == 'ply':
+            ply, uci, white_ms, black_ms = args
+            self._append(REC_PLY, slot, t_ms, PLY.pack(ply, *encode_uci(uci), int(white_ms), int(black_ms)))
+        elif kind == 'clock':
+            white_ms, black_ms, to_move, running = args
+            self._append(REC_CLOCK, slot, t_ms, CLOCK.pack(int(white_ms), int(black_ms),
+                                                           to_move == 'black', bool(running)))
+        elif kind == 'serial':
+            serial_kind, text, code = args
+            self._append(REC_SERIAL, slot, t_ms, SERIAL.pack(SERIAL_KINDS[serial_kind], code,
+                                                             text.encode('utf-8')[:18]))
+        elif kind == 'end':
+            status, winner = args
+            self._append(REC_END, slot, t_ms, END.pack(WINNERS.get(winner, 0), (status or '').encode()[:18]))
+            del self._games[game_id]
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+
+# =============================================================================
+# Leitura
+# =============================================================================
+class RecordedGame:
+    """Partida lida do log (os lances são carregados sob demanda)."""
+    def __init__(self, log, slot, start_record, started_at, game_id, color):
+        self.log = log
+        self.slot = slot
+        self.start_record = start_record
+        self.started_at = started_at  # epoch (s)
+        self.game_id = game_id
+        self.color = color
+        self.meta = {}
+        self.moves = []
+        self.clocks = []  # (brancas ms, pretas ms) após cada lance
+        self.move_times = []  # ms desde o início da partida
+        self.serial_events = []  # (ms, tipo, código, texto)
+        self.status = None
+        self.winner = None
+        self.finished = False
+        self.loaded = False
+
+    @property
+    def result(self):
+        if self.status == 'aborted':
+            return '*'
+        if self.winner == 'white':
+            return '1-0'
+        if self.winner == 'black':
+            return '0-1'
+        if not self.finished:
+            return '*'
+        return '1/2-1/2'
+
+    def load(self):
+        """Lê os registros da partida a partir do seu início no log."""
+        if not self.loaded:
+            self.log._load_game(self)
+        return self
+
+
+class GameLog:
+    """Leitor do log mapeado em memória (somente leitura)."""
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self.count = size // RECORD_SIZE
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self.last_index = NO_RECORD
+        self.next_slot = 0
+        self._games = None
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self.games())
+
+    def record(self, number):
+        """Registro número number (tipo, flags, slot, ms, dados) ou None se inválido."""
+        return decode_record(self._map, number * RECORD_SIZE)
+
+    def _start_records(self):
+        """Inícios das partidas: cadeia de índices a partir do fim + registros após o último índice."""
+        starts = []
+        last_index = NO_RECORD
+        for number in range(self.count - 1, -1, -1):
+            record = self.record(number)
+            if record is not None and record[0] == REC_INDEX:
+                last_index = number
+                break
+        self.last_index = last_index
+        number = last_index
+        while number != NO_RECORD:
+            record = self.record(number)
+            if record is None or record[0] != REC_INDEX:
+                logger.warning(f"{self.path}: cadeia de índices quebrada no registro {number}")
+                return self._scan_starts(0)
+            previous, slot, start = INDEX.unpack_from(record[4])
+            if slot != NO_SLOT:
+                starts.append(start)
+            number = previous
+        starts.reverse()
+        tail = last_index + 1 if last_index != NO_RECORD else 0
+        return starts + [start for start in self._scan_starts(tail) if start not in starts]
+
+    def _scan_starts(self, first):
+        return [number for number in range(first, self.count)
+                if self._map[number * RECORD_SIZE] == REC_START and self.record(number) is not None]
+
+    def games(self):
+        """Lista das partidas do log, em ordem de início."""
+        if self._games is None:
+            self._games = []
+            for number in self._start_records():
+                record = self.record(number)
+                if record is None or record[0] != REC_START:
+                    continue
+                started_ms, game_id, color = START.unpack_from(record[4])
+                self._games.append(RecordedGame(self, record[2], number, started_ms / 1000, _text(game_id),
+                                                'white' if color == 0 else 'black'))
+            if self._games:
+                self.next_slot = (self._games[-1].slot + 1) % NO_SLOT
+        return self._games
+
+    def game(self, game_id):
+        for game in self.games():
+            if game.game_id == game_id:
+                return game.load()
+        return None
+
+    def _load_game(self, game):
+        """Lê os registros do slot da partida desde o início até o seu REC_END."""
+        meta_parts = {}
+        for number in range(game.start_record + 1, self.count):
+            offset = number * RECORD_SIZE
+            # Tipo e slot lidos direto do cabeçalho: registros de outras partidas não passam pelo CRC
+            rec_type, _, slot = SLOT_HEADER.unpack_from(self._map, offset)
+            if slot != game.slot or rec_type == REC_INDEX:
+                continue
+            record = self.record(number)
+            if record is None:
+                continue  # registro corrompido ou cortado
+            if rec_type == REC_START:
+                break  # slot reutilizado por outra partida: fim desta
+            rec_type, _, _, t_ms, payload = record
+            if rec_type == REC_META:
+                key, part, text = META.unpack_from(payload)
+                meta_parts.setdefault(key, []).append((part, text.rstrip(b'\0')))
+            elif rec_type == REC_PLY:
+                ply, from_sq, to_sq, promotion, white_ms, black_ms = PLY.unpack_from(payload)
+                # Um lance com número menor (takeback, resync) descarta os seguintes
+                del game.moves[ply - 1:], game.clocks[ply - 1:], game.move_times[ply - 1:]
+                game.moves.append(decode_uci(from_sq, to_sq, promotion))
+                game.clocks.append((white_ms, black_ms))
+                game.move_times.append(t_ms)
+            elif rec_type == REC_SERIAL:
+                kind, code, text = SERIAL.unpack_from(payload)
+                game.serial_events.append((t_ms, SERIAL_NAMES.get(kind), code, _text(text)))
+            elif rec_type == REC_END:
+                winner, status = END.unpack_from(payload)
+                game.winner = WINNER_NAMES.get(winner)
+                game.status = _text(status)
+                game.finished = True
+                break
+        for key, parts in meta_parts.items():
+            game.meta[META_NAMES.get(key, key)] = b''.join(text for _, text in sorted(parts)).decode(
+                'utf-8', errors='replace')
+        game.loaded = True
+
+    # -------------------------------------------------------------------------
+    # PGN
+    # -------------------------------------------------------------------------
+    def to_pgn(self, game):
+        from chess_board import ChessBoard
+        from notation import uci_to_san
+        game.load()
+        player = game.meta.get('player') or '?'
+        opponent = game.meta.get('opponent') or '?'
+        white, black = (player, opponent) if game.color == 'white' else (opponent, player)
+        headers = [
+            ('Event', f"Lichess {game.meta.get('speed', '')} game".replace('  ', ' ')),
+            ('Site', f"https://lichess.org/{game.game_id}"),
+            ('Date', time.strftime('%Y.%m.%d', time.localtime(game.started_at))),
+            ('White', white),
+            ('Black', black),
+            ('Result', game.result),
+        ]
+        if game.status:
+            headers.append(('Termination', game.status))
+        board = ChessBoard()
+        tokens = []
+        for ply, uci in enumerate(game.moves):
+            if ply % 2 == 0:
+                tokens.append(f"{ply // 2 + 1}.")
+            tokens.append(uci_to_san(board, uci))
+            board.apply_move(uci)
+        tokens.append(game.result)
+        lines, line = [], ''
+        for token in tokens:
+            if len(line) + len(token) + 1 > 79:
+                lines.append(line)
+                line = token
+            else:
+                line = f"{line} {token}" if line else token
+        lines.append(line)
+        header_text = "\n".join(f'[{key} "{value}"]' for key, value in headers)
+        return f"{header_text}\n\n" + "\n".join(lines) + "\n"
+
+    def export_pgn(self, path, games=None):
+        """Grava as partidas (por padrão, todas) em um arquivo PGN."""
+        games = self.games() if games is None else games
+        with open(path, 'w', encoding='utf-8') as f:
+            for game in games:
+                f.write(self.to_pgn(game) + "\n")
+        return len(games)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lista ou exporta as partidas gravadas")
+    parser.add_argument("path", nargs="?", default=DEFAULT_PATH)
+    parser.add_argument("--pgn", help="exporta as partidas para este arquivo PGN")
+    parser.add_argument("--game", help="apenas a partida com este id")
+    args = parser.parse_args()
+
+    with GameLog(args.path) as log:
+        games = [log.game(args.game)] if args.game else log.games()
+        games = [game for game in games if game is not None]
+        if args.pgn:
+            print(f"{log.export_pgn(args.pgn, games)} partidas exportadas para {args.pgn}")
+            return
+        for game in games:
+            game.load()
+            started = time.strftime('%Y-%m-%d %H:%M', time.localtime(game.started_at))
+            print(f"{started}  {game.game_id}  {game.color:<5}  {game.meta.get('opponent', '?'):<20} "
+                  f"{len(game.moves):>3} lances  {game.result:<7} {game.status or 'incompleta'}")
+
+
+if __name__ == "__main__":
+    main()
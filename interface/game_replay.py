@@ -0,0 +1,173 @@
+"""
+Replay de partidas com busca rápida por lance.
+
+GameReplay guarda só a lista de lances UCI e um snapshot compacto da posição
+(ChessBoard.snapshot, ~100 bytes) a cada SNAPSHOT_INTERVAL lances, criados sob
+demanda. Ir para qualquer lance restaura o snapshot anterior mais próximo e
+aplica no máximo SNAPSHOT_INTERVAL - 1 lances; avançar e voltar poucos lances
+usa make/unmake direto no tabuleiro. Assim centenas de partidas podem ficar
+carregadas sem manter as posições intermediárias em memória.
+
+send_to_board envia a posição atual ao ESP32 (FRAME_POSITION), substituindo o
+tabuleiro lógico do firmware.
+
+Uso:
+    python game_replay.py [games.rec] --game <id> --ply 30 [--port /dev/ttyUSB0]
+"""
+import argparse
+import logging
+import time
+
+from chess_board import ChessBoard, STARTING_FEN
+from notation import uci_to_san
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_INTERVAL = 16
+
+
+class GameReplay:
+    """
+    Cursor sobre os lances de uma partida.
+
+    moves: lances UCI a partir de start_fen.
+    clocks: (brancas ms, pretas ms) após cada lance, se conhecidos.
+    """
+    def __init__(self, moves, clocks=None, start_fen=STARTING_FEN, snapshot_interval=SNAPSHOT_INTERVAL,
+                 game_id=None):
+        self.moves = list(moves)
+        self.clocks = list(clocks or [])
+        self.game_id = game_id
+        self.interval = snapshot_interval
+        self.board = ChessBoard(start_fen)
+        self.ply = 0
+        self._base = 0  # lance do último restore; board.history guarda os lances desde ele
+        self._snapshots = [self.board.snapshot()]  # posição após i * interval lances
+        self._san = None
+
+    @classmethod
+    def from_recorded(cls, game, **options):
+        """Cria o replay de uma partida lida do log do game_recorder."""
+        game.load()
+        return cls(game.moves, game.clocks, game_id=game.game_id, **options)
+
+    def __len__(self):
+        return len(self.moves)
+
+    # -------------------------------------------------------------------------
+    # Navegação
+    # -------------------------------------------------------------------------
+    def _snapshot(self, index):
+        """Snapshot da posição após index * interval lances (criando os que faltam)."""
+        if index >= len(self._snapshots):
+            board = ChessBoard()
+            board.restore(self._snapshots[-1])
+            ply = (len(self._snapshots) - 1) * self.interval
+            while len(self._snapshots) <= index:
+                for uci in self.moves[ply:ply + self.interval]:
+                    board.apply_move(uci)
+                ply += self.interval
+                self._snapshots.append(board.snapshot())
+        return self._snapshots[index]
+
+    def seek(self, ply):
+        """Vai para a posição após ply lances (limitado ao tamanho da partida)."""
+        ply = max(0, min(ply, len(self.moves)))
+        if ply == self.ply:
+            return self.board
+        if self._base <= ply < self.ply and self.ply - ply < self.interval:
+            while self.ply > ply:
+                self.board.unmake_move()
+                self.ply -= 1
+        elif not (self.ply < ply < self.ply + self.interval):
+            index = ply // self.interval
+            self.board.restore(self._snapshot(index))
+            self.ply = self._base = index * self.interval
+        for uci in self.moves[self.ply:ply]:
+            self.board.apply_move(uci)
+        self.ply = ply
+        return self.board
+
+    def forward(self):
+        return self.seek(self.ply + 1)
+
+    def back(self):
+        return self.seek(self.ply - 1)
+
+    def to_start(self):
+        return self.seek(0)
+
+    def to_end(self):
+        return self.seek(len(self.moves))
+
+    # -------------------------------------------------------------------------
+    # Informações da posição atual
+    # -------------------------------------------------------------------------
+    @property
+    def last_move(self):
+        return self.moves[self.ply - 1] if self.ply else None
+
+    def san(self, ply=None):
+        """SAN do lance ply (1 = primeiro lance); por padrão, o último lance jogado."""
+        ply = self.ply if ply is None else ply
+        if not 1 <= ply <= len(self.moves):
+            return None
+        if self._san is None:
+            board = ChessBoard()
+            board.restore(self._snapshots[0])  # posição inicial (start_fen)
+            self._san = []
+            for uci in self.moves:
+                self._san.append(uci_to_san(board, uci))
+                board.apply_move(uci)
+        return self._san[ply - 1]
+
+    @property
+    def clock(self):
+        """(brancas ms, pretas ms) após o lance atual, ou None."""
+        if self.ply and self.ply <= len(self.clocks):
+            return self.clocks[self.ply - 1]
+        return None
+
+    def send_to_board(self, serial_bridge):
+        """Envia a posição atual ao tabuleiro físico."""
+        return serial_bridge.send_position(self.board)
+
+
+def load_replays(path, **options):
+    """Replays de todas as partidas de um log do game_recorder."""
+    from game_recorder import GameLog
+    with GameLog(path) as log:
+        return [GameReplay.from_recorded(game, **options) for game in log.games()]
+
+
+def main():
+    from game_recorder import DEFAULT_PATH, GameLog
+
+    parser = argparse.ArgumentParser(description="Replay de uma partida gravada")
+    parser.add_argument("path", nargs="?", default=DEFAULT_PATH)
+    parser.add_argument("--game", required=True, help="id da partida")
+    parser.add_argument("--ply", type=int, default=None, help="lance a exibir (padrão: o último)")
+    parser.add_argument("--port", help="envia a posição ao tabuleiro nesta porta serial")
+    args = parser.parse_args()
+
+    with GameLog(args.path) as log:
+        game = log.game(args.game)
+    if game is None:
+        parser.error(f"partida {args.game} não encontrada em {args.path}")
+    replay = GameReplay.from_recorded(game)
+    board = replay.seek(len(replay) if args.ply is None else args.ply)
+    print(f"{replay.game_id} lance {replay.ply}/{len(replay)} {replay.san() or ''}")
+    for row in board.state:
+        print(' '.join(row))
+    print(board.fen())
+    if args.port:
+        from serial_bridge import SerialBridge
+        bridge = SerialBridge(args.port)
+        if bridge.start():
+            replay.send_to_board(bridge)
+            time.sleep(1.0)  # tempo para o ACK do ESP32
+            bridge.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""
+Rastreamento da latência de um lance, do sensor do tabuleiro ao LCD.
+
+Cada lance feito no tabuleiro físico vira um rastro com os instantes
+(time.monotonic) em que passou por cada etapa:
+
+    received    linha/quadro 'move' lido pela thread da serial
+    dispatched  lance entregue ao BoardController (fila do serviço ou sinal do Qt)
+    validated   lance validado localmente e enfileirado para o Lichess
+    post        resposta do POST do lance recebida pela thread de comandos
+    echo        gameState do Lichess com o lance chegou ao BoardController
+    render      tabuleiro/relógios atualizados na tela (listener.on_position)
+    serial      ESP32 confirmou (ACK) o quadro do lance, logo antes de atualizar o LCD
+
+Os trechos entre etapas (SPANS) alimentam um histograma por trecho. O resumo
+pode ser registrado no log (log_line), gravado em JSON (dump) e exposto em um
+endpoint HTTP local (serve) nos formatos JSON (/metrics.json) e Prometheus
+(/metrics).
+
+Configuração por variáveis de ambiente (usadas por from_env):
+    LATENCY_METRICS_PORT  porta do endpoint local (desligado se ausente)
+    LATENCY_DUMP          arquivo JSON gravado ao encerrar
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# (nome do trecho, etapa inicial, etapa final)
+SPANS = (
+    ('dispatch', 'received', 'dispatched'),
+    ('validate', 'dispatched', 'validated'),
+    ('post', 'validated', 'post'),
+    ('echo', 'validated', 'echo'),
+    ('render', 'echo', 'render'),
+    ('serial', 'echo', 'serial'),
+    ('total', 'received', None),  # até a última etapa registrada
+)
+# Limites superiores dos baldes dos histogramas (ms)
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+RECENT_SAMPLES = 1000
+TRACE_TIMEOUT = 30.0  # rastros incompletos são descartados depois disso (s)
+LOG_EVERY = 20  # registra o resumo no log a cada N lances completos
+
+
+class Histogram:
+    """Histograma cumulativo por baldes, com as amostras recentes para percentis."""
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)  # o último balde é +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=RECENT_SAMPLES)
+
+    def record(self, value_ms):
+        for index, bound in enumerate(BUCKETS_MS):
+            if value_ms <= bound:
+                break
+        else:
+            index = len(BUCKETS_MS)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value_ms
+        self.max = max(self.max, value_ms)
+        self.recent.append(value_ms)
+
+    def percentile(self, fraction):
+        if not self.recent:
+            return None
+        samples = sorted(self.recent)
+        return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+    def summary(self):
+        if not self.count:
+            return {'count': 0}
+        return {'count': self.count, 'mean': round(self.total / self.count, 3),
+                'p50': round(self.percentile(0.50), 3), 'p95': round(self.percentile(0.95), 3),
+                'p99': round(self.percentile(0.99), 3), 'max': round(self.max, 3),
+                'buckets': dict(zip([str(bound) for bound in BUCKETS_MS] + ['+Inf'], self.counts))}
+
+
+class MoveTrace:
+    """Instantes de cada etapa de um lance."""
+    def __init__(self, game_id, uci, received=None):
+        self.game_id = game_id
+        self.uci = uci
+        self.marks = {'received': received if received is not None else time.monotonic()}
+        self.expect_serial = True
+
+    def spans(self):
+        """Duração (ms) de cada trecho com as duas etapas registradas."""
+        result = {}
+        for name, start, end in SPANS:
+            end_time = self.marks.get(end) if end else max(self.marks.values())
+            if start in self.marks and end_time is not None:
+                result[name] = (end_time - self.marks[start]) * 1000
+        return result
+
+    @property
+    def complete(self):
+        required = ('post', 'echo', 'render') + (('serial',) if self.expect_serial else ())
+        return all(stage in self.marks for stage in required)
+
+
+class LatencyTracer:
+    """
+    Coleta os rastros dos lances. Os métodos podem ser chamados de qualquer
+    thread (o ACK da serial chega pela thread de leitura).
+    """
+    def __init__(self, dump_path=None, log_every=LOG_EVERY):
+        self.dump_path = dump_path
+        self.log_every = log_every
+        self.histograms = {name: Histogram() for name, _, _ in SPANS}
+        self.traces = {}
+        self.completed = 0
+        self.expired = 0
+        self._lock = threading.Lock()
+        self._server = None
+
+    @classmethod
+    def from_env(cls):
+        """Cria o rastreador e liga o endpoint/dump conforme as variáveis de ambiente."""
+        tracer = cls(dump_path=os.environ.get("LATENCY_DUMP"))
+        port = os.environ.get("LATENCY_METRICS_PORT")
+        if port:
+            tracer.serve(int(port))
+        return tracer
+
+    # -------------------------------------------------------------------------
+    # Coleta
+    # -------------------------------------------------------------------------
+    def record(self, span, value_ms):
+        """Registra um trecho medido fora de um rastro (ex.: validação recusada)."""
+        with self._lock:
+            self.histograms[span].record(value_ms)
+
+    def begin(self, game_id, uci, received=None, dispatched=None, validated=None):
+        """Abre o rastro de um lance enviado ao Lichess."""
+        trace = MoveTrace(game_id, uci, received)
+        if dispatched is not None:
+            trace.marks['dispatched'] = dispatched
+        trace.marks['validated'] = validated if validated is not None else time.monotonic()
+        with self._lock:
+            self._expire(trace.marks['validated'])
+            self.traces[(game_id, uci)] = trace
+        return trace
+
+    def pending(self, game_id, uci):
+        with self._lock:
+            return (game_id, uci) in self.traces
+
+    def mark(self, game_id, uci, stage, moment=None):
+        """Registra uma etapa do rastro do lance (ignorado se não houver rastro)."""
+        moment = moment if moment is not None else time.monotonic()
+        with self._lock:
+            trace = self.traces.get((game_id, uci))
+            if trace is None or stage in trace.marks:
+                return
+            trace.marks[stage] = moment
+            if trace.complete:
+                self._finish(trace)
+
+    def skip_serial(self, game_id, uci):
+        """O lance não foi enviado ao ESP32 (porta fechada): não espera o ACK."""
+        with self._lock:
+            trace = self.traces.get((game_id, uci))
+            if trace is None:
+                return
+            trace.expect_serial = False
+            if trace.complete:
+                self._finish(trace)
+
+    def discard(self, game_id, uci):
+        with self._lock:
+            self.traces.pop((game_id, uci), None)
+
+    def _finish(self, trace):
+        del self.traces[(trace.game_id, trace.uci)]
+        for name, value in trace.spans().items():
+            self.histograms[name].record(value)
+        self.completed += 1
+        logger.debug(f"Lance {trace.uci}: " + " ".join(f"{name}={value:.1f}ms"
+                                                       for name, value in trace.spans().items()))
+        if self.log_every and self.completed % self.log_every == 0:
+            logger.info(self._log_line())
+
+    def _expire(self, now):
+        for key, trace in list(self.traces.items()):
+            if now - trace.marks['received'] > TRACE_TIMEOUT:
+                del self.traces[key]
+                self.expired += 1
+
+    # -------------------------------------------------------------------------
+    # Saídas
+    # -------------------------------------------------------------------------
+    def summary(self):
+        with self._lock:
+            return {'completed': self.completed, 'expired': self.expired, 'pending': len(self.traces),
+                    'spans': {name: histogram.summary() for name, histogram in self.histograms.items()}}
+
+    def _log_line(self):
+        parts = [f"Latência dos lances (n={self.completed})"]
+        for name, histogram in self.histograms.items():
+            if histogram.count:
+                parts.append(f"{name} p50={histogram.percentile(0.5):.1f} "
+                             f"p95={histogram.percentile(0.95):.1f} max={histogram.max:.1f}")
+        return " | ".join(parts) + " ms"
+
+    def log_line(self):
+        with self._lock:
+            return self._log_line()
+
+    def prometheus(self):
+        """Histogramas no formato de exposição do Prometheus."""
+        lines = ["# HELP board_move_latency_ms Latência de cada trecho do lance do tabuleiro (ms)",
+                 "# TYPE board_move_latency_ms histogram"]
+        with self._lock:
+            for name, histogram in self.histograms.items():
+                cumulative = 0
+                for bound, count in zip([str(bound) for bound in BUCKETS_MS] + ['+Inf'], histogram.counts):
+                    cumulative += count
+                    lines.append(f'board_move_latency_ms_bucket{{span="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'board_move_latency_ms_sum{{span="{name}"}} {histogram.total:.3f}')
+                lines.append(f'board_move_latency_ms_count{{span="{name}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path=None):
+        """Grava o resumo em JSON (em path ou no dump_path configurado)."""
+        path = path or self.dump_path
+        if not path:
+            return None
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+        return path
+
+    def serve(self, port, host="127.0.0.1"):
+        """Expõe /metrics e /metrics.json em uma thread própria."""
+        # http.server só é carregado quando o endpoint é ligado (fora da inicialização)
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        tracer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/metrics":
+                    body, content_type = tracer.prometheus().encode(), "text/plain; version=0.0.4"
+                elif self.path == "/metrics.json":
+                    body, content_type = json.dumps(tracer.summary()).encode(), "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        try:
+            self._server = ThreadingHTTPServer((host, port), Handler)
+        except OSError as e:
+            logger.error(f"Não foi possível abrir o endpoint de métricas na porta {port}: {e}")
+            return False
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="latency-metrics", daemon=True).start()
+        logger.info(f"Métricas de latência em http://{host}:{self._server.server_address[1]}/metrics")
+        return True
+
+    def close(self):
+        """Registra o resumo final, grava o dump e fecha o endpoint."""
+        if self.completed:
+            logger.info(self.log_line())
+        try:
+            self.dump()
+        except OSError as e:
+            logger.error(f"Falha ao gravar as latências: {e}")
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,137 @@
+"""
+Cliente HTTP compartilhado para a API do Lichess.
+
+Todas as janelas e threads usam a mesma instância de LichessClient, que mantém
+um pool de conexões keep-alive (requests.Session + HTTPAdapter). Assim o custo
+do handshake TCP/TLS é pago apenas na primeira requisição para o host.
+
+O requests só é importado na primeira requisição (é o import mais pesado da
+interface), o que não atrasa a abertura da janela.
+
+A URL base pode ser trocada pela variável de ambiente LICHESS_URL, por exemplo
+para apontar para o servidor simulado de mock_lichess.py.
+"""
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+LICHESS_URL = os.environ.get("LICHESS_URL", "https://lichess.org")
+
+# Timeouts padrão (conexão, leitura) em segundos. Nos streams o Lichess envia
+# uma linha vazia de keep-alive a cada ~6 s, então 20 s sem dados indicam
+# conexão perdida.
+DEFAULT_TIMEOUT = (5, 15)
+STREAM_TIMEOUT = (5, 20)
+
+# Conexões mantidas por host: stream de eventos, streams das partidas
+# simultâneas (game_manager.MAX_GAME_STREAMS) e requisições avulsas
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 12
+
+
+class LichessClient:
+    """
+    Mantém a sessão HTTP, o token e os cabeçalhos de autenticação usados em
+    todas as chamadas ao Lichess.
+    """
+    def __init__(self, token=None, base_url=LICHESS_URL, timeout=DEFAULT_TIMEOUT,
+                 pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._session = None
+        self._session_lock = threading.Lock()
+        self.token = None
+        self.set_token(token)
+
+    @property
+    def session(self):
+        """Sessão HTTP, criada na primeira requisição."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._apply_token(session)
+                    self._session = session
+        return self._session
+
+    def _apply_token(self, session):
+        if self.token:
+            session.headers["Authorization"] = f"Bearer {self.token}"
+        else:
+            session.headers.pop("Authorization", None)
+
+    def set_token(self, token):
+        """Define (ou remove) o token usado no cabeçalho Authorization."""
+        self.token = token
+        if self._session is not None:
+            self._apply_token(self._session)
+
+    def url(self, path):
+        """Monta a URL completa para um caminho da API."""
+        return f"{self.base_url}{path}"
+
+    def request(self, method, path, **kwargs):
+        """Executa uma requisição reaproveitando as conexões do pool."""
+        kwargs.setdefault("timeout", STREAM_TIMEOUT if kwargs.get("stream") else self.timeout)
+        return self.session.request(method, self.url(path), **kwargs)
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def close(self):
+        """Fecha todas as conexões do pool."""
+        if self._session is not None:
+            self._session.close()
+
+    # -------------------------------------------------------------------------
+    # Endpoints usados pela interface
+    # -------------------------------------------------------------------------
+    def account(self, token=None):
+        """Consulta a conta; um token diferente do atual pode ser testado."""
+        headers = {"Authorization": f"Bearer {token}"} if token else None
+        return self.get("/api/account", headers=headers)
+
+    def stream_events(self):
+        return self.get("/api/stream/event", stream=True)
+
+    def stream_game(self, game_id):
+        return self.get(f"/api/board/game/stream/{game_id}", stream=True)
+
+    def make_move(self, game_id, move):
+        return self.post(f"/api/board/game/{game_id}/move/{move}")
+
+    def game_action(self, game_id, action):
+        """Envia 'resign' ou 'abort' para o jogo."""
+        return self.post(f"/api/board/game/{game_id}/{action}")
+
+    def challenge_ai(self, params):
+        return self.post("/api/challenge/ai", data=params)
+
+    def export_games(self, username, since=None, max_games=None):
+        """
+        Stream NDJSON das partidas do usuário, da mais antiga para a mais nova
+        (since em ms desde a época), com lances e abertura.
+        """
+        params = {'moves': 'true', 'opening': 'true', 'clocks': 'false', 'evals': 'false', 'sort': 'dateAsc'}
+        if since is not None:
+            params['since'] = since
+        if max_games is not None:
+            params['max'] = max_games
+        return self.get(f"/api/games/user/{username}", params=params, stream=True,
+                        headers={"Accept": "application/x-ndjson"})
+
+    def seek(self, params):
+        # A busca fica aberta até o pareamento, sem limite de leitura
+        return self.post("/api/board/seek", data=params, stream=True, timeout=(5, None))
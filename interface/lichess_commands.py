@@ -0,0 +1,91 @@
+"""
+Envio de lances, desistências e abortos ao Lichess fora da thread principal.
+
+Os comandos entram em uma fila limitada consumida por uma thread dedicada, de
+modo que quem os pede (interface gráfica ou serviço headless) nunca bloqueia
+na rede. O resultado de cada um, com a latência da requisição, é entregue ao
+callback on_done (com o instante de conclusão em 'done_at', usado pelo
+rastreamento de latência).
+"""
+import logging
+import queue
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+QUEUE_SIZE = 16
+LATENCY_HISTORY = 100
+
+
+class CommandWorker:
+    """
+    Thread que executa os comandos ('move', 'resign' ou 'abort') em ordem.
+    """
+    def __init__(self, client, on_done=None):
+        self.client = client
+        self.on_done = on_done
+        self.commands = queue.Queue(maxsize=QUEUE_SIZE)
+        self.latencies = deque(maxlen=LATENCY_HISTORY)
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="lichess-commands", daemon=True)
+        self._thread.start()
+
+    def submit(self, action, game_id, move=None):
+        """
+        Enfileira um comando sem bloquear.
+        Retorna False se a fila estiver cheia.
+        """
+        try:
+            self.commands.put_nowait((action, game_id, move))
+            return True
+        except queue.Full:
+            logger.error(f"Fila de comandos cheia, descartando {action} {move or ''}")
+            return False
+
+    def execute(self, action, game_id, move=None):
+        """Executa um comando (bloqueante) e retorna o dicionário de resultado."""
+        result = {'action': action, 'game_id': game_id, 'move': move,
+                  'ok': False, 'status': None, 'error': None}
+        start = time.monotonic()
+        try:
+            if action == 'move':
+                response = self.client.make_move(game_id, move)
+            else:
+                response = self.client.game_action(game_id, action)
+            result['status'] = response.status_code
+            result['ok'] = response.status_code == 200
+            if not result['ok']:
+                result['error'] = response.text
+        except Exception as e:
+            result['error'] = str(e)
+        result['done_at'] = time.monotonic()
+        result['latency_ms'] = (result['done_at'] - start) * 1000
+        self.latencies.append(result['latency_ms'])
+        return result
+
+    def _run(self):
+        while True:
+            command = self.commands.get()
+            if command is None:
+                break
+            result = self.execute(*command)
+            if self.on_done:
+                self.on_done(result)
+
+    def stop(self, timeout=2.0):
+        """Encerra a thread após os comandos já enfileirados."""
+        if self._thread is None:
+            return
+        deadline = time.monotonic() + timeout
+        try:
+            # A fila pode estar cheia com a rede travada: não espera além do timeout
+            self.commands.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning("Fila de comandos cheia ao encerrar; comandos pendentes descartados")
+        else:
+            self._thread.join(max(0.0, deadline - time.monotonic()))
+        self._thread = None
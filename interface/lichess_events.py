@@ -0,0 +1,123 @@
+"""
+Eventos tipados dos streams do Lichess.
+
+Cada linha NDJSON é convertida em um objeto com atributos (GameState,
+GameFull, GameStart, ...) em vez de um dicionário cru. O dicionário original
+continua disponível em event.raw para campos não mapeados.
+"""
+
+
+class StreamEvent:
+    """Evento genérico (tipos não mapeados)."""
+    __slots__ = ('type', 'raw')
+
+    def __init__(self, data):
+        self.type = data.get('type')
+        self.raw = data
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.raw!r})"
+
+
+class GameState(StreamEvent):
+    """Estado atual da partida: lances, relógios e status."""
+    __slots__ = ('moves', 'wtime', 'btime', 'winc', 'binc', 'status', 'winner')
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.moves = data.get('moves', "")
+        self.wtime = data.get('wtime', 0)
+        self.btime = data.get('btime', 0)
+        self.winc = data.get('winc', 0)
+        self.binc = data.get('binc', 0)
+        self.status = data.get('status', 'started')
+        self.winner = data.get('winner')
+
+    @property
+    def moves_list(self):
+        return self.moves.split()
+
+
+class GameFull(StreamEvent):
+    """Primeiro evento do stream do jogo, com os dados completos e o estado."""
+    __slots__ = ('game_id', 'white', 'black', 'initial_fen', 'state')
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.game_id = data.get('id')
+        self.white = data.get('white', {})
+        self.black = data.get('black', {})
+        self.initial_fen = data.get('initialFen', 'startpos')
+        self.state = GameState(data.get('state', {}))
+
+
+class ChatLine(StreamEvent):
+    __slots__ = ('username', 'text', 'room')
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.username = data.get('username')
+        self.text = data.get('text', "")
+        self.room = data.get('room')
+
+
+class OpponentGone(StreamEvent):
+    __slots__ = ('gone', 'claim_win_in_seconds')
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.gone = data.get('gone', False)
+        self.claim_win_in_seconds = data.get('claimWinInSeconds')
+
+
+class GameEvent(StreamEvent):
+    """Base para gameStart/gameFinish do stream de eventos gerais."""
+    __slots__ = ('game', 'game_id', 'color', 'source', 'opponent', 'status', 'winner')
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.game = data.get('game', {})
+        self.game_id = self.game.get('gameId')
+        self.color = self.game.get('color', 'white')
+        self.source = self.game.get('source')
+        self.opponent = self.game.get('opponent', {})
+        self.status = self.game.get('status', {}).get('name', '')
+        self.winner = self.game.get('winner')
+
+
+class GameStart(GameEvent):
+    __slots__ = ()
+
+
+class GameFinish(GameEvent):
+    __slots__ = ()
+
+
+class Challenge(StreamEvent):
+    __slots__ = ('challenge', 'challenge_id')
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.challenge = data.get('challenge', {})
+        self.challenge_id = self.challenge.get('id')
+
+
+EVENT_TYPES = {
+    'gameState': GameState,
+    'gameFull': GameFull,
+    'chatLine': ChatLine,
+    'opponentGone': OpponentGone,
+    'gameStart': GameStart,
+    'gameFinish': GameFinish,
+    'challenge': Challenge,
+}
+
+
+def parse_event(data):
+    """
+    Converte o dicionário decodificado de uma linha no evento tipado.
+    JSON válido que não é um objeto ([], "x", 1) levanta ValueError, como uma linha inválida.
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"evento não é um objeto JSON: {data!r:.40}")
+    return EVENT_TYPES.get(data.get('type'), StreamEvent)(data)
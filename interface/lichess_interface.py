@@ -1,20 +1,31 @@
 import sys
-import serial
 import threading
-import time
-import copy
-import json
 import logging
-import requests
-import serial.tools.list_ports
+
+# O relatório de inicialização (--startup-report) precisa ser ativado antes dos
+# imports que ele mede
+import startup_profile
+startup_profile.enable_from_argv()
+
 from PySide6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QPushButton, QLabel,
                                QWidget, QGridLayout, QStackedLayout, QHBoxLayout, QFrame)
 from PySide6.QtCore import Qt, QTimer, QThread, Signal
-from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QPixmap, QGuiApplication
 
-from ConnectWindow import ConnectWindow
-from SearchAGame import SearchAGame
 from ClockWidget import ClockWidget
+from chess_board import ChessBoard
+from clock_model import GameClock
+from lichess_client import LichessClient
+from lichess_stream import ReconnectingStream
+from lichess_commands import CommandWorker
+from game_manager import GameManager, MoveListSync
+from board_controller import BoardController
+from notation import uci_to_san
+from serial_bridge import SerialBridge, find_esp_port
+import base_windows.images_rc  # noqa: F401 (registra as imagens em :/images)
+# ConnectWindow e SearchAGame (e, com eles, o requests) são importados só
+# quando as janelas são abertas; engine_pool, latency_trace, opening_book e
+# game_recorder, onde os seus objetos são criados
 
 # Configuração do logger
 logging.basicConfig(level=logging.INFO)
@@ -22,223 +33,89 @@ logger = logging.getLogger(__name__)
 
 # Mapeamento das peças para os caminhos das imagens
 PIECES = {
-    'P': 'images/white-pawn.png',
-    'p': 'images/black-pawn.png',
-    'R': 'images/white-rook.png',
-    'r': 'images/black-rook.png',
-    'N': 'images/white-knight.png',
-    'n': 'images/black-knight.png',
-    'B': 'images/white-bishop.png',
-    'b': 'images/black-bishop.png',
-    'Q': 'images/white-queen.png',
-    'q': 'images/black-queen.png',
-    'K': 'images/white-king.png',
-    'k': 'images/black-king.png',
+    'P': ':/images/white-pawn.png',
+    'p': ':/images/black-pawn.png',
+    'R': ':/images/white-rook.png',
+    'r': ':/images/black-rook.png',
+    'N': ':/images/white-knight.png',
+    'n': ':/images/black-knight.png',
+    'B': ':/images/white-bishop.png',
+    'b': ':/images/black-bishop.png',
+    'Q': ':/images/white-queen.png',
+    'q': ':/images/black-queen.png',
+    'K': ':/images/white-king.png',
+    'k': ':/images/black-king.png',
 }
 
-# Configuração inicial do tabuleiro (FEN simplificado)
-INITIAL_BOARD = [
-    ['r', 'n', 'b', 'q', 'k', 'b', 'n', 'r'],
-    ['p', 'p', 'p', 'p', 'p', 'p', 'p', 'p'],
-    ['.', '.', '.', '.', '.', '.', '.', '.'],
-    ['.', '.', '.', '.', '.', '.', '.', '.'],
-    ['.', '.', '.', '.', '.', '.', '.', '.'],
-    ['.', '.', '.', '.', '.', '.', '.', '.'],
-    ['P', 'P', 'P', 'P', 'P', 'P', 'P', 'P'],
-    ['R', 'N', 'B', 'Q', 'K', 'B', 'N', 'R']
-]
+# Tamanho (em pixels lógicos) de cada casa do tabuleiro gráfico
+CELL_SIZE = 50
+
+# Intervalo de atualização dos relógios na tela (ms)
+CLOCK_REFRESH_MS = 100
 
 # =============================================================================
-# Classe para gerenciar o estado do tabuleiro
+# Cache das imagens das peças
 # =============================================================================
-class ChessBoard:
+class PiecePixmapCache:
     """
-    Gerencia o estado interno do tabuleiro de xadrez e operações relacionadas.
+    Guarda as imagens das peças já redimensionadas, indexadas pela peça e pelo
+    device pixel ratio da tela, para que nenhum arquivo seja lido ou escalado
+    durante a partida.
     """
-    def __init__(self):
-        self.state = copy.deepcopy(INITIAL_BOARD)
-    
-    def reset_board(self):
-        """Reseta o tabuleiro para a posição inicial."""
-        self.state = copy.deepcopy(INITIAL_BOARD)
-    
-    @staticmethod
-    def letter_position(letter):
-        """Converte uma letra (ex.: 'a') para um índice numérico (0 para 'a')."""
-        return ord(letter.lower()) - ord('a')
-    
-    def apply_move(self, move):
-        """
-        Atualiza o estado do tabuleiro aplicando o movimento dado.
-        Suporta roque, promoção e movimento normal.
-        """
-        start = move[:2]
-        end = move[2:4]
-        # Roque
-        if start == 'e1' and end == 'g1' and self.state[7][4].upper() == 'K':
-            self.state[7][6] = 'K'
-            self.state[7][5] = 'R'
-            self.state[7][4] = '.'
-            self.state[7][7] = '.'
-        elif start == 'e1' and end == 'c1' and self.state[7][4].upper() == 'K':
-            self.state[7][2] = 'K'
-            self.state[7][3] = 'R'
-            self.state[7][4] = '.'
-            self.state[7][0] = '.'
-        elif start == 'e8' and end == 'g8' and self.state[0][4] == 'k':
-            self.state[0][6] = 'k'
-            self.state[0][5] = 'r'
-            self.state[0][4] = '.'
-            self.state[0][7] = '.'
-        elif start == 'e8' and end == 'c8' and self.state[0][4] == 'k':
-            self.state[0][2] = 'k'
-            self.state[0][3] = 'r'
-            self.state[0][4] = '.'
-            self.state[0][0] = '.'
-        # Promoção (movimento com 5 caracteres, ex.: "e7e8q")
-        elif len(move) == 5:
-            start_row = 8 - int(start[1])
-            start_col = self.letter_position(start[0])
-            end_row = 8 - int(end[1])
-            end_col = self.letter_position(end[0])
-            # Captura o peão que está se movendo para determinar sua cor
-            pawn = self.state[start_row][start_col]
-            self.state[start_row][start_col] = '.'
-            if pawn.isupper():
-                # Peão branco: converte para maiúscula
-                promoted_piece = move[4].upper()
-            else:
-                # Peão preto: mantém minúsculo
-                promoted_piece = move[4].lower()
-            self.state[end_row][end_col] = promoted_piece
-        else:
-            # Movimento normal
-            start_row = 8 - int(start[1])
-            start_col = self.letter_position(start[0])
-            end_row = 8 - int(end[1])
-            end_col = self.letter_position(end[0])
-            self.state[end_row][end_col] = self.state[start_row][start_col]
-            self.state[start_row][start_col] = '.'
-    
-    def translate_move(self, move):
-        """
-        Converte um movimento no formato UCI para uma notação simplificada.
-        Essa tradução é simplificada e pode não cobrir todos os casos.
-        """
-        start = move[:2]
-        end = move[2:4]
-        promotion = move[4] if len(move) == 5 else None
-        
-        # Roque
-        if start == 'e1' and end == 'g1' and self.state[7][4].upper() == 'K':
-            return 'O-O'
-        elif start == 'e1' and end == 'c1' and self.state[7][4].upper() == 'K':
-            return 'O-O-O'
-        elif start == 'e8' and end == 'g8' and self.state[0][4] == 'k':
-            return 'O-O'
-        elif start == 'e8' and end == 'c8' and self.state[0][4] == 'k':
-            return 'O-O-O'
-        
-        start_row = 8 - int(start[1])
-        start_col = self.letter_position(start[0])
-        end_row = 8 - int(end[1])
-        end_col = self.letter_position(end[0])
-        moving_piece = self.state[start_row][start_col]
-        target_piece = self.state[end_row][end_col]
-        
-        # Promoção
-        if promotion:
-            if target_piece != '.':
-                return f"{start[0]}x{end}={promotion.upper() if moving_piece.isupper() else promotion.lower()}"
-            else:
-                return f"{end}={promotion.upper() if moving_piece.isupper() else promotion.lower()}"
-        
-        # Movimento de peão
-        if moving_piece.lower() == 'p':
-            if target_piece != '.':
-                return f"{start[0]}x{end}"
-            else:
-                return f"{end}"
-        else:
-            piece_letter = moving_piece.upper() if moving_piece != '.' else ''
-            if target_piece != '.':
-                return f"{piece_letter}x{end}"
-            else:
-                return f"{piece_letter}{end}"
+    def __init__(self, size=CELL_SIZE):
+        self.size = size
+        self._cache = {}
+        self.empty = QPixmap()
+
+    def preload(self, device_pixel_ratio):
+        """Carrega e escala todas as peças para o device pixel ratio dado."""
+        for piece in PIECES:
+            self.get(piece, device_pixel_ratio)
+
+    def get(self, piece, device_pixel_ratio=1.0):
+        """Retorna o pixmap da peça, ou um pixmap vazio para casas vazias."""
+        key = (piece, device_pixel_ratio)
+        pixmap = self._cache.get(key)
+        if pixmap is None:
+            if piece not in PIECES:
+                return self.empty
+            physical_size = round(self.size * device_pixel_ratio)
+            pixmap = QPixmap(PIECES[piece]).scaled(physical_size, physical_size,
+                                                   Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            pixmap.setDevicePixelRatio(device_pixel_ratio)
+            self._cache[key] = pixmap
+        return pixmap
 
 # =============================================================================
 # Threads para streaming dos eventos do Lichess
 # =============================================================================
-class LichessEventStreamThread(QThread):
+class LichessStreamThread(QThread):
     """
-    Thread para streaming de eventos gerais do Lichess.
+    Thread base para os streams do Lichess, com reconexão automática
+    (ver lichess_stream.ReconnectingStream).
     """
-    event_received = Signal(dict)
+    event_received = Signal(object)
     error = Signal(str)
-    
-    def __init__(self, token, parent=None):
+    status_changed = Signal(str)
+
+    def __init__(self, open_stream, is_final=None, name="stream", parent=None):
         super().__init__(parent)
-        self.token = token
-        self._running = True
-    
+        self.stream = ReconnectingStream(open_stream, self.event_received.emit, self.error.emit,
+                                         self.status_changed.emit, is_final, name)
+
     def run(self):
-        url = "https://lichess.org/api/stream/event"
-        headers = {"Authorization": f"Bearer {self.token}"}
-        try:
-            with requests.get(url, headers=headers, stream=True) as response:
-                if response.status_code != 200:
-                    self.error.emit(f"Erro: HTTP {response.status_code}")
-                    return
-                for line in response.iter_lines():
-                    if not self._running:
-                        break
-                    if line:
-                        try:
-                            event = json.loads(line)
-                            self.event_received.emit(event)
-                        except Exception as e:
-                            self.error.emit(str(e))
-        except Exception as e:
-            self.error.emit(str(e))
-    
+        self.stream.run()
+
     def stop(self):
-        self._running = False
+        self.stream.stop()
 
-class LichessGameStreamThread(QThread):
+class LichessEventStreamThread(LichessStreamThread):
     """
-    Thread para streaming dos eventos de um jogo específico.
+    Thread para streaming de eventos gerais do Lichess.
     """
-    event_received = Signal(dict)
-    error = Signal(str)
-    
-    def __init__(self, token, game_id, parent=None):
-        super().__init__(parent)
-        self.token = token
-        self.game_id = game_id
-        self._running = True
-    
-    def run(self):
-        url = f"https://lichess.org/api/board/game/stream/{self.game_id}"
-        headers = {"Authorization": f"Bearer {self.token}"}
-        try:
-            with requests.get(url, headers=headers, stream=True) as response:
-                if response.status_code != 200:
-                    self.error.emit(f"Erro: HTTP {response.status_code}")
-                    return
-                for line in response.iter_lines():
-                    if not self._running:
-                        break
-                    if line:
-                        try:
-                            event = json.loads(line)
-                            self.event_received.emit(event)
-                        except Exception as e:
-                            self.error.emit(str(e))
-        except Exception as e:
-            self.error.emit(str(e))
-    
-    def stop(self):
-        self._running = False
+    def __init__(self, client, parent=None):
+        super().__init__(client.stream_events, name="event stream", parent=parent)
+        self.client = client
 
 # =============================================================================
 # Classe principal da interface gráfica
@@ -251,6 +128,12 @@ class LichessInterface(QMainWindow):
     stop_timer_signal = Signal()  # Sinal para parar o timer
     game_start_signal = Signal()
     game_finish_signal = Signal()
+    serial_event_signal = Signal(dict)
+    game_event_signal = Signal(str, object)
+    game_status_signal = Signal(str, str)
+    command_done_signal = Signal(dict)
+    import_progress_signal = Signal(str)
+    engine_info_signal = Signal(str, object)
     
     def __init__(self):
         super().__init__()
@@ -259,22 +142,41 @@ class LichessInterface(QMainWindow):
         self.setGeometry(100, 100, 460, 600)
         self.setMaximumWidth(460)
         self.setMaximumHeight(600)
-        self.setWindowIcon(QPixmap('images/black-knight.png'))
+        self.setWindowIcon(QPixmap(PIECES['n']))
         self.game_active = False  # Flag para controle do jogo
 
         # Variáveis de controle
+        self.client = LichessClient()
         self.current_token = None
+        self.connected_user = None
         self.current_game = None
         self.current_color = 'white'
         self.to_move = 'white'
         self.current_moves = 0
+        self.clock = GameClock()
         
-        # Instância do tabuleiro
+        # Instância do tabuleiro (substituída pela da partida em foco)
         self.chess_board = ChessBoard()
+        self.move_sync = MoveListSync(self.chess_board)
         
         # Threads de streaming
         self.event_thread = None
-        self.game_thread = None
+
+        # Importação do histórico de partidas (game_import)
+        self.import_thread = None
+        self.import_stop = threading.Event()
+        self.import_progress_signal.connect(self.handle_import_progress)
+
+        # Thread de envio de comandos (lances, desistência, abortar)
+        self.command_thread = CommandWorker(self.client, on_done=self.command_done_signal.emit)
+        self.command_done_signal.connect(self.handle_command_done)
+        self.command_thread.start()
+
+        # Partidas simultâneas: um tabuleiro, relógio e stream por jogo
+        self.games = GameManager(self.client, self.game_event_signal.emit, self.handle_error,
+                                 self.game_status_signal.emit)
+        self.game_event_signal.connect(self.handle_game_events)
+        self.game_status_signal.connect(self.handle_game_stream_status)
         
         # Configuração da interface gráfica
         self.central_widget = QWidget()
@@ -285,6 +187,12 @@ class LichessInterface(QMainWindow):
         self.status_label = QLabel("Status: Disconnected")
         self.status_label.setAlignment(Qt.AlignCenter)
         self.layout.addWidget(self.status_label)
+
+        # Troca da partida em foco (visível só com outra partida em andamento)
+        self.next_game_button = QPushButton("Next game")
+        self.next_game_button.clicked.connect(self.next_game)
+        self.layout.addWidget(self.next_game_button)
+        self.next_game_button.hide()
         
         # Header: layout empilhado e relógios
         self.top_header = QFrame()
@@ -297,14 +205,23 @@ class LichessInterface(QMainWindow):
         self.opponent_time = ClockWidget()
         self.top_header_layout.addWidget(self.opponent_time)
         self.opponent_time.hide()
+
+        # Abertura da partida em foco e lances do livro (opening_book)
+        self.opening_label = QLabel("")
+        self.opening_label.setAlignment(Qt.AlignCenter)
+        self.layout.addWidget(self.opening_label)
+        self.opening_label.hide()
+
+        # Avaliação do motor UCI (engine_pool)
+        self.eval_label = QLabel("")
+        self.eval_label.setAlignment(Qt.AlignCenter)
+        self.layout.addWidget(self.eval_label)
+        self.eval_label.hide()
         
-        # Layouts para diferentes estados (conectar, conectado, em jogo)
-        self.connect_layout = self.create_connect_layout()
-        self.connected_layout = self.create_connected_layout()
-        self.in_game_layout = self.create_in_game_layout()
-        self.misc_layout.addWidget(self.connect_layout)
-        self.misc_layout.addWidget(self.connected_layout)
-        self.misc_layout.addWidget(self.in_game_layout)
+        # Layouts para diferentes estados (conectar, conectado, em jogo); os
+        # dois últimos só são criados quando exibidos pela primeira vez
+        self.layout_factories = [self.create_connect_layout, self.create_connected_layout,
+                                 self.create_in_game_layout]
         self.switch_layout(0)
         
         # Tabuleiro gráfico
@@ -312,8 +229,13 @@ class LichessInterface(QMainWindow):
         self.board_layout = QGridLayout()
         self.board_widget.setLayout(self.board_layout)
         self.layout.addWidget(self.board_widget)
+        self.pixmap_cache = PiecePixmapCache()
+        screen = QGuiApplication.primaryScreen()
+        self.device_pixel_ratio = screen.devicePixelRatio() if screen else 1.0
         self.cells = []
-        self.initialize_board()
+        self.rendered = []  # peça exibida atualmente em cada célula
+        # As casas e as imagens das peças são criadas logo após a janela aparecer
+        QTimer.singleShot(0, self.finish_startup)
         
         # Relógios
         self.your_time = ClockWidget()
@@ -330,23 +252,57 @@ class LichessInterface(QMainWindow):
         # Conexões de sinais
         self.start_timer_signal.connect(self.start_timer_main_thread)
         self.stop_timer_signal.connect(self.stop_timer_main_thread)
-        self.resign_button.clicked.connect(self.resign)
         self.game_start_signal.connect(self.your_time.show)
         self.game_start_signal.connect(self.opponent_time.show)
         self.game_start_signal.connect(lambda: self.switch_layout(2))
         self.game_finish_signal.connect(self.your_time.hide)
         self.game_finish_signal.connect(self.opponent_time.hide)
 
-        # Inicialize a porta serial (ajuste o COM e baud rate conforme necessário)
-        self.serial_port = serial.Serial(self.find_esp_port(), 115200, timeout=1)
-        # Inicia uma thread para enviar atualizações do relógio
+        # Porta serial: leitura orientada a eventos e fila de escrita
+        self.serial_event_signal.connect(self.handle_serial_event)
+        # A porta é procurada e aberta em segundo plano para não atrasar a janela
+        self.serial_bridge = SerialBridge(None, on_event=self.serial_event_signal.emit)
+        self.serial_bridge.start_async(find_esp_port, on_open=self.handle_serial_open)
+
+        # Núcleo compartilhado com o serviço headless (board_service.py); os
+        # sinais acima entregam tudo a ele na thread principal
+        # Latências dos lances: LATENCY_METRICS_PORT liga o endpoint e LATENCY_DUMP grava o JSON ao sair
+        # Partidas gravadas em GAME_RECORD (padrão ~/.digital_chessboard/games.rec; vazio desliga)
+        # Livro de aberturas em OPENING_BOOK e ECO_TABLE (padrão ~/.digital_chessboard/book.bin e eco.bin)
+        # Motor UCI em ENGINE_PATH (vazio desliga a avaliação); os resultados chegam pelo sinal
+        from engine_pool import EnginePool
+        from game_recorder import DEFAULT_PATH as RECORD_PATH, GameRecorder
+        from latency_trace import LatencyTracer
+        from opening_book import OpeningBook
+        self.recorder = GameRecorder() if RECORD_PATH else None
+        self.engine_pool = EnginePool.from_env(on_info=self.engine_info_signal.emit)
+        self.engine_info_signal.connect(self.handle_engine_info)
+        self.controller = BoardController(self.games, self.serial_bridge, self.command_thread.submit, listener=self,
+                                          tracer=LatencyTracer.from_env(), recorder=self.recorder,
+                                          book=OpeningBook(), engine=self.engine_pool)
+        startup_profile.mark("janela construída")
+
+    def finish_startup(self):
+        """Termina a inicialização depois que a janela já foi exibida."""
+        startup_profile.mark("janela exibida")
+        self.pixmap_cache.preload(self.device_pixel_ratio)
+        self.initialize_board()
+        if self.recorder is not None:
+            try:
+                self.recorder.start()
+            except OSError as e:
+                logger.error(f"Não foi possível abrir o arquivo de partidas: {e}")
+                self.recorder = None
+                from game_recorder import NullRecorder
+                self.controller.recorder = NullRecorder()
+        self.engine_pool.start()
+        startup_profile.mark("tabuleiro pronto")
+        startup_profile.report()
 
-    def find_esp_port(self):
-        portas = serial.tools.list_ports.comports()
-        for porta in portas:
-            if "USB" in porta.description or "UART" in porta.description or "CP210" in porta.description:
-                return porta.device
-        return None
+    def handle_serial_open(self, opened):
+        """Chamado pela thread que abre a porta serial."""
+        if opened:
+            logger.info(f"Porta serial {self.serial_bridge.port} aberta em {startup_profile.elapsed_ms():.0f} ms")
 
     def create_connect_layout(self):
         """Cria o layout de conexão com o Lichess."""
@@ -364,15 +320,19 @@ class LichessInterface(QMainWindow):
         self.result_label.setAlignment(Qt.AlignCenter)
         self.new_game_button = QPushButton("New game")
         self.new_game_button.clicked.connect(self.new_game_lichess)
+        self.import_button = QPushButton("Import my games")
+        self.import_button.clicked.connect(self.import_games)
         layout = QVBoxLayout(widget)
         layout.addWidget(self.result_label)
         layout.addWidget(self.new_game_button)
+        layout.addWidget(self.import_button)
         return widget
     
     def create_in_game_layout(self):
         """Cria o layout exibido durante a partida."""
         widget = QWidget()
         self.resign_button = QPushButton("Resign")
+        self.resign_button.clicked.connect(self.resign)
         self.opponent = QLabel("Unknown (00)")
         self.last_move = QLabel("--")
         layout = QHBoxLayout(widget)
@@ -383,8 +343,14 @@ class LichessInterface(QMainWindow):
         return widget
     
     def switch_layout(self, index):
-        """Alterna entre os layouts empilhados."""
+        """Alterna entre os layouts empilhados, criando-os na primeira exibição."""
+        self.ensure_layout(index)
         self.misc_layout.setCurrentIndex(index)
+
+    def ensure_layout(self, index):
+        """Cria (em ordem) os layouts empilhados até o índice dado."""
+        while self.misc_layout.count() <= index:
+            self.misc_layout.addWidget(self.layout_factories[self.misc_layout.count()]())
     
     def initialize_board(self):
         """
@@ -392,11 +358,12 @@ class LichessInterface(QMainWindow):
         """
         self.game_active = True
         self.cells = []  # Reinicia a lista de células
+        self.rendered = [[None] * 8 for _ in range(8)]
         for row in range(8):
             row_cells = []
             for col in range(8):
                 cell = QLabel()
-                cell.setFixedSize(50, 50)
+                cell.setFixedSize(CELL_SIZE, CELL_SIZE)
                 cell.setAlignment(Qt.AlignCenter)
                 # Células com cores alternadas
                 if (row + col) % 2 == 0:
@@ -411,24 +378,26 @@ class LichessInterface(QMainWindow):
     def update_board(self):
         """
         Atualiza as imagens do tabuleiro com base no estado atual armazenado em self.chess_board.
+        Apenas as células cuja peça mudou desde a última renderização são redesenhadas.
         Se o jogador for preto, inverte a exibição.
         """
-        for row in range(8):
-            for col in range(8):
-                if self.current_color == 'black':
-                    cell = self.cells[7 - row][7 - col]
-                else:
-                    cell = self.cells[row][col]
-                piece = self.chess_board.state[row][col]
-                if piece != ".":
-                    pixmap = QPixmap(PIECES.get(piece, ""))
-                    cell.setPixmap(pixmap.scaled(50, 50, Qt.KeepAspectRatio))
-                else:
-                    cell.setPixmap(QPixmap())
+        if not self.cells:
+            return  # tabuleiro gráfico ainda não criado (ver finish_startup)
+        flipped = self.current_color == 'black'
+        for row, pieces in enumerate(self.chess_board.state):
+            cell_row = 7 - row if flipped else row
+            rendered_row = self.rendered[cell_row]
+            for col, piece in enumerate(pieces):
+                cell_col = 7 - col if flipped else col
+                if rendered_row[cell_col] == piece:
+                    continue
+                rendered_row[cell_col] = piece
+                self.cells[cell_row][cell_col].setPixmap(self.pixmap_cache.get(piece, self.device_pixel_ratio))
     
     def connect_to_lichess(self):
         """Abre a janela de conexão para inserir o token do Lichess."""
-        self.connect_dialog = ConnectWindow()
+        from ConnectWindow import ConnectWindow
+        self.connect_dialog = ConnectWindow(self.client)
         self.connect_dialog.user_data.connect(self.handle_connection)
         self.connect_dialog.show()
     
@@ -438,166 +407,210 @@ class LichessInterface(QMainWindow):
         Se o token for válido, inicia o streaming de eventos.
         """
         self.current_token = data.get('token')
+        self.connected_user = data.get('user')
+        if self.recorder is not None:
+            self.recorder.username = self.connected_user
         if self.current_token:
             self.status_label.setText(f"Connected as: {data.get('user')}")
             self.switch_layout(1)
             # Inicia o streaming de eventos gerais
-            self.event_thread = LichessEventStreamThread(self.current_token)
+            self.event_thread = LichessEventStreamThread(self.client)
             self.event_thread.event_received.connect(self.handle_event)
             self.event_thread.error.connect(self.handle_error)
+            self.event_thread.status_changed.connect(self.handle_stream_status)
             self.event_thread.start()
         else:
             self.status_label.setText("Status: failed to connect")
     
-    def handle_event(self, event):
+    def import_games(self):
         """
-        Processa os eventos gerais do Lichess.
-        Em 'gameStart', inicia o streaming dos eventos do jogo.
-        Em 'gameFinish', trata o término da partida.
+        Importa o histórico de partidas do usuário conectado para o banco
+        local (game_import), em segundo plano e com o token já configurado.
         """
-        event_type = event.get('type')
-        if event_type == 'gameStart':
-            self.game_start_signal.emit()
-            self.start_serial_update_timer()
-            self.serial_port.write("reset".encode())
-            self.current_moves = 0
-            game_info = event.get('game', {})
-            if game_info.get('source') != 'ai':
-                opponent_info = game_info.get('opponent', {})
-                self.opponent.setText(f"{opponent_info.get('username', 'Unknown')} ({opponent_info.get('rating', '00')})")
-            else:
-                self.opponent.setText(f"{game_info.get('opponent', {}).get('username', 'Unknown')}")
-            self.current_game = game_info.get('gameId')
-            self.current_color = game_info.get("color", "white")
-            self.last_move.setText('--')
-            self.your_time.setText('--:--')
-            self.opponent_time.setText('--:--')
-            self.chess_board.reset_board()
-            self.update_board()
-            # Inicia o streaming dos eventos do jogo
-            self.game_thread = LichessGameStreamThread(self.current_token, self.current_game)
-            self.game_thread.event_received.connect(self.handle_game_events)
-            self.game_thread.error.connect(self.handle_error)
-            self.game_thread.start()
-        elif event_type == 'gameFinish':
-            self.stop_timer_signal.emit()
-            self.game_finish_signal.emit()
-            self.switch_layout(1)
-            self.game_active = False  # Jogo finalizado, não atualizar mais os relógios
-
-            game_data = event.get('game', {})
-            status = game_data.get('status', {}).get('name', '')
-            if status != 'aborted':
-                if 'winner' not in game_data:
-                    self.result_label.setText('1/2-1/2')
-                elif game_data.get('winner') == 'black':
-                    self.result_label.setText('0-1')
-                elif game_data.get('winner') == 'white':
-                    self.result_label.setText('1-0')
-                else:
-                    self.result_label.setText('1/2-1/2')
-            else:
-                self.result_label.setText('Aborted')
-            self.current_game = None
-            if self.game_thread:
-                self.game_thread.stop()
-                self.game_thread.wait()
-                self.game_thread = None
-    
-    def handle_game_events(self, event):
+        if self.import_thread and self.import_thread.is_alive():
+            return
+        self.import_button.setEnabled(False)
+        self.import_stop.clear()
+        self.import_thread = threading.Thread(target=self.run_import, args=(self.connected_user,), daemon=True)
+        self.import_thread.start()
+
+    def run_import(self, username):
+        import game_import
+
+        def progress(read, inserted):
+            self.import_progress_signal.emit(f"Imported {read} games ({inserted} new)")
+
+        try:
+            with game_import.GameStore() as store:
+                game_import.import_from_lichess(self.client, store, username, on_progress=progress,
+                                                should_stop=self.import_stop.is_set)
+        except Exception as e:
+            logger.error(f"Error importing games: {e}")
+            self.import_progress_signal.emit("Import failed")
+        self.import_progress_signal.emit("")
+
+    def handle_import_progress(self, text):
+        """Mostra o andamento da importação; texto vazio indica o fim."""
+        if text:
+            self.import_button.setText(text)
+        else:
+            self.import_button.setEnabled(True)
+
+    def handle_event(self, event):
         """
-        Processa os eventos do jogo:
-          - Atualiza o tabuleiro aplicando o último movimento.
-          - Atualiza os relógios e exibe a notação do último movimento.
+        Despacha os eventos gerais do Lichess para o núcleo (BoardController).
         """
-        # Se a partida já terminou, não processa novos eventos
-        if self.current_game is None:
-            return
+        self.controller.handle_event(event)
+    
+    def handle_game_events(self, game_id, event):
+        """Repassa ao núcleo os eventos (GameFull e GameState) do stream de um jogo."""
         try:
-            if event.get('type') == 'gameState':
-                moves_str = event.get('moves', "")
-                moves_list = moves_str.split()
-                if moves_list:
-                    last_move = moves_list[-1]
-                    self.current_moves += 1
-                    translated_move = self.chess_board.translate_move(last_move)
-                    self.last_move_ucl = last_move
-                    self.chess_board.apply_move(last_move)
-                    self.last_move.setText(f"{translated_move}")
-                    self.update_board()
-                white_time = event.get('wtime', 0) / 1000
-                black_time = event.get('btime', 0) / 1000
-                if len(moves_list) % 2 == 0:
-                    self.to_move = 'white'
-                else:
-                    self.to_move = 'black'
-                if self.current_color == 'white':
-                    self.your_time.setText(f"{int(white_time/60):02d}:{int(white_time%60):02d}")
-                    self.opponent_time.setText(f"{int(black_time/60):02d}:{int(black_time%60):02d}")
-                else:
-                    self.your_time.setText(f"{int(black_time/60):02d}:{int(black_time%60):02d}")
-                    self.opponent_time.setText(f"{int(white_time/60):02d}:{int(white_time%60):02d}")
-                if len(moves_list) >= 2:
-                    self.start_timer_signal.emit()
-                self.game_active = True
+            self.controller.handle_game_event(game_id, event)
         except Exception as e:
             logger.error(f"Error in handle_game_events: {e}")
+
+    # -------------------------------------------------------------------------
+    # Notificações do BoardController
+    # -------------------------------------------------------------------------
+    def on_focus(self, session):
+        """
+        A tela passa a mostrar o tabuleiro, o relógio e o último lance da
+        partida em foco.
+        """
+        self.ensure_layout(2)
+        self.current_game = session.game_id
+        self.current_color = session.color
+        self.chess_board = session.board
+        self.move_sync = session.move_sync
+        self.clock = session.clock
+        self.current_moves = session.plies
+        self.to_move = session.to_move
+        self.last_move_ucl = session.last_uci
+        self.opponent.setText(session.opponent_text)
+        self.last_move.setText(session.last_san or '--')
+        self.update_board()
+        self.update_opening(session)
+        self.game_active = True
+        self.game_start_signal.emit()
+        self.start_serial_update_timer()
+        self.refresh_clocks()
+        if self.clock.running:
+            self.start_timer_signal.emit()
+        else:
+            self.move_timer.stop()
+
+    def on_position(self, session, new_moves):
+        """
+        Atualiza os relógios, o tabuleiro gráfico e a notação do último
+        movimento da partida em foco.
+        """
+        self.current_moves = session.plies
+        self.to_move = session.to_move
+        if new_moves or session.move_sync.rebuilt:
+            self.last_move_ucl = session.last_uci
+            self.last_move.setText(session.last_san or '--')
+            self.update_board()
+            self.update_opening(session)
+        self.refresh_clocks()
+        if self.clock.running:
+            self.start_timer_signal.emit()
+        self.game_active = True
+
+    def update_opening(self, session, max_moves=3):
+        """Mostra o nome da abertura e os principais lances do livro na posição."""
+        book_moves = self.controller.book.book_moves(session.board)[:max_moves]
+        parts = []
+        if session.opening:
+            parts.append(f"{session.opening.eco} {session.opening.name}")
+        if book_moves:
+            parts.append("Book: " + ", ".join(uci_to_san(session.board, move.uci) for move in book_moves))
+        self.opening_label.setText("\n".join(parts))
+        self.opening_label.setVisible(bool(parts))
+
+    def handle_engine_info(self, game_id, info, max_moves=4):
+        """Mostra a avaliação e o início da variante principal, se ainda forem da posição exibida."""
+        from engine_pool import format_score
+        if game_id != self.current_game or info.key != self.chess_board.hash:
+            return
+        board = ChessBoard()
+        board.restore(self.chess_board.snapshot())
+        line = []
+        for uci in info.pv[:max_moves]:
+            line.append(uci_to_san(board, uci))
+            try:
+                board.apply_move(uci)
+            except (ValueError, KeyError, IndexError):
+                break
+        self.eval_label.setText(f"{format_score(info)} (depth {info.depth}) {' '.join(line)}")
+        self.eval_label.show()
+
+    def on_game_finished(self, session):
+        """Trata o término da partida em foco."""
+        self.stop_timer_signal.emit()
+        self.game_finish_signal.emit()
+        self.switch_layout(1)
+        self.opening_label.hide()
+        self.eval_label.hide()
+        self.game_active = False  # Jogo finalizado, não atualizar mais os relógios
+        self.result_label.setText(session.result)
+        self.current_game = None
+        if getattr(self, 'serial_timer', None) is not None:
+            self.serial_timer.stop()
+
+    def on_games_changed(self):
+        """Mostra quantas outras partidas estão em andamento (e se alguma espera o seu lance)."""
+        others = self.controller.other_games()
+        if not others:
+            self.next_game_button.hide()
+            return
+        text = f"Next game ({len(others)})"
+        if any(session.my_turn for session in others):
+            text += " - your move"
+        self.next_game_button.setText(text)
+        self.next_game_button.show()
+
+    def next_game(self):
+        """Passa o foco para a próxima partida em andamento."""
+        self.controller.next_game()
     
     def start_timer_main_thread(self):
-        """Inicia o timer para atualização dos relógios a cada segundo."""
-        self.move_timer.start(1000)
+        """Inicia o timer de atualização dos relógios na tela."""
+        if not self.move_timer.isActive():
+            self.move_timer.start(CLOCK_REFRESH_MS)
     
     def stop_timer_main_thread(self):
         """Para o timer (executado na thread principal)."""
         self.move_timer.stop()
+        self.refresh_clocks()
     
+    def refresh_clocks(self):
+        """Exibe nos ClockWidgets o tempo restante calculado pelo modelo de relógio."""
+        opponent_color = 'black' if self.current_color == 'white' else 'white'
+        your_text = self.clock.text(self.current_color)
+        opponent_text = self.clock.text(opponent_color)
+        if self.your_time.text() != your_text:
+            self.your_time.setText(your_text)
+        if self.opponent_time.text() != opponent_text:
+            self.opponent_time.setText(opponent_text)
+
     def update_time(self):
-        """Atualiza os relógios decrementando 1 segundo a cada tick do timer."""
+        """Atualiza os relógios a cada tick do timer a partir do modelo de relógio."""
         if not self.game_active:
             return
-        try:
-            if self.to_move == 'white' and self.current_color == 'white':
-                time_text = self.your_time.text()
-                if not time_text[0].isdigit():
-                    return
-                minutes, seconds = map(int, time_text.split(':'))
-                total_seconds = minutes * 60 + seconds - 1
-                self.your_time.setText(f"{int(total_seconds/60):02d}:{int(total_seconds%60):02d}")
-            else:
-                time_text = self.opponent_time.text()
-                if not time_text[0].isdigit():
-                    return
-                minutes, seconds = map(int, time_text.split(':'))
-                total_seconds = minutes * 60 + seconds - 1
-                self.opponent_time.setText(f"{int(total_seconds/60):02d}:{int(total_seconds%60):02d}")
-        except Exception as e:
-            logger.error(f"Error in update_time: {e}")
+        self.refresh_clocks()
     
     def resign(self):
         """
         Envia uma requisição para desistir ou abortar o jogo,
         conforme o estado atual dos lances.
         """
-        if not self.current_game:
-            return
-        if self.current_color == 'white' and self.current_moves == 0:
-            endpoint = "abort"
-        elif self.current_color == 'black' and self.current_moves == 1:
-            endpoint = "abort"
-        else:
-            endpoint = "resign"
-        url = f"https://lichess.org/api/board/game/{self.current_game}/{endpoint}"
-        try:
-            response = requests.post(url, headers={"Authorization": f"Bearer {self.current_token}"})
-            if response.status_code != 200:
-                logger.error("Falha ao enviar desistência ou abortar o jogo.")
-        except Exception as e:
-            logger.error(f"Error in resign: {e}")
+        self.controller.resign()
     
     def new_game_lichess(self):
         """Inicia uma nova partida no Lichess."""
         self.your_time.hide()
-        self.search_a_game = SearchAGame(self.current_token)
+        from SearchAGame import SearchAGame
+        self.search_a_game = SearchAGame(self.client)
         self.game_start_signal.connect(self.search_a_game.close)
         self.search_a_game.show()
     
@@ -605,45 +618,66 @@ class LichessInterface(QMainWindow):
         """Trata erros emitidos pelas threads de streaming."""
         logger.error(f"Stream error: {error_message}")
 
+    def handle_game_stream_status(self, game_id, status):
+        """Repassa o estado do stream apenas da partida em foco."""
+        if game_id == self.current_game:
+            self.handle_stream_status(status)
+
+    def handle_stream_status(self, status):
+        """Mostra no status quando um stream está reconectando."""
+        if status == 'reconnecting':
+            self.status_label.setText("Status: reconnecting...")
+        elif status == 'connected' and self.connected_user:
+            self.status_label.setText(f"Connected as: {self.connected_user}")
+
     def start_serial_update_timer(self):
-        self.serial_timer = QTimer(self)
-        self.serial_timer.timeout.connect(self.serial_update)
+        if getattr(self, 'serial_timer', None) is None:
+            self.serial_timer = QTimer(self)
+            self.serial_timer.timeout.connect(self.serial_update)
         self.serial_timer.start(1000)
 
     def serial_update(self):
-        if self.game_active:
-            white_time_str = self.your_time.text()
-            black_time_str = self.opponent_time.text()
-            last_move_val = self.last_move.text().replace("x", "")
-            msg = f"{white_time_str};{last_move_val};{black_time_str};{self.last_move_ucl}"
+        """Envia periodicamente os relógios ao ESP32."""
+        self.controller.serial_tick()
+
+    def handle_serial_event(self, event):
+        """Trata os eventos recebidos do tabuleiro assim que chegam pela serial."""
+        if event['type'] == 'move':
+            self.handle_special_interrupt(f"move:{event['move']}", event.get('received'))
+        elif event['type'] == 'occupancy':
+            self.controller.handle_board_occupancy(event['bitmap'])
+        elif event['type'] == 'confirm':
+            self.controller.handle_board_confirm(event['bitmap'], event.get('received'))
         else:
-            result = self.result_label.text()
-            msg = f".......{result}......."
-            self.serial_timer.stop()
-        try:
-            self.serial_port.write(msg.encode())
-        except Exception as e:
-            print("Erro enviando via serial:", e)
-        try:
-            move = self.serial_port.read_all().decode('utf-8').strip()
-            print(move)
-            if "move:" in move:
-                self.handle_special_interrupt(move)
-        except Exception as e:
-            print("Erro ao ler mensagem serial:", e)
+            logger.debug(f"ESP32: {event['line']}")
+
+    def handle_special_interrupt(self, move, received=None):
+        uci = move.replace('move:', '').strip()
+        logger.info(f"Lance do tabuleiro: {uci}")
+        self.controller.handle_board_move(uci, received)
+
+    def handle_command_done(self, result):
+        """Trata o resultado de um comando enviado pela thread de comandos."""
+        self.controller.handle_command_result(result)
 
-    def handle_special_interrupt(self, move):
-        url = f"https://lichess.org/api/board/game/{self.current_game}/move/{move.replace('move:', '').strip()}"
-        print(url)
-        response = requests.post(url, headers={"Authorization": f"Bearer {self.current_token}"})
-        print(response.text)
+    def closeEvent(self, event):
+        """Encerra as threads antes de fechar a janela."""
+        if self.event_thread:
+            self.event_thread.stop()
+        self.import_stop.set()
+        self.controller.shutdown()
+        self.command_thread.stop()
+        self.serial_bridge.stop()
+        super().closeEvent(event)
 
 
 # =============================================================================
 # Execução principal
 # =============================================================================
 if __name__ == "__main__":
+    startup_profile.mark("imports concluídos")
     app = QApplication(sys.argv)
+    startup_profile.mark("QApplication criada")
     window = LichessInterface()
     window.show()
     sys.exit(app.exec())
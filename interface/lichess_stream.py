@@ -0,0 +1,239 @@
+"""
+Streams NDJSON do Lichess com reconexão automática.
+
+ReconnectingStream mantém um stream HTTP aberto, entrega cada evento ao
+callback on_event e, quando a conexão cai (timeout de leitura, erro de rede,
+status HTTP inesperado ou fim do stream), reconecta com backoff exponencial.
+O timeout de leitura é ajustado às linhas vazias de keep-alive que o Lichess
+envia a cada poucos segundos, de modo que uma conexão morta é detectada
+rapidamente. stop() fecha a resposta em andamento e cancela a espera do
+backoff imediatamente.
+
+As linhas são separadas por NdjsonReader, que reaproveita o mesmo buffer entre
+leituras, distingue keep-alives de eventos, usa orjson/ujson quando instalados
+e entrega eventos tipados (lichess_events).
+"""
+import json
+import logging
+import random
+import socket
+import threading
+
+from lichess_events import parse_event
+
+logger = logging.getLogger(__name__)
+
+# Decodificador JSON mais rápido disponível
+try:
+    import orjson
+    json_loads = orjson.loads
+    JSON_BACKEND = "orjson"
+except ImportError:
+    try:
+        import ujson
+
+        def json_loads(data):
+            # ujson não aceita bytearray
+            return ujson.loads(bytes(data))
+        JSON_BACKEND = "ujson"
+    except ImportError:
+        json_loads = json.loads
+        JSON_BACKEND = "json"
+
+# Tamanho máximo de cada leitura do socket (bytes)
+READ_BUFFER_SIZE = 16 * 1024
+
+BACKOFF_INITIAL = 1.0
+BACKOFF_MAX = 60.0
+BACKOFF_FACTOR = 2.0
+RATE_LIMIT_BACKOFF = 60.0
+
+# Status HTTP que não adianta repetir (token inválido, jogo inexistente)
+FATAL_STATUS = frozenset((401, 403, 404))
+
+
+def shutdown_response(response):
+    """
+    Interrompe uma leitura bloqueada em outra thread: fechar a resposta não
+    acorda o recv() pendente, então o socket subjacente é desligado antes.
+    """
+    raw = getattr(response, 'raw', None)
+    sock = getattr(getattr(raw, '_connection', None), 'sock', None)
+    if sock is None:
+        # urllib3 1.x: o socket fica no objeto de arquivo do http.client
+        fp = getattr(getattr(raw, '_fp', None), 'fp', None)
+        sock = getattr(getattr(fp, 'raw', None), '_sock', None)
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+    response.close()
+
+
+class StreamStats:
+    """Contadores de um stream (acumulados entre reconexões)."""
+    __slots__ = ('events', 'bytes', 'keep_alives', 'decode_errors')
+
+    def __init__(self):
+        self.events = 0
+        self.bytes = 0
+        self.keep_alives = 0
+        self.decode_errors = 0
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class NdjsonReader:
+    """
+    Separa um fluxo de bytes em linhas NDJSON e as decodifica em eventos
+    tipados. O buffer é mantido entre chamadas, então uma linha pode chegar
+    dividida em vários pedaços.
+    """
+    def __init__(self, stats=None, loads=None, on_error=None):
+        self.stats = stats or StreamStats()
+        self.loads = loads or json_loads
+        self.on_error = on_error
+        self.buffer = bytearray()
+
+    def reset(self):
+        """Descarta dados parciais (ex.: após uma reconexão)."""
+        del self.buffer[:]
+
+    def feed(self, chunk):
+        """Processa um pedaço de bytes e retorna os eventos completos."""
+        stats = self.stats
+        stats.bytes += len(chunk)
+        buffer = self.buffer
+        buffer += chunk
+        events = []
+        start = 0
+        while True:
+            end = buffer.find(b'\n', start)
+            if end < 0:
+                break
+            if end == start or buffer[start:end].isspace():
+                stats.keep_alives += 1
+            else:
+                try:
+                    events.append(parse_event(self.loads(buffer[start:end])))
+                    stats.events += 1
+                except ValueError as e:
+                    stats.decode_errors += 1
+                    if self.on_error:
+                        self.on_error(f"JSON inválido: {e}")
+            start = end + 1
+        del buffer[:start]
+        return events
+
+    def iter_events(self, response, chunk_size=READ_BUFFER_SIZE):
+        """Itera os eventos de uma resposta HTTP em modo stream."""
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            yield from self.feed(chunk)
+
+
+class ReconnectingStream:
+    """
+    Executa um stream NDJSON até stop(), reconectando quando necessário.
+
+    open_stream: função sem argumentos que retorna a resposta (stream=True).
+    on_event: recebe cada evento tipado (lichess_events).
+    is_final: função opcional que recebe um evento e indica se o stream
+              terminou de forma definitiva (ex.: fim da partida).
+    """
+    def __init__(self, open_stream, on_event, on_error=None, on_status=None, is_final=None, name="stream",
+                 chunk_size=READ_BUFFER_SIZE):
+        self.open_stream = open_stream
+        self.on_event = on_event
+        self.on_error = on_error
+        self.on_status = on_status
+        self.is_final = is_final
+        self.name = name
+        self.chunk_size = chunk_size
+        self.stats = StreamStats()
+        self.reader = NdjsonReader(self.stats, on_error=self._report_error)
+        self.reconnects = 0
+        self._running = True
+        self._stop_event = threading.Event()
+        self._response = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self):
+        return self._running
+
+    def _report_error(self, message):
+        logger.error(f"{self.name}: {message}")
+        if self.on_error:
+            self.on_error(message)
+
+    def _set_status(self, status):
+        if self.on_status:
+            self.on_status(status)
+
+    def stop(self):
+        """Cancela o stream imediatamente, fechando a conexão em uso."""
+        self._running = False
+        self._stop_event.set()
+        with self._lock:
+            response = self._response
+        if response is not None:
+            try:
+                shutdown_response(response)
+            except Exception:
+                pass
+
+    def _consume(self, response):
+        """Lê o stream até ele terminar. Retorna True se recebeu algum dado."""
+        received_before = self.stats.bytes
+        self.reader.reset()
+        for event in self.reader.iter_events(response, self.chunk_size):
+            if not self._running:
+                break
+            self.on_event(event)
+            if self.is_final and self.is_final(event):
+                self._running = False
+                break
+        return self.stats.bytes > received_before
+
+    def run(self):
+        """Laço principal (bloqueante): conecta, consome e reconecta."""
+        delay = BACKOFF_INITIAL
+        while self._running:
+            self._set_status("connecting")
+            try:
+                response = self.open_stream()
+                with self._lock:
+                    self._response = response
+                if not self._running:
+                    response.close()
+                    break
+                with response:
+                    if response.status_code == 200:
+                        self._set_status("connected")
+                        if self._consume(response):
+                            delay = BACKOFF_INITIAL
+                    elif response.status_code in FATAL_STATUS:
+                        self._report_error(f"Erro: HTTP {response.status_code}")
+                        break
+                    else:
+                        self._report_error(f"Erro: HTTP {response.status_code}")
+                        if response.status_code == 429:
+                            delay = max(delay, RATE_LIMIT_BACKOFF)
+            except Exception as e:
+                if self._running:
+                    self._report_error(str(e))
+            finally:
+                with self._lock:
+                    self._response = None
+            if not self._running:
+                break
+            wait = delay * random.uniform(0.8, 1.2)
+            logger.info(f"{self.name}: reconectando em {wait:.1f} s")
+            self._set_status("reconnecting")
+            self.reconnects += 1
+            if self._stop_event.wait(wait):
+                break
+            delay = min(delay * BACKOFF_FACTOR, BACKOFF_MAX)
+        self._set_status("stopped")
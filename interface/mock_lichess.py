@@ -0,0 +1,647 @@
+"""
+Servidor local que imita a API de tabuleiro do Lichess, para testes e
+benchmarks sem rede.
+
+Implementa os endpoints usados pela interface (/api/account, stream de eventos,
+stream do jogo, lance, desistência, abortar, /api/board/seek, /api/challenge/ai
+e o export /api/games/user), com streams NDJSON em chunked encoding e linhas
+de keep-alive como o Lichess. O adversário é um robô no próprio servidor que
+responde com lances de um roteiro ou lances legais aleatórios (move_generator)
+após um tempo de "pensamento" configurável, o que permite acelerar partidas.
+Latência, erros HTTP e quedas dos streams podem ser injetados.
+
+Para testes de carga, --games N inicia N partidas seguidas e --self-play faz
+o servidor jogar também pelo usuário, de modo que a interface (ou o serviço
+headless) só acompanha os streams. As estatísticas ficam em GET /mock/stats.
+
+Uso:
+    python mock_lichess.py [--port 8080] [--think-ms 300] [--latency-ms 50]
+                           [--error-rate 0.05] [--games 1000 --self-play]
+    # em outro terminal: LICHESS_URL=http://127.0.0.1:8080 python lichess_interface.py
+"""
+import argparse
+import json
+import logging
+import queue
+import random
+import re
+import string
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+from chess_board import ChessBoard
+from move_generator import is_legal, legal_moves, move_to_uci, parse_uci, in_check
+from notation import uci_to_san
+
+logger = logging.getLogger(__name__)
+
+KEEP_ALIVE_INTERVAL = 6.0
+DEFAULT_CLOCK = (300000, 3000)  # limite e incremento (ms)
+DEFAULT_USERNAME = "board_tester"
+
+
+class MockConfig:
+    """Parâmetros do servidor e das falhas injetadas."""
+    def __init__(self, username=DEFAULT_USERNAME, tokens=None, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0,
+                 error_status=500, drop_rate=0.0, keep_alive=KEEP_ALIVE_INTERVAL, think_ms=500.0,
+                 max_plies=200, seek_wait_ms=1000.0, self_play=False):
+        self.username = username
+        self.tokens = tokens  # None aceita qualquer token não vazio
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.drop_rate = drop_rate
+        self.keep_alive = keep_alive
+        self.think_ms = think_ms
+        self.max_plies = max_plies
+        self.seek_wait_ms = seek_wait_ms
+        self.self_play = self_play
+
+
+def new_game_id():
+    return ''.join(random.choices(string.ascii_letters + string.digits, k=8))
+
+
+# =============================================================================
+# Partida simulada
+# =============================================================================
+class MockGame:
+    """
+    Estado de uma partida no servidor: tabuleiro, relógios, status e os
+    streams inscritos (uma fila por conexão).
+    """
+    def __init__(self, game_id, user_color, opponent, source='lobby', clock=DEFAULT_CLOCK, script=None,
+                 username=DEFAULT_USERNAME):
+        self.game_id = game_id
+        self.username = username
+        self.user_color = user_color
+        self.opponent = opponent
+        self.source = source
+        self.limit_ms, self.increment_ms = clock
+        self.board = ChessBoard()
+        self.moves = []
+        self.wtime = self.btime = self.limit_ms
+        self.status = 'started'
+        self.winner = None
+        self.script = list(script or [])
+        self.last_move_at = time.monotonic()
+        self.created_at = int(time.time() * 1000)
+        self.subscribers = []
+        self.lock = threading.Lock()
+
+    @property
+    def to_move(self):
+        return 'white' if len(self.moves) % 2 == 0 else 'black'
+
+    @property
+    def finished(self):
+        return self.status != 'started'
+
+    def state(self):
+        data = {'type': 'gameState', 'moves': ' '.join(self.moves), 'wtime': int(self.wtime),
+                'btime': int(self.btime), 'winc': self.increment_ms, 'binc': self.increment_ms,
+                'status': self.status}
+        if self.winner:
+            data['winner'] = self.winner
+        return data
+
+    def full(self):
+        user = {'id': self.username.lower(), 'name': self.username}
+        opponent = {'id': self.opponent.get('username', 'opponent').lower(), 'name': self.opponent.get('username')}
+        white, black = (user, opponent) if self.user_color == 'white' else (opponent, user)
+        return {'type': 'gameFull', 'id': self.game_id, 'initialFen': 'startpos', 'white': white,
+                'black': black, 'clock': {'initial': self.limit_ms, 'increment': self.increment_ms},
+                'speed': 'blitz', 'state': self.state()}
+
+    def export(self):
+        """Partida no formato de /api/games/user (lances em SAN)."""
+        board = ChessBoard()
+        san_moves = []
+        for uci in self.moves:
+            san_moves.append(uci_to_san(board, uci))
+            board.apply_move(uci)
+        user = {'user': {'id': self.username.lower(), 'name': self.username}, 'rating': 1500}
+        if 'aiLevel' in self.opponent:
+            opponent = {'aiLevel': self.opponent['aiLevel']}
+        else:
+            opponent = {'user': {'id': self.opponent.get('username', 'opponent').lower(),
+                                 'name': self.opponent.get('username')},
+                        'rating': self.opponent.get('rating', 1500)}
+        white, black = (user, opponent) if self.user_color == 'white' else (opponent, user)
+        data = {'id': self.game_id, 'rated': self.source == 'lobby', 'variant': 'standard', 'speed': 'blitz',
+                'perf': 'blitz', 'createdAt': self.created_at, 'lastMoveAt': int(time.time() * 1000),
+                'status': self.status, 'players': {'white': white, 'black': black},
+                'opening': {'eco': 'A00', 'name': 'Mock Opening', 'ply': 1}, 'moves': ' '.join(san_moves)}
+        if self.winner:
+            data['winner'] = self.winner
+        return data
+
+    def game_event(self, event_type):
+        """Evento gameStart/gameFinish do stream de eventos gerais."""
+        game = {'gameId': self.game_id, 'fullId': self.game_id + 'xxxx', 'color': self.user_color,
+                'source': self.source, 'opponent': self.opponent, 'status': {'name': self.status},
+                'speed': 'blitz', 'fen': self.board.fen(), 'isMyTurn': self.to_move == self.user_color}
+        if self.winner:
+            game['winner'] = self.winner
+        return {'type': event_type, 'game': game}
+
+    def broadcast(self, data):
+        for subscriber in list(self.subscribers):
+            subscriber.put(data)
+
+    def play(self, uci):
+        """Aplica um lance do lado a jogar. Retorna uma mensagem de erro ou None."""
+        if self.finished:
+            return "Game already over"
+        move = parse_uci(uci)
+        if move is None or not is_legal(self.board, move):
+            return f"Illegal move {uci}"
+        now = time.monotonic()
+        # Como no Lichess, os relógios só correm depois do primeiro lance de cada cor
+        if len(self.moves) >= 2:
+            elapsed = (now - self.last_move_at) * 1000
+            if self.to_move == 'white':
+                self.wtime = self.wtime - elapsed + self.increment_ms
+            else:
+                self.btime = self.btime - elapsed + self.increment_ms
+        self.last_move_at = now
+        mover = self.to_move
+        self.board.make_move(*move)
+        self.moves.append(move_to_uci(move))
+        if min(self.wtime, self.btime) <= 0:
+            self.status = 'outoftime'
+            self.winner = 'black' if self.wtime <= 0 else 'white'
+        elif not legal_moves(self.board):
+            if in_check(self.board):
+                self.status, self.winner = 'mate', mover
+            else:
+                self.status = 'stalemate'
+        elif self.board.halfmove >= 100:
+            self.status = 'draw'
+        return None
+
+    def finish(self, status, winner=None):
+        self.status = status
+        self.winner = winner
+
+
+# =============================================================================
+# Servidor
+# =============================================================================
+class MockLichess:
+    """
+    Servidor HTTP simulado. start() retorna a URL base a ser usada no
+    LichessClient (ou na variável de ambiente LICHESS_URL).
+    """
+    def __init__(self, host="127.0.0.1", port=0, config=None, scripts=None):
+        self.config = config or MockConfig()
+        self.scripts = list(scripts or [])  # roteiros de lances do adversário, um por partida
+        self.games = {}
+        self.event_subscribers = []
+        self.lock = threading.Lock()
+        self.stats = {'requests': 0, 'injected_errors': 0, 'dropped_streams': 0, 'games_started': 0,
+                      'games_finished': 0, 'moves': 0, 'rejected_moves': 0, 'echo_ms': []}
+        self.games_left = 0
+        self.games_gap = 0.0
+        self._stopping = threading.Event()
+        server = self
+
+        class Handler(MockHandler):
+            mock = server
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="mock-lichess", daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self):
+        self._stopping.set()
+        with self.lock:
+            for subscriber in self.event_subscribers:
+                subscriber.put(None)
+            for game in self.games.values():
+                game.broadcast(None)
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def serve_forever(self):
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self.httpd.server_close()
+
+    # -------------------------------------------------------------------------
+    # Partidas
+    # -------------------------------------------------------------------------
+    def create_game(self, color='random', source='lobby', opponent=None, clock=DEFAULT_CLOCK, script=None):
+        """Cria uma partida para o usuário e a anuncia no stream de eventos."""
+        if color not in ('white', 'black'):
+            color = random.choice(('white', 'black'))
+        if script is None and self.scripts:
+            script = self.scripts[self.stats['games_started'] % len(self.scripts)]
+        game = MockGame(new_game_id(), color, opponent or {'username': 'MockBot', 'rating': 1500},
+                        source, clock, script, self.config.username)
+        with self.lock:
+            self.games[game.game_id] = game
+            self.stats['games_started'] += 1
+            subscribers = list(self.event_subscribers)
+        for subscriber in subscribers:
+            subscriber.put(game.game_event('gameStart'))
+        logger.info(f"Partida {game.game_id} criada ({color})")
+        self._schedule_bot(game)
+        return game
+
+    def start_series(self, count, gap_ms=200.0, **game_options):
+        """Inicia count partidas seguidas (uma nova quando a anterior termina)."""
+        self.games_left = count
+        self.games_gap = gap_ms / 1000
+        self._series_options = game_options
+        self._next_in_series()
+
+    def _next_in_series(self):
+        if self.games_left <= 0 or self._stopping.is_set():
+            return
+        self.games_left -= 1
+        self.create_game(**getattr(self, '_series_options', {}))
+
+    def _bot_turn(self, game):
+        return game.to_move != game.user_color or self.config.self_play
+
+    def _schedule_bot(self, game):
+        if game.finished or not self._bot_turn(game):
+            return
+        delay = random.uniform(0.5, 1.5) * self.config.think_ms / 1000
+        timer = threading.Timer(delay, self._bot_move, (game,))
+        timer.daemon = True
+        timer.start()
+
+    def _bot_move(self, game):
+        if self._stopping.is_set():
+            return
+        with game.lock:
+            if game.finished or not self._bot_turn(game):
+                return
+            uci = None
+            while game.script and uci is None:
+                candidate = game.script.pop(0)
+                move = parse_uci(candidate)
+                if move is not None and is_legal(game.board, move):
+                    uci = candidate
+            if uci is None:
+                uci = move_to_uci(random.choice(legal_moves(game.board)))
+            game.play(uci)
+            if not game.finished and len(game.moves) >= self.config.max_plies:
+                game.finish('draw')
+        self._after_move(game)
+
+    def play_user_move(self, game, uci):
+        """Lance enviado pelo cliente. Retorna uma mensagem de erro ou None."""
+        received = time.monotonic()
+        with game.lock:
+            if game.finished:
+                return "Game already over"
+            if game.to_move != game.user_color:
+                return "Not your turn"
+            error = game.play(uci)
+            if not error and not game.finished and len(game.moves) >= self.config.max_plies:
+                game.finish('draw')
+        if error:
+            self.stats['rejected_moves'] += 1
+            return error
+        self._after_move(game)
+        self.stats['echo_ms'].append((time.monotonic() - received) * 1000)
+        return None
+
+    def _after_move(self, game):
+        self.stats['moves'] += 1
+        game.broadcast(game.state())
+        if game.finished:
+            self._finish(game)
+        else:
+            self._schedule_bot(game)
+
+    def end_game(self, game, status, winner=None):
+        with game.lock:
+            if game.finished:
+                return False
+            game.finish(status, winner)
+        game.broadcast(game.state())
+        self._finish(game)
+        return True
+
+    def _finish(self, game):
+        self.stats['games_finished'] += 1
+        game.broadcast(None)  # encerra os streams do jogo
+        with self.lock:
+            subscribers = list(self.event_subscribers)
+        for subscriber in subscribers:
+            subscriber.put(game.game_event('gameFinish'))
+        logger.info(f"Partida {game.game_id} terminou: {game.status} {game.winner or ''}")
+        if self.games_left > 0:
+            timer = threading.Timer(self.games_gap, self._next_in_series)
+            timer.daemon = True
+            timer.start()
+
+    def stats_summary(self):
+        echo = sorted(self.stats['echo_ms'])
+        summary = {key: value for key, value in self.stats.items() if key != 'echo_ms'}
+        if echo:
+            summary['echo_ms'] = {'count': len(echo), 'p50': echo[len(echo) // 2],
+                                  'p99': echo[min(len(echo) - 1, int(len(echo) * 0.99))], 'max': echo[-1]}
+        return summary
+
+
+# =============================================================================
+# Tratamento das requisições
+# =============================================================================
+ROUTES = [
+    ('GET', re.compile(r'^/api/account$'), 'account'),
+    ('GET', re.compile(r'^/api/stream/event$'), 'stream_events'),
+    ('GET', re.compile(r'^/api/board/game/stream/(\w+)$'), 'stream_game'),
+    ('POST', re.compile(r'^/api/board/game/(\w+)/move/(\w+)$'), 'move'),
+    ('POST', re.compile(r'^/api/board/game/(\w+)/(resign|abort)$'), 'game_action'),
+    ('POST', re.compile(r'^/api/board/seek$'), 'seek'),
+    ('POST', re.compile(r'^/api/challenge/ai$'), 'challenge_ai'),
+    ('GET', re.compile(r'^/api/games/user/(\w+)$'), 'export_games'),
+    ('GET', re.compile(r'^/mock/stats$'), 'mock_stats'),
+]
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    mock = None  # MockLichess (definido na subclasse criada pelo servidor)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+    # -------------------------------------------------------------------------
+    # Respostas
+    # -------------------------------------------------------------------------
+    def send_json(self, status, data):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_json(self, status, message):
+        self.send_json(status, {'error': message})
+
+    def start_stream(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def write_chunk(self, data):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def write_line(self, event=None):
+        """Escreve um evento NDJSON (ou uma linha vazia de keep-alive)."""
+        self.write_chunk((json.dumps(event) if event is not None else "").encode() + b"\n")
+
+    def end_stream(self):
+        try:
+            self.write_chunk(b"")
+        except OSError:
+            pass
+        self.close_connection = True
+
+    def pump(self, subscriber, until=None):
+        """Repassa os eventos da fila ao cliente até None, desconexão ou queda injetada."""
+        config = self.mock.config
+        while True:
+            try:
+                event = subscriber.get(timeout=config.keep_alive)
+            except queue.Empty:
+                event = {}
+            if event is None:
+                return True
+            self.write_line(event or None)
+            if event and config.drop_rate and random.random() < config.drop_rate:
+                self.mock.stats['dropped_streams'] += 1
+                self.close_connection = True
+                return False
+            if until and until():
+                return True
+
+    # -------------------------------------------------------------------------
+    # Despacho
+    # -------------------------------------------------------------------------
+    def do_GET(self):
+        self.dispatch('GET')
+
+    def do_POST(self):
+        self.dispatch('POST')
+
+    def dispatch(self, method):
+        mock = self.mock
+        config = mock.config
+        mock.stats['requests'] += 1
+        path, _, query = self.path.partition('?')
+        self.query = {key: values[-1] for key, values in parse_qs(query).items()}
+        self.form = {}
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.form = {key: values[-1] for key, values in parse_qs(self.rfile.read(length).decode()).items()}
+        for route_method, pattern, name in ROUTES:
+            match = pattern.match(path)
+            if match and route_method == method:
+                break
+        else:
+            self.send_error_json(404, "Not found")
+            return
+        if name == 'mock_stats':
+            self.send_json(200, mock.stats_summary())
+            return
+        delay = config.latency_ms + random.uniform(0, config.jitter_ms)
+        if delay:
+            time.sleep(delay / 1000)
+        if not self.authorized():
+            self.send_error_json(401, "No such token")
+            return
+        if config.error_rate and random.random() < config.error_rate:
+            mock.stats['injected_errors'] += 1
+            self.send_error_json(config.error_status, "Injected error")
+            return
+        try:
+            getattr(self, name)(*match.groups())
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def authorized(self):
+        header = self.headers.get('Authorization', '')
+        token = header[len('Bearer '):] if header.startswith('Bearer ') else ''
+        tokens = self.mock.config.tokens
+        return bool(token) and (tokens is None or token in tokens)
+
+    # -------------------------------------------------------------------------
+    # Endpoints
+    # -------------------------------------------------------------------------
+    def account(self):
+        username = self.mock.config.username
+        self.send_json(200, {'id': username.lower(), 'username': username})
+
+    def stream_events(self):
+        mock = self.mock
+        subscriber = queue.Queue()
+        with mock.lock:
+            mock.event_subscribers.append(subscriber)
+            # Como o Lichess, reenvia as partidas em andamento ao conectar
+            ongoing = [game for game in mock.games.values() if not game.finished]
+        for game in ongoing:
+            subscriber.put(game.game_event('gameStart'))
+        try:
+            self.start_stream()
+            self.write_line(None)
+            if self.pump(subscriber):
+                self.end_stream()
+        finally:
+            with mock.lock:
+                mock.event_subscribers.remove(subscriber)
+
+    def stream_game(self, game_id):
+        game = self.mock.games.get(game_id)
+        if game is None:
+            self.send_error_json(404, "No such game")
+            return
+        subscriber = queue.Queue()
+        with game.lock:
+            game.subscribers.append(subscriber)
+            full = game.full()
+            finished = game.finished
+        try:
+            self.start_stream()
+            self.write_line(full)
+            if finished or self.pump(subscriber):
+                self.end_stream()
+        finally:
+            with game.lock:
+                game.subscribers.remove(subscriber)
+
+    def move(self, game_id, uci):
+        game = self.mock.games.get(game_id)
+        if game is None:
+            self.send_error_json(404, "No such game")
+            return
+        error = self.mock.play_user_move(game, uci)
+        if error:
+            self.send_error_json(400, error)
+        else:
+            self.send_json(200, {'ok': True})
+
+    def game_action(self, game_id, action):
+        game = self.mock.games.get(game_id)
+        if game is None:
+            self.send_error_json(404, "No such game")
+            return
+        if action == 'abort':
+            if len(game.moves) >= 2:
+                self.send_error_json(400, "This game can no longer be aborted")
+                return
+            ended = self.mock.end_game(game, 'aborted')
+        else:
+            ended = self.mock.end_game(game, 'resign', 'black' if game.user_color == 'white' else 'white')
+        if ended:
+            self.send_json(200, {'ok': True})
+        else:
+            self.send_error_json(400, "Game already over")
+
+    def seek(self):
+        """Mantém a busca aberta até o pareamento (ou a desconexão do cliente)."""
+        limit = int(float(self.form.get('time', 5)) * 60000)
+        increment = int(self.form.get('increment', 0)) * 1000
+        color = self.form.get('color', 'random')
+        self.start_stream()
+        deadline = time.monotonic() + self.mock.config.seek_wait_ms / 1000
+        while time.monotonic() < deadline:
+            self.write_line(None)
+            time.sleep(min(0.5, max(0.0, deadline - time.monotonic())))
+        opponent = {'username': f"Seeker{random.randint(1, 999)}", 'rating': random.randint(1200, 2000)}
+        self.mock.create_game(color, 'lobby', opponent, (limit, increment))
+        self.end_stream()
+
+    def challenge_ai(self):
+        level = int(self.form.get('level', 1))
+        limit = int(self.form.get('clock.limit', 300)) * 1000
+        increment = int(self.form.get('clock.increment', 0)) * 1000
+        opponent = {'username': f"AI level {level}", 'aiLevel': level}
+        game = self.mock.create_game(self.form.get('color', 'random'), 'ai', opponent, (limit, increment))
+        self.send_json(201, {'id': game.game_id, 'variant': {'key': 'standard'}, 'speed': 'blitz',
+                             'color': game.user_color, 'status': {'name': 'started'}})
+
+    def export_games(self, username):
+        """Partidas terminadas do usuário em NDJSON, da mais antiga para a mais nova."""
+        if username.lower() != self.mock.config.username.lower():
+            self.send_error_json(404, "No such user")
+            return
+        since = int(self.query.get('since', 0))
+        with self.mock.lock:
+            games = sorted((game for game in self.mock.games.values() if game.finished and game.created_at >= since),
+                           key=lambda game: game.created_at)
+        if 'max' in self.query:
+            games = games[:int(self.query['max'])]
+        self.start_stream()
+        for game in games:
+            with game.lock:
+                self.write_line(game.export())
+        self.end_stream()
+
+
+def load_scripts(path):
+    """Roteiros de lances (um jogo por linha, lances UCI separados por espaço)."""
+    with open(path) as f:
+        return [line.split() for line in f if line.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor local que imita a API do Lichess")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--username", default=DEFAULT_USERNAME)
+    parser.add_argument("--token", action="append", help="token aceito (padrão: qualquer um)")
+    parser.add_argument("--think-ms", type=float, default=500.0, help="tempo médio de resposta do adversário")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="latência adicionada a cada requisição")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="variação aleatória da latência")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fração das requisições com erro HTTP")
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="chance de derrubar um stream a cada evento")
+    parser.add_argument("--keep-alive", type=float, default=KEEP_ALIVE_INTERVAL)
+    parser.add_argument("--max-plies", type=int, default=200, help="lances até declarar empate")
+    parser.add_argument("--seek-wait-ms", type=float, default=1000.0, help="espera até o pareamento na busca")
+    parser.add_argument("--script", help="arquivo com roteiros de lances do adversário")
+    parser.add_argument("--games", type=int, default=0, help="inicia N partidas seguidas")
+    parser.add_argument("--self-play", action="store_true", help="o servidor joga também pelo usuário")
+    parser.add_argument("--log-level", default="INFO")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    config = MockConfig(args.username, set(args.token) if args.token else None, args.latency_ms, args.jitter_ms,
+                        args.error_rate, args.error_status, args.drop_rate, args.keep_alive, args.think_ms,
+                        args.max_plies, args.seek_wait_ms, args.self_play)
+    mock = MockLichess(args.host, args.port, config, load_scripts(args.script) if args.script else None)
+    logger.info(f"Mock do Lichess em {mock.url}")
+    if args.games:
+        mock.start_series(args.games)
+    try:
+        mock.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    logger.info(f"Estatísticas: {json.dumps(mock.stats_summary())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""
+Geração de lances legais sobre o ChessBoard.
+
+Usa tabelas de ataque pré-calculadas (cavalo, rei, peões) e raios por direção
+para as peças deslizantes. Os lances pseudo-legais de uma casa são gerados a
+partir do mailbox e filtrados com make/unmake, descartando os que deixam o
+próprio rei em xeque (cravadas, xeques descobertos, en passant que expõe o rei).
+Roques verificam direitos, casas livres e casas atacadas.
+
+validate_move confere um lance lido pelo tabuleiro físico antes de enviá-lo
+ao Lichess e, quando possível, corrige erros típicos da leitura (promoção sem
+a peça, roque lido como rei capturando a torre, origem e destino trocados).
+"""
+from collections import namedtuple
+
+from chess_board import (PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, WHITE, BLACK, EMPTY, NO_SQUARE,
+                         CASTLE_WK, CASTLE_WQ, CASTLE_BK, CASTLE_BQ, PROMOTION_KINDS,
+                         SQUARE_INDEX, SQUARE_NAMES)
+
+# Lance: casa de origem, casa de destino e tipo da promoção (ou None)
+Move = namedtuple('Move', ['from_sq', 'to_sq', 'promotion'])
+
+PROMOTION_LETTERS = {KNIGHT: 'n', BISHOP: 'b', ROOK: 'r', QUEEN: 'q'}
+PROMOTION_ORDER = (QUEEN, ROOK, BISHOP, KNIGHT)
+
+
+# =============================================================================
+# Tabelas de ataque
+# =============================================================================
+def _offsets_table(offsets):
+    """Casas alcançadas a partir de cada casa por deslocamentos (arquivo, fileira)."""
+    table = []
+    for square in range(64):
+        file, rank = square & 7, square >> 3
+        targets = []
+        for df, dr in offsets:
+            f, r = file + df, rank + dr
+            if 0 <= f < 8 and 0 <= r < 8:
+                targets.append(r * 8 + f)
+        table.append(tuple(targets))
+    return table
+
+
+def _rays_table(directions):
+    """Para cada casa, um raio (casas em ordem de distância) por direção."""
+    table = []
+    for square in range(64):
+        file, rank = square & 7, square >> 3
+        rays = []
+        for df, dr in directions:
+            ray = []
+            f, r = file + df, rank + dr
+            while 0 <= f < 8 and 0 <= r < 8:
+                ray.append(r * 8 + f)
+                f += df
+                r += dr
+            if ray:
+                rays.append(tuple(ray))
+        table.append(tuple(rays))
+    return table
+
+
+KNIGHT_TARGETS = _offsets_table(((1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2)))
+KING_TARGETS = _offsets_table(((1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)))
+# PAWN_CAPTURES[cor][casa]: casas capturadas por um peão da cor nessa casa
+PAWN_CAPTURES = (_offsets_table(((-1, 1), (1, 1))), _offsets_table(((-1, -1), (1, -1))))
+ROOK_RAYS = _rays_table(((1, 0), (-1, 0), (0, 1), (0, -1)))
+BISHOP_RAYS = _rays_table(((1, 1), (1, -1), (-1, 1), (-1, -1)))
+QUEEN_RAYS = tuple(rooks + bishops for rooks, bishops in zip(ROOK_RAYS, BISHOP_RAYS))
+
+# Roques: (cor, flag, casa do rei, destino do rei, casas que devem estar livres, casas que o rei atravessa)
+CASTLING_MOVES = (
+    (WHITE, CASTLE_WK, 4, 6, (5, 6), (4, 5, 6)),
+    (WHITE, CASTLE_WQ, 4, 2, (1, 2, 3), (4, 3, 2)),
+    (BLACK, CASTLE_BK, 60, 62, (61, 62), (60, 61, 62)),
+    (BLACK, CASTLE_BQ, 60, 58, (57, 58, 59), (60, 59, 58)),
+)
+
+
+# =============================================================================
+# Ataques e xeques
+# =============================================================================
+def is_square_attacked(board, square, by_color):
+    """Indica se alguma peça da cor by_color ataca a casa."""
+    squares = board.squares
+    base = by_color * 6
+    # Um peão inimigo ataca a casa se um peão nosso nela atacaria a casa dele
+    pawn = base + PAWN
+    for target in PAWN_CAPTURES[by_color ^ 1][square]:
+        if squares[target] == pawn:
+            return True
+    knight = base + KNIGHT
+    for target in KNIGHT_TARGETS[square]:
+        if squares[target] == knight:
+            return True
+    king = base + KING
+    for target in KING_TARGETS[square]:
+        if squares[target] == king:
+            return True
+    queen = base + QUEEN
+    straight = (base + ROOK, queen)
+    for ray in ROOK_RAYS[square]:
+        for target in ray:
+            piece = squares[target]
+            if piece != EMPTY:
+                if piece in straight:
+                    return True
+                break
+    diagonal = (base + BISHOP, queen)
+    for ray in BISHOP_RAYS[square]:
+        for target in ray:
+            piece = squares[target]
+            if piece != EMPTY:
+                if piece in diagonal:
+                    return True
+                break
+    return False
+
+
+def king_square(board, color):
+    """Casa do rei da cor (NO_SQUARE se não houver rei no tabuleiro)."""
+    bitboard = board.bitboards[color * 6 + KING]
+    return bitboard.bit_length() - 1 if bitboard else NO_SQUARE
+
+
+def in_check(board, color=None):
+    """Indica se o rei da cor (por padrão, a do lado a jogar) está em xeque."""
+    color = board.turn if color is None else color
+    square = king_square(board, color)
+    return square != NO_SQUARE and is_square_attacked(board, square, color ^ 1)
+
+
+# =============================================================================
+# Geração de lances
+# =============================================================================
+def _pawn_moves(board, square, color, moves):
+    squares = board.squares
+    step = 8 if color == WHITE else -8
+    start_rank, last_rank = (1, 7) if color == WHITE else (6, 0)
+    targets = []
+    one = square + step
+    if 0 <= one < 64 and squares[one] == EMPTY:
+        targets.append(one)
+        if square >> 3 == start_rank and squares[one + step] == EMPTY:
+            targets.append(one + step)
+    for target in PAWN_CAPTURES[color][square]:
+        piece = squares[target]
+        if (piece != EMPTY and (piece >= 6) != color) or target == board.ep_square:
+            targets.append(target)
+    for target in targets:
+        if target >> 3 == last_rank:
+            for kind in PROMOTION_ORDER:
+                moves.append(Move(square, target, kind))
+        else:
+            moves.append(Move(square, target, None))
+
+
+def _castling_moves(board, color, moves):
+    squares = board.squares
+    for castle_color, flag, king_from, king_to, empty, path in CASTLING_MOVES:
+        if castle_color != color or not board.castling & flag:
+            continue
+        if squares[king_from] != color * 6 + KING:
+            continue
+        if any(squares[sq] != EMPTY for sq in empty):
+            continue
+        if any(is_square_attacked(board, sq, color ^ 1) for sq in path):
+            continue
+        moves.append(Move(king_from, king_to, None))
+
+
+def pseudo_legal_moves(board, from_sq=None):
+    """
+    Lances pseudo-legais do lado a jogar (podem deixar o rei em xeque).
+    Com from_sq, gera apenas os lances da peça nessa casa.
+    """
+    squares = board.squares
+    color = board.turn
+    own = board.occupancy[color]
+    moves = []
+    origins = (from_sq,) if from_sq is not None else range(64)
+    for square in origins:
+        piece = squares[square]
+        if piece == EMPTY or (piece >= 6) != color:
+            continue
+        kind = piece % 6
+        if kind == PAWN:
+            _pawn_moves(board, square, color, moves)
+            continue
+        if kind == KNIGHT or kind == KING:
+            table = KNIGHT_TARGETS if kind == KNIGHT else KING_TARGETS
+            for target in table[square]:
+                if not own >> target & 1:
+                    moves.append(Move(square, target, None))
+            if kind == KING:
+                _castling_moves(board, color, moves)
+            continue
+        rays = ROOK_RAYS if kind == ROOK else BISHOP_RAYS if kind == BISHOP else QUEEN_RAYS
+        for ray in rays[square]:
+            for target in ray:
+                occupant = squares[target]
+                if occupant == EMPTY:
+                    moves.append(Move(square, target, None))
+                    continue
+                if (occupant >= 6) != color:
+                    moves.append(Move(square, target, None))
+                break
+    return moves
+
+
+def legal_moves(board, from_sq=None):
+    """Lances legais do lado a jogar (opcionalmente só da casa from_sq)."""
+    color = board.turn
+    legal = []
+    for move in pseudo_legal_moves(board, from_sq):
+        board.make_move(*move)
+        if not in_check(board, color):
+            legal.append(move)
+        board.unmake_move()
+    return legal
+
+
+def is_checkmate(board):
+    return in_check(board) and not legal_moves(board)
+
+
+def is_stalemate(board):
+    return not in_check(board) and not legal_moves(board)
+
+
+def move_to_uci(move):
+    promotion = PROMOTION_LETTERS[move.promotion] if move.promotion is not None else ''
+    return f"{SQUARE_NAMES[move.from_sq]}{SQUARE_NAMES[move.to_sq]}{promotion}"
+
+
+def parse_uci(uci):
+    """Converte um lance UCI em Move, ou None se o texto for inválido."""
+    if len(uci) not in (4, 5):
+        return None
+    from_sq = SQUARE_INDEX.get(uci[:2])
+    to_sq = SQUARE_INDEX.get(uci[2:4])
+    if from_sq is None or to_sq is None:
+        return None
+    promotion = None
+    if len(uci) == 5:
+        promotion = PROMOTION_KINDS.get(uci[4])
+        if promotion is None:
+            return None
+    return Move(from_sq, to_sq, promotion)
+
+
+def is_legal(board, move):
+    """Indica se o Move é legal, gerando apenas os lances da casa de origem."""
+    return move in legal_moves(board, move.from_sq)
+
+
+# =============================================================================
+# Validação dos lances lidos pelo tabuleiro físico
+# =============================================================================
+# Resultado da validação: lance UCI a enviar (None se rejeitado), se foi
+# corrigido e o motivo ('ok', a correção aplicada ou a causa da rejeição)
+MoveCheck = namedtuple('MoveCheck', ['uci', 'repaired', 'reason'])
+
+
+def _repair_candidates(board, move):
+    """Interpretações alternativas de um lance mal lido, em ordem de preferência."""
+    piece = board.squares[move.from_sq]
+    if piece != EMPTY and piece % 6 == PAWN and move.promotion is None and move.to_sq >> 3 in (0, 7):
+        yield Move(move.from_sq, move.to_sq, QUEEN), 'promotion'
+    if piece != EMPTY and piece % 6 == KING:
+        # Roque lido como o rei indo para a casa da torre
+        rook = piece - KING + ROOK
+        if board.squares[move.to_sq] == rook and move.to_sq >> 3 == move.from_sq >> 3:
+            step = 2 if move.to_sq > move.from_sq else -2
+            yield Move(move.from_sq, move.from_sq + step, None), 'castling'
+    yield Move(move.to_sq, move.from_sq, move.promotion), 'reversed'
+
+
+def validate_move(board, uci):
+    """
+    Confere um lance lido pelo tabuleiro contra os lances legais da posição.
+    Retorna um MoveCheck com o lance a enviar (possivelmente corrigido) ou
+    com uci=None e o motivo da rejeição ('malformed' ou 'illegal').
+    """
+    move = parse_uci(uci.strip().lower())
+    if move is None:
+        return MoveCheck(None, False, 'malformed')
+    if is_legal(board, move):
+        return MoveCheck(move_to_uci(move), False, 'ok')
+    for candidate, reason in _repair_candidates(board, move):
+        if is_legal(board, candidate):
+            return MoveCheck(move_to_uci(candidate), True, reason)
+    return MoveCheck(None, False, 'illegal')
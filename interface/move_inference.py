@@ -0,0 +1,115 @@
+"""
+Inferência do lance a partir dos bitmaps de ocupação do tabuleiro físico.
+
+No modo bruto (BOARD_MODE_RAW) o ESP32 não interpreta os sensores: envia um
+bitmap de 64 bits (bit i = casa i, a1 = 0) a cada mudança da varredura e,
+quando o botão é pressionado, o bitmap final. O host compara esse bitmap com a
+ocupação resultante de cada lance legal do ChessBoard (calculada com operações
+de bits e guardada em cache pela posição), o que resolve capturas, roques, en
+passant e promoções sem lógica de estado no firmware.
+
+Uma captura deixa a mesma ocupação para qualquer peça capturada pela mesma
+origem; o desempate usa a ordem em que as casas foram esvaziadas desde o
+último lance confirmado (a peça capturada é retirada por último). Peças
+levantadas e recolocadas no lugar não alteram o bitmap final e são ignoradas.
+A promoção não é visível pelos sensores e vale dama (promotion).
+"""
+from chess_board import WHITE, BLACK, KING, PAWN, QUEEN, SQUARE_NAMES
+from move_generator import MoveCheck, legal_moves, move_to_uci
+from zobrist import PositionCache
+
+
+def occupancy(board):
+    """Bitmap das casas ocupadas no ChessBoard."""
+    return board.occupancy[WHITE] | board.occupancy[BLACK]
+
+
+def occupancy_after(board, move, occupied):
+    """Ocupação após o lance, só com operações de bits."""
+    after = occupied & ~(1 << move.from_sq) | 1 << move.to_sq
+    kind = board.squares[move.from_sq] % 6
+    if kind == KING and abs(move.to_sq - move.from_sq) == 2:
+        # Roque: a torre vai do canto para a casa ao lado do rei
+        if move.to_sq > move.from_sq:
+            after = after & ~(1 << (move.from_sq + 3)) | 1 << (move.from_sq + 1)
+        else:
+            after = after & ~(1 << (move.from_sq - 4)) | 1 << (move.from_sq - 1)
+    elif kind == PAWN and move.to_sq == board.ep_square and move.from_sq & 7 != move.to_sq & 7:
+        # En passant: o peão capturado fica na fileira de origem
+        after &= ~(1 << ((move.from_sq & 0x38) | (move.to_sq & 7)))
+    return after
+
+
+def _squares(bitmap):
+    while bitmap:
+        yield (bitmap & -bitmap).bit_length() - 1
+        bitmap &= bitmap - 1
+
+
+class OccupancyTracker:
+    """
+    Acompanha os bitmaps recebidos desde o último lance confirmado e infere
+    o lance pretendido no momento da confirmação.
+    """
+    def __init__(self, promotion=QUEEN, cache_size=256):
+        self.promotion = promotion
+        self._tables = PositionCache(cache_size)
+        self.last = None  # último bitmap recebido
+        self.lifted = {}  # casa -> ordem em que foi esvaziada por último
+        self._order = 0
+
+    def clear(self):
+        """Esquece as retiradas registradas (após um lance confirmado ou troca de partida)."""
+        self.lifted = {}
+        self._order = 0
+
+    def table(self, board):
+        """Ocupação final -> lances legais que a produzem, para a posição atual."""
+        def build():
+            occupied = occupancy(board)
+            table = {}
+            for move in legal_moves(board):
+                table.setdefault(occupancy_after(board, move, occupied), []).append(move)
+            return table
+        return self._tables.get_or_compute(board.hash, build)
+
+    def feed(self, bitmap):
+        """Registra um bitmap da varredura (as casas que acabaram de ser esvaziadas)."""
+        if self.last is not None:
+            for square in _squares(self.last & ~bitmap):
+                self._order += 1
+                self.lifted[square] = self._order
+        self.last = bitmap
+
+    def infer(self, board, bitmap):
+        """
+        MoveCheck com o lance UCI cuja ocupação final é o bitmap, ou uci=None
+        e o motivo ('unchanged', 'illegal' ou 'ambiguous').
+        """
+        self.feed(bitmap)
+        if bitmap == occupancy(board):
+            return MoveCheck(None, False, 'unchanged')
+        moves = self.table(board).get(bitmap)
+        if not moves:
+            return MoveCheck(None, False, 'illegal')
+        # Promoções: a mesma origem e destino para as quatro peças
+        targets = {}
+        for move in moves:
+            if move.promotion is None or move.promotion == self.promotion:
+                targets[move.to_sq] = move
+        if len(targets) > 1:
+            # Capturas pela mesma peça: vale a casa esvaziada por último
+            order = {square: self.lifted.get(square, 0) for square in targets}
+            ranked = sorted(order, key=order.get, reverse=True)
+            if order[ranked[0]] == 0 or order[ranked[0]] == order[ranked[1]]:
+                return MoveCheck(None, False, 'ambiguous')
+            return MoveCheck(move_to_uci(targets[ranked[0]]), False, 'ok')
+        return MoveCheck(move_to_uci(next(iter(targets.values()))), False, 'ok')
+
+    @staticmethod
+    def describe(board, bitmap):
+        """Casas esvaziada e ocupada em relação à posição (ex.: 'e2e5'), para o aviso no LCD."""
+        occupied = occupancy(board)
+        vacated = next(_squares(occupied & ~bitmap), None)
+        added = next(_squares(bitmap & ~occupied), None)
+        return ''.join(SQUARE_NAMES[square] for square in (vacated, added) if square is not None) or '----'
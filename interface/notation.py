@@ -0,0 +1,161 @@
+"""
+Notação algébrica (SAN) dos lances, a partir da geração de lances legais.
+
+move_to_san segue as regras da SAN: desambiguação pela coluna, fileira ou
+casa de origem (Nbd2, R1e2, Qh4e1), capturas inclusive en passant, promoção,
+roque e os sufixos de xeque (+) e mate (#). O resultado fica em um cache LRU
+indexado pelo hash Zobrist da posição e pelo lance, de modo que a mesma
+posição (por exemplo, ao reconstruir a partida após um resync) não é
+recalculada.
+
+parse_san faz o caminho inverso (SAN recebida do Lichess para Move) sem gerar
+todos os lances da posição: só as peças do tipo indicado são consideradas.
+
+lcd_notation gera a variante compacta exibida no LCD 16x2, que reserva quatro
+caracteres para o último lance.
+"""
+import re
+
+from chess_board import (PAWN, KING, EMPTY, WHITE, PIECE_SYMBOLS, PIECE_INDEX, PROMOTION_KINDS, SQUARE_NAMES,
+                         SQUARE_INDEX)
+from move_generator import (Move, PROMOTION_LETTERS, in_check, is_legal, king_square, legal_moves, parse_uci,
+                            pseudo_legal_moves)
+from zobrist import PositionCache
+
+LCD_WIDTH = 4
+
+SAN_PATTERN = re.compile(r'^([NBRQK])?([a-h])?([1-8])?x?([a-h][1-8])(?:=?([NBRQ]))?$')
+
+_san_cache = PositionCache(maxsize=8192)
+
+
+def _has_legal_move(board):
+    """Indica se o lado a jogar tem algum lance legal (para na primeira origem com lance)."""
+    own = board.occupancy[board.turn]
+    while own:
+        square = (own & -own).bit_length() - 1
+        if legal_moves(board, square):
+            return True
+        own &= own - 1
+    return False
+
+
+def _disambiguation(board, move, piece):
+    """Coluna, fileira ou casa de origem necessária para identificar a peça."""
+    others = board.bitboards[piece] & ~(1 << move.from_sq)
+    rivals = []
+    while others:
+        square = (others & -others).bit_length() - 1
+        others &= others - 1
+        if is_legal(board, Move(square, move.to_sq, None)):
+            rivals.append(square)
+    if not rivals:
+        return ''
+    name = SQUARE_NAMES[move.from_sq]
+    if all(square & 7 != move.from_sq & 7 for square in rivals):
+        return name[0]
+    if all(square >> 3 != move.from_sq >> 3 for square in rivals):
+        return name[1]
+    return name
+
+
+def _san(board, move):
+    piece = board.squares[move.from_sq]
+    kind = piece % 6
+    target = SQUARE_NAMES[move.to_sq]
+    if kind == KING and abs(move.to_sq - move.from_sq) == 2:
+        san = 'O-O' if move.to_sq > move.from_sq else 'O-O-O'
+    elif kind == PAWN:
+        capture = move.from_sq & 7 != move.to_sq & 7  # inclui en passant
+        san = f"{SQUARE_NAMES[move.from_sq][0]}x{target}" if capture else target
+        if move.promotion is not None:
+            san += '=' + PROMOTION_LETTERS[move.promotion].upper()
+    else:
+        capture = board.squares[move.to_sq] != EMPTY
+        san = PIECE_SYMBOLS[piece].upper() + _disambiguation(board, move, piece) + ('x' if capture else '') + target
+    board.make_move(*move)
+    try:
+        if in_check(board):
+            san += '+' if _has_legal_move(board) else '#'
+    finally:
+        board.unmake_move()
+    return san
+
+
+def move_to_san(board, move):
+    """SAN do Move (legal) na posição atual do tabuleiro."""
+    return _san_cache.get_or_compute((board.hash, move), lambda: _san(board, move))
+
+
+def clear_san_cache():
+    _san_cache.clear()
+
+
+def uci_to_san(board, uci):
+    """SAN de um lance UCI; lances inválidos são devolvidos como vieram."""
+    move = parse_uci(uci)
+    if move is None or board.squares[move.from_sq] == EMPTY:
+        return uci
+    return move_to_san(board, move)
+
+
+def parse_san(board, san):
+    """Converte um lance SAN em Move na posição atual; ValueError se inválido."""
+    text = san.rstrip('+#!?')
+    color = board.turn
+    if text in ('O-O', 'O-O-O', '0-0', '0-0-0'):
+        king = king_square(board, color)
+        return Move(king, king + (2 if len(text) == 3 else -2), None)
+    match = SAN_PATTERN.match(text)
+    if match is None:
+        raise ValueError(f"SAN inválida: {san}")
+    letter, from_file, from_rank, target, promotion = match.groups()
+    to_sq = SQUARE_INDEX[target]
+    promotion = PROMOTION_KINDS[promotion.lower()] if promotion else None
+    if letter is None:
+        # Peão: a origem sai da coluna (captura) ou do avanço de uma ou duas casas
+        step = -8 if color == WHITE else 8
+        if from_file:
+            from_sq = SQUARE_INDEX[from_file + target[1]] + step
+        else:
+            from_sq = to_sq + step
+            if board.squares[from_sq] == EMPTY:
+                from_sq += step
+        return Move(from_sq, to_sq, promotion)
+    piece = PIECE_INDEX[letter if color == WHITE else letter.lower()]
+    candidates = []
+    pieces = board.bitboards[piece]
+    while pieces:
+        square = (pieces & -pieces).bit_length() - 1
+        pieces &= pieces - 1
+        name = SQUARE_NAMES[square]
+        if (from_file and name[0] != from_file) or (from_rank and name[1] != from_rank):
+            continue
+        move = Move(square, to_sq, None)
+        if move in pseudo_legal_moves(board, square):
+            candidates.append(move)
+    if len(candidates) > 1:
+        # Desambiguação omitida porque as outras peças estão cravadas
+        candidates = [move for move in candidates if is_legal(board, move)]
+    if len(candidates) != 1:
+        raise ValueError(f"SAN {san} não corresponde a um lance único")
+    return candidates[0]
+
+
+def lcd_notation(san, width=LCD_WIDTH):
+    """
+    Variante compacta para o LCD: sem 'x' e '=', roques como OO/OOO e o
+    sufixo de xeque/mate só quando couber na largura.
+    Ex.: Nbxd2 -> Nbd2, exd8=Q+ -> ed8Q, O-O-O -> OOO, Nf3+ -> Nf3+.
+    """
+    core = san.rstrip('+#')
+    suffix = san[len(core):]
+    if core.startswith('O-O'):
+        core = core.replace('-', '')
+    else:
+        core = core.replace('x', '').replace('=', '')
+    if len(core) > width and core[0] in 'NBRQK':
+        core = core[0] + core[-2:]  # sem a desambiguação (Qh4e1 -> Qe1)
+    if suffix and len(core) + len(suffix) <= width:
+        return core + suffix
+    return core[:width]
@@ -0,0 +1,313 @@
+"""
+Livro de aberturas Polyglot e nomes das aberturas (ECO), consultados pelo hash
+Zobrist da posição sem acesso à rede.
+
+O livro .bin (formato Polyglot: entradas de 16 bytes ordenadas pela chave) e a
+tabela ECO são abertos com mmap e consultados por busca binária na chave, sem
+carregar os arquivos: uma consulta custa algumas dezenas de leituras de 8
+bytes, o que permite repeti-la a cada gameState. ChessBoard.hash já usa as
+chaves do Polyglot.
+
+A tabela ECO é gerada uma vez a partir dos TSV do repositório
+lichess-org/chess-openings (colunas eco, name e pgn ou uci):
+
+    python opening_book.py build-eco a.tsv b.tsv c.tsv d.tsv e.tsv -o eco.bin
+
+Formato de eco.bin (big-endian): 'ECO2', quantidade (uint32), lances da linha
+mais longa (uint32), registros de 16 bytes ordenados pela chave (chave uint64,
+início do texto uint32, tamanho uint16, lances uint16) e os textos
+'código<TAB>nome' em UTF-8.
+
+Os caminhos padrão são ~/.digital_chessboard/book.bin e eco.bin (variáveis
+OPENING_BOOK e ECO_TABLE); sem os arquivos as consultas não retornam nada.
+
+Uso:
+    python opening_book.py probe e2e4 e7e5 g1f3
+"""
+import argparse
+import bisect
+import logging
+import mmap
+import os
+import struct
+import time
+from collections import namedtuple
+
+from chess_board import ChessBoard, KING, SQUARE_NAMES
+from move_generator import PROMOTION_LETTERS
+from notation import parse_san
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.path.join(os.path.expanduser("~"), ".digital_chessboard")
+BOOK_PATH = os.environ.get("OPENING_BOOK", os.path.join(DATA_DIR, "book.bin"))
+ECO_PATH = os.environ.get("ECO_TABLE", os.path.join(DATA_DIR, "eco.bin"))
+
+# Entrada do Polyglot: chave, lance, peso e aprendizado
+BOOK_ENTRY = struct.Struct('>QHHI')
+BOOK_KEY = struct.Struct('>Q')
+# Promoção no lance do Polyglot (bits 12-14): 1=cavalo ... 4=dama
+POLYGLOT_PROMOTIONS = {1: 'n', 2: 'b', 3: 'r', 4: 'q'}
+
+ECO_MAGIC = b'ECO2'
+ECO_HEADER = struct.Struct('>4sII')
+ECO_RECORD = struct.Struct('>QIHH')
+
+BookMove = namedtuple('BookMove', ['uci', 'weight', 'learn'])
+Opening = namedtuple('Opening', ['eco', 'name', 'plies'])
+
+
+def _open_mmap(path):
+    """mmap somente leitura do arquivo (None se estiver vazio)."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class _KeyView:
+    """Sequência das chaves de registros de tamanho fixo, para o bisect."""
+    def __init__(self, data, offset, size, count):
+        self.data = data
+        self.offset = offset
+        self.size = size
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        return BOOK_KEY.unpack_from(self.data, self.offset + index * self.size)[0]
+
+
+# =============================================================================
+# Livro Polyglot
+# =============================================================================
+class PolyglotBook:
+    """Livro de aberturas no formato Polyglot (.bin)."""
+    def __init__(self, path):
+        self.path = path
+        self.data = _open_mmap(path)
+        self.count = len(self.data) // BOOK_ENTRY.size if self.data else 0
+        self._keys = _KeyView(self.data, 0, BOOK_ENTRY.size, self.count)
+
+    def close(self):
+        if self.data is not None:
+            self.data.close()
+            self.data = None
+            self.count = 0
+
+    def entries(self, key):
+        """(lance, peso, aprendizado) brutos das entradas com a chave."""
+        if not self.count:
+            return []
+        index = bisect.bisect_left(self._keys, key)
+        found = []
+        while index < self.count:
+            entry_key, move, weight, learn = BOOK_ENTRY.unpack_from(self.data, index * BOOK_ENTRY.size)
+            if entry_key != key:
+                break
+            found.append((move, weight, learn))
+            index += 1
+        return found
+
+    def moves(self, board):
+        """Lances do livro para a posição, do maior para o menor peso."""
+        moves = [BookMove(decode_move(board, move), weight, learn)
+                 for move, weight, learn in self.entries(board.hash)]
+        moves.sort(key=lambda move: -move.weight)
+        return moves
+
+
+def decode_move(board, move):
+    """
+    Lance do Polyglot em UCI. O roque é gravado como o rei capturando a
+    própria torre (e1h1) e é convertido para o lance do rei (e1g1).
+    """
+    to_sq = move & 0x3F
+    from_sq = move >> 6 & 0x3F
+    promotion = POLYGLOT_PROMOTIONS.get(move >> 12 & 7, '')
+    if board.squares[from_sq] % 6 == KING and from_sq & 7 == 4 and to_sq >> 3 == from_sq >> 3:
+        if to_sq & 7 == 7:
+            to_sq = from_sq + 2
+        elif to_sq & 7 == 0:
+            to_sq = from_sq - 2
+    return SQUARE_NAMES[from_sq] + SQUARE_NAMES[to_sq] + promotion
+
+
+# =============================================================================
+# Tabela ECO
+# =============================================================================
+class EcoTable:
+    """Nomes das aberturas indexados pela chave da posição (eco.bin)."""
+    def __init__(self, path):
+        self.path = path
+        self.data = _open_mmap(path)
+        self.count = 0
+        self.max_plies = 0
+        if self.data is not None:
+            if self.data[:len(ECO_MAGIC)] != ECO_MAGIC or len(self.data) < ECO_HEADER.size:
+                self.data.close()
+                raise ValueError(f"{path} não é uma tabela {ECO_MAGIC.decode()} (gere de novo com build-eco)")
+            # max_plies (lances da linha mais longa) limita a reclassificação de uma partida
+            _, self.count, self.max_plies = ECO_HEADER.unpack_from(self.data)
+        self._keys = _KeyView(self.data, ECO_HEADER.size, ECO_RECORD.size, self.count)
+        self._pool = ECO_HEADER.size + self.count * ECO_RECORD.size
+
+    def close(self):
+        if self.data is not None:
+            self.data.close()
+            self.data = None
+            self.count = 0
+
+    def lookup(self, key):
+        """Opening da posição com a chave, ou None."""
+        if not self.count:
+            return None
+        index = bisect.bisect_left(self._keys, key)
+        if index == self.count:
+            return None
+        entry_key, start, length, plies = ECO_RECORD.unpack_from(self.data, ECO_HEADER.size + index * ECO_RECORD.size)
+        if entry_key != key:
+            return None
+        eco, name = self.data[self._pool + start:self._pool + start + length].decode('utf-8').split('\t', 1)
+        return Opening(eco, name, plies)
+
+
+def _read_openings(path):
+    """(eco, nome, lances UCI) de cada linha de um TSV do chess-openings."""
+    with open(path, encoding='utf-8') as f:
+        columns = f.readline().rstrip('\n').split('\t')
+        for line in f:
+            fields = dict(zip(columns, line.rstrip('\n').split('\t')))
+            if 'uci' in fields:
+                yield fields['eco'], fields['name'], fields['uci'].split()
+                continue
+            board = ChessBoard()
+            moves = []
+            for token in fields['pgn'].split():
+                if token[0].isdigit():
+                    continue
+                move = parse_san(board, token)
+                board.make_move(*move)
+                moves.append(SQUARE_NAMES[move.from_sq] + SQUARE_NAMES[move.to_sq] +
+                             (PROMOTION_LETTERS[move.promotion] if move.promotion is not None else ''))
+            yield fields['eco'], fields['name'], moves
+
+
+def build_eco_table(tsv_paths, out_path):
+    """
+    Gera eco.bin a partir dos TSV. Posições alcançadas por mais de uma linha
+    (transposições) ficam com o nome da linha mais curta.
+    """
+    entries = {}
+    for path in tsv_paths:
+        for eco, name, moves in _read_openings(path):
+            board = ChessBoard()
+            for uci in moves:
+                board.apply_move(uci)
+            current = entries.get(board.hash)
+            if current is None or len(moves) < current[2]:
+                entries[board.hash] = (eco, name, len(moves))
+    records = []
+    pool = bytearray()
+    for key in sorted(entries):
+        eco, name, plies = entries[key]
+        text = f"{eco}\t{name}".encode('utf-8')
+        records.append(ECO_RECORD.pack(key, len(pool), len(text), plies))
+        pool += text
+    max_plies = max((plies for _, _, plies in entries.values()), default=0)
+    with open(out_path, 'wb') as f:
+        f.write(ECO_HEADER.pack(ECO_MAGIC, len(records), max_plies))
+        f.write(b''.join(records))
+        f.write(pool)
+    return len(records)
+
+
+# =============================================================================
+# Consulta combinada
+# =============================================================================
+class OpeningBook:
+    """
+    Livro Polyglot e tabela ECO juntos. Arquivos ausentes (ou caminho None)
+    desligam a parte correspondente sem erro.
+    """
+    def __init__(self, book_path=BOOK_PATH, eco_path=ECO_PATH):
+        self.book = self._open(PolyglotBook, book_path)
+        self.eco = self._open(EcoTable, eco_path)
+
+    @staticmethod
+    def _open(cls, path):
+        if not path:
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError) as e:
+            logger.info(f"Livro de aberturas indisponível ({path}): {e}")
+            return None
+
+    @property
+    def available(self):
+        return self.book is not None or self.eco is not None
+
+    def close(self):
+        for part in (self.book, self.eco):
+            if part is not None:
+                part.close()
+
+    def opening(self, board):
+        """Opening da posição atual, se ela estiver na tabela ECO."""
+        return self.eco.lookup(board.hash) if self.eco else None
+
+    def book_moves(self, board):
+        """Lances do livro para a posição atual (maior peso primeiro)."""
+        return self.book.moves(board) if self.book else []
+
+    def classify(self, moves, previous=None):
+        """
+        Última abertura nomeada ao longo dos lances UCI (a posição atual pode
+        já ter saído da tabela). Só os primeiros max_plies lances são refeitos.
+        """
+        if not self.eco:
+            return previous
+        board = ChessBoard()
+        opening = self.eco.lookup(board.hash)
+        for uci in moves[:self.eco.max_plies]:
+            board.apply_move(uci)
+            opening = self.eco.lookup(board.hash) or opening
+        return opening
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Livro de aberturas Polyglot e tabela ECO")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build-eco", help="gera a tabela ECO a partir dos TSV do chess-openings")
+    build.add_argument("tsv", nargs="+")
+    build.add_argument("-o", "--output", default=ECO_PATH)
+    probe = commands.add_parser("probe", help="consulta a posição após os lances UCI")
+    probe.add_argument("moves", nargs="*")
+    probe.add_argument("--book", default=BOOK_PATH)
+    probe.add_argument("--eco", default=ECO_PATH)
+    args = parser.parse_args()
+
+    if args.command == "build-eco":
+        count = build_eco_table(args.tsv, args.output)
+        print(f"{count} posições gravadas em {args.output}")
+        return
+    book = OpeningBook(args.book, args.eco)
+    board = ChessBoard()
+    for uci in args.moves:
+        board.apply_move(uci)
+    start = time.perf_counter()
+    opening = book.classify(args.moves)
+    moves = book.book_moves(board)
+    elapsed = (time.perf_counter() - start) * 1e6
+    print(f"{opening.eco} {opening.name}" if opening else "Abertura desconhecida")
+    for move in moves:
+        print(f"  {move.uci} (peso {move.weight})")
+    print(f"Consulta: {elapsed:.0f} µs")
+    book.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""
+Comunicação serial full-duplex com o ESP32.
+
+Uma thread de leitura acorda assim que chegam bytes na porta, decodifica os
+quadros do protocolo binário (board_protocol) e as linhas de texto do firmware
+e entrega cada evento do tabuleiro ao callback on_event. As escritas passam por
+uma fila limitada consumida por uma thread de escrita. Os quadros confiáveis
+são enviados um de cada vez (stop-and-wait), na ordem em que foram pedidos, e
+retransmitidos até chegar o ACK correspondente.
+"""
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+
+import serial
+
+import board_protocol as protocol
+
+logger = logging.getLogger(__name__)
+
+BAUD_RATE = 115200
+READ_TIMEOUT = 0.5
+WRITE_QUEUE_SIZE = 32
+ACK_TIMEOUT = 0.3
+MAX_RETRIES = 5
+# Quem interpreta os sensores: 'moves' (o firmware) ou 'raw' (o host, por move_inference)
+BOARD_MODE = os.environ.get("BOARD_MODE", "moves")
+
+
+def find_esp_port():
+    """
+    Procura a porta serial do ESP32 (adaptadores USB/UART/CP210x).
+    A variável de ambiente ESP_PORT força uma porta específica (ex.: o pty do emulador).
+    """
+    if os.environ.get("ESP_PORT"):
+        return os.environ["ESP_PORT"]
+    import serial.tools.list_ports
+    portas = serial.tools.list_ports.comports()
+    for porta in portas:
+        if "USB" in porta.description or "UART" in porta.description or "CP210" in porta.description:
+            return porta.device
+    return None
+
+
+def parse_board_line(line):
+    """
+    Converte uma linha recebida do tabuleiro em um evento.
+    Linhas 'move: e2e4' viram {'type': 'move', 'move': 'e2e4'}; as demais são
+    mensagens de log do firmware.
+    """
+    if line.startswith("move:"):
+        return {'type': 'move', 'move': line[len("move:"):].strip()}
+    return {'type': 'log', 'line': line}
+
+
+class SerialBridge:
+    """
+    Mantém a porta serial aberta com threads dedicadas de leitura e escrita.
+    """
+    def __init__(self, port, baudrate=BAUD_RATE, on_event=None, on_error=None, board_mode=BOARD_MODE):
+        self.port = port
+        self.baudrate = baudrate
+        self.board_mode = board_mode
+        self.on_event = on_event
+        self.on_error = on_error
+        self.serial_port = None
+        self.write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self.decoder = protocol.FrameDecoder()
+        self._seq = 0
+        self._last_rx_seq = None
+        self._reliable = deque()  # quadros confiáveis aguardando envio
+        self._inflight = None  # [seq, quadro, prazo do ACK, tentativas, on_ack]
+        self._pending_lock = threading.Lock()
+        self.retransmissions = 0
+        self._running = False
+        self._reader = None
+        self._writer = None
+
+    @property
+    def is_open(self):
+        return self.serial_port is not None and self.serial_port.is_open
+
+    def start(self):
+        """Abre a porta e inicia as threads de leitura e escrita."""
+        if self.port is None:
+            logger.warning("Nenhuma porta serial do ESP32 encontrada")
+            return False
+        try:
+            self.serial_port = serial.Serial(self.port, self.baudrate, timeout=READ_TIMEOUT)
+        except serial.SerialException as e:
+            self._report_error(f"Erro abrindo {self.port}: {e}")
+            return False
+        self._running = True
+        self._reader = threading.Thread(target=self._read_loop, name="serial-reader", daemon=True)
+        self._writer = threading.Thread(target=self._write_loop, name="serial-writer", daemon=True)
+        self._reader.start()
+        self._writer.start()
+        self.send_mode(protocol.BOARD_MODE_RAW if self.board_mode == 'raw' else protocol.BOARD_MODE_MOVES)
+        return True
+
+    def start_async(self, find_port=None, on_open=None):
+        """
+        Procura (se find_port for dado e não houver porta) e abre a porta em
+        segundo plano, sem atrasar quem chamou. on_open recebe o resultado de start().
+        """
+        def open_port():
+            if self.port is None and find_port is not None:
+                self.port = find_port()
+            opened = self.start()
+            if on_open:
+                on_open(opened)
+        threading.Thread(target=open_port, name="serial-open", daemon=True).start()
+
+    def stop(self):
+        """Encerra as threads e fecha a porta (desbloqueia a leitura pendente)."""
+        self._running = False
+        try:
+            self.write_queue.put_nowait(None)
+        except queue.Full:
+            pass
+        if self.serial_port is not None:
+            self.serial_port.close()
+
+    def write(self, data):
+        """
+        Enfileira bytes para envio. Se a fila estiver cheia, descarta a
+        mensagem mais antiga para manter o LCD atualizado.
+        """
+        if not self._running:
+            return False
+        while True:
+            try:
+                self.write_queue.put_nowait(data)
+                return True
+            except queue.Full:
+                try:
+                    self.write_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def send_frame(self, frame_type, payload=b'', on_ack=None):
+        """
+        Envia um quadro; os tipos confiáveis aguardam o ACK do anterior.
+        on_ack é chamado (na thread de leitura) quando o ESP32 confirma o quadro.
+        """
+        if not self._running:
+            return False
+        with self._pending_lock:
+            self._seq = (self._seq + 1) & 0xFF
+            frame = protocol.encode_frame(frame_type, self._seq, payload)
+            if frame_type in protocol.RELIABLE_FRAMES:
+                self._reliable.append((self._seq, frame, on_ack))
+                frame = b''  # apenas acorda a thread de escrita
+        return self.write(frame)
+
+    def send_clock(self, white_ms, black_ms, black_to_move=False, running=True):
+        return self.send_frame(protocol.FRAME_CLOCK,
+                               protocol.clock_payload(white_ms, black_ms, black_to_move, running))
+
+    def send_move(self, san, uci, on_ack=None):
+        return self.send_frame(protocol.FRAME_MOVE, protocol.move_payload(san, uci), on_ack)
+
+    def send_reset(self):
+        return self.send_frame(protocol.FRAME_RESET)
+
+    def send_result(self, result):
+        return self.send_frame(protocol.FRAME_RESULT, protocol.result_payload(result))
+
+    def send_position(self, board):
+        """Substitui a posição do tabuleiro lógico do ESP32 pela do ChessBoard (replay)."""
+        return self.send_frame(protocol.FRAME_POSITION,
+                               protocol.position_payload(board.piece_at(square) for square in range(64)))
+
+    def send_opening(self, code):
+        """Código ECO da abertura exibido no LCD (None apaga)."""
+        return self.send_frame(protocol.FRAME_OPENING, protocol.opening_payload(code))
+
+    def send_mode(self, mode):
+        """Escolhe quem interpreta os sensores: o firmware ou o host (BOARD_MODE_RAW)."""
+        return self.send_frame(protocol.FRAME_MODE, protocol.mode_payload(mode))
+
+    def send_reject(self, uci, reason):
+        """Avisa o tabuleiro que o lance lido foi recusado, para que ele o desfaça."""
+        return self.send_frame(protocol.FRAME_REJECT, protocol.reject_payload(uci, reason))
+
+    def _report_error(self, message):
+        logger.error(message)
+        if self.on_error:
+            self.on_error(message)
+
+    def _emit(self, event):
+        event['received'] = time.monotonic()
+        if self.on_event:
+            self.on_event(event)
+
+    def _handle_frame(self, frame):
+        if frame.type == protocol.FRAME_ACK:
+            on_ack = None
+            with self._pending_lock:
+                if frame.payload and self._inflight and self._inflight[0] == frame.payload[0]:
+                    on_ack = self._inflight[4]
+                    self._inflight = None
+            self.write(b'')  # libera o próximo quadro confiável
+            if on_ack:
+                on_ack()
+            return
+        if frame.type in protocol.RELIABLE_FRAMES:
+            self.write(protocol.encode_frame(protocol.FRAME_ACK, 0, protocol.ack_payload(frame.seq)))
+            if frame.seq == self._last_rx_seq:
+                return  # retransmissão de um quadro já processado
+            self._last_rx_seq = frame.seq
+        if frame.type == protocol.FRAME_BOARD_MOVE:
+            self._emit({'type': 'move', 'move': frame.payload.decode('ascii', errors='replace').strip()})
+        elif frame.type in (protocol.FRAME_OCCUPANCY, protocol.FRAME_BOARD_CONFIRM) and len(frame.payload) == 8:
+            kind = 'occupancy' if frame.type == protocol.FRAME_OCCUPANCY else 'confirm'
+            self._emit({'type': kind, 'bitmap': protocol.decode_occupancy(frame.payload)})
+
+    def _read_loop(self):
+        while self._running:
+            try:
+                # Bloqueia até chegar ao menos um byte (ou o timeout expirar)
+                data = self.serial_port.read(self.serial_port.in_waiting or 1)
+            except (serial.SerialException, OSError, TypeError) as e:
+                if self._running:
+                    self._report_error(f"Erro ao ler mensagem serial: {e}")
+                break
+            if not data:
+                continue
+            for item in self.decoder.feed(data):
+                if isinstance(item, protocol.Frame):
+                    self._handle_frame(item)
+                else:
+                    self._emit(parse_board_line(item))
+
+    def _service_reliable(self):
+        """Envia o próximo quadro confiável ou retransmite o que expirou."""
+        now = time.monotonic()
+        with self._pending_lock:
+            if self._inflight is None:
+                if not self._reliable:
+                    return
+                seq, frame, on_ack = self._reliable.popleft()
+                self._inflight = [seq, frame, now + ACK_TIMEOUT, 0, on_ack]
+                self.serial_port.write(frame)
+                return
+            seq, frame, deadline, retries, _ = self._inflight
+            if deadline > now:
+                return
+            if retries >= MAX_RETRIES:
+                self._inflight = None
+                self._report_error(f"Quadro {seq} não confirmado pelo ESP32")
+                return
+            self._inflight[2] = now + ACK_TIMEOUT
+            self._inflight[3] = retries + 1
+            self.retransmissions += 1
+            self.serial_port.write(frame)
+
+    def _write_loop(self):
+        while self._running:
+            try:
+                data = self.write_queue.get(timeout=ACK_TIMEOUT / 2)
+            except queue.Empty:
+                data = b''
+            if data is None:
+                break
+            try:
+                if data:
+                    self.serial_port.write(data)
+                self._service_reliable()
+            except (serial.SerialException, OSError) as e:
+                if self._running:
+                    self._report_error(f"Erro enviando via serial: {e}")
@@ -0,0 +1,110 @@
+"""
+Relatório do tempo de inicialização da interface.
+
+Ativado com a opção --startup-report (ou a variável de ambiente
+STARTUP_REPORT=1), registra o tempo de cada import feito depois da ativação,
+no mesmo formato de 'python -X importtime' (tempo próprio e acumulado, em µs),
+e as etapas marcadas com mark() desde o início do processo. report() imprime
+as etapas e os imports mais lentos na saída de erro.
+
+Deve ser importado e ativado antes dos imports pesados (PySide6, requests).
+"""
+import os
+import sys
+import threading
+import time
+
+START = time.perf_counter()
+
+enabled = False
+_marks = []
+_imports = []  # (profundidade, módulo, tempo próprio, tempo acumulado) em segundos
+_stacks = {}  # pilha de imports em andamento por thread
+
+
+class _ImportTimer:
+    """
+    Finder colocado no início de sys.meta_path: delega a busca aos demais
+    finders e envolve o exec_module do loader encontrado para medir o import.
+    """
+    def find_spec(self, name, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        loader = spec.loader
+        # Importadores de módulos embutidos/congelados são classes compartilhadas
+        if loader is None or isinstance(loader, type) or not hasattr(loader, 'exec_module'):
+            return spec
+        try:
+            if '__startup_timed__' not in vars(loader):
+                loader.exec_module = _timed(loader.exec_module, name)
+                loader.__startup_timed__ = True
+        except (AttributeError, TypeError):
+            pass  # loader sem __dict__: import não medido
+        return spec
+
+
+def _timed(exec_module, name):
+    def wrapper(module):
+        stack = _stacks.setdefault(threading.get_ident(), [])
+        entry = [0.0]  # tempo dos imports filhos
+        stack.append(entry)
+        start = time.perf_counter()
+        try:
+            exec_module(module)
+        finally:
+            cumulative = time.perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1][0] += cumulative
+            _imports.append((len(stack), name, cumulative - entry[0], cumulative))
+    return wrapper
+
+
+def enable():
+    """Passa a medir os imports seguintes."""
+    global enabled
+    if enabled:
+        return
+    enabled = True
+    sys.meta_path.insert(0, _ImportTimer())
+
+
+def enable_from_argv(argv=None):
+    """Ativa se --startup-report estiver em argv (removendo-o) ou STARTUP_REPORT=1."""
+    argv = sys.argv if argv is None else argv
+    if '--startup-report' in argv:
+        argv.remove('--startup-report')
+        enable()
+    elif os.environ.get('STARTUP_REPORT') == '1':
+        enable()
+    return enabled
+
+
+def mark(label):
+    """Registra uma etapa da inicialização."""
+    if enabled:
+        _marks.append((label, time.perf_counter()))
+
+
+def elapsed_ms():
+    return (time.perf_counter() - START) * 1000
+
+
+def report(top=15, stream=None):
+    """Imprime as etapas e os imports mais lentos."""
+    if not enabled:
+        return
+    stream = stream or sys.stderr
+    print("startup: etapa                         ms desde o início", file=stream)
+    for label, moment in _marks:
+        print(f"startup: {label:<30} {(moment - START) * 1000:8.1f}", file=stream)
+    print(f"startup: {top} imports mais lentos (self [us] | cumulative [us] | módulo)", file=stream)
+    for depth, name, self_time, cumulative in sorted(_imports, key=lambda item: -item[3])[:top]:
+        print(f"import time: {self_time * 1e6:9.0f} | {cumulative * 1e6:10.0f} | {'  ' * depth}{name}",
+              file=stream)
@@ -0,0 +1,149 @@
+"""
+Motor UCI mínimo para testes do engine_pool, sem dependências externas.
+
+Responde ao handshake (uci, isready, setoption), aceita 'position' (startpos
+ou fen, com lances) e, a cada 'go', emite uma linha 'info' por profundidade
+com a diferença de material do lado a jogar e uma variante gulosa (capturas
+primeiro), esperando --delay ms por profundidade. 'stop' interrompe a busca
+e responde 'bestmove' na hora, como um motor real.
+
+Uso:
+    ENGINE_PATH="python uci_stub_engine.py --delay 20" python lichess_interface.py
+"""
+import argparse
+import sys
+import threading
+import time
+
+from chess_board import ChessBoard, EMPTY
+from move_generator import legal_moves, move_to_uci
+
+PIECE_VALUES = (100, 320, 330, 500, 900, 0)
+
+
+def material(board):
+    """Material do lado a jogar menos o do adversário (centipeões)."""
+    score = 0
+    for piece in range(12):
+        value = PIECE_VALUES[piece % 6] * bin(board.bitboards[piece]).count('1')
+        score += value if piece // 6 == board.turn else -value
+    return score
+
+
+def greedy_line(board, length):
+    """Variante em que cada lado faz a captura mais valiosa (ou o primeiro lance)."""
+    line = []
+    for _ in range(length):
+        moves = legal_moves(board)
+        if not moves:
+            break
+        move = max(moves, key=lambda move: PIECE_VALUES[board.squares[move.to_sq] % 6]
+                   if board.squares[move.to_sq] != EMPTY else -1)
+        line.append(move)
+        board.make_move(*move)
+    for _ in line:
+        board.unmake_move()
+    return line
+
+
+class StubEngine:
+    def __init__(self, delay_ms, max_depth):
+        self.delay = delay_ms / 1000
+        self.max_depth = max_depth
+        self.board = ChessBoard()
+        self.options = {}
+        self._stop = threading.Event()
+        self._search = None
+        self._out = threading.Lock()
+
+    def send(self, line):
+        with self._out:
+            sys.stdout.write(line + "\n")
+            sys.stdout.flush()
+
+    def position(self, tokens):
+        if tokens[0] == 'startpos':
+            self.board = ChessBoard()
+            rest = tokens[1:]
+        else:
+            end = tokens.index('moves') if 'moves' in tokens else len(tokens)
+            self.board = ChessBoard(' '.join(tokens[1:end]))
+            rest = tokens[end:]
+        for uci in rest[1:]:
+            self.board.apply_move(uci)
+
+    def go(self, tokens):
+        depth = self.max_depth
+        movetime = None
+        for name, value in zip(tokens, tokens[1:]):
+            if name == 'depth':
+                depth = min(depth, int(value))
+            elif name == 'movetime':
+                movetime = int(value) / 1000
+        self._stop.clear()
+        board = ChessBoard()
+        board.restore(self.board.snapshot())
+        self._search = threading.Thread(target=self.search, args=(board, depth, movetime), daemon=True)
+        self._search.start()
+
+    def search(self, board, depth, movetime):
+        started = time.monotonic()
+        best = None
+        score = material(board)
+        for current in range(1, depth + 1):
+            if self._stop.wait(self.delay) or (movetime and time.monotonic() - started >= movetime):
+                break
+            line = greedy_line(board, min(current, 6))
+            if not line:
+                break
+            best = line[0]
+            elapsed = int((time.monotonic() - started) * 1000)
+            self.send(f"info depth {current} score cp {score + current % 3} nodes {current * 1000} "
+                      f"time {elapsed} pv {' '.join(move_to_uci(move) for move in line)}")
+        self.send(f"bestmove {move_to_uci(best) if best else '0000'}")
+
+    def stop(self):
+        self._stop.set()
+        if self._search is not None:
+            self._search.join()
+            self._search = None
+
+    def run(self):
+        for line in sys.stdin:
+            tokens = line.split()
+            if not tokens:
+                continue
+            command = tokens[0]
+            if command == 'uci':
+                self.send("id name StubEngine")
+                self.send("option name Threads type spin default 1 min 1 max 64")
+                self.send("option name Hash type spin default 16 min 1 max 4096")
+                self.send("uciok")
+            elif command == 'isready':
+                self.send("readyok")
+            elif command == 'setoption' and len(tokens) >= 5:
+                self.options[tokens[2]] = tokens[4]
+            elif command == 'ucinewgame':
+                self.board = ChessBoard()
+            elif command == 'position':
+                self.position(tokens[1:])
+            elif command == 'go':
+                self.stop()
+                self.go(tokens[1:])
+            elif command == 'stop':
+                self.stop()
+            elif command == 'quit':
+                break
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Motor UCI mínimo para testes")
+    parser.add_argument("--delay", type=float, default=50.0, help="tempo por profundidade (ms)")
+    parser.add_argument("--max-depth", type=int, default=12)
+    args = parser.parse_args()
+    StubEngine(args.delay, args.max_depth).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -212,92 +212,337 @@ void reset_board(){
     }
 }
 
-// Função para atualizar o display com os tempos recebidos
-void update_lcd_clock(const char *msg) {
-    char msg_winner[64];
-    if (strcmp(msg, "reset") == 1){
-        reset_board();
-        return;
+// Protocolo binário host <-> ESP32 (ver interface/board_protocol.py):
+// SOF | versão | tipo | seq | tamanho | payload | CRC16-CCITT (big-endian)
+#define FRAME_SOF               0xA5
+#define PROTOCOL_VERSION        1
+#define FRAME_HEADER_SIZE       5
+#define FRAME_CRC_SIZE          2
+#define FRAME_MAX_PAYLOAD       64
+#define FRAME_CLOCK             0x01
+#define FRAME_MOVE              0x02
+#define FRAME_RESET             0x03
+#define FRAME_RESULT            0x04
+#define FRAME_REJECT            0x05
+#define FRAME_POSITION          0x06
+#define FRAME_OPENING           0x07
+#define FRAME_MODE              0x08
+#define FRAME_BOARD_MOVE        0x10
+#define FRAME_OCCUPANCY         0x11
+#define FRAME_BOARD_CONFIRM     0x12
+#define FRAME_ACK               0x7F
+#define ACK_TIMEOUT_MS          300
+#define MAX_RETRIES             5
+
+static uint8_t frame_buf[FRAME_HEADER_SIZE + FRAME_MAX_PAYLOAD + FRAME_CRC_SIZE];
+static size_t frame_len = 0;
+static int last_rx_seq = -1;
+static uint8_t tx_seq = 0;
+static uint32_t white_ms = 0;
+static uint32_t black_ms = 0;
+static char last_san[16] = "";
+static char opening_code[5] = ""; // código ECO da abertura (vazio: "LM")
+// Modo bruto: envia a ocupação dos sensores e o host infere o lance
+static bool raw_mode = false;
+
+// Quadro do tabuleiro (lance ou confirmação) aguardando o ACK do host
+static volatile bool board_move_pending = false;
+static uint8_t board_move_seq;
+static uint8_t board_move_frame[FRAME_HEADER_SIZE + 8 + FRAME_CRC_SIZE];
+static size_t board_move_frame_len;
+static TickType_t board_move_sent_at;
+static int board_move_retries;
+
+// CRC-16/CCITT-FALSE (polinômio 0x1021, valor inicial 0xFFFF)
+static uint16_t crc16_ccitt(const uint8_t *data, size_t len)
+{
+    uint16_t crc = 0xFFFF;
+    for (size_t i = 0; i < len; i++) {
+        crc ^= (uint16_t)data[i] << 8;
+        for (int bit = 0; bit < 8; bit++) {
+            crc = (crc & 0x8000) ? (crc << 1) ^ 0x1021 : crc << 1;
+        }
     }
-    if (strchr(msg, ';') == NULL) {
-        lcd_clear();
-        strncpy(msg_winner, msg, sizeof(msg_winner)-1);
-        int len = strlen(msg_winner);
-        // Calcula posição para centralizar o resultado (display de 16 colunas)
-        int pos = (16 - len) / 2;
-        lcd_set_cursor(4, 0);
-        lcd_write_string("GAME OVER");
-        lcd_set_cursor(pos, 1);
-        lcd_write_string(msg_winner);
-        reset_board();
+    return crc;
+}
+
+// Monta um quadro em out e retorna o seu tamanho
+static size_t encode_frame(uint8_t *out, uint8_t type, uint8_t seq, const uint8_t *payload, uint8_t len)
+{
+    out[0] = FRAME_SOF;
+    out[1] = PROTOCOL_VERSION;
+    out[2] = type;
+    out[3] = seq;
+    out[4] = len;
+    if (len) {
+        memcpy(&out[FRAME_HEADER_SIZE], payload, len);
+    }
+    uint16_t crc = crc16_ccitt(&out[1], FRAME_HEADER_SIZE - 1 + len);
+    out[FRAME_HEADER_SIZE + len] = crc >> 8;
+    out[FRAME_HEADER_SIZE + len + 1] = crc & 0xFF;
+    return FRAME_HEADER_SIZE + len + FRAME_CRC_SIZE;
+}
+
+static void send_ack(uint8_t seq)
+{
+    uint8_t buf[FRAME_HEADER_SIZE + 1 + FRAME_CRC_SIZE];
+    size_t len = encode_frame(buf, FRAME_ACK, 0, &seq, 1);
+    uart_write_bytes(UART_NUM, (const char *)buf, len);
+}
+
+// Envia um quadro confiável do tabuleiro; fica pendente até o ACK do host
+static void send_board_frame(uint8_t type, const uint8_t *payload, uint8_t len)
+{
+    tx_seq++;
+    board_move_seq = tx_seq;
+    board_move_frame_len = encode_frame(board_move_frame, type, board_move_seq, payload, len);
+    board_move_retries = 0;
+    board_move_sent_at = xTaskGetTickCount();
+    board_move_pending = true;
+    uart_write_bytes(UART_NUM, (const char *)board_move_frame, board_move_frame_len);
+}
+
+// Envia o lance detectado no tabuleiro
+void send_board_move(const char *move)
+{
+    send_board_frame(FRAME_BOARD_MOVE, (const uint8_t *)move, strlen(move));
+}
+
+// Ocupação dos sensores (bit i = casa i, a1 = 0) em big-endian
+static void pack_occupancy(uint8_t out[8], uint64_t bitmap)
+{
+    for (int k = 0; k < 8; k++) {
+        out[k] = bitmap >> (56 - 8 * k);
+    }
+}
+
+// Modo bruto: ocupação após uma mudança na varredura (sem ACK; a próxima a substitui)
+void send_occupancy(uint64_t bitmap)
+{
+    uint8_t payload[8];
+    uint8_t buf[FRAME_HEADER_SIZE + 8 + FRAME_CRC_SIZE];
+    pack_occupancy(payload, bitmap);
+    size_t len = encode_frame(buf, FRAME_OCCUPANCY, ++tx_seq, payload, 8);
+    uart_write_bytes(UART_NUM, (const char *)buf, len);
+}
+
+// Modo bruto: botão pressionado, o host infere o lance pela ocupação final
+void send_board_confirm(uint64_t bitmap)
+{
+    uint8_t payload[8];
+    pack_occupancy(payload, bitmap);
+    send_board_frame(FRAME_BOARD_CONFIRM, payload, 8);
+}
+
+// Retransmite o lance pendente se o ACK não chegou a tempo
+void service_board_move(void)
+{
+    if (!board_move_pending) return;
+    if (xTaskGetTickCount() - board_move_sent_at < pdMS_TO_TICKS(ACK_TIMEOUT_MS)) return;
+    if (++board_move_retries > MAX_RETRIES) {
+        board_move_pending = false;
+        ESP_LOGW(TAG, "Lance sem ACK do host");
         return;
     }
-    // Espera-se o formato: "white_time;last_move;black_time;last_move_uci"
-    char header[21];
+    board_move_sent_at = xTaskGetTickCount();
+    uart_write_bytes(UART_NUM, (const char *)board_move_frame, board_move_frame_len);
+}
+
+static void format_clock(char *out, size_t size, uint32_t ms)
+{
+    uint32_t seconds = ms / 1000;
+    snprintf(out, size, "%02" PRIu32 ":%02" PRIu32, seconds / 60, seconds % 60);
+}
+
+// Atualiza o display com os tempos e o último lance
+void render_clock(void)
+{
+    char white_time[10];
+    char black_time[10];
+    char line1[21];
     char line2[21];
-    char msg_copy[64];
-    strncpy(msg_copy, msg, sizeof(msg_copy)-1);
-    msg_copy[sizeof(msg_copy)-1] = '\0';
-    
-    // Usa strtok para separar os tokens
-    char *token = strtok(msg_copy, ";");
-    if (token != NULL) {
-        char white_time[10];
-        strncpy(white_time, token, sizeof(white_time)-1);
-        white_time[sizeof(white_time)-1] = '\0';
-    
-        token = strtok(NULL, ";");
-        if (token != NULL) {
-            char last_move_lichess[10];
-            strncpy(last_move_lichess, token, sizeof(last_move_lichess)-1);
-            last_move_lichess[sizeof(last_move_lichess)-1] = '\0';
-    
-            token = strtok(NULL, ";");
-            if (token != NULL) {
-                char black_time[10];
-                strncpy(black_time, token, sizeof(black_time)-1);
-                black_time[sizeof(black_time)-1] = '\0';
-    
-                // Atualiza o display apenas com os tokens referentes aos tempos e último movimento lichess
-                snprintf(header, sizeof(header), "WHITE  LM  BLACK");
-                snprintf(line2, sizeof(line2), "%5.5s %-3.3s  %5.5s", white_time, last_move_lichess, black_time);
-    
-                lcd_clear();
-                lcd_set_cursor(0,0);
-                lcd_write_string(header);
-                lcd_set_cursor(0,1);
-                lcd_write_string(line2);
-    
-                // Pega o quarto token para atualizar somente o tabuleiro
-                token = strtok(NULL, ";");
-                if (token != NULL) {
-                    if (strcmp (token, "None") == 0){
-
-                    if (strcmp(token, last_move) != 0) {
-                        int src_letter = token[0] - 'a';        // 'a' -> 0, 'b' -> 1, etc.
-                        int src_digit  = (token[1] - '0') - 1;    // '3' -> 3 - 1 = 2
-                        int dst_letter = token[2] - 'a';
-                        int dst_digit  = (token[3] - '0') - 1;            
-                        last_valid_board[dst_digit][dst_letter] = last_valid_board[src_digit][src_letter];
-                        last_valid_board[src_digit][src_letter] = '.';
-                        gpio_set_level(GPIO_NUM_12, 1);
-                        gpio_set_level(GPIO_NUM_13, 0);
-                        move_valid = false; 
-                        strcpy(last_move, token);
-                    }
-                }
-                else{
-                    reset_board();
-                }
-                }
-                return; // Processamento concluído com sucesso
-            }
-        }
+    format_clock(white_time, sizeof(white_time), white_ms);
+    format_clock(black_time, sizeof(black_time), black_ms);
+    // Código da abertura no lugar de "LM" enquanto o host o informar
+    snprintf(line1, sizeof(line1), "WHITE %-4.4s BLACK", opening_code[0] ? opening_code : " LM ");
+    // Último lance na notação compacta do host (até 4 caracteres)
+    snprintf(line2, sizeof(line2), "%5.5s %-4.4s %5.5s", white_time, last_san, black_time);
+    lcd_clear();
+    lcd_set_cursor(0,0);
+    lcd_write_string(line1);
+    lcd_set_cursor(0,1);
+    lcd_write_string(line2);
+}
+
+// Exibe o resultado da partida
+void render_result(const char *result)
+{
+    lcd_clear();
+    int pos = (16 - (int)strlen(result)) / 2;
+    lcd_set_cursor(4, 0);
+    lcd_write_string("GAME OVER");
+    lcd_set_cursor(pos < 0 ? 0 : pos, 1);
+    lcd_write_string(result);
+}
+
+// Aplica ao tabuleiro lógico o último lance informado pelo host
+void apply_host_move(const char *move)
+{
+    // Compara só origem e destino: o host pode ter completado a promoção
+    if (strlen(move) < 4 || strncmp(move, last_move, 4) == 0) return;
+    int src_letter = move[0] - 'a';        // 'a' -> 0, 'b' -> 1, etc.
+    int src_digit  = (move[1] - '0') - 1;  // '3' -> 3 - 1 = 2
+    int dst_letter = move[2] - 'a';
+    int dst_digit  = (move[3] - '0') - 1;
+    last_valid_board[dst_digit][dst_letter] = last_valid_board[src_digit][src_letter];
+    last_valid_board[src_digit][src_letter] = '.';
+    gpio_set_level(GPIO_NUM_12, 1);
+    gpio_set_level(GPIO_NUM_13, 0);
+    move_valid = false;
+    strncpy(last_move, move, sizeof(last_move) - 1);
+    last_move[sizeof(last_move) - 1] = '\0';
+}
+
+// Desfaz no tabuleiro lógico o lance recusado pelo host e avisa no display
+void reject_board_move(uint8_t reason, const char *move)
+{
+    if (strlen(move) >= 4 && strncmp(move, last_move, 4) == 0) {
+        int src_letter = move[0] - 'a';
+        int src_digit  = (move[1] - '0') - 1;
+        int dst_letter = move[2] - 'a';
+        int dst_digit  = (move[3] - '0') - 1;
+        last_valid_board[src_digit][src_letter] = last_valid_board[dst_digit][dst_letter];
+        last_valid_board[dst_digit][dst_letter] = '.';
+        last_move[0] = '\0';
     }
-    // Se o formato não for o esperado, mostra a mensagem completa na primeira linha
+    char line2[17];
+    snprintf(line2, sizeof(line2), "%.8s (%u)", move, reason);
     lcd_clear();
     lcd_set_cursor(0,0);
-    lcd_write_string(msg);
+    lcd_write_string("Lance invalido");
+    lcd_set_cursor(0,1);
+    lcd_write_string(line2);
+    gpio_set_level(GPIO_NUM_12, 1);
+    gpio_set_level(GPIO_NUM_13, 0);
+    move_valid = false;
+}
+
+// Trata um quadro válido recebido do host
+void handle_frame(uint8_t type, uint8_t seq, const uint8_t *payload, uint8_t len)
+{
+    if (type == FRAME_ACK) {
+        if (len && board_move_pending && payload[0] == board_move_seq) {
+            board_move_pending = false;
+        }
+        return;
+    }
+    if (type == FRAME_MOVE || type == FRAME_RESET || type == FRAME_RESULT || type == FRAME_REJECT ||
+        type == FRAME_POSITION || type == FRAME_OPENING || type == FRAME_MODE) {
+        send_ack(seq);
+        if (seq == last_rx_seq) return; // retransmissão já processada
+        last_rx_seq = seq;
+    }
+    switch (type) {
+    case FRAME_CLOCK:
+        if (len < 9) return;
+        white_ms = ((uint32_t)payload[0] << 24) | ((uint32_t)payload[1] << 16) | ((uint32_t)payload[2] << 8) | payload[3];
+        black_ms = ((uint32_t)payload[4] << 24) | ((uint32_t)payload[5] << 16) | ((uint32_t)payload[6] << 8) | payload[7];
+        render_clock();
+        break;
+    case FRAME_MOVE: {
+        char uci[8];
+        if (len < 1) return;
+        uint8_t san_len = payload[0];
+        if (san_len >= sizeof(last_san) || 1 + san_len > len) return;
+        size_t uci_len = len - 1 - san_len;
+        if (uci_len >= sizeof(uci)) return;
+        memcpy(last_san, &payload[1], san_len);
+        last_san[san_len] = '\0';
+        memcpy(uci, &payload[1 + san_len], uci_len);
+        uci[uci_len] = '\0';
+        apply_host_move(uci);
+        render_clock();
+        break;
+    }
+    case FRAME_RESET:
+        reset_board();
+        last_san[0] = '\0';
+        last_move[0] = '\0';
+        opening_code[0] = '\0';
+        break;
+    case FRAME_OPENING: {
+        size_t code_len = len < sizeof(opening_code) - 1 ? len : sizeof(opening_code) - 1;
+        memcpy(opening_code, payload, code_len);
+        opening_code[code_len] = '\0';
+        render_clock();
+        break;
+    }
+    case FRAME_MODE:
+        if (len < 1) return;
+        raw_mode = payload[0] != 0;
+        ESP_LOGI(TAG, "Modo %s", raw_mode ? "bruto" : "lances");
+        break;
+    case FRAME_REJECT: {
+        char move[9];
+        if (len < 1) return;
+        size_t move_len = len - 1 < sizeof(move) - 1 ? len - 1 : sizeof(move) - 1;
+        memcpy(move, &payload[1], move_len);
+        move[move_len] = '\0';
+        reject_board_move(payload[0], move);
+        break;
+    }
+    case FRAME_POSITION:
+        // Posição completa (replay): 64 casas de a1 a h8, fileira por fileira
+        if (len != 64) return;
+        memcpy(last_valid_board, payload, 64);
+        last_san[0] = '\0';
+        last_move[0] = '\0';
+        move_valid = false;
+        lcd_clear();
+        lcd_set_cursor(0,0);
+        lcd_write_string("Posicao recebida");
+        lcd_set_cursor(4,1);
+        lcd_write_string("(replay)");
+        break;
+    case FRAME_RESULT: {
+        char result[17];
+        size_t result_len = len < sizeof(result) - 1 ? len : sizeof(result) - 1;
+        memcpy(result, payload, result_len);
+        result[result_len] = '\0';
+        render_result(result);
+        reset_board();
+        break;
+    }
+    default:
+        break;
+    }
+}
+
+// Máquina de estados que remonta os quadros a partir dos bytes recebidos
+void frame_parser_feed(uint8_t byte)
+{
+    if (frame_len == 0 && byte != FRAME_SOF) return; // ignora bytes fora de quadros
+    frame_buf[frame_len++] = byte;
+    if (frame_len == 2 && byte != PROTOCOL_VERSION) {
+        frame_len = 0;
+        return;
+    }
+    if (frame_len < FRAME_HEADER_SIZE) return;
+    uint8_t payload_len = frame_buf[4];
+    if (payload_len > FRAME_MAX_PAYLOAD) {
+        frame_len = 0;
+        return;
+    }
+    size_t total = FRAME_HEADER_SIZE + payload_len + FRAME_CRC_SIZE;
+    if (frame_len < total) return;
+    uint16_t crc = crc16_ccitt(&frame_buf[1], FRAME_HEADER_SIZE - 1 + payload_len);
+    uint16_t received = ((uint16_t)frame_buf[total - 2] << 8) | frame_buf[total - 1];
+    if (crc == received) {
+        handle_frame(frame_buf[2], frame_buf[3], &frame_buf[FRAME_HEADER_SIZE], payload_len);
+    } else {
+        ESP_LOGW(TAG, "CRC inválido no quadro recebido");
+    }
+    frame_len = 0;
 }
 
 // Tarefa para receber dados pela UART e atualizar o LCD
@@ -305,11 +550,9 @@ void uart_rx_task(void *pvParameters)
 {
     uint8_t *data = (uint8_t *) malloc(UART_BUF_SIZE);
     while (1) {
-        int len = uart_read_bytes(UART_NUM, data, UART_BUF_SIZE - 1, pdMS_TO_TICKS(1000));
-        if (len > 0) {
-            data[len] = '\0';
-            ESP_LOGI(TAG, "Recebido: %s", (char *)data);
-            update_lcd_clock((char *)data);
+        int len = uart_read_bytes(UART_NUM, data, UART_BUF_SIZE, pdMS_TO_TICKS(100));
+        for (int i = 0; i < len; i++) {
+            frame_parser_feed(data[i]);
         }
     }
     free(data);
@@ -663,6 +906,8 @@ void app_main(void)
     int number_of_adds;
     int number_of_removes;
     char aux[3];
+    uint64_t occupancy = 0;
+    uint64_t sent_occupancy = ~0ULL;
     ESP_ERROR_CHECK(i2c_master_init());
     lcd_init();
     uart_init_config();
@@ -711,6 +956,27 @@ void app_main(void)
             }
             gpio_set_level(columns[i], 0);
         }
+        if (raw_mode) {
+            // O host interpreta a ocupação; o firmware só repassa as mudanças
+            occupancy = 0;
+            for (j = 0; j < 8; j++) {
+                for (i = 0; i < 8; i++) {
+                    if (current_board[j][i]) occupancy |= 1ULL << (j * 8 + i);
+                }
+            }
+            if (occupancy != sent_occupancy) {
+                send_occupancy(occupancy);
+                sent_occupancy = occupancy;
+            }
+            if (buttonPressed) {
+                buttonPressed = false;
+                send_board_confirm(occupancy);
+            }
+            service_board_move();
+            vTaskDelay(10/portTICK_PERIOD_MS);
+            continue;
+        }
+        sent_occupancy = ~0ULL;
         if (number_of_adds + number_of_removes && has_changed){
             int valid = verify_valid_board(current_board, number_of_adds, number_of_removes, addList, removeList);
             if (valid){
@@ -729,7 +995,7 @@ void app_main(void)
         if (buttonPressed) {
             buttonPressed = false;
             if (move_valid) {
-                printf("move: %s\n", current_move);
+                send_board_move(current_move);
                 int src_letter = current_move[0] - 'a';        // 'a' -> 0, 'b' -> 1, etc.
                 int src_digit  = (current_move[1] - '0') - 1;    // '3' -> 3 - 1 = 2
                 int dst_letter = current_move[2] - 'a';
@@ -742,6 +1008,7 @@ void app_main(void)
                 strcpy(last_move, current_move);
             }
         }
+        service_board_move();
         vTaskDelay(10/portTICK_PERIOD_MS);
     }
 }